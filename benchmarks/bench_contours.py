@@ -0,0 +1,60 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for getting the contours from an RT Structure Set."""
+
+from io import BytesIO
+
+import numpy as np
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian
+
+
+def create_rtstruct(nr_rois, nr_contours, nr_points):
+    """Return an encoded RT Structure Set with `nr_rois` ROIs, each with
+    `nr_contours` contours of `nr_points` points.
+    """
+    rng = np.random.default_rng(12345)
+    ds = Dataset()
+    ds.ROIContourSequence = Sequence()
+    for roi_number in range(1, nr_rois + 1):
+        roi = Dataset()
+        roi.ReferencedROINumber = roi_number
+        roi.ContourSequence = Sequence()
+        for _ in range(nr_contours):
+            contour = Dataset()
+            contour.ContourGeometricType = "CLOSED_PLANAR"
+            contour.NumberOfContourPoints = nr_points
+            points = rng.uniform(-250, 250, nr_points * 3)
+            contour.ContourData = [f"{x:.6g}" for x in points]
+            roi.ContourSequence.append(contour)
+
+        ds.ROIContourSequence.append(roi)
+
+    ds.preamble = b"\x00" * 128
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    buffer = BytesIO()
+    ds.save_as(buffer)
+
+    return buffer
+
+
+class TimeContourArrays:
+    """Time getting the contours for 20 ROIs with 100 contours each."""
+
+    def setup(self):
+        self.buffer = create_rtstruct(20, 100, 100)
+
+    def time_contour_arrays(self):
+        self.buffer.seek(0)
+        dcmread(self.buffer).contour_arrays()
+
+    def time_contour_data(self):
+        self.buffer.seek(0)
+        ds = dcmread(self.buffer)
+        for roi in ds.ROIContourSequence:
+            np.asarray(
+                [c.ContourData for c in roi.ContourSequence], dtype="f8"
+            ).reshape(-1, 3)
@@ -0,0 +1,73 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the data dictionary lookups."""
+
+from io import BytesIO
+
+from pydicom import dcmread
+from pydicom.datadict import dictionary_VR, keyword_for_tag, mask_match
+from pydicom.dataset import Dataset
+
+
+def create_overlays(nr_groups):
+    """Return an implicit VR encoded dataset with `nr_groups` overlay and curve
+    repeating groups.
+    """
+    ds = Dataset()
+    ds.PatientName = "Citizen^Jan"
+    for group in range(0, nr_groups * 2, 2):
+        # Overlay Plane Module
+        ds.add_new(0x60000010 + (group << 16), "US", 8)
+        ds.add_new(0x60000011 + (group << 16), "US", 8)
+        ds.add_new(0x60000022 + (group << 16), "LO", "Overlay")
+        ds.add_new(0x60000040 + (group << 16), "CS", "G")
+        ds.add_new(0x60000050 + (group << 16), "SS", [1, 1])
+        ds.add_new(0x60000100 + (group << 16), "US", 1)
+        ds.add_new(0x60000102 + (group << 16), "US", 0)
+        ds.add_new(0x60001500 + (group << 16), "LO", "Label")
+        ds.add_new(0x60003000 + (group << 16), "OW", b"\x00" * 8)
+        # Curve Module (retired)
+        ds.add_new(0x50000005 + (group << 16), "US", 2)
+        ds.add_new(0x50000010 + (group << 16), "US", 2)
+        ds.add_new(0x50000020 + (group << 16), "CS", "TAC")
+        ds.add_new(0x50000022 + (group << 16), "LO", "Curve")
+
+    fp = BytesIO()
+    ds.save_as(fp, implicit_vr=True, little_endian=True)
+
+    return fp.getvalue()
+
+
+class TimeMaskMatch:
+    """Time tests for looking up repeating group elements."""
+
+    def setup(self):
+        groups = range(0x6000, 0x6020, 2)
+        self.tags = [(group << 16) | elem for group in groups for elem in range(256)]
+
+    def time_mask_match(self):
+        for tag in self.tags:
+            mask_match(tag)
+
+    def time_dictionary_vr(self):
+        for tag in self.tags[::4]:
+            try:
+                dictionary_VR(tag)
+            except KeyError:
+                pass
+
+    def time_keyword_for_tag(self):
+        for tag in self.tags[::4]:
+            keyword_for_tag(tag)
+
+
+class TimeReadImplicitOverlays:
+    """Time tests for reading implicit VR datasets with repeating groups."""
+
+    def setup(self):
+        self.data = create_overlays(16)
+
+    def time_read(self):
+        for _ in range(20):
+            ds = dcmread(BytesIO(self.data), force=True)
+            for elem in ds:
+                pass
@@ -0,0 +1,63 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the memory used by datasets read from file."""
+
+from io import BytesIO
+import tracemalloc
+
+from pydicom import config, dcmread
+from pydicom.data import get_testdata_file
+from pydicom.dataset import FileMetaDataset
+from pydicom.filewriter import dcmwrite
+from pydicom.uid import ExplicitVRLittleEndian
+
+from .bench_nested_seq import create_nested_test_seq
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+
+
+class MemReadDataset:
+    """Memory used by datasets read with and without compact storage."""
+
+    params = [False, True]
+    param_names = ["compact_datasets"]
+
+    def setup(self, compact):
+        ds = create_nested_test_seq(10000)
+        ds.preamble = b"\x00" * 128
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        self.buffer = BytesIO()
+        dcmwrite(self.buffer, ds)
+
+        self.original = config.settings.compact_datasets
+        config.settings.compact_datasets = compact
+
+    def teardown(self, compact):
+        config.settings.compact_datasets = self.original
+
+    def _traced(self, func):
+        tracemalloc.start()
+        try:
+            result = func()  # noqa: F841 - keep the result alive while traced
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    def track_read_file(self, compact):
+        return self._traced(
+            lambda: [dcmread(CT_SMALL, stop_before_pixels=True) for _ in range(100)]
+        )
+
+    track_read_file.unit = "bytes"
+
+    def track_parse_sequence_items(self, compact):
+        def func():
+            self.buffer.seek(0)
+            ds = dcmread(self.buffer)
+            seq = ds.PerFrameFunctionalGroupsSequence
+            return ds, [item.PlanePositionSequence[0] for item in seq]
+
+        return self._traced(func)
+
+    track_parse_sequence_items.unit = "bytes"
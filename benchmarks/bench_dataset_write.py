@@ -0,0 +1,65 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for writing datasets that have been read from file."""
+
+from io import BytesIO
+import os
+from tempfile import TemporaryDirectory
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.filebase import DicomBytesIO
+from pydicom.filewriter import patch_file, write_dataset
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+
+
+class TimeWriteRead:
+    """Time writing datasets with only a few elements changed since reading."""
+
+    def setup(self):
+        self.ct = dcmread(CT_SMALL)
+        self.ct.PatientName = "Citizen^Jan"
+        self.rtplan = dcmread(RTPLAN)
+        self.rtplan.PatientID = "12345678"
+
+    def time_write_ct(self):
+        for _ in range(100):
+            self.ct.save_as(BytesIO())
+
+    def time_write_rtplan(self):
+        for _ in range(100):
+            self.rtplan.save_as(BytesIO())
+
+    def time_write_dataset_ct(self):
+        for _ in range(100):
+            write_dataset(DicomBytesIO(), self.ct)
+
+
+class TimePatchFile:
+    """Time changing an element in a file with 64 MB of *Pixel Data*."""
+
+    def setup(self):
+        self.tdir = TemporaryDirectory()
+        self.path = os.path.join(self.tdir.name, "large.dcm")
+        ds = dcmread(CT_SMALL)
+        ds.PixelData = b"\x00" * (64 * 1024 * 1024)
+        ds.save_as(self.path)
+        self.patient_id = ds.PatientID
+
+    def teardown(self):
+        self.tdir.cleanup()
+
+    def time_patch_in_place(self):
+        patch_file(self.path, {"PatientID": "ABCDEF"})
+
+    def time_patch_rewrite(self):
+        # Alternate the length so the file is always rewritten
+        self.patient_id = "ABCDEF" if len(self.patient_id) > 6 else "ABCDEFGHIJ"
+        patch_file(self.path, {"PatientID": self.patient_id})
+
+    def time_dcmread_dcmwrite(self):
+        ds = dcmread(self.path)
+        ds.PatientID = "ABCDEFGHIJKLMNOPQRS"
+        ds.save_as(self.path)
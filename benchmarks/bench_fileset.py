@@ -0,0 +1,100 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for loading and searching a File-set."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pydicom import examples
+from pydicom.fileset import FileSet
+
+
+def create_fileset(nr_patients, nr_instances):
+    """Return a File-set with `nr_instances` instances for each of
+    `nr_patients` patients.
+    """
+    ds = examples.ct
+    del ds.PixelData
+    fs = FileSet()
+    for patient in range(nr_patients):
+        ds.PatientID = f"PID{patient:05d}"
+        ds.StudyInstanceUID = f"1.2.3.{patient}"
+        ds.SeriesInstanceUID = f"1.2.3.{patient}.1"
+        for instance in range(nr_instances):
+            ds.SOPInstanceUID = f"1.2.3.{patient}.1.{instance}"
+            fs.add(ds)
+
+    return fs
+
+
+class TimeFileSetFind:
+    """Benchmarks for FileSet.find() and FileSet.find_values()."""
+
+    def setup(self):
+        self.fs = create_fileset(100, 5)
+        self.patient_ids = [f"PID{patient:05d}" for patient in range(100)]
+
+    def teardown(self):
+        self.fs.clear()
+
+    def time_find(self):
+        for patient_id in self.patient_ids:
+            self.fs.find(PatientID=patient_id)
+
+    def time_find_wildcard(self):
+        for patient_id in self.patient_ids[:10]:
+            self.fs.find(PatientID=f"{patient_id[:-1]}*")
+
+    def time_find_values(self):
+        for _ in range(100):
+            self.fs.find_values(["PatientID", "StudyInstanceUID"])
+
+    def time_find_load(self):
+        for patient_id in self.patient_ids[:10]:
+            self.fs.find(load=True, PatientID=patient_id)
+
+
+class TimeFileSetLoad:
+    """Benchmarks for loading an existing File-set."""
+
+    def setup(self):
+        self.tdir = TemporaryDirectory()
+        create_fileset(20, 50).write(self.tdir.name)
+        self.path = Path(self.tdir.name) / "DICOMDIR"
+
+    def teardown(self):
+        self.tdir.cleanup()
+
+    def time_load(self):
+        FileSet(self.path)
+
+    def time_load_find(self):
+        FileSet(self.path).find(PatientID="PID00010")
+
+
+class TimeFileSetWrite:
+    """Benchmarks for writing additions to an existing File-set."""
+
+    number = 1
+
+    def setup(self):
+        self.tdir = TemporaryDirectory()
+        create_fileset(10, 50).write(self.tdir.name)
+        self.fs = FileSet(Path(self.tdir.name) / "DICOMDIR")
+
+        ds = examples.ct
+        del ds.PixelData
+        ds.PatientID = "PID00000"
+        ds.StudyInstanceUID = "1.2.3.0"
+        ds.SeriesInstanceUID = "1.2.3.0.1"
+        for instance in range(50, 100):
+            ds.SOPInstanceUID = f"1.2.3.0.1.{instance}"
+            self.fs.add(ds)
+
+    def teardown(self):
+        self.tdir.cleanup()
+
+    def time_write(self):
+        self.fs.write()
+
+    def time_write_workers(self):
+        self.fs.write(workers=4)
@@ -0,0 +1,47 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the time taken to import pydicom."""
+
+import subprocess
+import sys
+
+
+def importtime(module):
+    """Return the cumulative time in microseconds to import `module` in a new
+    interpreter, as reported by ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # The last line is for `module` itself:
+    #   import time: self [us] | cumulative | imported package
+    line = result.stderr.strip().splitlines()[-1]
+
+    return int(line.split("|")[1])
+
+
+class TimeImport:
+    """Time tests for importing pydicom in a new interpreter."""
+
+    def timeraw_import_pydicom(self):
+        return "import pydicom"
+
+    def timeraw_import_sr(self):
+        return "import pydicom.sr"
+
+    def timeraw_import_codes(self):
+        return "from pydicom.sr import codes; codes.SCT.Deep"
+
+
+class TrackImport:
+    """Track the cumulative import times from ``python -X importtime``."""
+
+    unit = "microseconds"
+
+    def track_importtime_pydicom(self):
+        return importtime("pydicom")
+
+    def track_importtime_sr(self):
+        return importtime("pydicom.sr")
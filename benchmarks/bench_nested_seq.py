@@ -1,6 +1,11 @@
-from pydicom.dataset import Dataset
+from io import BytesIO
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.filewriter import dcmwrite
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag
+from pydicom.uid import ExplicitVRLittleEndian
 
 
 def create_nested_test_seq(num_items: int = 6280) -> Dataset:
@@ -82,3 +87,48 @@ class TimeNestedSeqAccess:
 
     def track_len_top_sequence(self):
         return self.len_top_sequence
+
+
+class TimeNestedSeqRead:
+    """Time tests for reading large nested sequences."""
+
+    len_top_sequence = 2000
+
+    def setup(self):
+        ds = create_nested_test_seq(self.len_top_sequence)
+        ds["PerFrameFunctionalGroupsSequence"].is_undefined_length = True
+        ds.preamble = b"\x00" * 128
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        self.buffer = BytesIO()
+        dcmwrite(self.buffer, ds)
+
+    def _read(self):
+        self.buffer.seek(0)
+        return dcmread(self.buffer)
+
+    def time_read_first_item(self):
+        ds = self._read()
+        pps_item = ds.PerFrameFunctionalGroupsSequence[0].PlanePositionSequence[0]
+        pps_item.RowPositionInTotalImagePixelMatrix
+
+    def time_read_iterate(self):
+        ds = self._read()
+        for func_gp in ds.PerFrameFunctionalGroupsSequence:
+            func_gp.PlanePositionSequence[0].RowPositionInTotalImagePixelMatrix
+
+    def time_read_write_unmodified(self):
+        ds = self._read()
+        ds.PerFrameFunctionalGroupsSequence
+        dcmwrite(BytesIO(), ds)
+
+    def time_sequence_array(self):
+        ds = self._read()
+        ds.sequence_array(
+            "PerFrameFunctionalGroupsSequence.PlanePositionSequence"
+            ".XOffsetInSlideCoordinateSystem"
+        )
+
+    def peakmem_read_first_item(self):
+        ds = self._read()
+        ds.PerFrameFunctionalGroupsSequence[0].PlanePositionSequence[0]
@@ -5,7 +5,13 @@ import numpy as np
 
 from pydicom import dcmread
 from pydicom.data import get_testdata_file
-from pydicom.pixel_data_handlers.util import convert_color_space
+from pydicom.pixel_data_handlers.util import (
+    apply_color_lut,
+    apply_modality_lut,
+    apply_voi_lut,
+    convert_color_space,
+)
+from pydicom.pixels import render
 
 
 # 32/32, 3 sample/pixel, 2 frame
@@ -56,3 +62,89 @@ class TimeConvertColorSpace:
         """Time converting RGB to YBR."""
         for ii in range(1):
             convert_color_space(self.arr_large, "RGB", "YBR_FULL", per_frame=True)
+
+    def time_ybr_rgb_large_out(self):
+        """Time converting YBR to RGB in-place."""
+        for ii in range(1):
+            convert_color_space(self.arr_large, "YBR_FULL", "RGB", out=self.arr_large)
+
+
+class TimeApplyLUT:
+    """Benchmarks for applying LUTs to every frame of a multi-frame image."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.palette = dcmread(get_testdata_file("OBXXXX1A.dcm"))
+        self.segmented = dcmread(get_testdata_file("gdcm-US-ALOKA-16.dcm"))
+        self.modality = dcmread(get_testdata_file("mlut_18.dcm"))
+        self.voi = dcmread(get_testdata_file("vlut_04.dcm"))
+        self.windowing = dcmread(get_testdata_file("MR-SIEMENS-DICOM-WithOverlays.dcm"))
+
+        rng = np.random.default_rng(12345)
+        self.frames_8 = rng.integers(0, 256, (50, 512, 512), dtype="u1")
+        self.frames_16 = rng.integers(0, 4096, (50, 512, 512), dtype="u2")
+        self.rgb = np.empty((512, 512, 3), dtype="u2")
+        self.float = np.empty((512, 512), dtype="f8")
+
+    def time_color_lut(self):
+        """Time applying a palette color LUT to each frame."""
+        for frame in self.frames_8:
+            apply_color_lut(frame, self.palette)
+
+    def time_color_lut_out(self):
+        """Time applying a palette color LUT to each frame with `out`."""
+        for frame in self.frames_8:
+            apply_color_lut(frame, self.palette, out=self.rgb)
+
+    def time_segmented_color_lut(self):
+        """Time applying a segmented palette color LUT to each frame."""
+        for frame in self.frames_8:
+            apply_color_lut(frame, self.segmented)
+
+    def time_modality_lut(self):
+        """Time applying a modality LUT to each frame."""
+        for frame in self.frames_16:
+            apply_modality_lut(frame, self.modality)
+
+    def time_voi_lut(self):
+        """Time applying a VOI LUT to each frame."""
+        for frame in self.frames_8:
+            apply_voi_lut(frame, self.voi)
+
+    def time_windowing(self):
+        """Time applying a windowing operation to each frame."""
+        for frame in self.frames_16:
+            apply_voi_lut(frame, self.windowing)
+
+    def time_windowing_out(self):
+        """Time applying a windowing operation to each frame with `out`."""
+        for frame in self.frames_16:
+            apply_voi_lut(frame, self.windowing, out=self.float)
+
+
+class TimeRender:
+    """Benchmarks for rendering every frame of a multi-frame image."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.ds = dcmread(get_testdata_file("MR-SIEMENS-DICOM-WithOverlays.dcm"))
+        rng = np.random.default_rng(12345)
+        self.frames = rng.integers(0, 4096, (50, 512, 512), dtype="u2")
+        self.out = np.empty((512, 512), dtype="u1")
+
+    def time_apply_functions(self):
+        """Time rendering using the modality and VOI LUT functions."""
+        for frame in self.frames:
+            arr = apply_voi_lut(apply_modality_lut(frame, self.ds), self.ds)
+            arr *= 255 / 4095
+            np.rint(arr, out=arr).astype("u1")
+
+    def time_render(self):
+        """Time rendering with render()."""
+        for frame in self.frames:
+            render(frame, self.ds, out=self.out)
+
+    def time_render_chunked(self):
+        """Time rendering 32-bit frames with render()."""
+        for frame in self.frames[:10]:
+            render(frame.astype("i4"), self.ds, out=self.out)
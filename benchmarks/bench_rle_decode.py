@@ -4,10 +4,12 @@
 from pydicom import dcmread
 from pydicom.data import get_testdata_file
 from pydicom.encaps import decode_data_sequence
+from pydicom.pixels import get_decoder
 from pydicom.pixel_data_handlers.rle_handler import (
     get_pixeldata,
     _rle_decode_frame,
 )
+from pydicom.uid import RLELossless
 
 
 # 8/8-bit, 1 sample/pixel, 1 frame
@@ -114,3 +116,34 @@ class TimeGetPixelData:
         """Time retrieval of 32-bit, 3 sample/pixel RLE data."""
         for ii in range(self.no_runs):
             get_pixeldata(self.ds_32_3_1)
+
+
+class TimeRLEDecodePlugins:
+    """Time tests for the RLE Lossless decoding plugins."""
+
+    params = ["pydicom", "numpy"]
+    param_names = ["plugin"]
+
+    def setup(self, plugin):
+        """Setup the test"""
+        self.ds_8_3_1 = dcmread(SC_RLE_1F)
+        self.ds_16_1_10 = dcmread(EMRI_RLE_10F)
+        self.ds_32_1_15 = dcmread(RTDOSE_RLE_15F)
+        self.decoder = get_decoder(RLELossless)
+
+        self.no_runs = 10
+
+    def time_08bit_3sample_1frame(self, plugin):
+        """Time decoding 8-bit, 3 sample/pixel RLE data."""
+        for ii in range(self.no_runs):
+            self.decoder.as_array(self.ds_8_3_1, decoding_plugin=plugin)
+
+    def time_16bit_1sample_10frame(self, plugin):
+        """Time decoding 16-bit, 1 sample/pixel, 10 frame RLE data."""
+        for ii in range(self.no_runs):
+            self.decoder.as_array(self.ds_16_1_10, decoding_plugin=plugin)
+
+    def time_32bit_1sample_15frame(self, plugin):
+        """Time decoding 32-bit, 1 sample/pixel, 15 frame RLE data."""
+        for ii in range(self.no_runs):
+            self.decoder.as_array(self.ds_32_1_15, decoding_plugin=plugin)
@@ -87,6 +87,11 @@ class TimeDatasetCompress:
         for _ in range(self.no_runs):
             self.ds.compress(RLELossless, self.arr8_1, encoding_plugin="pydicom")
 
+    def time_numpy(self):
+        """Time the NumPy RLE encoder."""
+        for _ in range(self.no_runs):
+            self.ds.compress(RLELossless, self.arr8_1, encoding_plugin="numpy")
+
     def time_pylibjpeg(self):
         """Time the pylibjpeg-rle Rust RLE encoder."""
         for _ in range(self.no_runs):
@@ -0,0 +1,75 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for reading the headers of many files."""
+
+import shutil
+from tempfile import TemporaryDirectory
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.filereader import scan_directory, scan_headers
+
+
+PATHS = [
+    get_testdata_file(name)
+    for name in [
+        "CT_small.dcm",
+        "MR_small.dcm",
+        "JPEG2000.dcm",
+        "emri_small_big_endian.dcm",
+        "liver_1frame.dcm",
+        "rtplan.dcm",
+    ]
+]
+TAGS = [
+    "PatientID",
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "SOPInstanceUID",
+    "Modality",
+    "Rows",
+    "Columns",
+]
+
+
+class TimeScanHeaders:
+    """Time tests for reading a few top-level elements from many files."""
+
+    def setup(self):
+        self.paths = PATHS * 50
+
+    def time_dcmread(self):
+        """Time reading with dcmread() and specific_tags."""
+        for path in self.paths:
+            ds = dcmread(path, specific_tags=TAGS, stop_before_pixels=True)
+            [ds.get(tag) for tag in TAGS]
+
+    def time_scan_headers(self):
+        """Time reading with scan_headers()."""
+        scan_headers(self.paths, TAGS)
+
+    def time_scan_headers_columnar(self):
+        """Time reading with scan_headers() as a columnar batch."""
+        scan_headers(self.paths, TAGS, columnar=True)
+
+
+class TimeScanDirectory:
+    """Time tests for reading the headers of a directory of files."""
+
+    def setup(self):
+        self.tdir = TemporaryDirectory()
+        for idx in range(500):
+            path = PATHS[idx % len(PATHS)]
+            shutil.copy(path, f"{self.tdir.name}/{idx:04d}.dcm")
+
+    def teardown(self):
+        self.tdir.cleanup()
+
+    def time_scan_directory(self):
+        """Time reading the files in a single process."""
+        for batch in scan_directory(self.tdir.name, TAGS, batch_size=100):
+            pass
+
+    def time_scan_directory_workers(self):
+        """Time reading the files in a pool of processes."""
+        for batch in scan_directory(self.tdir.name, TAGS, batch_size=100, workers=4):
+            pass
@@ -0,0 +1,34 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the values module."""
+
+import numpy as np
+
+from pydicom.values import (
+    convert_DS_array,
+    convert_DS_string,
+    convert_IS_array,
+    convert_IS_string,
+)
+
+
+class TimeConvertNumericStrings:
+    """Time converting 'DS' and 'IS' values with many items."""
+
+    def setup(self):
+        rng = np.random.default_rng(12345)
+        floats = rng.uniform(-500, 500, 30000)
+        self.ds = "\\".join(f"{x:.6g}" for x in floats).encode()
+        ints = rng.integers(-10000, 10000, 30000)
+        self.is_ = "\\".join(str(x) for x in ints).encode()
+
+    def time_DS_string(self):
+        convert_DS_string(self.ds, True)
+
+    def time_DS_array(self):
+        convert_DS_array(self.ds)
+
+    def time_IS_string(self):
+        convert_IS_string(self.is_, True)
+
+    def time_IS_array(self):
+        convert_IS_array(self.is_)
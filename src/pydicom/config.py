@@ -192,6 +192,7 @@ class Settings:
         # currently the default value depends on enforce_valid_values
         self._writing_validation_mode: int | None = RAISE if _use_future else None
         self._infer_sq_for_un_vr: bool = True
+        self._compact_datasets: bool = False
 
     @property
     def reading_validation_mode(self) -> int:
@@ -239,6 +240,23 @@ class Settings:
     def infer_sq_for_un_vr(self, value: bool) -> None:
         self._infer_sq_for_un_vr = value
 
+    @property
+    def compact_datasets(self) -> bool:
+        """If ``True`` then the elements of datasets read from file, including
+        sequence items, are stored in compact arrays and a
+        :class:`~pydicom.dataelem.RawDataElement` is only created when an
+        element is accessed. This reduces the memory used by datasets with
+        large sequences at the cost of slower element access. Default
+        ``False``.
+
+        .. versionadded:: 3.0
+        """
+        return self._compact_datasets
+
+    @compact_datasets.setter
+    def compact_datasets(self, value: bool) -> None:
+        self._compact_datasets = value
+
 
 settings = Settings()
 """The global configuration object of type :class:`Settings` to access some
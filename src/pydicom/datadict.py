@@ -3,12 +3,16 @@
 
 # the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
 # those with tags like "(50xx,0005)"
+from typing import Any
+
 from pydicom._dicom_dict import DicomDictionary, RepeatersDictionary
 from pydicom.misc import warn_and_log
-from pydicom._private_dict import private_dictionaries
 from pydicom.tag import Tag, BaseTag, TagType
 
 
+PrivateDictionaryType = dict[str, dict[str, tuple[str, str, str, str]]]
+
+
 # Generate mask dict for checking repeating groups etc.
 # Map a true bitwise mask to the DICOM mask with "x"'s in it.
 masks: dict[str, tuple[int, int]] = {}
@@ -21,6 +25,21 @@ for mask_x in RepeatersDictionary:
     mask2 = int("".join(["F0"[c == "x"] for c in mask_x]), 16)
     masks[mask_x] = (mask1, mask2)
 
+# Index the masks so a tag can be matched without checking every mask:
+#   masks like "60xx0010" with "x"s only in the last two digits of the group
+#   are keyed by (group >> 8, element), masks like "002804x0" with a fixed
+#   group are keyed by group and any other masks are checked for every tag
+_mask_elements: dict[tuple[int, int], str] = {}
+_mask_groups: dict[int, list[tuple[str, int, int]]] = {}
+_mask_other: list[tuple[str, int, int]] = []
+for mask_x, (mask1, mask2) in masks.items():
+    if mask2 == 0xFF00FFFF:
+        _mask_elements[(mask1 >> 24, mask1 & 0xFFFF)] = mask_x
+    elif mask2 >> 16 == 0xFFFF:
+        _mask_groups.setdefault(mask1 >> 16, []).append((mask_x, mask1, mask2))
+    else:
+        _mask_other.append((mask_x, mask1, mask2))
+
 
 def mask_match(tag: int) -> str | None:
     """Return the repeaters tag mask for `tag`.
@@ -36,9 +55,18 @@ def mask_match(tag: int) -> str | None:
         If the tag is in the repeaters dictionary then returns the
         corresponding masked tag, otherwise returns ``None``.
     """
-    for mask_x, (mask1, mask2) in masks.items():
+    mask_x = _mask_elements.get((tag >> 24, tag & 0xFFFF))
+    if mask_x is not None:
+        return mask_x
+
+    for mask_x, mask1, mask2 in _mask_groups.get(tag >> 16, ()):
+        if (tag ^ mask1) & mask2 == 0:
+            return mask_x
+
+    for mask_x, mask1, mask2 in _mask_other:
         if (tag ^ mask1) & mask2 == 0:
             return mask_x
+
     return None
 
 
@@ -148,6 +176,22 @@ def add_dict_entries(
     keyword_dict.update({val[4]: tag for tag, val in new_entries_dict.items()})
 
 
+def _private_dictionaries() -> PrivateDictionaryType:
+    """Return the private dictionaries, which are only imported when first
+    used.
+    """
+    from pydicom._private_dict import private_dictionaries
+
+    return private_dictionaries
+
+
+def __getattr__(name: str) -> Any:
+    if name == "private_dictionaries":
+        return _private_dictionaries()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def add_private_dict_entry(
     private_creator: str, tag: int, VR: str, description: str, VM: str = "1"
 ) -> None:
@@ -228,7 +272,7 @@ def add_private_dict_entries(
         f"{tag >> 16:04X}xx{tag & 0xff:02X}": value
         for tag, value in new_entries_dict.items()
     }
-    private_dictionaries.setdefault(private_creator, {}).update(new_entries)
+    _private_dictionaries().setdefault(private_creator, {}).update(new_entries)
 
 
 def get_entry(tag: TagType) -> tuple[str, str, str, str, str]:
@@ -547,7 +591,7 @@ def get_private_entry(tag: TagType, private_creator: str) -> tuple[str, str, str
         tag = Tag(tag)
 
     try:
-        private_dict = private_dictionaries[private_creator]
+        private_dict = _private_dictionaries()[private_creator]
     except KeyError as exc:
         raise KeyError(
             f"Private creator '{private_creator}' not in the private dictionary"
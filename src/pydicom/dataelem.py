@@ -8,8 +8,9 @@ A DataElement has a tag,
 """
 
 import base64
+from copy import deepcopy
 import json
-from typing import Optional, Any, TYPE_CHECKING, NamedTuple
+from typing import Optional, Any, TYPE_CHECKING, NamedTuple, SupportsIndex
 from collections.abc import Callable, MutableSequence
 
 from pydicom import config  # don't import datetime_conversion directly
@@ -24,6 +25,7 @@ from pydicom.datadict import (
     repeater_has_tag,
     private_dictionary_VR,
 )
+from pydicom.encaps import EncapsulatedFrames
 from pydicom.errors import BytesLengthException
 from pydicom.jsonrep import JsonDataElementConverter, BulkDataType
 from pydicom.misc import warn_and_log
@@ -154,6 +156,20 @@ class DataElement:
         The element's Value Representation.
     """
 
+    # Per-instance attributes are kept in slots to reduce the memory used
+    #   by large datasets, the instance __dict__ is only created if other
+    #   attributes are set, such as the display settings below
+    __slots__ = (
+        "tag",
+        "VR",
+        "validation_mode",
+        "_value",
+        "file_tell",
+        "is_undefined_length",
+        "private_creator",
+        "__dict__",
+    )
+
     descripWidth = 35
     maxBytesToDisplay = 16
     showVR = True
@@ -321,6 +337,9 @@ class DataElement:
         if self.VR in (BYTES_VR | AMBIGUOUS_VR) - {VR_.US_SS}:
             if not self.is_empty:
                 binary_value = self.value
+                if isinstance(binary_value, EncapsulatedFrames):
+                    binary_value = binary_value.to_bytes()
+
                 encoded_value = base64.b64encode(binary_value).decode("utf-8")
                 if (
                     bulk_data_element_handler is not None
@@ -454,7 +473,7 @@ class DataElement:
         if self.value is None:
             return 0
 
-        if isinstance(self.value, str | bytes | PersonName):
+        if isinstance(self.value, str | bytes | memoryview | PersonName):
             return 1 if self.value else 0
 
         try:
@@ -549,6 +568,45 @@ class DataElement:
         self.validate(val)
         return val
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DataElement":
+        """Return a deep copy of the element.
+
+        Values that are a :class:`memoryview`, such as those from a
+        memory-mapped file, are copied to :class:`bytes`.
+        """
+        cls = self.__class__
+        elem = cls.__new__(cls)
+        memo[id(self)] = elem
+        names = [name for name in DataElement.__slots__[:-1] if hasattr(self, name)]
+        for name in [*names, *self.__dict__]:
+            value = getattr(self, name)
+            if isinstance(value, memoryview):
+                value = value.tobytes()
+
+            setattr(elem, name, deepcopy(value, memo))
+
+        return elem
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the element's state for pickling.
+
+        Values that are a :class:`memoryview`, such as those from a
+        memory-mapped file, are copied to :class:`bytes`.
+        """
+        names = [name for name in DataElement.__slots__[:-1] if hasattr(self, name)]
+        state = {name: getattr(self, name) for name in names}
+        state.update(self.__dict__)
+        for name, value in state.items():
+            if isinstance(value, memoryview):
+                state[name] = value.tobytes()
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the element's state when unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other: Any) -> Any:
         """Compare `self` and `other` for equality.
 
@@ -612,6 +670,9 @@ class DataElement:
         if isinstance(self.value, UID):
             return self.value.name
 
+        if isinstance(self.value, memoryview):
+            return repr(self.value.tobytes())
+
         return repr(self.value)
 
     def __getitem__(self, key: int) -> Any:
@@ -709,12 +770,31 @@ class RawDataElement(NamedTuple):
     tag: BaseTag
     VR: str | None
     length: int
-    value: bytes | None
+    value: bytes | memoryview | None
     value_tell: int
     is_implicit_VR: bool
     is_little_endian: bool
     is_raw: bool = True
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "RawDataElement":
+        """Return a deep copy of the raw element, with any :class:`memoryview`
+        value copied to :class:`bytes`.
+        """
+        if isinstance(self.value, memoryview):
+            return self._replace(value=self.value.tobytes())
+
+        # All the fields are immutable
+        return self
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Return the raw element for pickling, with any :class:`memoryview`
+        value copied to :class:`bytes`.
+        """
+        if isinstance(self.value, memoryview):
+            return (self.__class__, (*self[:3], self.value.tobytes(), *self[4:]))
+
+        return (self.__class__, tuple(self))
+
 
 # The first and third values of the following elements are always US
 #   even if the VR is SS (PS3.3 C.7.6.3.1.5, C.11.1, C.11.2).
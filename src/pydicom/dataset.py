@@ -14,6 +14,7 @@ Dataset (dict subclass)
         * A Sequence (list subclass), where each item is a Dataset which
             contains its own DataElements, and so on in a recursive manner.
 """
+from array import array
 import copy
 import io
 import json
@@ -23,6 +24,7 @@ import re
 from bisect import bisect_left
 from collections.abc import (
     ValuesView,
+    Iterable,
     Iterator,
     Callable,
     MutableSequence,
@@ -63,7 +65,7 @@ from pydicom.datadict import (
     get_private_entry,
 )
 from pydicom.dataelem import DataElement, DataElement_from_raw, RawDataElement
-from pydicom.encaps import encapsulate, encapsulate_extended
+from pydicom.encaps import EncapsulatedFrames, encapsulate, encapsulate_extended
 from pydicom.filebase import ReadableBuffer, WriteableBuffer
 from pydicom.fileutil import path_from_pathlike, PathType
 from pydicom.misc import warn_and_log
@@ -244,6 +246,155 @@ _DatasetValue = DataElement | RawDataElement
 _DatasetType: TypeAlias = "Dataset | MutableMapping[BaseTag, _DatasetValue]"
 
 
+# The VRs that can be stored by _CompactElements, index 0 is for implicit VR
+_COMPACT_VR: tuple[str | None, ...] = (None, *VR_)
+_COMPACT_VR_INDEX = {vr: idx for idx, vr in enumerate(_COMPACT_VR)}
+
+
+class _CompactElements(MutableMapping[BaseTag, _DatasetValue]):
+    """A compact mapping of element tags to raw and converted elements.
+
+    The encoded elements are kept in an array of tags, an array of
+    ``(VR, length, value tell, value offset)`` records and a single buffer of
+    encoded values, and a :class:`~pydicom.dataelem.RawDataElement` is only
+    created when the element is accessed. Elements that are added or
+    converted, together with any encoded elements that can't be stored in
+    the arrays, are kept in a :class:`dict`.
+
+    Used as the :class:`Dataset` element storage for datasets read while
+    :attr:`Settings.compact_datasets<pydicom.config.Settings.compact_datasets>`
+    is ``True``.
+    """
+
+    __slots__ = (
+        "is_implicit_VR",
+        "is_little_endian",
+        "_buffer",
+        "_elements",
+        "_records",
+        "_tags",
+    )
+
+    def __init__(
+        self,
+        elements: Iterable[_DatasetValue],
+        is_implicit_VR: bool,
+        is_little_endian: bool,
+    ) -> None:
+        """Create a new compact mapping.
+
+        Parameters
+        ----------
+        elements : Iterable[DataElement | RawDataElement]
+            The elements to store.
+        is_implicit_VR : bool
+            ``True`` if the raw elements are implicit VR, ``False`` otherwise.
+        is_little_endian : bool
+            ``True`` if the raw elements are little endian, ``False`` otherwise.
+        """
+        self.is_implicit_VR = is_implicit_VR
+        self.is_little_endian = is_little_endian
+        self._elements: dict[BaseTag, _DatasetValue] = {}
+
+        compact: list[RawDataElement] = []
+        for elem in elements:
+            if (
+                isinstance(elem, RawDataElement)
+                and elem.length != 0xFFFFFFFF
+                and isinstance(elem.value, bytes)
+                and elem.VR in _COMPACT_VR_INDEX
+                and elem.is_implicit_VR == is_implicit_VR
+                and elem.is_little_endian == is_little_endian
+                and elem.value_tell is not None
+            ):
+                compact.append(elem)
+            else:
+                self._elements[elem.tag] = elem
+
+        compact.sort(key=lambda elem: elem.tag)
+        self._tags = array("L", [elem.tag for elem in compact])
+        self._records = array("q")
+        values = [cast(bytes, elem.value) for elem in compact]
+        offset = 0
+        for elem, value in zip(compact, values):
+            vr = _COMPACT_VR_INDEX[elem.VR]
+            self._records.extend((vr, elem.length, elem.value_tell, offset))
+            offset += len(value)
+
+        self._buffer = b"".join(values)
+
+    def _index(self, tag: Any) -> int:
+        """Return the index of `tag` in the arrays or ``-1`` if not present."""
+        if not isinstance(tag, int):
+            return -1
+
+        idx = bisect_left(self._tags, tag)
+        if idx < len(self._tags) and self._tags[idx] == tag:
+            return idx
+
+        return -1
+
+    def _remove(self, idx: int) -> None:
+        """Remove the encoded element at `idx` from the arrays."""
+        # The encoded value is left in the buffer
+        del self._tags[idx]
+        del self._records[4 * idx : 4 * idx + 4]
+
+    def __contains__(self, tag: object) -> bool:
+        """Return ``True`` if `tag` is in the mapping, ``False`` otherwise."""
+        return tag in self._elements or self._index(tag) != -1
+
+    def __delitem__(self, tag: BaseTag) -> None:
+        """Delete the element with `tag`."""
+        if tag in self._elements:
+            del self._elements[tag]
+            return
+
+        idx = self._index(tag)
+        if idx == -1:
+            raise KeyError(tag)
+
+        self._remove(idx)
+
+    def __getitem__(self, tag: BaseTag) -> _DatasetValue:
+        """Return the element with `tag`."""
+        if tag in self._elements:
+            return self._elements[tag]
+
+        idx = self._index(tag)
+        if idx == -1:
+            raise KeyError(tag)
+
+        vr, length, value_tell, offset = self._records[4 * idx : 4 * idx + 4]
+        return RawDataElement(
+            BaseTag(tag),
+            _COMPACT_VR[vr],
+            length,
+            self._buffer[offset : offset + length],
+            value_tell,
+            self.is_implicit_VR,
+            self.is_little_endian,
+        )
+
+    def __iter__(self) -> Iterator[BaseTag]:
+        """Return an iterator over the element tags."""
+        # Elements are moved from the arrays when converted, so iterate over
+        #   a copy of the tags to allow conversion while iterating
+        return iter([*map(BaseTag, self._tags), *self._elements])
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return len(self._tags) + len(self._elements)
+
+    def __setitem__(self, tag: BaseTag, elem: _DatasetValue) -> None:
+        """Set the element with `tag`."""
+        idx = self._index(tag)
+        if idx != -1:
+            self._remove(idx)
+
+        self._elements[tag] = elem
+
+
 class Dataset:
     """A DICOM dataset as a mutable mapping of DICOM Data Elements.
 
@@ -524,7 +675,11 @@ class Dataset:
 
     def __array__(self) -> "numpy.ndarray":
         """Support accessing the dataset from a numpy array."""
-        return numpy.asarray(self._dict)
+        elements = self._dict
+        if not isinstance(elements, dict):
+            elements = dict(elements)
+
+        return numpy.asarray(elements)
 
     def data_element(self, name: str) -> DataElement | None:
         """Return the element corresponding to the element keyword `name`.
@@ -1657,6 +1812,9 @@ class Dataset:
         ------
         ValueError
             If `handler_name` is not a valid handler name.
+        TypeError
+            If the *Pixel Data* is an
+            :class:`~pydicom.encaps.EncapsulatedFrames` instance.
         NotImplementedError
             If the given handler or any handler, if none given, is unable to
             decompress pixel data with the current transfer syntax
@@ -1687,6 +1845,13 @@ class Dataset:
         if already_have:
             return
 
+        if isinstance(self.get("PixelData"), EncapsulatedFrames):
+            raise TypeError(
+                "Unable to decode the pixel data as the (7FE0,0010) 'Pixel Data' "
+                "value is an 'EncapsulatedFrames' instance, which can only be "
+                "used as a source of encoded frames when writing the dataset"
+            )
+
         if handler_name:
             self._convert_pixel_data_using_handler(handler_name)
         else:
@@ -1822,6 +1987,7 @@ class Dataset:
         decoding_plugin: str = "",
         encapsulate_ext: bool = False,
         jls_error: int | None = None,
+        workers: int = 1,
         **kwargs: Any,
     ) -> None:
         """Compress and update an uncompressed dataset in-place with the
@@ -1880,7 +2046,7 @@ class Dataset:
 
         .. versionadded:: 3.0
 
-            Added the `jls_error` keyword parameter.
+            Added the `jls_error` and `workers` keyword parameters.
 
         Examples
         --------
@@ -1919,6 +2085,11 @@ class Dataset:
         jls_error : int, optional
             The allowed absolute compression error in the pixel values (*JPEG-LS
             Near Lossless* only).
+        workers : int, optional
+            The maximum number of frames to compress in parallel (default
+            ``1``). See :meth:`Encoder.iter_encode()
+            <pydicom.pixels.encoders.base.Encoder.iter_encode>` for more
+            information.
         **kwargs
             Optional keyword parameters for the encoding plugin may also be
             present. See the :doc:`encoding plugins options
@@ -1944,13 +2115,13 @@ class Dataset:
         if arr is None:
             # Encode the current *Pixel Data*
             frame_iterator = encoder.iter_encode(
-                self, encoding_plugin=encoding_plugin, **kwargs
+                self, encoding_plugin=encoding_plugin, workers=workers, **kwargs
             )
         else:
             # Encode from an uncompressed pixel data array
             opts = as_pixel_options(self, **kwargs)
             frame_iterator = encoder.iter_encode(
-                arr, encoding_plugin=encoding_plugin, **opts
+                arr, encoding_plugin=encoding_plugin, workers=workers, **opts
             )
 
         # Encode!
@@ -2088,6 +2259,101 @@ class Dataset:
         self.convert_pixel_data()
         return cast("numpy.ndarray", self._pixel_array)
 
+    def sequence_array(self, path: str | Iterable[TagType]) -> "numpy.ndarray":
+        """Return the values of an element found in each item of a sequence
+        as a :class:`numpy.ndarray`.
+
+        .. versionadded:: 3.0
+
+        Sequence items that haven't been parsed yet are searched using their
+        encoded data, so the values for every frame of a multi-frame object
+        can be retrieved without creating a :class:`Dataset` for each item.
+
+        Examples
+        --------
+
+        >>> ds.sequence_array(
+        ...     "PerFrameFunctionalGroupsSequence"
+        ...     ".PlanePositionSequence.ImagePositionPatient"
+        ... )
+        array([[-128.  , -128.  ,   10.  ],
+               [-128.  , -128.  ,   12.5 ],
+               ...
+
+        Parameters
+        ----------
+        path : str | Iterable[int | str | tuple[int, int]]
+            The path to the element, starting with the top-level sequence and
+            followed by any nested sequences, either as a :class:`str` of
+            element keywords separated by ``"."`` or as an iterable of element
+            tags or keywords. The first item of each nested sequence is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values with one row per item in the top-level sequence.
+            Binary numeric, **DS** and **IS** values use a numeric array with
+            shape (items, VM), or (items,) if the VM is 1, with ``NaN``
+            for items that don't contain a value. Any other values use an
+            ``object`` array of the element values.
+        """
+        if not config.have_numpy:
+            raise ImportError(
+                f"NumPy is required for {type(self).__name__}.sequence_array()"
+            )
+
+        if isinstance(path, str):
+            path = path.split(".")
+
+        tags = [Tag(item) for item in path]
+        if len(tags) < 2:
+            raise ValueError(
+                "The path must contain the sequence and the element to return"
+            )
+
+        from pydicom.filereader import _sequence_array
+
+        return _sequence_array(self, tags)
+
+    def contour_arrays(self) -> dict[int, tuple["numpy.ndarray", "numpy.ndarray"]]:
+        """Return the *Contour Data* for each ROI in the (3006,0039) *ROI
+        Contour Sequence* of an RT Structure Set as :class:`numpy.ndarray`.
+
+        .. versionadded:: 3.0
+
+        Sequence items that haven't been parsed yet are searched using their
+        encoded data and the *Contour Data* values for every contour are
+        converted in a single pass, without creating a :class:`Dataset` for
+        each item or a :class:`~pydicom.valuerep.DSfloat` for each value.
+
+        Examples
+        --------
+
+        >>> points, offsets = ds.contour_arrays()[1]
+        >>> points.shape
+        (6, 3)
+        >>> first_contour = points[offsets[0] : offsets[1]]
+
+        Returns
+        -------
+        dict[int, tuple[numpy.ndarray, numpy.ndarray]]
+            The contours for each ROI as ``{ROI number: (points, offsets)}``,
+            keyed by (3006,0084) *Referenced ROI Number*. `points` is a
+            float64 array with shape (N, 3) containing the (x, y, z)
+            coordinates of the points for all of the ROI's contours in
+            the order of the (3006,0040) *Contour Sequence*. `offsets` is an
+            int64 array with shape (contours + 1,), where the points of the
+            contour at index ``i`` are ``points[offsets[i]:offsets[i + 1]]``.
+        """
+        if not config.have_numpy:
+            raise ImportError(
+                f"NumPy is required for {type(self).__name__}.contour_arrays()"
+            )
+
+        from pydicom.filereader import _contour_arrays
+
+        return _contour_arrays(self)
+
     def waveform_array(self, index: int) -> "numpy.ndarray":
         """Return an :class:`~numpy.ndarray` for the multiplex group at
         `index` in the (5400,0100) *Waveform Sequence*.
@@ -2603,17 +2869,23 @@ class Dataset:
         # Note that the value of `_pixel_rep` gets updated as we move
         #   down the tree - the value used to correct ambiguous
         #   elements will be from the closest dataset to that element
-        for item in elem.value:
-            if TAG_PIXREP in item._dict:
-                pr = item._dict[TAG_PIXREP].value
-                if pr is not None:
-                    item._pixel_rep = (
-                        int(b"\x01" in pr) if isinstance(pr, bytes) else pr
-                    )
-                elif hasattr(self, "_pixel_rep"):
-                    item._pixel_rep = self._pixel_rep
-            elif hasattr(self, "_pixel_rep"):
-                item._pixel_rep = self._pixel_rep
+        seq = cast("pydicom.Sequence", elem.value)
+        # Items that haven't been parsed yet are updated when parsed
+        seq._parent_pixel_rep = getattr(self, "_pixel_rep", None)
+        for item in seq._parsed_items():
+            item._set_item_pixel_rep(seq._parent_pixel_rep)
+
+    def _set_item_pixel_rep(self, parent_pixel_rep: int | None) -> None:
+        """Set the `_pixel_rep` attribute for a sequence item using its own
+        *Pixel Representation* if present, otherwise that of its parent."""
+        if TAG_PIXREP in self._dict:
+            pr = cast(int | bytes | None, self._dict[TAG_PIXREP].value)
+            if pr is not None:
+                self._pixel_rep = int(b"\x01" in pr) if isinstance(pr, bytes) else pr
+                return
+
+        if parent_pixel_rep is not None:
+            self._pixel_rep = parent_pixel_rep
 
     def _slice_dataset(
         self, start: "TagType | None", stop: "TagType | None", step: int | None
@@ -3230,7 +3502,7 @@ class FileMetaDataset(Dataset):
         if init_value is None:
             return
 
-        if not isinstance(init_value, Dataset | dict):
+        if not isinstance(init_value, Dataset | dict | _CompactElements):
             raise TypeError(
                 f"Argument must be a dict or Dataset, not {type(init_value)}"
             )
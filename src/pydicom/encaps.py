@@ -1,20 +1,30 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """Functions for working with encapsulated (compressed) pixel data."""
 
-from collections.abc import Iterator
+from array import array
+from collections.abc import Iterable, Iterator, Sized
 from io import BytesIO
 from struct import pack, unpack
-from typing import Any
+from typing import Any, cast
 
 from pydicom import config
 from pydicom.misc import warn_and_log
-from pydicom.filebase import DicomBytesIO, DicomIO, ReadableBuffer
+from pydicom.filebase import DicomBytesIO, DicomIO, DicomMappedIO, ReadableBuffer
 from pydicom.tag import Tag, ItemTag, SequenceDelimiterTag
 
 
+def _as_readable(buffer: bytes | bytearray | memoryview) -> ReadableBuffer:
+    """Return `buffer` wrapped in a readable buffer-like without copying it."""
+    if isinstance(buffer, memoryview):
+        # BytesIO would copy the entire view, such as one on a memory-mapped file
+        return DicomMappedIO(buffer)
+
+    return BytesIO(buffer)
+
+
 # Functions for parsing encapsulated data
 def parse_basic_offsets(
-    buffer: bytes | bytearray | ReadableBuffer, *, endianness: str = "<"
+    buffer: bytes | bytearray | memoryview | ReadableBuffer, *, endianness: str = "<"
 ) -> list[int]:
     """Return the encapsulated pixel data's basic offset table frame offsets.
 
@@ -22,13 +32,13 @@ def parse_basic_offsets(
 
     Parameters
     ----------
-    buffer : bytes | bytearray | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, positioned at the
         beginning of the Basic Offset Table. May be :class:`bytes`,
-        :class:`bytearray` or an object with ``read()``, ``tell()`` and
-        ``seek()`` methods. If the latter then after reading it will be
-        positioned at the start of the item tag of the first fragment after the
-        Basic Offset Table.
+        :class:`bytearray`, :class:`memoryview` or an object with ``read()``,
+        ``tell()`` and ``seek()`` methods. If the latter then after reading it
+        will be positioned at the start of the item tag of the first fragment
+        after the Basic Offset Table.
     endianness : str, optional
         If ``"<"`` (default) then the encapsulated data uses little endian
         encoding, otherwise if ``">"`` it uses big endian encoding.
@@ -43,8 +53,8 @@ def parse_basic_offsets(
     ----------
     :dcm:`DICOM Standard, Part 5, Annex A.4<part05/sect_A.4.html#table_A.4-1>`
     """
-    if isinstance(buffer, bytes | bytearray):
-        buffer = BytesIO(buffer)
+    if isinstance(buffer, bytes | bytearray | memoryview):
+        buffer = _as_readable(buffer)
 
     group, elem = unpack(f"{endianness}HH", buffer.read(4))
     if group << 16 | elem != 0xFFFEE000:
@@ -66,7 +76,7 @@ def parse_basic_offsets(
 
 
 def parse_fragments(
-    buffer: bytes | bytearray | ReadableBuffer, *, endianness: str = "<"
+    buffer: bytes | bytearray | memoryview | ReadableBuffer, *, endianness: str = "<"
 ) -> tuple[int, list[int]]:
     """Return the number of fragments and their positions in `buffer`.
 
@@ -74,12 +84,13 @@ def parse_fragments(
 
     Parameters
     ----------
-    buffer : bytes | bytearray | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, starting at the first
         byte of item tag for a fragment, such as after the end of the Basic
-        Basic Offset Table. May be :class:`bytes`, :class:`bytearray` or an
-        object with ``read()``, ``tell()`` and ``seek()`` methods. If the latter
-        then the offset will be reset to the starting position afterwards.
+        Basic Offset Table. May be :class:`bytes`, :class:`bytearray`,
+        :class:`memoryview` or an object with ``read()``, ``tell()`` and
+        ``seek()`` methods. If the latter then the offset will be reset to the
+        starting position afterwards.
     endianness : str, optional
         If ``"<"`` (default) then the encapsulated data uses little endian
         encoding, otherwise if ``">"`` it uses big endian encoding.
@@ -90,8 +101,8 @@ def parse_fragments(
         The number of fragments and the absolute offset position of the first
         byte of the item tag for each fragment in `buffer`.
     """
-    if isinstance(buffer, bytes | bytearray):
-        buffer = BytesIO(buffer)
+    if isinstance(buffer, bytes | bytearray | memoryview):
+        buffer = _as_readable(buffer)
 
     start_offset = buffer.tell()
 
@@ -135,7 +146,7 @@ def parse_fragments(
 
 
 def generate_fragments(
-    buffer: bytes | bytearray | ReadableBuffer, *, endianness: str = "<"
+    buffer: bytes | bytearray | memoryview | ReadableBuffer, *, endianness: str = "<"
 ) -> Iterator[bytes]:
     """Yield frame fragments from the encapsulated pixel data in `buffer`.
 
@@ -143,13 +154,13 @@ def generate_fragments(
 
     Parameters
     ----------
-    buffer : bytes | bytearray | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, starting at the first
         byte of item tag for a fragment, usually this will be after the end
-        of the Basic Offset Table. May be :class:`bytes`, :class:`bytearray` or
-        an object with ``read()``, ``tell()`` and ``seek()`` methods. If the
-        latter than the final offset position depends on how many fragments have
-        been yielded.
+        of the Basic Offset Table. May be :class:`bytes`, :class:`bytearray`,
+        :class:`memoryview` or an object with ``read()``, ``tell()`` and
+        ``seek()`` methods. If the latter than the final offset position
+        depends on how many fragments have been yielded.
     endianness : str, optional
         If ``"<"`` (default) then the encapsulated data uses little endian
         encoding, otherwise if ``">"`` it uses big endian encoding.
@@ -159,8 +170,8 @@ def generate_fragments(
     bytes
         A pixel data fragment.
     """
-    if isinstance(buffer, bytes | bytearray):
-        buffer = BytesIO(buffer)
+    if isinstance(buffer, bytes | bytearray | memoryview):
+        buffer = _as_readable(buffer)
 
     while True:
         try:
@@ -195,7 +206,7 @@ def generate_fragments(
 
 
 def generate_fragmented_frames(
-    buffer: bytes | bytearray | ReadableBuffer,
+    buffer: bytes | bytearray | memoryview | ReadableBuffer,
     *,
     number_of_frames: int | None = None,
     extended_offsets: tuple[list[int], list[int]] | tuple[bytes, bytes] | None = None,
@@ -214,12 +225,12 @@ def generate_fragmented_frames(
 
     Parameters
     ----------
-    buffer : bytes | bytearray | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, positioned at the first
         byte of the basic offset table. May be :class:`bytes`,
-        :class:`bytearray` or an object with ``read()``, ``tell()`` and
-        ``seek()`` methods. If the latter then the final position depends on
-        how many fragmented frames have been yielded.
+        :class:`bytearray`, :class:`memoryview` or an object with ``read()``,
+        ``tell()`` and ``seek()`` methods. If the latter then the final
+        position depends on how many fragmented frames have been yielded.
     number_of_frames : int, optional
         Required for multi-frame data when the Basic Offset Table is empty,
         the Extended Offset Table has not been supplied and there are
@@ -240,8 +251,8 @@ def generate_fragmented_frames(
         An encapsulated pixel data frame, with the contents of the tuple the
         frame's fragmented encoded data.
     """
-    if isinstance(buffer, bytes | bytearray):
-        buffer = BytesIO(buffer)
+    if isinstance(buffer, bytes | bytearray | memoryview):
+        buffer = _as_readable(buffer)
 
     basic_offsets = parse_basic_offsets(buffer, endianness=endianness)
     # `buffer` is positioned at the end of the basic offsets table
@@ -253,13 +264,13 @@ def generate_fragmented_frames(
         #   of every frame, as measured from the first byte of the item tag
         #   following the Basic Offset Table, which *should* be empty
         # Only 1 fragment per frame is allowed (Table C.7-11a)
-        if isinstance(extended_offsets[0], bytes):
+        if isinstance(extended_offsets[0], bytes | memoryview):
             nr_offsets = len(extended_offsets[0]) // 8
             offsets = list(unpack(f"{endianness}{nr_offsets}Q", extended_offsets[0]))
         else:
             offsets = extended_offsets[0]
 
-        if isinstance(extended_offsets[1], bytes):
+        if isinstance(extended_offsets[1], bytes | memoryview):
             nr_offsets = len(extended_offsets[1]) // 8
             lengths = list(unpack(f"{endianness}{nr_offsets}Q", extended_offsets[1]))
         else:
@@ -387,7 +398,7 @@ def generate_fragmented_frames(
 
 
 def generate_frames(
-    buffer: bytes | ReadableBuffer,
+    buffer: bytes | bytearray | memoryview | ReadableBuffer,
     *,
     number_of_frames: int | None = None,
     extended_offsets: tuple[list[int], list[int]] | tuple[bytes, bytes] | None = None,
@@ -406,12 +417,12 @@ def generate_frames(
 
     Parameters
     ----------
-    buffer : bytes | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, starting at the first
         byte of the basic offset table. May be :class:`bytes`,
-        :class:`bytearray` or an object with ``read()``, ``tell()`` and
-        ``seek()`` methods. If the latter then the final offset position depends
-        on the number of yielded frames.
+        :class:`bytearray`, :class:`memoryview` or an object with ``read()``,
+        ``tell()`` and ``seek()`` methods. If the latter then the final offset
+        position depends on the number of yielded frames.
     number_of_frames : int, optional
         Required for multi-frame data when the Basic Offset Table is empty,
         the Extended Offset Table has not been supplied and there are
@@ -446,7 +457,7 @@ def generate_frames(
 
 
 def get_frame(
-    buffer: bytes | bytearray | ReadableBuffer,
+    buffer: bytes | bytearray | memoryview | ReadableBuffer,
     index: int,
     *,
     extended_offsets: tuple[list[int], list[int]] | tuple[bytes, bytes] | None = None,
@@ -466,13 +477,13 @@ def get_frame(
 
     Parameters
     ----------
-    buffer : bytes | bytearray | readable buffer
+    buffer : bytes | bytearray | memoryview | readable buffer
         A buffer containing the encapsulated frame data, positioned at the first
         byte of the basic offset table. May be :class:`bytes`,
-        :class:`bytearray` or an object with ``read()``, ``tell()`` and
-        ``seek()`` methods. If the latter then the buffer will be reset to the
-        starting position if the frame was
-        returned successfully.
+        :class:`bytearray`, :class:`memoryview` or an object with ``read()``,
+        ``tell()`` and ``seek()`` methods. If the latter then the buffer will
+        be reset to the starting position if the frame was returned
+        successfully.
     index : int
         The index of the frame to be returned, starting at ``0`` for the first
         frame.
@@ -500,8 +511,8 @@ def get_frame(
     ----------
     DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
     """
-    if isinstance(buffer, bytes | bytearray):
-        buffer = BytesIO(buffer)
+    if isinstance(buffer, bytes | bytearray | memoryview):
+        buffer = _as_readable(buffer)
 
     # `buffer` is positioned at the start of the basic offsets table
     starting_position = buffer.tell()
@@ -511,13 +522,13 @@ def get_frame(
 
     # Prefer the extended offset table (if available)
     if extended_offsets:
-        if isinstance(extended_offsets[0], bytes):
+        if isinstance(extended_offsets[0], bytes | memoryview):
             nr_offsets = len(extended_offsets[0]) // 8
             offsets = list(unpack(f"{endianness}{nr_offsets}Q", extended_offsets[0]))
         else:
             offsets = extended_offsets[0]
 
-        if isinstance(extended_offsets[1], bytes):
+        if isinstance(extended_offsets[1], bytes | memoryview):
             nr_offsets = len(extended_offsets[1]) // 8
             lengths = list(unpack(f"{endianness}{nr_offsets}Q", extended_offsets[1]))
         else:
@@ -638,6 +649,290 @@ def get_frame(
     raise ValueError(f"There is insufficient pixel data to contain {index + 1} frames")
 
 
+class FrameIndex:
+    """An index of the frame boundaries within encapsulated pixel data.
+
+    .. versionadded:: 3.0
+
+    The index is built from a single pass over the item headers of the
+    encapsulated data, after which the encoded data for any frame can be
+    returned without having to re-parse the preceding fragments. The offset
+    and length of each fragment are stored in compact :class:`array.array`
+    containers, so the index remains small even for pixel data with many
+    thousands of frames.
+
+    The frame boundaries are determined in the same way as
+    :func:`~pydicom.encaps.get_frame`, preferring the Extended Offset Table
+    (if supplied), then the Basic Offset Table (if not empty), and finally
+    falling back to the number of fragments and JPEG EOI/EOC markers.
+
+    Examples
+    --------
+
+    ::
+
+        from pydicom import dcmread
+        from pydicom.encaps import FrameIndex
+
+        ds = dcmread("path/to/dataset.dcm")
+        index = FrameIndex(ds.PixelData, number_of_frames=ds.NumberOfFrames)
+        for idx in range(len(index) - 1, -1, -1):
+            frame = index.read_frame(ds.PixelData, idx)
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | bytearray | memoryview | ReadableBuffer,
+        *,
+        extended_offsets: (
+            tuple[list[int], list[int]] | tuple[bytes, bytes] | None
+        ) = None,
+        number_of_frames: int | None = None,
+        endianness: str = "<",
+    ) -> None:
+        """Create a new index of the frames in `buffer`.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | readable buffer
+            A buffer containing the encapsulated frame data, positioned at the
+            first byte of the basic offset table. May be :class:`bytes`,
+            :class:`bytearray`, :class:`memoryview` or an object with
+            ``read()``, ``tell()`` and ``seek()`` methods. If the latter then
+            the buffer will be reset to the starting position afterwards.
+        extended_offsets : tuple[list[int], list[int]] or tuple[bytes, bytes], optional
+            The (offsets, lengths) of the Extended Offset Table as taken from
+            (7FE0,0001) *Extended Offset Table* and (7FE0,0002) *Extended Offset
+            Table Lengths* as either the raw encoded values or a list of their
+            decoded equivalents.
+        number_of_frames : int, optional
+            Required for multi-frame data when the Basic Offset Table is empty,
+            the Extended Offset Table has not been supplied and there are
+            multiple frames. This should be the value of (0028,0008) *Number of
+            Frames* or the expected number of frames in the encapsulated data.
+        endianness : str, optional
+            If ``"<"`` (default) then the encapsulated data uses little endian
+            encoding, otherwise if ``">"`` it uses big endian encoding.
+        """
+        if isinstance(buffer, bytes | bytearray | memoryview):
+            buffer = _as_readable(buffer)
+
+        # The offset to the first byte of each fragment's value and the
+        #   fragment lengths, with offsets relative to the start of the
+        #   basic offset table item
+        self._offsets = array("Q")
+        self._lengths = array("Q")
+        # The index of the first fragment of each frame, plus a sentinel
+        #   value equal to the total number of fragments
+        self._frames = array("Q")
+        # Whether or not the final frame is missing its JPEG EOI/EOC marker
+        self._is_truncated = False
+
+        starting_position = buffer.tell()
+        try:
+            self._build(buffer, extended_offsets, number_of_frames, endianness)
+        finally:
+            buffer.seek(starting_position, 0)
+
+    def _build(
+        self,
+        buffer: ReadableBuffer,
+        extended_offsets: tuple[list[int], list[int]] | tuple[bytes, bytes] | None,
+        number_of_frames: int | None,
+        endianness: str,
+    ) -> None:
+        """Populate the index by parsing the item headers in `buffer`."""
+        starting_position = buffer.tell()
+        basic_offsets = parse_basic_offsets(buffer, endianness=endianness)
+        first_item = buffer.tell() - starting_position
+
+        # Prefer the extended offset table (if available), no parsing required
+        if extended_offsets:
+            if isinstance(extended_offsets[0], bytes | memoryview):
+                nr_offsets = len(extended_offsets[0]) // 8
+                offsets = list(
+                    unpack(f"{endianness}{nr_offsets}Q", extended_offsets[0])
+                )
+            else:
+                offsets = extended_offsets[0]
+
+            if isinstance(extended_offsets[1], bytes | memoryview):
+                nr_offsets = len(extended_offsets[1]) // 8
+                lengths = list(
+                    unpack(f"{endianness}{nr_offsets}Q", extended_offsets[1])
+                )
+            else:
+                lengths = extended_offsets[1]
+
+            # Skip past the item tag and item length
+            self._offsets.extend(first_item + offset + 8 for offset in offsets)
+            self._lengths.extend(lengths)
+            self._frames.extend(range(len(offsets) + 1))
+            return
+
+        # Only the item headers are read, plus the final bytes of each
+        #   fragment when we might need to search for JPEG EOI/EOC markers
+        check_eoi = not basic_offsets
+        has_eoi = []
+        eoi_marker = b"\xFF\xD9"
+        while True:
+            try:
+                group, elem = unpack(f"{endianness}HH", buffer.read(4))
+            except Exception:
+                break
+
+            tag = group << 16 | elem
+            if tag == 0xFFFEE000:
+                if len(raw_length := buffer.read(4)) != 4:
+                    raise ValueError(
+                        "Unable to determine the length of the item at offset "
+                        f"{buffer.tell() - len(raw_length) - 4} as the end of "
+                        "the data has been reached - the encapsulated pixel data "
+                        "may be invalid"
+                    )
+                length = unpack(f"{endianness}L", raw_length)[0]
+                if length == 0xFFFFFFFF:
+                    raise ValueError(
+                        f"Undefined item length at offset {buffer.tell() - 4} when "
+                        "parsing the encapsulated pixel data fragments"
+                    )
+
+                self._offsets.append(buffer.tell() - starting_position)
+                self._lengths.append(length)
+                if check_eoi:
+                    tail_length = min(length, 10)
+                    buffer.seek(length - tail_length, 1)
+                    has_eoi.append(eoi_marker in buffer.read(tail_length))
+                else:
+                    buffer.seek(length, 1)
+            elif tag == 0xFFFEE0DD:
+                break
+            else:
+                raise ValueError(
+                    f"Unexpected tag '{Tag(tag)}' at offset {buffer.tell() - 4} when "
+                    "parsing the encapsulated pixel data fragment items"
+                )
+
+        nr_fragments = len(self._offsets)
+
+        # Use the basic offset table (if available)
+        if basic_offsets:
+            # Map the position of each fragment's item tag, relative to the end
+            #   of the basic offset table, to the fragment's index
+            fragments = {
+                offset - first_item - 8: idx for idx, offset in enumerate(self._offsets)
+            }
+            for offset in basic_offsets:
+                if offset not in fragments:
+                    raise ValueError(
+                        f"The Basic Offset Table offset {offset} doesn't match the "
+                        "start of any encapsulated pixel data fragment"
+                    )
+
+                self._frames.append(fragments[offset])
+
+            self._frames.append(nr_fragments)
+            return
+
+        # No basic or extended offset table
+        if nr_fragments < 2:
+            # Single fragment must be 1 frame
+            self._frames.extend(range(nr_fragments + 1))
+            return
+
+        # From this point on we require the number of frames as there are
+        #   multiple fragments and may be one or more frames
+        if not number_of_frames:
+            raise ValueError(
+                "Unable to determine the frame boundaries for the encapsulated "
+                "pixel data as there is no basic or extended offset table data and "
+                "the number of frames has not been supplied"
+            )
+
+        if nr_fragments == number_of_frames:
+            # 1 fragment per frame, for N frames
+            self._frames.extend(range(nr_fragments + 1))
+        elif number_of_frames == 1:
+            # Multiple fragments for 1 frame
+            self._frames.extend((0, nr_fragments))
+        else:
+            # Use the JPEG/JPEG-LS/JPEG2K EOI/EOC marker which should be the
+            #   last two bytes of a frame
+            self._frames.append(0)
+            self._frames.extend(idx + 1 for idx, eoi in enumerate(has_eoi[:-1]) if eoi)
+            self._frames.append(nr_fragments)
+            self._is_truncated = not has_eoi[-1]
+
+    def __len__(self) -> int:
+        """Return the number of frames in the index."""
+        return len(self._frames) - 1
+
+    def fragments(self, index: int) -> list[tuple[int, int]]:
+        """Return the (offset, length) of each fragment in the frame at `index`.
+
+        Parameters
+        ----------
+        index : int
+            The index of the frame, starting at ``0`` for the first frame.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The offset to the first byte of each fragment's value, as measured
+            from the start of the Basic Offset Table item, and the length of
+            the fragment in bytes.
+        """
+        if not 0 <= index < len(self):
+            raise ValueError(
+                f"There is insufficient pixel data to contain {index + 1} frames"
+            )
+
+        start, end = self._frames[index], self._frames[index + 1]
+        return list(zip(self._offsets[start:end], self._lengths[start:end]))
+
+    def read_frame(
+        self, buffer: bytes | bytearray | memoryview | ReadableBuffer, index: int
+    ) -> bytes:
+        """Return the encoded frame at `index`.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | readable buffer
+            The encapsulated frame data used to create the index, positioned at
+            the first byte of the basic offset table. If a readable buffer then
+            it will be reset to the starting position afterwards.
+        index : int
+            The index of the frame to be returned, starting at ``0`` for the
+            first frame.
+
+        Returns
+        -------
+        bytes
+            A single frame of encoded pixel data.
+        """
+        fragments = self.fragments(index)
+        if self._is_truncated and index == len(self) - 1:
+            warn_and_log(
+                "The end of the encapsulated pixel data has been reached but no "
+                "JPEG EOI/EOC marker was found, the returned frame data may be "
+                "invalid"
+            )
+
+        if isinstance(buffer, bytes | bytearray | memoryview):
+            return b"".join(
+                buffer[offset : offset + length] for offset, length in fragments
+            )
+
+        starting_position = buffer.tell()
+        frame = []
+        for offset, length in fragments:
+            buffer.seek(starting_position + offset, 0)
+            frame.append(buffer.read(length))
+
+        buffer.seek(starting_position, 0)
+        return b"".join(frame)
+
+
 # Functions for encapsulating data
 def fragment_frame(frame: bytes, nr_fragments: int = 1) -> Iterator[bytes]:
     """Yield one or more fragments from `frame`.
@@ -931,6 +1226,261 @@ def encapsulate_extended(frames: list[bytes]) -> tuple[bytes, bytes, bytes]:
     return encapsulate(frames, has_bot=False), offsets, lengths
 
 
+class EncapsulatedFrames:
+    """A lazy source of encoded frames to be encapsulated when written.
+
+    .. versionadded:: 3.0
+
+    Assigning an :class:`EncapsulatedFrames` instance to (7FE0,0010) *Pixel
+    Data* allows a dataset to be written with
+    :func:`~pydicom.filewriter.dcmwrite` without the encapsulated pixel data
+    ever being held in memory. Each frame is itemized and written as soon as
+    it's produced, then the values of the Basic or Extended Offset Table are
+    back-patched once all the frames have been written, which requires that
+    the destination be seekable.
+
+    If `frames` is an iterator then the dataset can only be written once. The
+    frames are only available for writing, and decoding the *Pixel Data* of
+    a dataset using an :class:`EncapsulatedFrames` raises a :class:`TypeError`.
+
+    Examples
+    --------
+
+    Write encoded frames as they're produced by a generator::
+
+        from pydicom.encaps import EncapsulatedFrames
+
+        def generate_encoded_frames():
+            for arr in source_arrays:
+                yield encode(arr)
+
+        ds.PixelData = EncapsulatedFrames(
+            generate_encoded_frames(), number_of_frames=ds.NumberOfFrames
+        )
+        ds.save_as("out.dcm")
+
+    Copy the encapsulated pixel data from an existing file a frame at a time,
+    using the Extended Offset Table::
+
+        ds = dcmread("path/to/dataset.dcm", mmap=True)
+        ds.PixelData = EncapsulatedFrames.from_buffer(
+            ds.PixelData, number_of_frames=ds.NumberOfFrames, use_extended=True
+        )
+        ds.save_as("out.dcm")
+
+    Attributes
+    ----------
+    offsets : list[int]
+        After writing, the offset to the first fragment of each frame, as
+        measured from the first byte after the Basic Offset Table item.
+    lengths : list[int]
+        After writing, the length of the encapsulated data for each frame.
+    """
+
+    def __init__(
+        self,
+        frames: Iterable[bytes],
+        *,
+        number_of_frames: int | None = None,
+        fragments_per_frame: int = 1,
+        has_bot: bool = True,
+        use_extended: bool = False,
+    ) -> None:
+        """Create a new lazy source of encoded frames.
+
+        Parameters
+        ----------
+        frames : Iterable[bytes]
+            The encoded frames to be encapsulated, one frame per item such as a
+            generator of encoded frames.
+        number_of_frames : int, optional
+            The number of frames in `frames`, required if `frames` has no
+            length and either the Basic or Extended Offset Table is to be
+            used.
+        fragments_per_frame : int, optional
+            The number of fragments to use for each frame (default ``1``).
+        has_bot : bool, optional
+            ``True`` (default) to include values in the Basic Offset Table,
+            ``False`` otherwise. Ignored if `use_extended` is ``True``.
+        use_extended : bool, optional
+            If ``True`` then write the (7FE0,0001) *Extended Offset Table* and
+            (7FE0,0002) *Extended Offset Table Lengths* elements instead of
+            using the Basic Offset Table, replacing any existing values
+            (default ``False``).
+        """
+        if number_of_frames is None and isinstance(frames, Sized):
+            number_of_frames = len(frames)
+
+        if use_extended and fragments_per_frame != 1:
+            raise ValueError(
+                "The Extended Offset Table can only be used when each frame is "
+                "contained in a single fragment"
+            )
+
+        has_bot = has_bot and not use_extended
+        if (has_bot or use_extended) and number_of_frames is None:
+            raise ValueError(
+                "'number_of_frames' is required when using the Basic or Extended "
+                "Offset Table and 'frames' has no length"
+            )
+
+        self.frames = frames
+        self.number_of_frames = number_of_frames
+        self.fragments_per_frame = fragments_per_frame
+        self.has_bot = has_bot
+        self.use_extended = use_extended
+        self.offsets: list[int] = []
+        self.lengths: list[int] = []
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: bytes | bytearray | memoryview | ReadableBuffer,
+        *,
+        number_of_frames: int | None = None,
+        extended_offsets: (
+            tuple[list[int], list[int]] | tuple[bytes, bytes] | None
+        ) = None,
+        endianness: str = "<",
+        has_bot: bool = True,
+        use_extended: bool = False,
+    ) -> "EncapsulatedFrames":
+        """Return a source that re-encapsulates the frames in `buffer`.
+
+        Only a single frame is read from `buffer` at a time.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | readable buffer
+            A buffer containing existing encapsulated pixel data, such as a
+            file positioned at the first byte of the Basic Offset Table or the
+            :class:`memoryview` value of a memory-mapped *Pixel Data* element.
+        number_of_frames : int, optional
+            The number of frames in `buffer`, see :class:`FrameIndex`.
+        extended_offsets : tuple[list[int], list[int]] or tuple[bytes, bytes], optional
+            The (offsets, lengths) of the Extended Offset Table for the
+            encapsulated pixel data in `buffer`, see :class:`FrameIndex`.
+        endianness : str, optional
+            The endianness of the encapsulated data in `buffer`, ``"<"``
+            (default) for little endian or ``">"`` for big endian.
+        has_bot : bool, optional
+            ``True`` (default) to include values in the Basic Offset Table
+            when writing, ``False`` otherwise.
+        use_extended : bool, optional
+            ``True`` to write the Extended Offset Table instead of the Basic
+            Offset Table (default ``False``).
+
+        Returns
+        -------
+        EncapsulatedFrames
+            The lazy source of frames.
+        """
+        index = FrameIndex(
+            buffer,
+            extended_offsets=extended_offsets,
+            number_of_frames=number_of_frames,
+            endianness=endianness,
+        )
+
+        class _Frames:
+            def __iter__(self) -> Iterator[bytes]:
+                return (index.read_frame(buffer, idx) for idx in range(len(index)))
+
+        return cls(
+            _Frames(),
+            number_of_frames=len(index),
+            has_bot=has_bot,
+            use_extended=use_extended,
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the source."""
+        return (
+            f"<{type(self).__name__}: {self.number_of_frames} frame(s), "
+            f"has_bot={self.has_bot}, use_extended={self.use_extended}>"
+        )
+
+    def write(self, fp: DicomIO) -> None:
+        """Write the encapsulated frames to `fp`.
+
+        Writes the value of the *Pixel Data* element, from the start of the
+        Basic Offset Table item up to (but not including) the Sequence
+        Delimiter item, and updates :attr:`offsets` and :attr:`lengths`.
+
+        Parameters
+        ----------
+        fp : pydicom.filebase.DicomIO
+            The seekable file-like to write the encapsulated frames to.
+        """
+        nr_frames = self.number_of_frames
+
+        # The Basic Offset Table item, with values written once known
+        fp.write_tag(ItemTag)
+        if self.has_bot:
+            nr_frames = cast(int, nr_frames)
+            fp.write_UL(4 * nr_frames)
+            bot_start = fp.tell()
+            fp.write(b"\xFF\xFF\xFF\xFF" * nr_frames)
+        else:
+            fp.write_UL(0)
+
+        self.offsets = offsets = []
+        self.lengths = lengths = []
+        first_item = fp.tell()
+        for frame in self.frames:
+            offsets.append(fp.tell() - first_item)
+            length = 0
+            for fragment in fragment_frame(frame, self.fragments_per_frame):
+                fp.write_tag(ItemTag)
+                fp.write_UL(len(fragment))
+                fp.write(fragment)
+                length += len(fragment)
+
+            lengths.append(length)
+
+        if nr_frames is not None and len(offsets) != nr_frames:
+            raise ValueError(
+                f"The number of frames written ({len(offsets)}) doesn't match "
+                f"the expected number of frames ({nr_frames})"
+            )
+
+        if not self.has_bot or not offsets:
+            return
+
+        if offsets[-1] > 2**32 - 1:
+            raise ValueError(
+                f"The total length of the encapsulated frame data ({offsets[-1]} "
+                "bytes) is greater than the maximum allowed by the Basic "
+                f"Offset Table ({2**32 - 1} bytes), it's recommended that you "
+                "use the Extended Offset Table instead"
+            )
+
+        # Go back and write the frame offsets
+        end = fp.tell()
+        fp.seek(bot_start)
+        endianness = "<" if fp.is_little_endian else ">"
+        fp.write(pack(f"{endianness}{nr_frames}L", *offsets))
+        fp.seek(end)
+
+    def to_bytes(self) -> bytes:
+        """Return the little endian encapsulated frames as :class:`bytes`.
+
+        The returned value is the same as would be written by :meth:`write`,
+        and if `frames` is an iterator then it'll be consumed.
+
+        Returns
+        -------
+        bytes
+            The encapsulated frames, starting with the Basic Offset Table
+            item.
+        """
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        self.write(fp)
+
+        return fp.getvalue()
+
+
 # Deprecated functions
 def _get_frame_offsets(fp: DicomIO) -> tuple[bool, list[int]]:
     """Return a list of the fragment offsets from the Basic Offset Table.
@@ -3,10 +3,11 @@
 
 from collections.abc import Callable
 from io import BytesIO
+import mmap
 import os
 from struct import Struct
 from types import TracebackType
-from typing import cast, Any, TypeVar, Protocol
+from typing import cast, Any, BinaryIO, TypeVar, Protocol
 
 
 ExitException = tuple[
@@ -300,3 +301,140 @@ class DicomBytesIO(DicomIO):
         super().__init__(buffer)
 
         self.getvalue = buffer.getvalue
+
+
+class _MappedBuffer:
+    """A read-only buffer over a :class:`memoryview` with an independent
+    position, used by :class:`DicomMappedIO`.
+    """
+
+    def __init__(self, view: memoryview, name: str | None = None) -> None:
+        self._view = view
+        self._pos = 0
+        self._size = len(view)
+        if name is not None:
+            self.name = name
+
+    def read(self, size: int = -1, /) -> bytes:
+        return self.read_view(size).tobytes()
+
+    def read_view(self, size: int = -1, /) -> memoryview:
+        start = self._pos
+        end = self._size if size is None or size < 0 else min(start + size, self._size)
+        self._pos = max(start, end)
+        return self._view[start:end]
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence value '{whence}'")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class DicomMappedIO(DicomIO):
+    """Read-only wrapper for memory-mapped files that supports zero-copy reads.
+
+    .. versionadded:: 3.0
+
+    In addition to the usual :meth:`~pydicom.filebase.DicomIO.read` method,
+    which returns a copy of the data as :class:`bytes`, a
+    :meth:`~pydicom.filebase.DicomMappedIO.read_view` method is available that
+    returns a :class:`memoryview` slice of the mapped data without copying it.
+
+    The mapping is kept alive for as long as any of the views returned by
+    :meth:`~pydicom.filebase.DicomMappedIO.read_view` exist, even after
+    :meth:`~pydicom.filebase.DicomMappedIO.close` has been called.
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :func:`~pydicom.filereader.dcmread`
+    """
+
+    def __init__(
+        self,
+        source: "str | os.PathLike[str] | BinaryIO | bytes | bytearray | memoryview",
+        mode: str = "rb",
+    ) -> None:
+        """Create a new ``DicomMappedIO`` instance.
+
+        Parameters
+        ----------
+        source : str | PathLike | file-like | bytes | bytearray | memoryview
+            The path to the file to be memory-mapped, a file-like opened in
+            ``"rb"`` mode with a ``fileno()`` method or a buffer-like object
+            to read from without copying. If a file-like then the new
+            instance will start at the file-like's current position and the
+            caller remains responsible for closing it.
+        mode : str, optional
+            The mode to open the file in, only ``"rb"`` is supported.
+        """
+        if mode != "rb":
+            raise ValueError(f"'{type(self).__name__}' only supports mode 'rb'")
+
+        name: str | None = None
+        offset = 0
+        self._mmap: mmap.mmap | None = None
+        if isinstance(source, bytes | bytearray | memoryview):
+            view = memoryview(source).cast("B")
+        else:
+            if isinstance(source, str | os.PathLike):
+                name = os.fspath(source)
+                with open(name, "rb") as f:
+                    self._mmap = self._map(f.fileno())
+            else:
+                name = getattr(source, "name", None)
+                offset = source.tell()
+                self._mmap = self._map(source.fileno())
+
+            view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+        self._view = view
+        buffer = _MappedBuffer(view, name)
+        buffer.seek(offset)
+        super().__init__(buffer)
+
+        self.read_view = buffer.read_view
+
+    @staticmethod
+    def _map(fileno: int) -> mmap.mmap | None:
+        """Return a read-only memory map of the file with `fileno`."""
+        # Empty files can't be mapped
+        if os.fstat(fileno).st_size == 0:
+            return None
+
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def close(self, *args: Any, **kwargs: Any) -> None:
+        """Release the mapping.
+
+        If views returned by :meth:`read_view` still exist then the memory
+        map will only be unmapped once they have all been garbage collected.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Exported views still exist, let them keep the map alive
+                pass
+
+            self._mmap = None
+
+    def read_view(self, size: int = -1, /) -> memoryview:
+        """Return up to `size` bytes from the buffer as a :class:`memoryview`
+        without copying them. If `size` is unspecified, all bytes until EOF
+        are returned.
+        """
+        raise NotImplementedError()  # pragma: no cover
@@ -6,31 +6,33 @@
 from io import BytesIO
 import os
 from struct import Struct, unpack
-from typing import BinaryIO, Any, cast
-from collections.abc import Callable, MutableSequence, Iterator
+from itertools import islice
+from typing import BinaryIO, Any, NamedTuple, cast
+from collections.abc import Callable, Iterable, MutableSequence, Iterator
 import zlib
 
 from pydicom import config
 from pydicom.charset import default_encoding, convert_encodings
 from pydicom.config import logger
-from pydicom.datadict import _dictionary_vr_fast
+from pydicom.datadict import _dictionary_vr_fast, keyword_for_tag
 from pydicom.dataelem import (
     DataElement,
     RawDataElement,
     DataElement_from_raw,
     empty_value_for_VR,
 )
-from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
+from pydicom.dataset import Dataset, FileDataset, FileMetaDataset, _CompactElements
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import ReadableBuffer
+from pydicom.filebase import DicomMappedIO, ReadableBuffer
 from pydicom.fileutil import (
+    FileHandleCache,
     read_undefined_length_value,
     path_from_pathlike,
     PathType,
     _unpack_tag,
 )
-from pydicom.misc import size_in_bytes, warn_and_log
-from pydicom.sequence import Sequence
+from pydicom.misc import is_dicom, size_in_bytes, warn_and_log, _imap_ordered
+from pydicom.sequence import Sequence, _EncodedSequence
 from pydicom.tag import (
     ItemTag,
     SequenceDelimiterTag,
@@ -40,10 +42,70 @@ from pydicom.tag import (
 )
 import pydicom.uid
 from pydicom.util.hexutil import bytes2hex
-from pydicom.valuerep import EXPLICIT_VR_LENGTH_32, VR as VR_
+from pydicom.valuerep import BYTES_VR, EXPLICIT_VR_LENGTH_32, VR as VR_
+
+
+if config.have_numpy:
+    import numpy
 
 
 ENCODED_VR = {vr.encode(default_encoding) for vr in VR_}
+_ENCODED_VR_LENGTH_32 = {vr.encode(default_encoding) for vr in EXPLICIT_VR_LENGTH_32}
+
+#: The open file handles used by :func:`read_deferred_data_element`, shared by
+#: all datasets. Use ``deferred_read_cache.invalidate(path)`` to close the
+#: handles for a file or ``deferred_read_cache.close()`` to close them all.
+deferred_read_cache = FileHandleCache()
+
+
+# VRs whose values may be returned as views on memory-mapped files
+_MAPPABLE_VR = BYTES_VR | {VR_.OB_OW}
+
+
+def _is_mappable(tag: int, vr: str | None) -> bool:
+    """Return ``True`` if the value for the element with `tag` and `vr` may be
+    returned as a :class:`memoryview` when reading from a memory-mapped file.
+    """
+    if vr is None:
+        # Implicit VR, so use the dictionary VR instead
+        try:
+            vr = _dictionary_vr_fast(tag)
+        except KeyError:
+            return False
+
+    return vr in _MAPPABLE_VR
+
+
+def _read_value(
+    fp_read: Callable[[int], bytes],
+    fp_read_view: Callable[[int], memoryview] | None,
+    tag: int,
+    vr: str | None,
+    length: int,
+) -> bytes | memoryview | None:
+    """Return the value of the element with `tag`, `vr` and `length`.
+
+    Parameters
+    ----------
+    fp_read : Callable[[int], bytes]
+        The ``read()`` method of the file-like containing the value.
+    fp_read_view : Callable[[int], memoryview] | None
+        The ``read_view()`` method when reading from a memory-mapped file,
+        which is used to return bulk values as views without copying.
+    tag : int
+        The element's tag.
+    vr : str | None
+        The element's VR, or ``None`` if implicit VR.
+    length : int
+        The length of the value, in bytes.
+    """
+    if length == 0:
+        return cast(bytes | None, empty_value_for_VR(vr, raw=True))
+
+    if fp_read_view is not None and _is_mappable(tag, vr):
+        return fp_read_view(length)
+
+    return fp_read(length)
 
 
 def data_element_generator(
@@ -120,8 +182,9 @@ def data_element_generator(
         element_struct_unpack = Struct(f"{endian_chr}HH2sH").unpack
         extra_length_unpack = Struct(f"{endian_chr}L").unpack  # for lookup speed
 
-    # Make local variables so have faster lookup
-    fp_read = fp.read
+    # Make local variables so have faster lookup, memory-mapped files can
+    #   also return bulk values as views without copying
+    fp_read, fp_read_view = fp.read, getattr(fp, "read_view", None)
     fp_seek = fp.seek
     fp_tell = fp.tell
     logger_debug = logger.debug
@@ -234,14 +297,10 @@ def data_element_generator(
                     )
                 fp_seek(fp_tell() + length)
             else:
-                value = (
-                    fp_read(length)
-                    if length > 0
-                    else cast(bytes | None, empty_value_for_VR(vr, raw=True))
-                )
+                value = _read_value(fp_read, fp_read_view, tag, vr, length)
                 if debugging:
                     dotdot = "..." if length > 20 else "   "
-                    displayed_value = value[:20] if value else b""
+                    displayed_value = bytes(value[:20]) if value else b""
                     logger_debug(
                         "%08x: %-34s %s %r %s"
                         % (
@@ -489,7 +548,14 @@ def read_dataset(
     except NotImplementedError as details:
         logger.error(details)
 
-    ds = Dataset(raw_data_elements)
+    if config.settings.compact_datasets:
+        ds = Dataset(
+            _CompactElements(
+                raw_data_elements.values(), is_implicit_VR, is_little_endian
+            )
+        )
+    else:
+        ds = Dataset(raw_data_elements)
 
     encoding: str | MutableSequence[str]
     if 0x00080005 in raw_data_elements:
@@ -515,32 +581,99 @@ def read_sequence(
 ) -> Sequence:
     """Read and return a :class:`~pydicom.sequence.Sequence` -- i.e. a
     :class:`list` of :class:`Datasets<pydicom.dataset.Dataset>`.
+
+    .. versionchanged:: 3.0
+
+        The items are only located when the sequence is read and each item
+        is parsed when it's first accessed.
     """
-    seq = []  # use builtin list to start for speed, convert to Sequence at end
-    is_undefined_length = False
-    if bytelength != 0:  # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
-        if bytelength == 0xFFFFFFFF:
-            is_undefined_length = True
-            bytelength = 0
-
-        fp_tell = fp.tell  # for speed in loop
-        fpStart = fp_tell()
-        while (not bytelength) or (fp_tell() - fpStart < bytelength):
-            file_tell = fp_tell()
-            dataset = read_sequence_item(
-                fp, is_implicit_VR, is_little_endian, encoding, offset
-            )
-            if dataset is None:  # None is returned if hit Sequence Delimiter
+    fp_tell = fp.tell  # for speed in loop
+    fp_start = fp_tell()
+    value_end = fp_start
+    items: list[tuple[int, int]] = []
+    is_undefined_length = bytelength == 0xFFFFFFFF
+    # The items of an explicit VR sequence may have actually been encoded
+    #   using implicit VR, such as those of a UN element inferred to be SQ
+    items_explicit = not is_implicit_VR
+    # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
+    if bytelength != 0:
+        item_unpack = Struct("<HHL" if is_little_endian else ">HHL").unpack
+        while is_undefined_length or fp_tell() - fp_start < bytelength:
+            item_start = fp_tell()
+            try:
+                group, element, length = item_unpack(fp.read(8))
+            except BaseException:
+                raise OSError(
+                    f"No tag to read at file position {item_start + offset:X}"
+                )
+
+            tag = group << 16 | element
+            if tag == 0xFFFEE0DD:
+                # No more items, time to stop reading
+                if config.debugging:
+                    logger.debug(f"{item_start + offset:08x}: End of Sequence")
+                    if length != 0:
+                        logger.warning(
+                            f"Expected 0x00000000 after delimiter, found "
+                            f"0x{length:X}, at position 0x{item_start + 4 + offset:X}"
+                        )
                 break
 
-            dataset.file_tell = file_tell + offset
-            seq.append(dataset)
+            if config.debugging and tag != 0xFFFEE000:
+                # Flag the incorrect item encoding, will usually raise an
+                #   exception afterwards due to the misaligned format
+                logger.warning(
+                    f"Expected sequence item with tag {ItemTag} at file position "
+                    f"0x{item_start + 4 + offset:X}"
+                )
+
+            if items_explicit and length:
+                items_explicit = _is_explicit_item(fp, item_unpack)
+                fp.seek(item_start + 8)
+
+            if length == 0xFFFFFFFF:
+                _skip_undefined_length_item(fp, is_implicit_VR, is_little_endian)
+            else:
+                fp.seek(length, os.SEEK_CUR)
+
+            items.append((item_start - fp_start, fp_tell() - fp_start))
+            value_end = fp_tell()
+
+    # Keep the encoded items so they can be parsed when first accessed
+    fp_end = fp_tell()
+    fp.seek(fp_start)
+    value = fp.read(value_end - fp_start)
+    fp.seek(fp_end)
 
-    sequence = Sequence(seq)
+    encoded = _EncodedSequence(
+        value, is_implicit_VR, is_little_endian, encoding, fp_start + offset
+    )
+    sequence = Sequence._from_encoded(encoded, items)
     sequence.is_undefined_length = is_undefined_length
+    if not is_implicit_VR and not items_explicit:
+        # Items that don't match the sequence's encoding can't be written
+        #   as-is, so have to be parsed and re-encoded instead
+        sequence._is_unmodified = False
+
     return sequence
 
 
+def _is_explicit_item(fp: BinaryIO, item_unpack: Callable[[bytes], Any]) -> bool:
+    """Return ``False`` if the first element of the item at the current
+    position in `fp` is encoded using implicit VR, ``True`` otherwise.
+    """
+    header = fp.read(8)
+    if len(header) < 8:
+        return True
+
+    group, element, _ = item_unpack(header)
+    if group << 16 | element == 0xFFFEE00D:
+        # Empty undefined length item
+        return True
+
+    return header[4:6] in ENCODED_VR
+
+
 def read_sequence_item(
     fp: BinaryIO,
     is_implicit_VR: bool,
@@ -789,55 +922,26 @@ def _at_pixel_data(tag: BaseTag, vr: str | None, length: int) -> bool:
     return tag in {0x7FE00010, 0x7FE00009, 0x7FE00008}
 
 
-def read_partial(
-    fileobj: BinaryIO,
-    stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
-    defer_size: int | str | float | None = None,
-    force: bool = False,
-    specific_tags: list[BaseTag | int] | None = None,
-) -> FileDataset:
-    """Parse a DICOM file until a condition is met.
+def _dataset_encoding(
+    fileobj: BinaryIO, transfer_syntax: pydicom.uid.UID | None
+) -> tuple[BinaryIO, bool, bool]:
+    """Return the file-like to read the dataset from and its encoding.
 
     Parameters
     ----------
-    fileobj : a file-like object
-        Note that the file will not close when the function returns.
-    stop_when :
-        Stop condition. See :func:`read_dataset` for more info.
-    defer_size : int, str or float, optional
-        See :func:`dcmread` for parameter info.
-    force : bool
-        See :func:`dcmread` for parameter info.
-    specific_tags : list or None
-        See :func:`dcmread` for parameter info.
-
-    Notes
-    -----
-    Use :func:`dcmread` unless you need to stop on some condition other than
-    reaching pixel data.
+    fileobj : file-like
+        The file-like positioned at the start of the dataset.
+    transfer_syntax : pydicom.uid.UID | None
+        The *Transfer Syntax UID* from the File Meta Information, or ``None``
+        if not available.
 
     Returns
     -------
-    dataset.FileDataset
-        The read dataset.
-
-    See Also
-    --------
-    dcmread
-        More generic file reading function.
+    tuple[file-like, bool, bool]
+        The file-like to read the dataset from, which will be a new file-like
+        for a deflated transfer syntax, and whether the dataset is encoded
+        using implicit VR and little endian.
     """
-    # Read File Meta Information
-
-    # Read preamble (if present)
-    preamble = read_preamble(fileobj, force)
-    # Read any File Meta Information group (0002,eeee) elements (if present)
-    file_meta = _read_file_meta_info(fileobj)
-
-    # Read Dataset
-
-    # Read any Command Set group (0000,eeee) elements (if present)
-    command_set = _read_command_set_elements(fileobj)
-
     # Check to see if there's anything left to read
     peek = fileobj.read(1)
     if peek != b"":
@@ -849,7 +953,6 @@ def read_partial(
     # transfer syntax of implicit VR little endian and correct it as necessary
     is_implicit_VR = True
     is_little_endian = True
-    transfer_syntax = file_meta.get("TransferSyntaxUID")
     if peek == b"":  # EOF
         pass
     elif transfer_syntax is None:  # issue 258
@@ -897,15 +1000,72 @@ def read_partial(
     elif transfer_syntax in pydicom.uid.PrivateTransferSyntaxes:
         # Replace with the registered UID as it has the encoding information
         index = pydicom.uid.PrivateTransferSyntaxes.index(transfer_syntax)
-        transfer_syntax = pydicom.uid.PrivateTransferSyntaxes[index]
-        is_implicit_VR = transfer_syntax.is_implicit_VR
-        is_little_endian = transfer_syntax.is_little_endian
+        private_syntax = pydicom.uid.PrivateTransferSyntaxes[index]
+        is_implicit_VR = private_syntax.is_implicit_VR
+        is_little_endian = private_syntax.is_little_endian
     else:
         # Any other syntax should be Explicit VR Little Endian,
         #   e.g. all Encapsulated (JPEG etc) are ExplVR-LE
         #        by Standard PS 3.5-2008 A.4 (p63)
         is_implicit_VR = False
 
+    return fileobj, is_implicit_VR, is_little_endian
+
+
+def read_partial(
+    fileobj: BinaryIO,
+    stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
+    defer_size: int | str | float | None = None,
+    force: bool = False,
+    specific_tags: list[BaseTag | int] | None = None,
+) -> FileDataset:
+    """Parse a DICOM file until a condition is met.
+
+    Parameters
+    ----------
+    fileobj : a file-like object
+        Note that the file will not close when the function returns.
+    stop_when :
+        Stop condition. See :func:`read_dataset` for more info.
+    defer_size : int, str or float, optional
+        See :func:`dcmread` for parameter info.
+    force : bool
+        See :func:`dcmread` for parameter info.
+    specific_tags : list or None
+        See :func:`dcmread` for parameter info.
+
+    Notes
+    -----
+    Use :func:`dcmread` unless you need to stop on some condition other than
+    reaching pixel data.
+
+    Returns
+    -------
+    dataset.FileDataset
+        The read dataset.
+
+    See Also
+    --------
+    dcmread
+        More generic file reading function.
+    """
+    # Read File Meta Information
+
+    # Read preamble (if present)
+    preamble = read_preamble(fileobj, force)
+    # Read any File Meta Information group (0002,eeee) elements (if present)
+    file_meta = _read_file_meta_info(fileobj)
+
+    # Read Dataset
+
+    # Read any Command Set group (0000,eeee) elements (if present)
+    command_set = _read_command_set_elements(fileobj)
+
+    transfer_syntax = file_meta.get("TransferSyntaxUID")
+    fileobj, is_implicit_VR, is_little_endian = _dataset_encoding(
+        fileobj, transfer_syntax
+    )
+
     # Try and decode the dataset
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
@@ -946,6 +1106,7 @@ def dcmread(
     stop_before_pixels: bool = False,
     force: bool = False,
     specific_tags: TagListType | None = None,
+    mmap: bool = False,
 ) -> FileDataset:
     """Read and parse a DICOM dataset stored in the DICOM File Format.
 
@@ -1000,6 +1161,17 @@ def dcmread(
         elements can be tags or keywords. Note that the element (0008,0005)
         *Specific Character Set* is always returned if present - this ensures
         correct decoding of returned text values.
+    mmap : bool, optional
+        If ``True`` then memory-map the file rather than reading it, and return
+        the values of elements with a VR of **OB**, **OD**, **OF**, **OL**,
+        **OV**, **OW** or **UN** (such as *Pixel Data*) as :class:`memoryview`
+        slices of the mapping instead of copying them into :class:`bytes`.
+        `fp` must be a path or a file-like with a ``fileno()`` method. The
+        mapping remains open for as long as the dataset references it, copying
+        or pickling the dataset converts the views to :class:`bytes`. Default
+        ``False``.
+
+        .. versionadded:: 3.0
 
     Returns
     -------
@@ -1024,7 +1196,21 @@ def dcmread(
     # Open file if not already a file object
     caller_owns_file = True
     fp = path_from_pathlike(fp)
-    if isinstance(fp, str):
+    if mmap:
+        if not isinstance(fp, str):
+            try:
+                fp.fileno()  # type: ignore[union-attr]
+            except (AttributeError, OSError):
+                raise TypeError(
+                    "dcmread: 'mmap' requires a file path or a file-like with "
+                    f"a 'fileno()' method, but got {type(fp).__name__}"
+                )
+
+        # We own the mapping, but not any file-like it was created from
+        caller_owns_file = False
+        logger.debug(f"Memory-mapping file '{getattr(fp, 'name', fp)}'")
+        fp = cast(BinaryIO, DicomMappedIO(fp))
+    elif isinstance(fp, str):
         # caller provided a file name; we own the file handle
         caller_owns_file = False
         logger.debug(f"Reading file '{fp}'")
@@ -1046,7 +1232,7 @@ def dcmread(
         logger.debug(
             f"filename: {getattr(fp, 'name', '<none>')}, defer_size={defer_size}, "
             f"stop_before_pixels={stop_before_pixels}, force={force}, "
-            f"specific_tags={specific_tags}"
+            f"specific_tags={specific_tags}, mmap={mmap}"
         )
         if caller_owns_file:
             logger.debug("Caller passed file object")
@@ -1078,6 +1264,912 @@ def dcmread(
     return dataset
 
 
+def scan_headers(
+    paths: Iterable[PathType | BinaryIO],
+    tags: TagListType,
+    *,
+    columnar: bool = False,
+    force: bool = False,
+) -> list[dict[BaseTag, Any]] | dict[BaseTag, list[Any]]:
+    """Return the values of top-level elements from the headers of many
+    DICOM files.
+
+    .. versionadded:: 3.0
+
+    Unlike :func:`dcmread`, no :class:`~pydicom.dataset.FileDataset` is
+    created. Only the element headers are parsed, with the values of
+    unwanted elements (including those of undefined length sequences)
+    skipped over by seeking, and reading ends as soon as the last of the
+    requested elements has been passed. This makes it suitable for indexing
+    large numbers of files.
+
+    Examples
+    --------
+
+    >>> from pydicom.filereader import scan_headers
+    >>> rows = scan_headers(paths, ["PatientID", "StudyInstanceUID"])
+    >>> rows[0][Tag("PatientID")]
+    '12345'
+    >>> batch = scan_headers(paths, ["PatientID"], columnar=True)
+    >>> batch[Tag("PatientID")]
+    ['12345', '67890']
+
+    Parameters
+    ----------
+    paths : Iterable[str | PathLike | file-like]
+        The paths to the DICOM files or file-likes opened in ``"rb"`` mode.
+        File-likes are read from their current position and are not closed.
+    tags : list[int | str | tuple[int, int] | BaseTag]
+        The tags of the top-level elements to return, either as tags or
+        element keywords. File Meta Information elements may also be used.
+    columnar : bool, optional
+        If ``False`` (default) then return a row for each file, otherwise
+        return a single batch with a column for each tag.
+    force : bool, optional
+        If ``True`` then read files that are missing the DICOM File Meta
+        Information header, see :func:`dcmread` (default ``False``).
+
+    Returns
+    -------
+    list[dict[BaseTag, Any]] | dict[BaseTag, list[Any]]
+        If `columnar` is ``False`` then a list of ``{tag: value}`` for each
+        file, otherwise a ``{tag: list of values}`` with a value for each
+        file. Values are converted as for :attr:`DataElement.value
+        <pydicom.dataelem.DataElement.value>` and are ``None`` for elements
+        that aren't in a file.
+
+    Raises
+    ------
+    InvalidDicomError
+        If `force` is ``False`` and a file is missing the DICOM File Meta
+        Information header.
+
+    See Also
+    --------
+    dcmread
+        Read a DICOM dataset.
+    """
+    requested = [Tag(tag) for tag in tags]
+    rows = [_scan_header(path, requested, force) for path in paths]
+    if not columnar:
+        return rows
+
+    return {tag: [row[tag] for row in rows] for tag in requested}
+
+
+def _scan_header(
+    src: PathType | BinaryIO, tags: list[BaseTag], force: bool = False
+) -> dict[BaseTag, Any]:
+    """Return the values of the top-level elements with `tags` from `src`.
+
+    Parameters
+    ----------
+    src : str | PathLike | file-like
+        The path to the DICOM file or a file-like opened in ``"rb"`` mode.
+    tags : list[BaseTag]
+        The tags of the top-level elements to return.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    dict[BaseTag, Any]
+        The converted element values as ``{tag: value}``, with a value of
+        ``None`` for elements that are missing.
+    """
+    src = path_from_pathlike(src)
+    if isinstance(src, str):
+        with open(src, "rb") as f:
+            return _scan_header(f, tags, force)
+
+    fp = cast(BinaryIO, src)
+    tag_set: set[int] = set(tags)
+    values: dict[BaseTag, Any] = dict.fromkeys(tags)
+
+    read_preamble(fp, force)
+
+    # File Meta Information elements are always explicit VR little endian
+    transfer_syntax = None
+    meta_tags = tag_set | {0x00020010}  # Transfer Syntax UID
+    for elem in _scan_elements(fp, False, True, meta_tags, 0x0002FFFF):
+        if isinstance(elem, RawDataElement):
+            elem = DataElement_from_raw(elem)
+
+        if elem.tag == 0x00020010 and elem.value:
+            transfer_syntax = pydicom.uid.UID(elem.value)
+
+        if elem.tag in tag_set:
+            values[elem.tag] = elem.value
+
+    fp, is_implicit_VR, is_little_endian = _dataset_encoding(fp, transfer_syntax)
+
+    encoding: str | MutableSequence[str] = default_encoding
+    dataset_tags = tag_set | {0x00080005}  # Specific Character Set
+    last_tag = max(tags, default=0)
+    for elem in _scan_elements(
+        fp, is_implicit_VR, is_little_endian, dataset_tags, last_tag, encoding
+    ):
+        if isinstance(elem, RawDataElement):
+            elem = DataElement_from_raw(elem, encoding)
+
+        if elem.tag == 0x00080005:
+            encoding = convert_encodings(elem.value or default_encoding)
+
+        if elem.tag in tag_set:
+            values[elem.tag] = elem.value
+
+    return values
+
+
+def _scan_elements(
+    fp: BinaryIO,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+    tags: set[int],
+    last_tag: int,
+    encoding: str | MutableSequence[str] = default_encoding,
+) -> Iterator[RawDataElement | DataElement]:
+    """Yield the elements with `tags` from `fp`, skipping over all others.
+
+    Only the element headers are read, with unwanted values skipped by
+    seeking. Scanning ends at the end of the file, at an *Item Delimitation
+    Item* or before the first element with a tag greater than `last_tag`.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like positioned at the start of an element.
+    is_implicit_VR : bool
+        ``True`` if the data is encoded as implicit VR, ``False`` otherwise.
+    is_little_endian : bool
+        ``True`` if the data is encoded as little endian, ``False`` otherwise.
+    tags : set[int]
+        The tags of the elements to yield.
+    last_tag : int
+        The largest tag to scan to.
+    encoding : str | MutableSequence[str], optional
+        The character encoding to use when parsing undefined length
+        sequences.
+
+    Yields
+    ------
+    RawDataElement | DataElement
+        Yields DataElement for undefined length SQ, RawDataElement
+        otherwise.
+    """
+    endian_chr = "><"[is_little_endian]
+    implicit_VR_unpack = Struct(f"{endian_chr}HHL").unpack
+    explicit_VR_unpack = Struct(f"{endian_chr}HH2sH").unpack
+    extra_length_unpack = Struct(f"{endian_chr}L").unpack
+
+    fp_read = fp.read
+    fp_seek = fp.seek
+    fp_tell = fp.tell
+    # Plain int comparisons are much faster than those with BaseTag
+    tags = {int(tag) for tag in tags}
+    last_tag = int(last_tag)
+
+    while len(bytes_read := fp_read(8)) == 8:
+        # The VR is only decoded for the elements that are yielded
+        raw_vr = None
+        header_length = 8
+        if is_implicit_VR:
+            group, elem, length = implicit_VR_unpack(bytes_read)
+        else:
+            group, elem, raw_vr, length = explicit_VR_unpack(bytes_read)
+            if raw_vr in _ENCODED_VR_LENGTH_32:
+                length = extra_length_unpack(fp_read(4))[0]
+                header_length = 12
+            elif raw_vr in ENCODED_VR:
+                pass
+            elif not (b"AA" <= raw_vr <= b"ZZ") and config.assume_implicit_vr_switch:
+                # Same handling of a switch to implicit VR as
+                #   data_element_generator()
+                raw_vr = None
+                group, elem, length = implicit_VR_unpack(bytes_read)
+
+        tag = group << 16 | elem
+        if tag == 0xFFFEE00D:
+            # End of the current item dataset
+            return
+
+        if tag > last_tag:
+            fp_seek(-header_length, os.SEEK_CUR)
+            return
+
+        if tag not in tags:
+            if length == 0xFFFFFFFF:
+                _skip_undefined_length(fp, is_implicit_VR, is_little_endian)
+            else:
+                fp_seek(length, os.SEEK_CUR)
+
+            continue
+
+        if length == 0xFFFFFFFF:
+            # Parse undefined length values in the usual way
+            fp_seek(-header_length, os.SEEK_CUR)
+            yield next(
+                data_element_generator(
+                    fp, is_implicit_VR, is_little_endian, encoding=encoding
+                )
+            )
+            continue
+
+        vr = None if raw_vr is None else raw_vr.decode(default_encoding)
+        value_tell = fp_tell()
+        if length == 0:
+            value = cast(bytes | None, empty_value_for_VR(vr, raw=True))
+        else:
+            value = fp_read(length)
+
+        yield RawDataElement(
+            BaseTag(tag),
+            vr,
+            length,
+            value,
+            value_tell,
+            is_implicit_VR,
+            is_little_endian,
+        )
+
+
+def _skip_undefined_length(
+    fp: BinaryIO, is_implicit_VR: bool, is_little_endian: bool
+) -> None:
+    """Skip past the value of an undefined length element.
+
+    The value may be the items of a sequence or the fragments of
+    encapsulated data, either way it ends with a *Sequence Delimitation
+    Item*. Undefined length items are skipped by scanning their elements.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like positioned at the start of the value.
+    is_implicit_VR : bool
+        ``True`` if the data is encoded as implicit VR, ``False`` otherwise.
+    is_little_endian : bool
+        ``True`` if the data is encoded as little endian, ``False`` otherwise.
+    """
+    item_unpack = Struct(f"{'><'[is_little_endian]}HHL").unpack
+    while len(bytes_read := fp.read(8)) == 8:
+        group, elem, length = item_unpack(bytes_read)
+        if group << 16 | elem == SequenceDelimiterTag:
+            return
+
+        if length != 0xFFFFFFFF:
+            fp.seek(length, os.SEEK_CUR)
+            continue
+
+        _skip_undefined_length_item(fp, is_implicit_VR, is_little_endian)
+
+
+def _skip_undefined_length_item(
+    fp: BinaryIO, is_implicit_VR: bool, is_little_endian: bool
+) -> None:
+    """Skip past the dataset of an undefined length sequence item.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like positioned at the start of the item's dataset.
+    is_implicit_VR : bool
+        ``True`` if the sequence is encoded as implicit VR, ``False``
+        otherwise. Items in an explicit VR sequence may use implicit VR.
+    is_little_endian : bool
+        ``True`` if the data is encoded as little endian, ``False`` otherwise.
+    """
+    fp_start = fp.tell()
+    is_implicit_VR = _is_implicit_vr(
+        fp, is_implicit_VR, is_little_endian, stop_when=None, is_sequence=True
+    )
+    fp.seek(fp_start)
+
+    # Scan to the end of the item, nothing is yielded without any tags
+    for _ in _scan_elements(fp, is_implicit_VR, is_little_endian, set(), 0xFFFFFFFF):
+        pass
+
+
+class HeaderBatch(NamedTuple):
+    """A batch of header values from :func:`scan_directory`.
+
+    .. versionadded:: 3.0
+    """
+
+    #: The paths to the files that were read successfully
+    paths: list[str]
+    #: The values for each file in `paths`, either as ``{tag: list of values}``
+    #: or a NumPy structured array
+    values: "dict[BaseTag, list[Any]] | numpy.ndarray"
+    #: The path and exception for each file that couldn't be read
+    errors: list[tuple[str, Exception]]
+
+
+def scan_directory(
+    path: PathType,
+    tags: TagListType,
+    *,
+    recursive: bool = True,
+    check_dicom: bool = False,
+    force: bool = False,
+    batch_size: int = 1000,
+    workers: int = 1,
+    as_array: bool = False,
+) -> Iterator[HeaderBatch]:
+    """Yield batches of top-level element values from the DICOM files in a
+    directory.
+
+    .. versionadded:: 3.0
+
+    The files are read using :func:`scan_headers`, with each batch of files
+    read in a separate process when `workers` is greater than ``1``. Files
+    that can't be read are recorded in the batch's
+    :attr:`~HeaderBatch.errors` rather than ending the scan.
+
+    Examples
+    --------
+
+    >>> from pydicom.filereader import scan_directory
+    >>> tags = ["PatientID", "SOPInstanceUID"]
+    >>> for batch in scan_directory("path/to/dir", tags, workers=4):
+    ...     index.append(batch.paths, batch.values)
+    ...     for path, exc in batch.errors:
+    ...         print(f"Unable to read '{path}': {exc}")
+
+    Parameters
+    ----------
+    path : str | PathLike
+        The directory containing the files to be read.
+    tags : list[int | str | tuple[int, int] | BaseTag]
+        The tags of the top-level elements to return, either as tags or
+        element keywords.
+    recursive : bool, optional
+        If ``True`` (default) then also read the files in any
+        subdirectories.
+    check_dicom : bool, optional
+        If ``True`` then skip any files that don't have a DICOM File Meta
+        Information header, as determined by
+        :func:`~pydicom.misc.is_dicom`, without recording an error (default
+        ``False``).
+    force : bool, optional
+        If ``True`` then read files that are missing the DICOM File Meta
+        Information header, see :func:`dcmread` (default ``False``).
+    batch_size : int, optional
+        The maximum number of files in each batch (default ``1000``).
+    workers : int, optional
+        The maximum number of processes to use when reading (default ``1``).
+        No more than ``2 * workers`` batches are read ahead of the one being
+        yielded.
+    as_array : bool, optional
+        If ``False`` (default) then the values will be a
+        ``{tag: list of values}``, otherwise they'll be a NumPy structured
+        array with a field for each tag, named after its keyword or the
+        tag's hex value for unknown and private tags. Requires NumPy.
+
+    Yields
+    ------
+    HeaderBatch
+        The values, successfully read paths and any errors for each batch of
+        files. The batches are yielded in the order the files were found,
+        which is sorted alphabetically within each directory.
+
+    See Also
+    --------
+    scan_headers
+    """
+    if as_array and not config.have_numpy:
+        raise ImportError("NumPy is required when 'as_array' is True")
+
+    if batch_size < 1:
+        raise ValueError("'batch_size' must be greater than 0")
+
+    requested = [Tag(tag) for tag in tags]
+    batches = (
+        (paths, requested, check_dicom, force)
+        for paths in _batched(_walk_files(path, recursive), batch_size)
+    )
+    if workers > 1:
+        results = _imap_ordered(_scan_batch, batches, workers)
+    else:
+        results = (_scan_batch(*item) for item in batches)
+
+    for batch in results:
+        if as_array:
+            batch = batch._replace(values=_as_structured_array(batch.values))
+
+        yield batch
+
+
+def _walk_files(path: PathType, recursive: bool) -> Iterator[str]:
+    """Yield the paths to the files in the directory at `path`, sorted by
+    name within each directory.
+    """
+    root = os.fspath(path)
+    if not recursive:
+        with os.scandir(root) as entries:
+            files = sorted(entry.path for entry in entries if entry.is_file())
+
+        yield from files
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            yield os.path.join(dirpath, filename)
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Yield lists of up to `size` consecutive items from `items`."""
+    items = iter(items)
+    while batch := list(islice(items, size)):
+        yield batch
+
+
+def _scan_batch(
+    paths: list[str], tags: list[BaseTag], check_dicom: bool, force: bool
+) -> HeaderBatch:
+    """Return the values of the elements with `tags` for the files at
+    `paths`.
+
+    Used as the worker function by :func:`scan_directory`.
+    """
+    values: dict[BaseTag, list[Any]] = {tag: [] for tag in tags}
+    read: list[str] = []
+    errors: list[tuple[str, Exception]] = []
+    for path in paths:
+        try:
+            if check_dicom and not is_dicom(path):
+                continue
+
+            row = _scan_header(path, tags, force)
+        except Exception as exc:
+            errors.append((path, exc))
+            continue
+
+        read.append(path)
+        for tag, value in row.items():
+            values[tag].append(value)
+
+    return HeaderBatch(read, values, errors)
+
+
+def _as_structured_array(values: dict[BaseTag, list[Any]]) -> "numpy.ndarray":
+    """Return the columnar `values` as a NumPy structured array.
+
+    Columns of single integer values use an ``int64`` field and columns of
+    single integer or float values with any missing values use a
+    ``float64`` field with ``NaN`` for the missing values. All other columns
+    use an ``object`` field.
+    """
+    fields: list[tuple[str, str]] = []
+    for tag, column in values.items():
+        name = keyword_for_tag(tag) or f"{tag:08X}"
+        numbers = [v for v in column if v is not None]
+        if not numbers or not all(isinstance(v, int | float) for v in numbers):
+            fields.append((name, "O"))
+        elif len(numbers) == len(column) and all(isinstance(v, int) for v in numbers):
+            fields.append((name, "i8"))
+        else:
+            fields.append((name, "f8"))
+
+    length = len(next(iter(values.values()), []))
+    arr = numpy.empty(length, dtype=fields)
+    for (name, dtype), column in zip(fields, values.values()):
+        if dtype == "O":
+            # Assign item by item so multi-valued elements aren't broadcast
+            field = arr[name]
+            for idx, value in enumerate(column):
+                field[idx] = value
+        else:
+            arr[name] = [numpy.nan if v is None else v for v in column]
+
+    return arr
+
+
+# The NumPy dtype used for the values of each binary numeric VR
+_NUMERIC_VR_DTYPE: dict[str, str] = {
+    VR_.FD: "f8",
+    VR_.FL: "f4",
+    VR_.SL: "i4",
+    VR_.SS: "i2",
+    VR_.SV: "i8",
+    VR_.UL: "u4",
+    VR_.US: "u2",
+    VR_.UV: "u8",
+}
+
+_ItemElement = tuple[RawDataElement | DataElement | None, str | MutableSequence[str]]
+
+
+def _sequence_array(ds: Dataset, path: list[BaseTag]) -> "numpy.ndarray":
+    """Return the values of an element in each item of a sequence in `ds`.
+
+    Items that haven't been parsed yet are searched for the element using
+    their encoded data, without creating any nested datasets or sequence
+    items.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset containing the sequence.
+    path : list[BaseTag]
+        The tags of the top-level sequence, any nested sequences and the
+        element to return the values of. The first item of each nested
+        sequence is used.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values, one row per item of the top-level sequence.
+    """
+    seq = ds[path[0]].value
+    if not isinstance(seq, Sequence):
+        raise ValueError(f"The element {path[0]} in the path is not a sequence")
+
+    fp = BytesIO(seq._encoded.value) if seq._encoded is not None else None
+    elements = [_item_element(seq, idx, path[1:], fp) for idx in range(len(seq._list))]
+
+    return _elements_as_array(elements)
+
+
+def _item_element(
+    seq: Sequence, index: int, path: list[BaseTag], fp: BytesIO | None = None
+) -> _ItemElement:
+    """Return the element at the end of `path` in the item at `index` in `seq`
+    and the character encoding for its value.
+
+    Parameters
+    ----------
+    seq : pydicom.sequence.Sequence
+        The sequence to search.
+    index : int
+        The index of the item to search.
+    path : list[BaseTag]
+        The tags of any nested sequences and the element to return. The first
+        item of each nested sequence is used.
+    fp : io.BytesIO, optional
+        The encoded value of `seq`, if available.
+
+    Returns
+    -------
+    tuple[RawDataElement | DataElement | None, str | MutableSequence[str]]
+        The element, or ``None`` if it's not present, and the encoding to use
+        when decoding its value.
+    """
+    tag = path[0]
+    item = seq._list[index]
+    elem: RawDataElement | DataElement | None = None
+    if isinstance(item, Dataset):
+        elem = item._dict.get(tag)
+        encoding: str | MutableSequence[str] = item._character_set
+    else:
+        encoded = cast(_EncodedSequence, seq._encoded)
+        fp = fp or BytesIO(encoded.value)
+        fp.seek(item.start + 8)
+        encoding = encoded.encoding
+        for elem in data_element_generator(
+            fp,
+            encoded.is_implicit_VR,
+            encoded.is_little_endian,
+            stop_when=lambda t, vr, length: t > tag,
+            encoding=encoding,
+            specific_tags=[0x00080005, tag],
+        ):
+            if elem.tag == 0x00080005:
+                charset = DataElement_from_raw(elem).value
+                encoding = convert_encodings(charset or default_encoding)
+                elem = None
+
+    if elem is None or len(path) == 1:
+        return elem, encoding
+
+    # Search the first item of the nested sequence
+    if isinstance(item, Dataset):
+        nested = item[tag].value
+    elif isinstance(elem, RawDataElement) and elem.value is not None:
+        if (elem.VR or _dictionary_vr_fast(tag)) != VR_.SQ:
+            raise ValueError(f"The element {tag} in the path is not a sequence")
+
+        nested = read_sequence(
+            BytesIO(elem.value),
+            elem.is_implicit_VR,
+            elem.is_little_endian,
+            elem.length,
+            encoding,
+        )
+    else:
+        nested = elem.value
+
+    if not isinstance(nested, Sequence):
+        raise ValueError(f"The element {tag} in the path is not a sequence")
+
+    return _item_element(nested, 0, path[1:]) if nested else (None, encoding)
+
+
+def _elements_as_array(elements: list[_ItemElement]) -> "numpy.ndarray":
+    """Return the values of `elements` as a :class:`numpy.ndarray`.
+
+    Binary numeric values and **DS** and **IS** values are converted directly
+    from their encoded values when every element has the same VR and
+    multiplicity. Items without a value are ``NaN`` in numeric arrays.
+    """
+    has_value = [
+        elem is not None and elem.value is not None and elem.value != b""
+        for elem, _ in elements
+    ]
+    present = [elem for (elem, _), keep in zip(elements, has_value) if keep]
+    arr = _raw_values_as_array(present) if present else None
+    if arr is None:
+        return _values_as_array(
+            [
+                (
+                    DataElement_from_raw(elem, encoding).value
+                    if isinstance(elem, RawDataElement)
+                    else getattr(elem, "value", None)
+                )
+                for elem, encoding in elements
+            ]
+        )
+
+    if len(present) == len(elements):
+        return arr
+
+    # Fill any missing values with NaN
+    out = numpy.full((len(elements), *arr.shape[1:]), numpy.nan)
+    out[has_value] = arr
+    return out
+
+
+def _raw_values_as_array(elements: list[Any]) -> "numpy.ndarray | None":
+    """Return the encoded values of `elements` as a :class:`numpy.ndarray`
+    or ``None`` if they can't be converted directly.
+    """
+    if not all(isinstance(elem, RawDataElement) for elem in elements):
+        return None
+
+    vrs = set()
+    for elem in elements:
+        try:
+            vrs.add(elem.VR or _dictionary_vr_fast(elem.tag))
+        except KeyError:
+            return None
+
+    is_little_endian = {elem.is_little_endian for elem in elements}
+    if len(vrs) != 1 or len(is_little_endian) != 1:
+        return None
+
+    vr = vrs.pop()
+    values = [elem.value for elem in elements]
+    if vr in _NUMERIC_VR_DTYPE:
+        dtype = numpy.dtype(_NUMERIC_VR_DTYPE[vr])
+        widths = {len(value) // dtype.itemsize for value in values}
+        if len(widths) != 1 or any(len(value) % dtype.itemsize for value in values):
+            return None
+
+        dtype = dtype.newbyteorder("<" if is_little_endian.pop() else ">")
+        arr = numpy.frombuffer(b"".join(values), dtype=dtype)
+        arr = arr.astype(dtype.newbyteorder("="))
+    elif vr in (VR_.DS, VR_.IS):
+        widths = {value.count(b"\\") + 1 for value in values}
+        if len(widths) != 1:
+            return None
+
+        try:
+            arr = numpy.array(b"\\".join(values).split(b"\\"))
+            arr = arr.astype("f8" if vr == VR_.DS else "i8")
+        except ValueError:
+            # Non-conformant values, e.g. IS with a fractional part
+            return None
+    else:
+        return None
+
+    width = widths.pop()
+    return arr.reshape(-1, width) if width > 1 else arr
+
+
+def _values_as_array(values: list[Any]) -> "numpy.ndarray":
+    """Return the converted element `values` as a :class:`numpy.ndarray`.
+
+    Numeric values with the same multiplicity use a numeric array with
+    ``NaN`` for missing values, otherwise an ``object`` array is used.
+    """
+    rows = [list(v) if isinstance(v, MutableSequence) else v for v in values]
+    present = [row for row in rows if row is not None and row != ""]
+    widths = {len(row) if isinstance(row, list) else 1 for row in present}
+    is_numeric = all(
+        isinstance(v, int | float)
+        for row in present
+        for v in (row if isinstance(row, list) else [row])
+    )
+    if present and is_numeric and len(widths) == 1:
+        width = widths.pop()
+        missing = [numpy.nan] * width if width > 1 else numpy.nan
+        return numpy.array(
+            [missing if row is None or row == "" else row for row in rows]
+        )
+
+    arr = numpy.empty(len(values), dtype=object)
+    # Assign item by item so multi-valued elements aren't broadcast
+    for idx, value in enumerate(values):
+        arr[idx] = value
+
+    return arr
+
+
+def _contour_arrays(
+    ds: Dataset,
+) -> dict[int, tuple["numpy.ndarray", "numpy.ndarray"]]:
+    """Return the *Contour Data* for each ROI in the *ROI Contour Sequence*
+    of `ds`.
+
+    Items that haven't been parsed yet are searched using their encoded data
+    and the encoded *Contour Data* values for all the ROIs are converted
+    together.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The RT Structure Set dataset.
+
+    Returns
+    -------
+    dict[int, tuple[numpy.ndarray, numpy.ndarray]]
+        The ``(points, offsets)`` for each ROI as ``{ROI number: (points,
+        offsets)}``, see :meth:`Dataset.contour_arrays()
+        <pydicom.dataset.Dataset.contour_arrays>`.
+    """
+    from pydicom.values import convert_DS_array
+
+    seq = ds[0x30060039].value
+    if not isinstance(seq, Sequence):
+        raise ValueError("The (3006,0039) 'ROI Contour Sequence' is not a sequence")
+
+    # The Contour Data for all the contours, with the ROI number and index
+    #   of the first contour for each ROI
+    contours: list[bytes | Any] = []
+    rois: list[tuple[int, int]] = []
+    fp = BytesIO(seq._encoded.value) if seq._encoded is not None else None
+    for index in range(len(seq._list)):
+        rois.append((_roi_contours(seq, index, contours, fp), len(contours)))
+
+    # Contour Data is DS so encoded values can be joined and converted at once
+    if all(isinstance(value, bytes) for value in contours):
+        encoded = [value for value in contours if value.strip()]
+        values = cast("numpy.ndarray", convert_DS_array(b"\\".join(encoded)))
+        nr_values = [
+            value.count(b"\\") + 1 if value.strip() else 0 for value in contours
+        ]
+    else:
+        arrays = [
+            (
+                convert_DS_array(value)
+                if isinstance(value, bytes)
+                else numpy.asarray(value, dtype="f8").ravel()
+            )
+            for value in contours
+        ]
+        values = numpy.concatenate(arrays) if arrays else numpy.empty(0, dtype="f8")
+        nr_values = [len(arr) for arr in arrays]
+
+    counts = numpy.asarray(nr_values, dtype="i8")
+    if len(values) % 3 or numpy.any(counts % 3):
+        raise ValueError(
+            "Unable to return the contour points as one or more 'Contour Data' "
+            "values doesn't contain (x, y, z) triplets"
+        )
+
+    points = values.reshape(-1, 3)
+    offsets = numpy.zeros(len(counts) + 1, dtype="i8")
+    numpy.cumsum(counts // 3, out=offsets[1:])
+
+    result = {}
+    for index, (roi_number, end) in enumerate(rois):
+        start = rois[index - 1][1] if index else 0
+        roi_offsets = offsets[start : end + 1]
+        result[roi_number] = (
+            points[roi_offsets[0] : roi_offsets[-1]],
+            roi_offsets - roi_offsets[0],
+        )
+
+    return result
+
+
+def _roi_contours(
+    seq: Sequence, index: int, contours: list[bytes | Any], fp: BytesIO | None
+) -> int:
+    """Add the *Contour Data* values from the item at `index` in the *ROI
+    Contour Sequence* `seq` to `contours` and return its *Referenced ROI
+    Number*.
+
+    Parameters
+    ----------
+    seq : pydicom.sequence.Sequence
+        The *ROI Contour Sequence*.
+    index : int
+        The index of the item to use.
+    contours : list[bytes | Any]
+        The list to add the encoded *Contour Data* values to, or their
+        element values for items that have already been parsed.
+    fp : io.BytesIO | None
+        The encoded value of `seq`, if available.
+
+    Returns
+    -------
+    int
+        The item's *Referenced ROI Number*.
+    """
+    item = seq._list[index]
+    roi_number = None
+    contour_seq = None
+    if isinstance(item, Dataset):
+        roi_number = item.get("ReferencedROINumber")
+        contour_seq = item.get("ContourSequence")
+    else:
+        encoded = cast(_EncodedSequence, seq._encoded)
+        fp = fp or BytesIO(encoded.value)
+        fp.seek(item.start + 8)
+        for elem in _scan_elements(
+            fp,
+            encoded.is_implicit_VR,
+            encoded.is_little_endian,
+            {0x30060040, 0x30060084},  # Contour Sequence, Referenced ROI Number
+            0x30060084,
+            encoded.encoding,
+        ):
+            if elem.tag == 0x30060084:
+                roi_number = DataElement_from_raw(elem).value
+            elif isinstance(elem, DataElement):
+                contour_seq = elem.value
+            elif elem.value:
+                contour_seq = read_sequence(
+                    BytesIO(elem.value),
+                    elem.is_implicit_VR,
+                    elem.is_little_endian,
+                    elem.length,
+                    encoded.encoding,
+                )
+
+    if roi_number is None:
+        raise ValueError(
+            f"Item {index} in the 'ROI Contour Sequence' has no (3006,0084) "
+            "'Referenced ROI Number' value"
+        )
+
+    if not contour_seq:
+        return int(roi_number)
+
+    contour_fp = None
+    if contour_seq._encoded is not None:
+        contour_fp = BytesIO(contour_seq._encoded.value)
+
+    for contour_index, contour in enumerate(contour_seq._list):
+        value: bytes | Any = b""
+        if isinstance(contour, Dataset):
+            contour_data: RawDataElement | DataElement | None = contour.get_item(
+                0x30060050
+            )
+            if contour_data is not None and contour_data.value is not None:
+                value = contour_data.value
+                if isinstance(contour_data, RawDataElement):
+                    value = bytes(value)
+        else:
+            encoded = cast(_EncodedSequence, contour_seq._encoded)
+            contour_fp = cast(BytesIO, contour_fp)
+            contour_fp.seek(contour.start + 8)
+            for contour_data in _scan_elements(
+                contour_fp,
+                encoded.is_implicit_VR,
+                encoded.is_little_endian,
+                {0x30060050},  # Contour Data
+                0x30060050,
+            ):
+                value = contour_data.value or b""
+
+        contours.append(value)
+
+    return int(roi_number)
+
+
 def data_element_offset_to_value(is_implicit_VR: bool, VR: str | None) -> int:
     """Return number of bytes from start of data element to start of value"""
     if is_implicit_VR:
@@ -1103,6 +2195,11 @@ def read_deferred_data_element(
         This is called internally by pydicom and will normally not be
         needed in user code.
 
+    .. versionchanged:: 3.0
+
+        Files are no longer re-opened for every deferred read, instead the
+        open file handles are kept in :attr:`deferred_read_cache`.
+
     Parameters
     ----------
     fileobj_type : type
@@ -1137,46 +2234,87 @@ def read_deferred_data_element(
     if filename_or_obj is None:
         raise OSError("Deferred read -- original filename not stored. Cannot re-open")
 
+    if not isinstance(filename_or_obj, str):
+        return _read_deferred_value(cast(BinaryIO, filename_or_obj), raw_data_elem)
+
     # Check that the file is the same as when originally read
-    is_filename = isinstance(filename_or_obj, str)
-    if isinstance(filename_or_obj, str):
-        if not os.path.exists(filename_or_obj):
-            raise OSError(
-                f"Deferred read -- original file {filename_or_obj} is missing"
-            )
+    try:
+        statinfo = os.stat(filename_or_obj)
+    except FileNotFoundError:
+        deferred_read_cache.invalidate(filename_or_obj)
+        raise OSError(
+            f"Deferred read -- original file {filename_or_obj} is missing"
+        ) from None
+
+    if timestamp is not None and statinfo.st_mtime != timestamp:
+        warn_and_log("Deferred read warning -- file modification time has changed")
+
+    # Use the file's current identity so a modified or replaced file is
+    #   re-opened rather than reading from a stale cached handle
+    version = (
+        statinfo.st_dev,
+        statinfo.st_ino,
+        statinfo.st_mtime_ns,
+        statinfo.st_size,
+    )
+    with deferred_read_cache.open(filename_or_obj, version, fileobj_type) as fp:
+        return _read_deferred_value(fp, raw_data_elem)
 
-        if timestamp is not None:
-            statinfo = os.stat(filename_or_obj)
-            if statinfo.st_mtime != timestamp:
-                warn_and_log(
-                    "Deferred read warning -- file modification time has " "changed"
-                )
 
-    # Open the file, position to the right place
-    fp = fileobj_type(filename_or_obj, "rb") if is_filename else filename_or_obj
+def _read_deferred_value(fp: BinaryIO, raw_data_elem: RawDataElement) -> RawDataElement:
+    """Return `raw_data_elem` with its value read from `fp`.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like containing the deferred element.
+    raw_data_elem : dataelem.RawDataElement
+        The raw data element with no value set.
+
+    Returns
+    -------
+    dataelem.RawDataElement
+        The data element with the value set.
+    """
     is_implicit_VR = raw_data_elem.is_implicit_VR
     is_little_endian = raw_data_elem.is_little_endian
     offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
     # Seek back to the start of the deferred element
     fp.seek(raw_data_elem.value_tell - offset)
-    elem_gen = data_element_generator(
-        fp, is_implicit_VR, is_little_endian, defer_size=None
-    )
 
-    # Read the data element and check matches what was stored before
-    # The first element out of the iterator should be the same type as the
-    #   the deferred element == RawDataElement
-    elem = cast(RawDataElement, next(elem_gen))
-    if is_filename:
-        fp.close()
-    if elem.VR != raw_data_elem.VR:
+    if raw_data_elem.length == 0xFFFFFFFF:
+        # Undefined length values have to be parsed to find their end
+        elem_gen = data_element_generator(
+            fp, is_implicit_VR, is_little_endian, defer_size=None
+        )
+        # The first element out of the iterator should be the same type as the
+        #   the deferred element == RawDataElement
+        elem = cast(RawDataElement, next(elem_gen))
+        tag, vr = elem.tag, elem.VR
+    else:
+        # Otherwise read the value directly, only using the header to check
+        #   the element matches what was stored before
+        header = fp.read(offset)
+        tag = _unpack_tag(header[:4], "<" if is_little_endian else ">")
+        vr = raw_data_elem.VR
+        if not is_implicit_VR and vr is not None:
+            vr = header[4:6].decode(default_encoding, errors="replace")
+
+        # Memory-mapped sources return a view rather than a copy, as when
+        #   the element is read by the generator
+        value = _read_value(
+            fp.read, getattr(fp, "read_view", None), tag, vr, raw_data_elem.length
+        )
+        elem = raw_data_elem._replace(value=value)
+
+    if vr != raw_data_elem.VR:
         raise ValueError(
-            f"Deferred read VR {elem.VR} does not match original {raw_data_elem.VR}"
+            f"Deferred read VR {vr} does not match original {raw_data_elem.VR}"
         )
 
-    if elem.tag != raw_data_elem.tag:
+    if tag != raw_data_elem.tag:
         raise ValueError(
-            f"Deferred read tag {elem.tag!r} does not match "
+            f"Deferred read tag {tag!r} does not match "
             f"original {raw_data_elem.tag!r}"
         )
 
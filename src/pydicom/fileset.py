@@ -1,24 +1,29 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """DICOM File-set handling."""
 
-from collections.abc import Iterator, Iterable, Callable
-import copy
+from collections.abc import Iterator, Iterable
+from functools import lru_cache
+import itertools
 import os
 from pathlib import Path
 import re
 import shutil
+from struct import pack, pack_into
 from tempfile import TemporaryDirectory
-from typing import Optional, Union, Any, cast
+from io import BytesIO
+from typing import Optional, Union, Any, NamedTuple, cast
 import uuid
 
 from pydicom.charset import default_encoding
-from pydicom.datadict import tag_for_keyword, dictionary_description
+from pydicom.datadict import tag_for_keyword, dictionary_description, dictionary_VR
 from pydicom.dataelem import DataElement
 from pydicom.dataset import Dataset, FileMetaDataset, FileDataset
 from pydicom.filebase import DicomBytesIO, DicomFileLike
-from pydicom.filereader import dcmread
+from pydicom.filereader import data_element_generator, dcmread
 from pydicom.filewriter import write_dataset, write_data_element, write_file_meta_info
-from pydicom.misc import warn_and_log
+from pydicom.misc import warn_and_log, _imap_ordered
+from pydicom.multival import MultiValue
+from pydicom.sequence import Sequence, _EncodedItem, _EncodedSequence
 from pydicom.tag import Tag, BaseTag
 import pydicom.uid as sop
 from pydicom.uid import (
@@ -28,6 +33,7 @@ from pydicom.uid import (
     ImplicitVRLittleEndian,
     MediaStorageDirectoryStorage,
 )
+from pydicom.valuerep import PersonName
 
 
 # Regex for conformant File ID paths - PS3.10 Section 8.5
@@ -71,6 +77,26 @@ _FIRST_OFFSET = "OffsetOfTheFirstDirectoryRecordOfTheRootDirectoryEntity"
 _NEXT_OFFSET = "OffsetOfTheNextDirectoryRecord"
 _LOWER_OFFSET = "OffsetOfReferencedLowerLevelDirectoryEntity"
 _LAST_OFFSET = "OffsetOfTheLastDirectoryRecordOfTheRootDirectoryEntity"
+# The directory record elements needed to build the record tree
+_RECORD_TAGS = [
+    0x00041400,  # OffsetOfTheNextDirectoryRecord
+    0x00041410,  # RecordInUseFlag
+    0x00041420,  # OffsetOfReferencedLowerLevelDirectoryEntity
+    0x00041430,  # DirectoryRecordType
+    0x00041500,  # ReferencedFileID
+    0x00041511,  # ReferencedSOPInstanceUIDInFile
+    0x00041432,  # PrivateRecordUID
+    0x00100020,  # PatientID
+    0x0020000D,  # StudyInstanceUID
+    0x0020000E,  # SeriesInstanceUID
+]
+# The elements used for the key of each type of record, see RecordNode.key
+_RECORD_KEY_TAGS = {
+    "PATIENT": (0x00100020,),
+    "STUDY": (0x0020000D, 0x00041511),
+    "SERIES": (0x0020000E,),
+    "PRIVATE": (0x00041432,),
+}
 
 
 def generate_filename(
@@ -172,6 +198,116 @@ def is_conformant_file_id(path: Path) -> bool:
     return False
 
 
+class _EncodedRecord(NamedTuple):
+    """A directory record that hasn't been parsed yet."""
+
+    #: The *Directory Record Sequence* containing the record
+    sequence: Sequence
+    #: The index of the record's item in `sequence`
+    position: int
+    #: The offset from the start of the DICOMDIR to the start of the item
+    offset: int
+    #: The *Offset of the Next Directory Record*
+    next_offset: int
+    #: The *Offset of Referenced Lower Level Directory Entity*
+    lower_offset: int
+    #: The *Directory Record Type*, ``None`` if not present
+    record_type: str | None
+    #: The *Referenced File ID* components, ``None`` if not present
+    file_id: tuple[str, ...] | None
+    #: The *Referenced SOP Instance UID in File*, ``None`` if not present
+    uid: str | None
+    #: The positions of the next and lower offset values in the encoded
+    #: sequence, ``None`` if the record can't be written as-is
+    value_tells: tuple[int, int] | None
+    #: ``True`` if the element required for the record's key is present
+    has_key: bool
+
+
+def _read_records(seq: Sequence) -> Iterator[Dataset | _EncodedRecord]:
+    """Yield the items of a *Directory Record Sequence* without parsing them.
+
+    Items that have already been parsed are yielded as-is. For the others
+    only the elements needed to build the record tree are read from the
+    encoded item and an :class:`_EncodedRecord` is yielded instead, the
+    record itself is parsed when the node's record is first used.
+
+    Parameters
+    ----------
+    seq : pydicom.sequence.Sequence
+        The *Directory Record Sequence*.
+
+    Yields
+    ------
+    pydicom.dataset.Dataset | _EncodedRecord
+        The parsed or unparsed directory records.
+    """
+    encoded = seq._encoded
+    fp = BytesIO(encoded.value if encoded else b"")
+    for index, item in enumerate(seq._list):
+        if not isinstance(item, _EncodedItem):
+            yield item
+            continue
+
+        encoded = cast(_EncodedSequence, encoded)
+        # Skip the item's tag and length
+        fp.seek(item.start + 8)
+        raw_elements = {
+            raw.tag: raw
+            for raw in data_element_generator(
+                fp,
+                encoded.is_implicit_VR,
+                encoded.is_little_endian,
+                stop_when=lambda tag, vr, length: tag > 0x0020000E,
+                specific_tags=_RECORD_TAGS,
+            )
+        }
+        elements = {
+            tag: cast(bytes, raw.value or b"") for tag, raw in raw_elements.items()
+        }
+        # The values are all UL, US, CS or UI so can be decoded directly
+        byteorder = "little" if encoded.is_little_endian else "big"
+        record_type = elements.get(0x00041430, b"").decode(default_encoding)
+        record_type = record_type.strip(" \x00")
+        file_id: tuple[str, ...] | None = None
+        if 0x00041500 in elements:
+            value = elements[0x00041500].decode(default_encoding).strip(" \x00")
+            file_id = tuple(v.strip() for v in value.split("\\")) if value else ()
+
+        uid = None
+        if 0x00041511 in elements:
+            uid = elements[0x00041511].decode(default_encoding).strip(" \x00")
+
+        # The record can only be written as-is if parsing it wouldn't change it
+        value_tells = None
+        in_use = int.from_bytes(elements.get(0x00041410, b""), byteorder)
+        if (
+            in_use == 0xFFFF
+            and len(elements.get(0x00041400, b"")) == 4
+            and len(elements.get(0x00041420, b"")) == 4
+        ):
+            value_tells = (
+                raw_elements[0x00041400].value_tell,
+                raw_elements[0x00041420].value_tell,
+            )
+
+        yield _EncodedRecord(
+            seq,
+            index,
+            encoded.offset + item.start,
+            int.from_bytes(elements.get(0x00041400, b""), byteorder),
+            int.from_bytes(elements.get(0x00041420, b""), byteorder),
+            record_type or None,
+            file_id,
+            uid or None,
+            value_tells,
+            any(
+                tag in elements
+                for tag in _RECORD_KEY_TAGS.get(record_type, (0x00041511,))
+            ),
+        )
+
+
 class RecordNode(Iterable["RecordNode"]):
     """Representation of a DICOMDIR's directory record.
 
@@ -196,7 +332,9 @@ class RecordNode(Iterable["RecordNode"]):
         self.children: list[RecordNode] = []
         self.instance: FileInstance | None = None
         self._parent: RecordNode | None = None
-        self._record: Dataset
+        self._dataset: Dataset | None = None
+        # The record when it hasn't been parsed yet
+        self._encoded: _EncodedRecord | None = None
 
         if record:
             self._set_record(record)
@@ -294,7 +432,63 @@ class RecordNode(Iterable["RecordNode"]):
         "Return the number of nodes to the level below the tree root"
         return len(list(self.reverse())) - 1
 
-    def _encode_record(self, force_implicit: bool = False) -> int:
+    def _encode_item(self, force_implicit: bool = False) -> bytearray:
+        """Encode the node's directory record as a *Directory Record Sequence*
+        item.
+
+        * Records that haven't been parsed are copied from the original
+          DICOMDIR when their encoding is unchanged
+        * Sets the ``RecordNode._offset_next`` and ``RecordNode._offset_lower``
+          attributes to the position of the start of the values of the *Offset
+          of the Next Directory Record* and *Offset of Referenced Lower Level
+          Directory Entity* elements. Note that the offsets are relative to
+          the start of the item.
+
+        The values for the *Offset Of The Next Directory Record* and *Offset
+        of Referenced Lower Level Directory Entity* elements are not guaranteed
+        to be correct.
+
+        Parameters
+        ----------
+        force_implicit : bool, optional
+            ``True`` to force using implicit VR encoding, which is
+            non-conformant. Default ``False``.
+
+        Returns
+        -------
+        bytearray
+            The encoded sequence item, including the item tag and length and
+            any *Item Delimitation Item*.
+        """
+        encoded = self._encoded
+        if encoded is not None and encoded.value_tells is not None:
+            seq = encoded.sequence
+            item = seq._list[encoded.position]
+            seq_encoded = seq._encoded
+            if (
+                isinstance(item, _EncodedItem)
+                and seq_encoded is not None
+                and seq_encoded.is_implicit_VR == force_implicit
+                and seq_encoded.is_little_endian
+            ):
+                self._offset_next = encoded.value_tells[0] - item.start
+                self._offset_lower = encoded.value_tells[1] - item.start
+                return bytearray(seq_encoded.value[item.start : item.end])
+
+        record = self._encode_record(force_implicit)
+        self._offset_next += 8
+        self._offset_lower += 8
+        if self._record.is_undefined_length_sequence_item:
+            # Item, then Item Delimitation Item with a length of 0
+            return bytearray(
+                pack("<HHL", 0xFFFE, 0xE000, 0xFFFFFFFF)
+                + record
+                + pack("<HHL", 0xFFFE, 0xE00D, 0)
+            )
+
+        return bytearray(pack("<HHL", 0xFFFE, 0xE000, len(record)) + record)
+
+    def _encode_record(self, force_implicit: bool = False) -> bytes:
         """Encode the node's directory record.
 
         * Encodes the record as explicit VR little endian
@@ -316,8 +510,8 @@ class RecordNode(Iterable["RecordNode"]):
 
         Returns
         -------
-        int
-            The length of the encoded directory record.
+        bytes
+            The encoded directory record.
 
         See Also
         --------
@@ -344,7 +538,7 @@ class RecordNode(Iterable["RecordNode"]):
 
             write_data_element(fp, self._record[tag], encoding)
 
-        return len(fp.getvalue())
+        return fp.getvalue()
 
     @property
     def _file_id(self) -> Path | None:
@@ -356,7 +550,10 @@ class RecordNode(Iterable["RecordNode"]):
             The *Referenced File ID* from the directory record as a
             :class:`pathlib.Path` or ``None`` if the element value is null.
         """
-        if "ReferencedFileID" in self._record:
+        if self._encoded is not None and self._encoded.file_id is not None:
+            return Path(*self._encoded.file_id) if self._encoded.file_id else None
+
+        if self._has_file_id:
             elem = self._record["ReferencedFileID"]
             if elem.VM == 1:
                 return Path(cast(str, self._record.ReferencedFileID))
@@ -372,6 +569,14 @@ class RecordNode(Iterable["RecordNode"]):
         """Return the tree's :class:`~pydicom.fileset.FileSet`."""
         return self.root.file_set
 
+    @property
+    def _has_file_id(self) -> bool:
+        """Return ``True`` if the record has a *Referenced File ID*."""
+        if self._encoded is not None:
+            return self._encoded.file_id is not None
+
+        return "ReferencedFileID" in self._record
+
     def __getitem__(self, key: Union[str, "RecordNode"]) -> "RecordNode":
         """Return the current node's child using it's
         :attr:`~pydicom.fileset.RecordNode.key`
@@ -593,9 +798,31 @@ class RecordNode(Iterable["RecordNode"]):
         except (AttributeError, ValueError) as exc:
             raise ValueError(f"{msg} a required element") from exc
 
+    @property
+    def _record(self) -> Dataset:
+        """Return the node's directory record, parsing it first if required."""
+        if self._encoded is not None:
+            encoded, self._encoded = self._encoded, None
+            self._set_record(encoded.sequence[encoded.position])
+
+        if self._dataset is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '_record'"
+            )
+
+        return self._dataset
+
+    @_record.setter
+    def _record(self, ds: Dataset) -> None:
+        """Set the node's directory record."""
+        self._dataset = ds
+
     @property
     def record_type(self) -> str:
         """Return the record's *Directory Record Type* as :class:`str`."""
+        if self._encoded is not None:
+            return cast(str, self._encoded.record_type)
+
         return cast(str, self._record.DirectoryRecordType)
 
     def remove(self, node: "RecordNode") -> None:
@@ -812,11 +1039,11 @@ class FileInstance:
         if self.for_addition:
             return False
 
-        if self["ReferencedFileID"].VM == 1:
-            file_id = self.FileID.split(os.path.sep)
-            return [self.ReferencedFileID] != file_id
+        file_id = self.node._file_id
+        if file_id is None:
+            return True
 
-        return cast(bool, self.ReferencedFileID != self.FileID.split(os.path.sep))
+        return list(file_id.parts) != self.FileID.split(os.path.sep)
 
     @property
     def for_removal(self) -> bool:
@@ -946,9 +1173,223 @@ class FileInstance:
         return cast(UID, self.ReferencedTransferSyntaxUIDInFile)
 
 
+class _RecordIndex:
+    """A hash index of File-set instances by the value of a directory record
+    element.
+    """
+
+    def __init__(self, tag: BaseTag) -> None:
+        """Create a new, empty, index.
+
+        Parameters
+        ----------
+        tag : pydicom.tag.BaseTag
+            The tag of the directory record element to index.
+        """
+        self.tag = tag
+        try:
+            self.vr = dictionary_VR(tag)
+        except KeyError:
+            self.vr = ""
+
+        # The instances for each element value, as {key: {instance: None}}
+        #   with the instances in the same order as the File-set
+        self.buckets: dict[Any, dict[FileInstance, None]] = {}
+        # The element value for each key
+        self.values: dict[Any, Any] = {}
+        # The key for each indexed instance
+        self.keys: dict[FileInstance, Any] = {}
+        # Whether or not every key is a str
+        self.text_only = True
+
+    def add(self, instance: FileInstance) -> None:
+        """Add `instance` to the index.
+
+        Raises
+        ------
+        TypeError
+            If the element value can't be indexed.
+        """
+        try:
+            value = instance[self.tag].value
+        except KeyError:
+            return
+
+        key = _index_key(value)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+            self.values[key] = value
+            self.text_only = self.text_only and isinstance(key, str)
+
+        bucket[instance] = None
+        self.keys[instance] = key
+
+    def find(self, query: Any) -> dict[FileInstance, None]:
+        """Return the instances with an element value matching `query`."""
+        if not isinstance(query, list | tuple):
+            # Any other value type may equal a str, such as IS
+            is_plain = not isinstance(query, str) or (
+                self.text_only
+                and "*" not in query
+                and "?" not in query
+                and not (self.vr in _RANGE_VRS and "-" in query)
+            )
+            if is_plain:
+                try:
+                    return self.buckets.get(_index_key(query), {})
+                except TypeError:
+                    pass
+
+        matches: dict[FileInstance, None] = {}
+        for key, value in self.values.items():
+            if _match_value(value, query, self.vr):
+                matches.update(self.buckets[key])
+
+        return matches
+
+    def remove(self, instance: FileInstance) -> None:
+        """Remove `instance` from the index."""
+        if instance not in self.keys:
+            return
+
+        key = self.keys.pop(instance)
+        bucket = self.buckets[key]
+        del bucket[instance]
+        if not bucket:
+            del self.buckets[key]
+            del self.values[key]
+
+
+# VRs that support range matching
+_RANGE_VRS = ("DA", "TM")
+
+
+def _index_key(value: Any) -> Any:
+    """Return a hashable key for the element `value`.
+
+    Raises
+    ------
+    TypeError
+        If `value` is unhashable.
+    """
+    if isinstance(value, PersonName):
+        return str(value)
+
+    if isinstance(value, MultiValue | list | tuple):
+        return tuple(_index_key(v) for v in value)
+
+    hash(value)
+
+    return value
+
+
+def _is_after_pixels(key: str | int) -> bool:
+    """Return ``True`` if the element with keyword or tag `key` isn't available
+    when reading with `stop_before_pixels`.
+    """
+    try:
+        return bool(Tag(key) >= 0x7FE00008)
+    except ValueError:
+        return False
+
+
+def _match_value(value: Any, query: Any, vr: str) -> bool:
+    """Return ``True`` if an element `value` matches the `query` value.
+
+    Parameters
+    ----------
+    value : Any
+        The element value to be matched.
+    query : Any
+        The value to match against, which may be:
+
+        * A list of values, which matches any of the values or a multi-valued
+          element with the same values.
+        * A :class:`str` containing ``*`` or ``?`` wildcards, which match zero
+          or more characters and a single character respectively.
+        * For **DA** and **TM** elements, a :class:`str` range such as
+          ``"20200101-20201231"``, ``"-20201231"`` or ``"20200101-"``.
+        * Otherwise the value must be equal to `query`.
+    vr : str
+        The VR of the element.
+
+    Returns
+    -------
+    bool
+        ``True`` if `value` matches, ``False`` otherwise.
+    """
+    if isinstance(query, list | tuple):
+        return bool(value == query) or any(_match_value(value, q, vr) for q in query)
+
+    if isinstance(query, str):
+        if isinstance(value, str | PersonName) and ("*" in query or "?" in query):
+            return _wildcard_pattern(query).fullmatch(str(value)) is not None
+
+        # Either str or, with datetime conversion, DA or TM
+        if vr in _RANGE_VRS and "-" in query:
+            if not value:
+                return False
+
+            lower, _, upper = query.partition("-")
+            value = str(value)
+            return (not lower or value >= lower) and (not upper or value <= upper)
+
+    return bool(value == query)
+
+
+@lru_cache(maxsize=64)
+def _wildcard_pattern(query: str) -> re.Pattern[str]:
+    """Return a compiled regex for a `query` containing ``*`` and ``?``
+    wildcards.
+    """
+    pattern = "".join(
+        ".*" if c == "*" else "." if c == "?" else re.escape(c) for c in query
+    )
+    return re.compile(pattern, re.DOTALL)
+
+
 DSPathType = Dataset | str | os.PathLike
 
 
+def _copy_file(src: str | os.PathLike, dst: Path, link: bool) -> None:
+    """Copy the file at `src` to `dst`, hard linking it instead if `link` is
+    ``True`` and the file system supports it.
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+    # Uses the platform's fast copy functions where available
+    shutil.copyfile(src, dst)
+
+
+def _copy_files(
+    files: list[tuple[str | os.PathLike, Path, bool]], workers: int = 1
+) -> None:
+    """Copy files using :func:`_copy_file`.
+
+    Parameters
+    ----------
+    files : list[tuple[str | os.PathLike, pathlib.Path, bool]]
+        The ``(src, dst, link)`` arguments for each file to be copied.
+    workers : int, optional
+        If greater than ``1`` then copy the files using a pool of up to
+        `workers` threads (default ``1``).
+    """
+    if workers > 1 and len(files) > 1:
+        for _ in _imap_ordered(_copy_file, files, workers, threads=True):
+            pass
+
+        return
+
+    for src, dst, link in files:
+        _copy_file(src, dst, link)
+
+
 class FileSet:
     """Representation of a DICOM File-set."""
 
@@ -982,6 +1423,18 @@ class FileSet:
         self._ds = Dataset()
         # The File-set's managed SOP Instances as list of FileInstance
         self._instances: list[FileInstance] = []
+        # The order the instances were added in, used to sort search results
+        self._sequence: dict[FileInstance, int] = {}
+        self._counter = itertools.count()
+        # Indexes of the instances by directory record element, created when
+        #   first searched, ``None`` if the element values can't be indexed
+        self._indexes: dict[BaseTag, _RecordIndex | None] = {}
+        # The instances read when searching with `load`, without pixel data
+        self._headers: dict[FileInstance, Dataset] = {}
+        # The instances by *SOP Instance UID*, created when first needed
+        self._uids: dict[str, FileInstance] | None = None
+        # The key for each instance in `_uids`, so it can be removed directly
+        self._uid_keys: dict[FileInstance, str] = {}
         # Use alphanumeric or numeric File IDs
         self._use_alphanumeric = False
 
@@ -1030,14 +1483,14 @@ class FileSet:
             ds = ds_or_path
 
         key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        have_instance = self._find_instance(key)
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
         if key in self._stage["-"]:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
-            self._instances.append(instance)
+            self._add_instance(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
@@ -1045,7 +1498,7 @@ class FileSet:
         # The instance is already in the File-set (and not staged for removal)
         #   May or may not be staged for addition/movement
         if have_instance:
-            return have_instance[0]
+            return have_instance
 
         # If not already in the File-set, stage for addition
         # Create the directory records and tree nodes for the dataset
@@ -1066,12 +1519,28 @@ class FileSet:
 
         # Save the dataset to the stage
         self._stage["+"][instance.SOPInstanceUID] = instance
-        self._instances.append(instance)
+        self._add_instance(instance)
         instance._apply_stage("+")
         ds.save_as(instance.path, enforce_file_format=True)
 
         return cast(FileInstance, instance)
 
+    def _add_instance(self, instance: FileInstance) -> None:
+        """Add `instance` to the managed instances and any indexes."""
+        self._instances.append(instance)
+        self._sequence[instance] = next(self._counter)
+        if self._uids is not None:
+            self._add_uid(instance)
+
+        for tag, index in self._indexes.items():
+            if index is None:
+                continue
+
+            try:
+                index.add(instance)
+            except TypeError:
+                self._indexes[tag] = None
+
     def add_custom(self, ds_or_path: DSPathType, leaf: RecordNode) -> FileInstance:
         """Stage an instance for addition to the File-set using custom records.
 
@@ -1166,20 +1635,20 @@ class FileSet:
             )
 
         key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        have_instance = self._find_instance(key)
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
         if key in self._stage["-"]:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
-            self._instances.append(instance)
+            self._add_instance(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
 
         if have_instance:
-            return have_instance[0]
+            return have_instance
 
         # Ensure the leaf node's record contains the required elements
         leaf._record.ReferencedFileID = None
@@ -1193,7 +1662,7 @@ class FileSet:
 
         # Save the dataset to the stage
         self._stage["+"][instance.SOPInstanceUID] = instance
-        self._instances.append(instance)
+        self._add_instance(instance)
         instance._apply_stage("+")
         ds.save_as(instance.path, enforce_file_format=True)
 
@@ -1203,6 +1672,11 @@ class FileSet:
         """Clear the File-set."""
         self._tree.children = []
         self._instances = []
+        self._sequence = {}
+        self._indexes = {}
+        self._headers = {}
+        self._uids = None
+        self._uid_keys = {}
         self._path = None
         self._ds = Dataset()
         self._id = None
@@ -1219,10 +1693,16 @@ class FileSet:
         self._stage["t"] = TemporaryDirectory()
         self._stage["path"] = Path(self._stage["t"].name)
 
-    def copy(self, path: str | os.PathLike, force_implicit: bool = False) -> "FileSet":
+    def copy(
+        self, path: str | os.PathLike, force_implicit: bool = False, workers: int = 1
+    ) -> "FileSet":
         """Copy the File-set to a new root directory and return the copied
         File-set.
 
+        .. versionchanged:: 3.0
+
+            Added the `workers` keyword parameter.
+
         Changes staged to the original :class:`~pydicom.fileset.FileSet` will
         be applied to the new File-set. The original
         :class:`~pydicom.fileset.FileSet` will remain staged.
@@ -1235,6 +1715,9 @@ class FileSet:
             If ``True`` force the DICOMDIR file to be encoded using *Implicit
             VR Little Endian* which is non-conformant to the DICOM Standard
             (default ``False``).
+        workers : int, optional
+            If greater than ``1`` then copy the instances using a pool of up
+            to `workers` threads (default ``1``).
 
         Returns
         -------
@@ -1264,12 +1747,18 @@ class FileSet:
             continue
 
         file_ids = []
+        files = []
         for instance in self:
-            file_ids.append(instance.ReferencedFileID)
-            dst = path / Path(instance.FileID)
+            file_id = instance.FileID
+            dst = path / Path(file_id)
             dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(instance.path, dst)
-            instance.node._record.ReferencedFileID = instance.FileID.split(os.path.sep)
+            files.append((instance.path, dst, False))
+            # Records with an unchanged File ID don't need updating
+            if instance.for_addition or instance.node._file_id != Path(file_id):
+                file_ids.append((instance, instance.ReferencedFileID))
+                instance.node._record.ReferencedFileID = file_id.split(os.path.sep)
+
+        _copy_files(files, workers)
 
         # Create the DICOMDIR file
         p = path / "DICOMDIR"
@@ -1278,10 +1767,8 @@ class FileSet:
             self._write_dicomdir(f, copy_safe=True, force_implicit=force_implicit)
 
         # Reset the *Referenced File ID* values
-        # The order here doesn't matter because removed instances aren't
-        #   yielded by iter(self)
-        for instance, file_id in zip(self, file_ids):
-            instance.node._record.ReferencedFileID = file_id
+        for instance, original in file_ids:
+            instance.node._record.ReferencedFileID = original
 
         # Reattach the removed nodes
         for node in detached_nodes:
@@ -1422,13 +1909,39 @@ class FileSet:
     def find(self, load: bool = False, **kwargs: Any) -> list[FileInstance]:
         """Return matching instances in the File-set
 
+        .. versionchanged:: 3.0
+
+            Added support for multiple values, wildcard and range matching.
+            Searches of the directory records use an index for each element
+            and searches with `load` only read each instance once.
+
+        Each search parameter matches when the element value is:
+
+        * Equal to the parameter value.
+        * If the parameter value is a :class:`list`, equal to any of the
+          items, such as ``PatientID=['1234567', '7654321']``, or equal
+          to the list itself for multi-valued elements.
+        * If the parameter value is a :class:`str` containing ``*`` or ``?``
+          wildcards, a text value matching the pattern, with ``*`` matching
+          any number of characters and ``?`` matching a single character,
+          such as ``PatientName="CITIZEN^J*"``.
+        * For elements with a VR of **DA** or **TM**, if the parameter value
+          is a :class:`str` containing ``-``, within the inclusive range, such
+          as ``StudyDate="20200101-20201231"``, ``StudyDate="-20201231"`` or
+          ``StudyDate="20200101-"``.
+
+        When searching the directory records, an index of the instances is
+        created for each element the first time it's used and kept up to
+        date as instances are added and removed, so repeated searches don't
+        need to check every record. When searching with `load`, each instance
+        is only read once (without its pixel data) and cached until the
+        File-set is cleared or reloaded.
+
         **Limitations**
 
-        * Only single value matching is supported so neither
-          ``PatientID=['1234567', '7654321']`` or ``PatientID='1234567',
-          PatientID='7654321'`` will work (although the first example will
-          work if the *Patient ID* is actually multi-valued).
         * Repeating group and private elements cannot be used when searching.
+        * The indexes aren't updated when the elements of a directory record
+          are changed, use :meth:`~pydicom.fileset.FileSet.reindex` afterwards.
 
         Parameters
         ----------
@@ -1450,13 +1963,19 @@ class FileSet:
         if not kwargs:
             return self._instances[:]
 
+        if not load:
+            indexes = [(self._index(Tag(kw)), val) for kw, val in kwargs.items()]
+            if all(index is not None for index, _ in indexes):
+                return self._find_indexed(cast(list[tuple[_RecordIndex, Any]], indexes))
+
         # Flag whether or not the query elements are in the DICOMDIR records
         has_elements = False
+        full_load = any(_is_after_pixels(kw) for kw in kwargs)
 
         def match(ds: Dataset | FileInstance, **kwargs: Any) -> bool:
             nonlocal has_elements
             if load:
-                ds = ds.load()
+                ds = self._load_header(cast(FileInstance, ds), full_load)
 
             # Check that all query elements are present
             if all([kw in ds for kw in kwargs]):
@@ -1464,7 +1983,8 @@ class FileSet:
 
             for kw, val in kwargs.items():
                 try:
-                    assert ds[kw].value == val
+                    elem = ds[kw]
+                    assert _match_value(elem.value, val, elem.VR)
                 except (AssertionError, KeyError):
                     return False
 
@@ -1476,14 +1996,68 @@ class FileSet:
                 matches.append(instance)
 
         if not load and not has_elements:
-            warn_and_log(
-                "None of the records in the DICOMDIR dataset contain all "
-                "the query elements, consider using the 'load' parameter "
-                "to expand the search to the corresponding SOP instances"
-            )
+            self._warn_missing_elements()
 
         return matches
 
+    def _find_indexed(
+        self, indexes: list[tuple[_RecordIndex, Any]]
+    ) -> list[FileInstance]:
+        """Return the instances matching the search values using indexes.
+
+        Parameters
+        ----------
+        indexes : list[tuple[_RecordIndex, Any]]
+            The index and search value for each search parameter.
+
+        Returns
+        -------
+        list of pydicom.fileset.FileInstance
+            The matching instances, in the same order as the File-set.
+        """
+        found = sorted((index.find(val) for index, val in indexes), key=len)
+        matches = found[0]
+        for others in found[1:]:
+            matches = {ii: None for ii in matches if ii in others}
+
+        if not matches:
+            # Check that all query elements are present in at least one instance
+            present = [index.keys.keys() for index, _ in indexes]
+            if not set(present[0]).intersection(*present[1:]):
+                self._warn_missing_elements()
+
+            return []
+
+        return sorted(matches, key=self._sequence.__getitem__)
+
+    def _find_instance(self, uid: str) -> FileInstance | None:
+        """Return the instance with *SOP Instance UID* `uid`, or ``None`` if
+        there's no such instance in the File-set.
+        """
+        if self._uids is None:
+            self._uids = {}
+            for instance in self:
+                self._add_uid(instance)
+
+        return self._uids.get(uid)
+
+    def _add_uid(self, instance: FileInstance) -> None:
+        """Add `instance` to the instances found by :meth:`_find_instance`."""
+        # Avoid parsing the directory records if possible
+        encoded = instance.node._encoded
+        if encoded is not None and encoded.uid is not None:
+            uid = encoded.uid
+        else:
+            try:
+                uid = instance.SOPInstanceUID
+            except AttributeError:
+                return
+
+        uids = cast(dict[str, FileInstance], self._uids)
+        if uid not in uids:
+            uids[uid] = instance
+            self._uid_keys[instance] = uid
+
     def find_values(
         self,
         elements: str | int | list[str | int],
@@ -1492,6 +2066,12 @@ class FileSet:
     ) -> list[Any] | dict[str | int, list[Any]]:
         """Return a list of unique values for given element(s).
 
+        .. versionchanged:: 3.0
+
+            Searches of all the directory records use an index for each
+            element and searches with `load` only read each instance once.
+            See :meth:`~pydicom.fileset.FileSet.find` for details.
+
         Parameters
         ----------
         elements : str, int or pydicom.tag.BaseTag, or list of these
@@ -1518,11 +2098,32 @@ class FileSet:
         element_list = elements if isinstance(elements, list) else [elements]
         has_element = {element: False for element in element_list}
         results: dict[str | int, list[Any]] = {element: [] for element in element_list}
-        iter_instances = instances or iter(self)
+
+        # Use the indexes when searching all the directory records
+        indexes: dict[str | int, _RecordIndex | None] = {}
+        if not load and not instances:
+            indexes = {element: self._index(Tag(element)) for element in element_list}
+
+        for element, index in indexes.items():
+            if index is None:
+                continue
+
+            # Values in the order they first appear in the File-set
+            buckets = sorted(
+                index.buckets.items(),
+                key=lambda item: self._sequence[next(iter(item[1]))],
+            )
+            results[element] = [index.values[key] for key, _ in buckets]
+            has_element[element] = bool(buckets)
+
+        # Search any remaining elements
+        element_list = [ii for ii in element_list if indexes.get(ii) is None]
+        full_load = any(_is_after_pixels(element) for element in element_list)
+        iter_instances = (instances or iter(self)) if element_list else []
         instance: Dataset | FileInstance
         for instance in iter_instances:
             if load:
-                instance = instance.load()
+                instance = self._load_header(cast(FileInstance, instance), full_load)
 
             for element in element_list:
                 if element not in instance:
@@ -1543,7 +2144,7 @@ class FileSet:
             )
 
         if not isinstance(elements, list):
-            return results[element_list[0]]
+            return results[elements]
 
         return results
 
@@ -1577,6 +2178,33 @@ class FileSet:
         else:
             raise ValueError("The maximum length of the 'File-set ID' is 16 characters")
 
+    def _index(self, tag: BaseTag) -> _RecordIndex | None:
+        """Return the index for the directory record element with `tag`.
+
+        Parameters
+        ----------
+        tag : pydicom.tag.BaseTag
+            The tag of the element to return the index for.
+
+        Returns
+        -------
+        _RecordIndex | None
+            The index, created from the directory records if this is the first
+            time it's been used, or ``None`` if the element values can't be
+            indexed.
+        """
+        if tag not in self._indexes:
+            index: _RecordIndex | None = _RecordIndex(tag)
+            try:
+                for instance in self._instances:
+                    cast(_RecordIndex, index).add(instance)
+            except TypeError:
+                index = None
+
+            self._indexes[tag] = index
+
+        return self._indexes[tag]
+
     @property
     def is_staged(self) -> bool:
         """Return ``True`` if the File-set is new or has changes staged."""
@@ -1696,7 +2324,32 @@ class FileSet:
                 self._stage["~"] = True
 
         for instance in bad_instances:
-            self._instances.remove(instance)
+            self._remove_instance(instance)
+
+    def _load_header(self, instance: FileInstance, full: bool = False) -> Dataset:
+        """Return the SOP Instance for `instance` when searching with `load`.
+
+        Parameters
+        ----------
+        instance : pydicom.fileset.FileInstance
+            The instance to return the dataset for.
+        full : bool, optional
+            If ``False`` (default) then return the cached dataset without
+            its pixel data, reading it if this is the first time it's been
+            used. If ``True`` then read and return the entire dataset.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset
+            The dataset for `instance`.
+        """
+        if full:
+            return instance.load()
+
+        if instance not in self._headers:
+            self._headers[instance] = dcmread(instance.path, stop_before_pixels=True)
+
+        return self._headers[instance]
 
     def _parse_records(
         self, ds: Dataset, include_orphans: bool, raise_orphans: bool = False
@@ -1717,43 +2370,65 @@ class FileSet:
             are found in the File-set (default ``False``).
         """
         # First pass: get the offsets for each record
-        records = {}
-        for record in cast(Iterable[Dataset], ds.DirectoryRecordSequence):
-            offset = cast(int, record.seq_item_tell)
-            node = RecordNode(record)
-            node._offset = offset
-            records[offset] = node
+        #   Unparsed records are only parsed when first used
+        records: dict[int, RecordNode] = {}
+        # The (next, lower) record offsets for each record
+        links: dict[int, tuple[int, int]] = {}
+        seq = cast(Sequence, ds.DirectoryRecordSequence)
+        for record in _read_records(seq):
+            if (
+                isinstance(record, _EncodedRecord)
+                and record.record_type
+                and record.has_key
+            ):
+                node = RecordNode()
+                node._encoded = record
+                node._offset = record.offset
+                links[node._offset] = (record.next_offset, record.lower_offset)
+            else:
+                if isinstance(record, _EncodedRecord):
+                    # Parse now to raise the exception for the invalid record
+                    record = seq[record.position]
+
+                node = RecordNode(record)
+                node._offset = cast(int, record.seq_item_tell)
+                links[node._offset] = (
+                    record[_NEXT_OFFSET].value or 0,
+                    record[_LOWER_OFFSET].value or 0,
+                )
+
+            records[node._offset] = node
 
         # Define the top-level nodes
         if records:
             node = records[ds[_FIRST_OFFSET].value]
             node.parent = self._tree
-            while getattr(node._record, _NEXT_OFFSET, None):
-                node = records[node._record[_NEXT_OFFSET].value]
+            while links[node._offset][0]:
+                node = records[links[node._offset][0]]
                 node.parent = self._tree
 
         # Second pass: build the record hierarchy
         #   Records not in the hierarchy will be ignored
         #   Branches without a valid leaf node File ID will be removed
         def recurse_node(node: RecordNode) -> None:
-            child_offset = getattr(node._record, _LOWER_OFFSET, None)
+            child_offset = links[node._offset][1]
             if child_offset:
                 child = records[child_offset]
                 child.parent = node
 
-                next_offset = getattr(child._record, _NEXT_OFFSET, None)
+                next_offset = links[child._offset][0]
                 while next_offset:
                     child = records[next_offset]
                     child.parent = node
-                    next_offset = getattr(child._record, _NEXT_OFFSET, None)
-            elif "ReferencedFileID" not in node._record:
+                    next_offset = links[child._offset][0]
+            elif not node._has_file_id:
                 # No children = leaf node, leaf nodes must reference a File ID
                 del node.parent[node]
 
             # The leaf node references the FileInstance
-            if "ReferencedFileID" in node._record:
+            if node._has_file_id:
                 node.instance = FileInstance(node)
-                self._instances.append(node.instance)
+                self._add_instance(node.instance)
 
             for child in node.children:
                 recurse_node(child)
@@ -1771,7 +2446,7 @@ class FileSet:
         # Determine which nodes are both orphaned and reference an instance
         missing_set = set(records.keys()) - {ii._offset for ii in self._tree}
         missing = [records[o] for o in missing_set]
-        missing = [r for r in missing if "ReferencedFileID" in r._record]
+        missing = [r for r in missing if r._has_file_id]
 
         if missing and not include_orphans:
             warn_and_log(
@@ -1887,6 +2562,19 @@ class FileSet:
 
         yield from records
 
+    def reindex(self) -> None:
+        """Discard the indexes used when searching the directory records.
+
+        .. versionadded:: 3.0
+
+        The indexes used by :meth:`~pydicom.fileset.FileSet.find` and
+        :meth:`~pydicom.fileset.FileSet.find_values` are only updated when
+        instances are added or removed, so this should be called after
+        changing the elements of any directory records. Each index will be
+        recreated the next time it's used.
+        """
+        self._indexes = {}
+
     def remove(self, instance: FileInstance | list[FileInstance]) -> None:
         """Stage instance(s) for removal from the File-set.
 
@@ -1904,7 +2592,7 @@ class FileSet:
                 self.remove(item)
             return
 
-        if instance not in self._instances:
+        if instance not in self._sequence:
             raise ValueError("No such instance in the File-set")
 
         # If staged for addition, no longer add
@@ -1918,13 +2606,25 @@ class FileSet:
             except FileNotFoundError:
                 pass
             instance._apply_stage("-")
-            self._instances.remove(instance)
+            self._remove_instance(instance)
 
         # Stage for removal if not already done
         elif instance.SOPInstanceUID not in self._stage["-"]:
             instance._apply_stage("-")
             self._stage["-"][instance.SOPInstanceUID] = instance
-            self._instances.remove(instance)
+            self._remove_instance(instance)
+
+    def _remove_instance(self, instance: FileInstance) -> None:
+        """Remove `instance` from the managed instances and any indexes."""
+        self._instances.remove(instance)
+        del self._sequence[instance]
+        if instance in self._uid_keys:
+            del cast(dict[str, FileInstance], self._uids)[self._uid_keys.pop(instance)]
+
+        self._headers.pop(instance, None)
+        for index in self._indexes.values():
+            if index is not None:
+                index.remove(instance)
 
     def __str__(self) -> str:
         """Return a string representation of the FileSet."""
@@ -1999,9 +2699,14 @@ class FileSet:
         path: str | os.PathLike | None = None,
         use_existing: bool = False,
         force_implicit: bool = False,
+        workers: int = 1,
     ) -> None:
         """Write the File-set, or changes to the File-set, to the file system.
 
+        .. versionchanged:: 3.0
+
+            Added the `workers` keyword parameter.
+
         .. warning::
 
             If modifying an existing File-set it's **strongly recommended**
@@ -2030,6 +2735,12 @@ class FileSet:
         `use_existing` keyword parameter to keep the existing directory
         structure and only update the DICOMDIR file.
 
+        Only instances that have been staged for addition or whose File ID
+        has changed are written, and staged instances are hard linked from
+        the staging directory into the File-set when possible. Directory
+        records that haven't been used since the File-set was loaded are
+        written to the DICOMDIR file without being re-encoded.
+
         Parameters
         ----------
         path : str or PathLike, optional
@@ -2046,6 +2757,10 @@ class FileSet:
             If ``True`` force the DICOMDIR file to be encoded using *Implicit
             VR Little Endian* which is non-conformant to the DICOM Standard
             (default ``False``).
+        workers : int, optional
+            If greater than ``1`` then copy the instances staged for addition
+            into the File-set using a pool of up to `workers` threads
+            (default ``1``).
 
         Raises
         ------
@@ -2114,33 +2829,39 @@ class FileSet:
 
             return
 
+        # The new File IDs, only instances that are staged for addition or
+        #   whose File ID changes need to be written
+        root = cast(Path, self._path)
+        file_ids = {ii: ii.FileID for ii in self}
+        current = {ii: ii.node._file_id for ii in self if not ii.for_addition}
+        changed = [ii for ii in self if Path(file_ids[ii]) != current.get(ii)]
+
         # We need to be careful not to overwrite the source file
         #   for a different (later) instance
         # Check for collisions between the new and old File IDs
         #   and copy any to the stage
-        fout = {Path(ii.FileID) for ii in self}
-        fin = {
-            ii.node._file_id for ii in self if ii.SOPInstanceUID not in self._stage["+"]
-        }
-        collisions = fout & fin
-        for instance in [ii for ii in self if ii.node._file_id in collisions]:
+        fout = {Path(file_ids[ii]) for ii in changed}
+        collisions = fout & set(current.values())
+        for instance in [ii for ii in changed if current.get(ii) in collisions]:
             self._stage["+"][instance.SOPInstanceUID] = instance
             instance._apply_stage("+")
-            shutil.copyfile(self._path / instance.node._file_id, instance.path)
+            shutil.copyfile(root / cast(Path, current[instance]), instance.path)
 
-        for instance in self:
-            dst = self._path / instance.FileID
+        staged = []
+        for instance in changed:
+            dst = root / file_ids[instance]
             dst.parent.mkdir(parents=True, exist_ok=True)
-            fn: Callable
-            if instance.SOPInstanceUID in self._stage["+"]:
-                src = instance.path
-                fn = shutil.copyfile
+            if instance.for_addition:
+                # The stage is discarded after writing so link where possible
+                staged.append((instance.path, dst, True))
             else:
-                src = self._path / instance.node._file_id
-                fn = shutil.move
+                src = root / cast(Path, current[instance])
+                shutil.move(os.fspath(src), os.fspath(dst))
 
-            fn(os.fspath(src), os.fspath(dst))
-            instance.node._record.ReferencedFileID = instance.FileID.split(os.path.sep)
+            file_id = file_ids[instance].split(os.path.sep)
+            instance.node._record.ReferencedFileID = file_id
+
+        _copy_files(staged, workers)
 
         # Create the DICOMDIR file
         with open(p, "wb") as fp:
@@ -2151,6 +2872,14 @@ class FileSet:
         #   We're doing things wrong if we have orphans so raise
         self.load(p, raise_orphans=True)
 
+    def _warn_missing_elements(self) -> None:
+        """Warn that the directory records don't contain the search elements."""
+        warn_and_log(
+            "None of the records in the DICOMDIR dataset contain all "
+            "the query elements, consider using the 'load' parameter "
+            "to expand the search to the corresponding SOP instances"
+        )
+
     def _write_dicomdir(
         self, fp: DicomFileLike, copy_safe: bool = False, force_implicit: bool = False
     ) -> None:
@@ -2201,41 +2930,50 @@ class FileSet:
         write_dataset(fp, ds[0x00041200:0x00041220])
 
         # Rebuild and encode the *Directory Record Sequence*
-        # Step 1: Determine the offsets for all the records
-        offset = fp.tell() + seq_offset  # Start of the first seq. item tag
-        for node in self._tree:
+        # Step 1: Encode the records and determine their offsets
+        #   Records that haven't been parsed are copied as-is
+        seq_start = fp.tell() + seq_offset  # Start of the first seq. item tag
+        offset = seq_start
+        nodes = list(self._tree)
+        items = {}
+        for node in nodes:
             # RecordNode._offset is the start of each record's seq. item tag
             node._offset = offset
-            offset += 8  # a sequence item's (tag + length)
             # Copy safe - only modifies RecordNode._offset
-            offset += node._encode_record(force_implicit)
-            # If the sequence item has undefined length then it uses a
-            #   sequence item delimiter item
-            if node._record.is_undefined_length_sequence_item:
-                offset += 8
-
-        # Step 2: Update the records and add to *Directory Record Sequence*
-        ds.DirectoryRecordSequence = []
-        for node in self._tree:
-            record = node._record
-            if not copy_safe:
-                node._update_record_offsets()
-            else:
-                record = copy.deepcopy(record)
-                next_elem = record[_NEXT_OFFSET]
-                next_elem.value = 0
-                if node.next:
-                    next_elem.value = node.next._offset
-
-                lower_elem = record[_LOWER_OFFSET]
-                lower_elem.value = 0
-                if node.children:
-                    record[_LOWER_OFFSET].value = node.children[0]._offset
-
-            cast(list[Dataset], ds.DirectoryRecordSequence).append(record)
+            items[node] = node._encode_item(force_implicit)
+            offset += len(items[node])
+
+        # Step 2: Update the record offsets in the encoded items
+        #   The offset values have a fixed length so no re-encoding is needed
+        for parent in [self._tree, *nodes]:
+            children = parent.children
+            if not parent.is_root:
+                lower = children[0]._offset if children else 0
+                pack_into("<L", items[parent], parent._offset_lower, lower)
+
+            for child, sibling in zip(children, [*children[1:], None]):
+                next_offset = sibling._offset if sibling else 0
+                pack_into("<L", items[child], child._offset_next, next_offset)
+
+        if not copy_safe:
+            for node in nodes:
+                if node._encoded is None:
+                    node._update_record_offsets()
 
         # Step 3: Encode *Directory Record Sequence* and the rest
-        write_dataset(fp, ds[0x00041220:])
+        spans = []
+        for node in nodes:
+            start = node._offset - seq_start
+            spans.append((start, start + len(items[node])))
+
+        encoding = ds.get("SpecificCharacterSet", default_encoding)
+        encoded = _EncodedSequence(
+            b"".join(items.values()), force_implicit, True, encoding, seq_start
+        )
+        ds.DirectoryRecordSequence = Sequence._from_encoded(encoded, spans)
+        # The records are already encoded so write the sequence as-is
+        write_data_element(fp, ds["DirectoryRecordSequence"], encoding)
+        write_dataset(fp, ds[0x00041221:])
 
         # Update the first and last record offsets
         if self._tree.children:
@@ -1,8 +1,12 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """Functions for reading to certain bytes, e.g. delimiters."""
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
 import os
 from struct import pack, unpack
-from typing import BinaryIO, cast
+from threading import RLock
+from typing import Any, BinaryIO, cast
 
 from pydicom.misc import size_in_bytes
 from pydicom.tag import TupleTag, Tag, SequenceDelimiterTag, ItemTag, BaseTag
@@ -335,7 +339,8 @@ def _try_read_encapsulated_pixel_data(
         value = None
     else:
         fp.seek(data_start)
-        value = fp.read(byte_count - 4)
+        # Memory-mapped files can return the value without copying
+        value = getattr(fp, "read_view", fp.read)(byte_count - 4)
 
     fp.seek(data_start + byte_count + 4)
     return (True, value)
@@ -441,5 +446,139 @@ def path_from_pathlike(
         return cast(BinaryIO, file_object)
 
 
+class FileHandleCache:
+    """A bounded least-recently-used cache of open file handles.
+
+    .. versionadded:: 3.0
+
+    Handles are keyed by the file's path and a `version` that identifies the
+    current contents of the file, such as its inode and modification time
+    from :func:`os.stat`, so a file that has been modified or replaced since
+    its handle was cached is re-opened rather than using the stale handle.
+    Once the cache is full the least recently used handle is closed to make
+    room for a new one.
+
+    The cache is safe to share between threads. Each handle is only used by
+    one thread at a time, and a thread that finds no free handle for a file
+    opens a new one rather than waiting.
+
+    Examples
+    --------
+
+    ::
+
+        import os
+
+        from pydicom.fileutil import FileHandleCache
+
+        cache = FileHandleCache(maxsize=4)
+        st = os.stat("path/to/file.dcm")
+        with cache.open("path/to/file.dcm", (st.st_ino, st.st_mtime_ns)) as fp:
+            fp.seek(offset)
+            value = fp.read(length)
+
+        # Close any handles to a file so it can be deleted or replaced
+        cache.invalidate("path/to/file.dcm")
+        # Close all the open handles
+        cache.close()
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        """Create a new cache of file handles.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of file handles to keep open (default ``16``),
+            if ``0`` then no handles will be kept open after use.
+        """
+        self.maxsize = maxsize
+        self._handles: OrderedDict[tuple[str, Hashable, Any], BinaryIO] = OrderedDict()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        """Return the number of open file handles in the cache."""
+        return len(self._handles)
+
+    def close(self) -> None:
+        """Close all the file handles in the cache."""
+        self.invalidate()
+
+    def invalidate(self, path: PathType | None = None) -> None:
+        """Close and remove cached file handles.
+
+        Parameters
+        ----------
+        path : str | bytes | os.PathLike, optional
+            If used then only close the handles for `path`, otherwise close
+            all the handles in the cache (default).
+        """
+        if path is not None:
+            path = cast(str, path_from_pathlike(path))
+
+        with self._lock:
+            for key in list(self._handles):
+                if path is None or key[0] == path:
+                    self._handles.pop(key).close()
+
+    @contextmanager
+    def open(
+        self,
+        path: str,
+        version: Hashable,
+        opener: Callable[[str, str], BinaryIO] = open,  # type: ignore[assignment]
+    ) -> Iterator[BinaryIO]:
+        """Yield an open file handle for `path`.
+
+        The handle is only valid within the context manager and mustn't be
+        closed by the caller.
+
+        Parameters
+        ----------
+        path : str
+            The path to the file.
+        version : Hashable
+            A value that identifies the current contents of the file, such as
+            its ``(st_ino, st_mtime_ns)`` from :func:`os.stat`. A cached
+            handle is only used if it was opened for the same `version`, and
+            any handles for other versions are closed.
+        opener : Callable[[str, str], BinaryIO], optional
+            The callable used to open the file in ``"rb"`` mode when there's
+            no suitable cached handle (default :func:`open`).
+
+        Yields
+        ------
+        BinaryIO
+            The open file handle.
+        """
+        key = (path, version, opener)
+        # Only hold the lock while looking up and storing the handle, so
+        #   other threads aren't blocked while it's in use
+        with self._lock:
+            fp = self._handles.pop(key, None)
+            if fp is None:
+                # Any other cached handles for `path` are stale
+                self.invalidate(path)
+
+        if fp is None:
+            fp = opener(path, "rb")
+
+        try:
+            yield fp
+        except BaseException:
+            fp.close()
+            raise
+
+        with self._lock:
+            # Another thread may have cached a handle for `key` in the meantime
+            other = self._handles.pop(key, None)
+            if other is not None:
+                other.close()
+
+            self._handles[key] = fp
+            while len(self._handles) > self.maxsize:
+                self._handles.popitem(last=False)[1].close()
+
+
 def _unpack_tag(b: bytes, endianness: str) -> BaseTag:
     return TupleTag(cast(tuple[int, int], unpack(f"{endianness}HH", b)))
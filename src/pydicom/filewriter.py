@@ -3,20 +3,34 @@
 
 from collections.abc import Sequence, MutableSequence, Iterable
 from copy import deepcopy
+import os
+import shutil
 from struct import pack
+import tempfile
 from typing import BinaryIO, Any, cast
 import zlib
 
 from pydicom import config
 from pydicom.charset import default_encoding, convert_encodings, encode_string
+from pydicom.datadict import dictionary_VR, private_dictionary_VR
 from pydicom.dataelem import DataElement_from_raw, DataElement, RawDataElement
 from pydicom.dataset import Dataset, validate_file_meta, FileMetaDataset
+from pydicom.encaps import EncapsulatedFrames
 from pydicom.filebase import DicomFile, DicomBytesIO, DicomIO, WriteableBuffer
+from pydicom.filereader import (
+    _dataset_encoding,
+    _scan_elements,
+    data_element_generator,
+    dcmread,
+    read_preamble,
+)
 from pydicom.fileutil import path_from_pathlike, PathType
 from pydicom.misc import warn_and_log
 from pydicom.multival import MultiValue
 from pydicom.tag import (
+    BaseTag,
     Tag,
+    TagType,
     ItemTag,
     ItemDelimiterTag,
     SequenceDelimiterTag,
@@ -591,6 +605,18 @@ def write_data_element(
     # Write element's tag
     fp.write_tag(elem.tag)
 
+    if not elem.is_raw and isinstance(elem.value, EncapsulatedFrames):
+        # Stream the encapsulated frames directly to `fp`
+        if not fp.is_implicit_VR:
+            fp.write(b"OB")
+            fp.write_US(0)  # reserved 2 bytes
+
+        fp.write_UL(0xFFFFFFFF)
+        elem.value.write(fp)
+        fp.write_tag(SequenceDelimiterTag)
+        fp.write_UL(0)
+        return
+
     # write into a buffer to avoid seeking back which can be expansive
     buffer = DicomBytesIO()
     buffer.is_little_endian = fp.is_little_endian
@@ -639,7 +665,7 @@ def write_data_element(
         if not fp.is_little_endian:
             # Non-conformant endianness
             encap_item = b"\xff\xfe\xe0\x00"
-        if not cast(bytes, elem.value).startswith(encap_item):
+        if bytes(cast(bytes, elem.value)[:4]) != encap_item:
             raise ValueError(
                 "(7FE0,0010) Pixel Data has an undefined length indicating "
                 "that it's compressed, but the data isn't encapsulated as "
@@ -688,6 +714,55 @@ def write_data_element(
         fp.write_UL(0)  # 4-byte 'length' of delimiter data item
 
 
+def _write_raw_data_element(fp: DicomIO, elem: RawDataElement) -> bool:
+    """Copy the encoded value of `elem` straight to `fp`.
+
+    Only used when the encoding and character set of the dataset containing
+    `elem` are unchanged since it was read, as the value can then be written
+    as-is without converting it to a :class:`~pydicom.dataelem.DataElement`.
+
+    Parameters
+    ----------
+    fp : pydicom.filebase.DicomIO
+        The file-like to write the encoded data to.
+    elem : pydicom.dataelem.RawDataElement
+        The raw element to write.
+
+    Returns
+    -------
+    bool
+        ``True`` if `elem` was written, ``False`` if it needs to be written
+        using :func:`write_data_element` instead.
+    """
+    value = elem.value
+    length = elem.length
+    if not isinstance(value, bytes) or length != len(value):
+        # Deferred reads, undefined length and user-created elements
+        return False
+
+    tag = elem.tag
+    endianness = "<" if fp.is_little_endian else ">"
+    if fp.is_implicit_VR:
+        fp.write(pack(f"{endianness}HHL", tag >> 16, tag & 0xFFFF, length))
+    else:
+        vr = elem.VR
+        if not vr or len(vr) != 2:
+            return False
+
+        if vr in EXPLICIT_VR_LENGTH_32:
+            fmt = f"{endianness}HH2sHL"
+            fp.write(pack(fmt, tag >> 16, tag & 0xFFFF, vr.encode(), 0, length))
+        elif length <= 0xFFFF:
+            fmt = f"{endianness}HH2sH"
+            fp.write(pack(fmt, tag >> 16, tag & 0xFFFF, vr.encode(), length))
+        else:
+            return False
+
+    fp.write(value)
+
+    return True
+
+
 EncodingType = tuple[bool | None, bool | None]
 
 
@@ -760,18 +835,84 @@ def write_dataset(
 
     fpStart = fp.tell()
 
+    # Streamed Pixel Data may replace the Extended Offset Table elements
+    use_extended = False
+    if 0x7FE00010 in dataset:
+        value = getattr(dataset.get_item(0x7FE00010), "value", None)
+        use_extended = isinstance(value, EncapsulatedFrames) and value.use_extended
+
+    # Unconverted raw elements can be copied as-is when the encoding and
+    #   character set are the same as when `dataset` was read
+    is_unchanged = (
+        fp_encoding == or_encoding
+        and dataset.original_character_set == dataset._character_set
+    )
+    elements = dataset._dict
+
     # data_elements must be written in tag order
     for tag in sorted(dataset.keys()):
         # do not write retired Group Length (see PS3.5, 7.2)
         if tag.element == 0 and tag.group > 6:
             continue
 
+        if use_extended and tag in (0x7FE00001, 0x7FE00002):
+            continue
+
+        if is_unchanged:
+            raw = elements[tag]
+            if raw.__class__ is RawDataElement and _write_raw_data_element(
+                fp, cast(RawDataElement, raw)
+            ):
+                continue
+
         with tag_in_exception(tag):
-            write_data_element(fp, dataset.get_item(tag), dataset_encoding)
+            elem = dataset.get_item(tag)
+            if use_extended and tag == 0x7FE00010:
+                _write_extended_pixel_data(fp, cast(DataElement, elem))
+            else:
+                write_data_element(fp, elem, dataset_encoding)
 
     return fp.tell() - fpStart
 
 
+def _write_extended_pixel_data(fp: DicomIO, elem: DataElement) -> None:
+    """Write the Extended Offset Table elements followed by the streamed
+    *Pixel Data* in `elem`.
+
+    The values of the (7FE0,0001) *Extended Offset Table* and (7FE0,0002)
+    *Extended Offset Table Lengths* elements are back-patched once all the
+    frames have been written.
+
+    Parameters
+    ----------
+    fp : pydicom.filebase.DicomIO
+        The seekable file-like to write the encoded data to.
+    elem : pydicom.dataelem.DataElement
+        The *Pixel Data* element with an
+        :class:`~pydicom.encaps.EncapsulatedFrames` value.
+    """
+    source = cast(EncapsulatedFrames, elem.value)
+    length = 8 * cast(int, source.number_of_frames)
+
+    # Reserve space for the table values
+    positions = []
+    for tag in (0x7FE00001, 0x7FE00002):
+        write_data_element(fp, DataElement(tag, VR.OV, b"\x00" * length))
+        positions.append(fp.tell() - length)
+
+    write_data_element(fp, elem)
+
+    # Go back and write the table values
+    end = fp.tell()
+    endianness = "<" if fp.is_little_endian else ">"
+    nr_frames = length // 8
+    for position, values in zip(positions, (source.offsets, source.lengths)):
+        fp.seek(position)
+        fp.write(pack(f"{endianness}{nr_frames}Q", *values))
+
+    fp.seek(end)
+
+
 def write_sequence(fp: DicomIO, elem: DataElement, encodings: list[str]) -> None:
     """Write a sequence contained in `data_element` to the file-like `fp`.
 
@@ -786,6 +927,18 @@ def write_sequence(fp: DicomIO, elem: DataElement, encodings: list[str]) -> None
     """
     # write_data_element has already written the VR='SQ' (if needed) and
     #    a placeholder for length"""
+    # Sequences that are unchanged since being read can be written as-is
+    #   provided the encoding is the same
+    encoded = getattr(elem.value, "_unmodified_value", None)
+    if (
+        encoded is not None
+        and encoded.is_implicit_VR == fp.is_implicit_VR
+        and encoded.is_little_endian == fp.is_little_endian
+        and convert_encodings(encoded.encoding) == encodings
+    ):
+        fp.write(encoded.value)
+        return
+
     for ds in cast(Iterable[Dataset], elem.value):
         write_sequence_item(fp, ds, encodings)
 
@@ -1415,6 +1568,291 @@ def dcmwrite(
             fp.close()
 
 
+def patch_file(
+    filename: PathType,
+    values: dict[TagType, Any],
+    *,
+    force: bool = False,
+) -> bool:
+    """Change the values of top-level elements in the DICOM file at
+    `filename` without decoding and re-encoding the entire dataset.
+
+    .. versionadded:: 3.0
+
+    If every element in `values` is already present in the file and its
+    new encoded value has the same length as the current one (such as a
+    fixed-length numeric value or a string with the same padded length)
+    then the values are overwritten in place. Otherwise the file is rewritten
+    by copying the unchanged parts of the file, including the *Pixel Data*,
+    from the original using :func:`os.copy_file_range` or :func:`os.sendfile`
+    where available, and writing only the new elements.
+
+    Examples
+    --------
+
+    >>> from pydicom.filewriter import patch_file
+    >>> patch_file("CT_small.dcm", {"PatientID": "12345678"})
+    True
+
+    Parameters
+    ----------
+    filename : str | PathLike
+        The path to the DICOM file to change.
+    values : dict[int | str | tuple[int, int] | BaseTag, Any]
+        The new values as ``{tag: value}``, where the tag may also be an
+        element keyword and the value may be a
+        :class:`~pydicom.dataelem.DataElement`. Elements that aren't present
+        in the file are added, using the VR from the DICOM data dictionary
+        (or the private data dictionary) if no
+        :class:`~pydicom.dataelem.DataElement` is given. Ambiguous VRs such as
+        **US or SS** are resolved using the file's *Pixel Representation*.
+    force : bool, optional
+        If ``True`` then change files that are missing the DICOM File Meta
+        Information header, see :func:`~pydicom.filereader.dcmread` (default
+        ``False``).
+
+    Returns
+    -------
+    bool
+        ``True`` if the file was changed in place, ``False`` if it was
+        rewritten.
+
+    Raises
+    ------
+    ValueError
+        If `values` contains a *File Meta Information* element, or the VR of
+        a private element can't be determined.
+
+    See Also
+    --------
+    pydicom.filereader.data_element_generator
+        Used to find the location of each element in the file.
+    """
+    tags = {Tag(tag): value for tag, value in values.items()}
+    if not tags:
+        return True
+
+    if any(tag.group == 0x0002 for tag in tags):
+        raise ValueError(
+            "'patch_file()' cannot be used to change File Meta Information elements"
+        )
+
+    filename = cast(str, path_from_pathlike(filename))
+    with open(filename, "rb") as f:
+        read_preamble(f, force)
+        transfer_syntax = None
+        for elem in _scan_elements(f, False, True, {0x00020010}, 0x0002FFFF):
+            if elem.value:
+                transfer_syntax = UID(
+                    cast(bytes, elem.value).decode(default_encoding).strip(" \0")
+                )
+
+        if transfer_syntax == DeflatedExplicitVRLittleEndian:
+            # The dataset is compressed so has to be decoded and re-encoded
+            f.seek(0)
+            ds = dcmread(f, force=force)
+            for tag, value in sorted(tags.items()):
+                ds[tag] = _patch_element(tag, value, ds.get_item(tag), ds)
+
+            for tag in tags:
+                correct_ambiguous_vr_element(ds[tag], ds, True)
+
+            f.close()
+            ds.save_as(filename)
+            return False
+
+        fp, is_implicit_VR, is_little_endian = _dataset_encoding(f, transfer_syntax)
+
+        # The location of each top-level element up to the last one of interest
+        #   as {tag: (start offset, end offset, element)}, including the
+        #   elements needed to resolve ambiguous VRs
+        last_tag = max(*tags, 0x00280103)
+        locations: dict[BaseTag, tuple[int, int, RawDataElement | DataElement]] = {}
+        elements = data_element_generator(
+            fp,
+            is_implicit_VR,
+            is_little_endian,
+            stop_when=lambda tag, vr, length: tag > last_tag,
+            # Only small values such as the character set, private creators
+            #   and Pixel Representation are needed
+            defer_size=1024,
+        )
+        start = fp.tell()
+        for elem in elements:
+            locations[elem.tag] = (start, fp.tell(), elem)
+            start = fp.tell()
+
+        end_of_file = fp.seek(0, os.SEEK_END)
+
+    # The scanned elements with the new values, used to look up the private
+    #   creators and the values needed to resolve ambiguous VRs
+    context = Dataset({tag: loc[2] for tag, loc in locations.items()})
+    context.set_original_encoding(is_implicit_VR, is_little_endian, default_encoding)
+    for tag, value in sorted(tags.items()):
+        original = locations[tag][2] if tag in locations else None
+        context[tag] = _patch_element(tag, value, original, context)
+
+    for tag in tags:
+        correct_ambiguous_vr_element(context[tag], context, is_little_endian)
+
+    charset = context.get("SpecificCharacterSet")
+    encodings = convert_encodings(charset or default_encoding)
+
+    # The encoded elements and the offsets of the data they replace
+    patches: list[tuple[int, int, bytes]] = []
+    for tag in sorted(tags):
+        buffer = DicomBytesIO()
+        buffer.is_implicit_VR = is_implicit_VR
+        buffer.is_little_endian = is_little_endian
+        if tag in locations:
+            offset, end, _ = locations[tag]
+        else:
+            # Insert before the first element with a larger tag
+            offset = end = min(
+                (loc[0] for key, loc in locations.items() if key > tag),
+                default=start,
+            )
+
+        write_data_element(buffer, context[tag], encodings)
+        patches.append((offset, end, buffer.getvalue()))
+
+    if all(len(encoded) == end - start for start, end, encoded in patches):
+        with open(filename, "r+b") as f:
+            for start, _, encoded in patches:
+                f.seek(start)
+                f.write(encoded)
+
+        return True
+
+    # Stream the unchanged parts of the file to a new file with the patches
+    #   inserted, then replace the original
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, path = tempfile.mkstemp(suffix=".dcm", dir=directory)
+    try:
+        with open(filename, "rb") as src, open(fd, "wb", buffering=0) as dst:
+            offset = 0
+            for start, end, encoded in patches:
+                _copy_range(src, dst, offset, start - offset)
+                dst.write(encoded)
+                offset = end
+
+            _copy_range(src, dst, offset, end_of_file - offset)
+
+        shutil.copymode(filename, path)
+        os.replace(path, filename)
+    except BaseException:
+        os.remove(path)
+        raise
+
+    return False
+
+
+def _patch_element(
+    tag: BaseTag,
+    value: Any,
+    original: DataElement | RawDataElement | None,
+    ds: Dataset,
+) -> DataElement:
+    """Return a :class:`~pydicom.dataelem.DataElement` for the new `value`.
+
+    Parameters
+    ----------
+    tag : pydicom.tag.BaseTag
+        The element's tag.
+    value : Any
+        The new value for the element, or the new element.
+    original : pydicom.dataelem.DataElement | pydicom.dataelem.RawDataElement | None
+        The element being replaced, or ``None`` if it's a new element.
+    ds : pydicom.dataset.Dataset
+        The dataset containing the element, used to find the private creator
+        for private elements.
+
+    Returns
+    -------
+    pydicom.dataelem.DataElement
+        The new element, which may have an ambiguous VR.
+
+    Raises
+    ------
+    ValueError
+        If the VR of a private element can't be determined.
+    """
+    if isinstance(value, DataElement):
+        return value
+
+    # Elements in implicit VR datasets have no VR
+    vr = getattr(original, "VR", None)
+    if vr:
+        return DataElement(tag, vr, value)
+
+    try:
+        return DataElement(tag, dictionary_VR(tag), value)
+    except KeyError:
+        pass
+
+    if tag.is_private and not tag.is_private_creator:
+        creator = ds.get(tag.private_creator)
+        if creator is not None:
+            try:
+                vr = private_dictionary_VR(tag, creator.value)
+                return DataElement(tag, vr, value)
+            except KeyError:
+                pass
+
+    raise ValueError(
+        f"Unable to determine the VR for the element with tag {tag}, use a "
+        "'DataElement' with the VR set as the value instead"
+    )
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int) -> None:
+    """Copy `length` bytes starting at `offset` in `src` to the current
+    position in `dst`.
+
+    The data is copied by the kernel using :func:`os.copy_file_range` or
+    :func:`os.sendfile` if possible, otherwise it's copied in chunks.
+
+    Parameters
+    ----------
+    src : file-like
+        The file to copy from.
+    dst : file-like
+        The unbuffered file to copy to.
+    offset : int
+        The offset in `src` to start copying from.
+    length : int
+        The number of bytes to copy.
+    """
+    src_fd = src.fileno()
+    dst_fd = dst.fileno()
+    for method in ("copy_file_range", "sendfile"):
+        if not hasattr(os, method):
+            continue
+
+        try:
+            while length > 0:
+                if method == "copy_file_range":
+                    nr_copied = os.copy_file_range(src_fd, dst_fd, length, offset)
+                else:
+                    nr_copied = os.sendfile(dst_fd, src_fd, offset, length)
+
+                if not nr_copied:
+                    break
+
+                offset += nr_copied
+                length -= nr_copied
+
+            return
+        except OSError:
+            # Not supported for this combination of files or platform
+            continue
+
+    src.seek(offset)
+    while length > 0 and (chunk := src.read(min(length, 1024 * 1024))):
+        dst.write(chunk)
+        length -= len(chunk)
+
+
 # Map each VR to a function which can write it
 # for write_numbers, the Writer maps to a tuple (function, struct_format)
 #   (struct_format is python's struct module format)
@@ -1,9 +1,13 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Miscellaneous helper functions"""
 
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 from itertools import groupby
 from pathlib import Path
+from typing import Any
 import warnings
 
 
@@ -81,3 +85,49 @@ def warn_and_log(
     """
     LOGGER.warning(msg)
     warnings.warn(msg, category, stacklevel=stacklevel + 1)
+
+
+def _imap_ordered(
+    func: Callable[..., Any],
+    items: Iterable[tuple[Any, ...]],
+    workers: int,
+    threads: bool = False,
+) -> Iterator[Any]:
+    """Yield ``func(*item)`` for each item in `items` using a pool of workers.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to run in the pool, must be picklable if `threads` is
+        ``False``.
+    items : Iterable[tuple[Any, ...]]
+        The arguments to pass to `func`. `items` is consumed lazily, with no
+        more than ``2 * workers`` items in flight at any one time.
+    workers : int
+        The maximum number of workers in the pool.
+    threads : bool, optional
+        If ``True`` then use a thread pool, which is only useful if `func`
+        releases the GIL, otherwise use a process pool (default).
+
+    Yields
+    ------
+    Any
+        The results of `func`, in the same order as `items`.
+    """
+    executor: Executor
+    if threads:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    pending: deque[Future[Any]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, *item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
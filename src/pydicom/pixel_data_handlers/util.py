@@ -1,10 +1,10 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Utility functions used in the pixel data handlers."""
 
-from struct import unpack, unpack_from
+from functools import cache, lru_cache
 from sys import byteorder
-from typing import Optional, TYPE_CHECKING, cast
-from collections.abc import Iterable, ByteString
+from typing import Optional, NamedTuple, TYPE_CHECKING, cast
+from collections.abc import ByteString, Sequence
 
 try:
     import numpy as np
@@ -27,12 +27,34 @@ _UNPACK_LUT: dict[int, bytes] = {
     k: bytes(int(s) for s in reversed(f"{k:08b}")) for k in range(256)
 }
 
+# The maximum number of LUTs to keep in each LUT cache
+_LUT_CACHE_SIZE = 32
+
+
+class _LUT(NamedTuple):
+    """A lookup table ready to be applied with :func:`_apply_lut`."""
+
+    #: The read-only LUT entries, as (entries,) or (entries, channels)
+    data: "np.ndarray"
+    #: The input value mapped to the first entry
+    first_map: int
+    #: The number of entries given by the LUT descriptor
+    nr_entries: int
+
 
 def apply_color_lut(
-    arr: "np.ndarray", ds: Optional["Dataset"] = None, palette: str | UID | None = None
+    arr: "np.ndarray",
+    ds: Optional["Dataset"] = None,
+    palette: str | UID | None = None,
+    *,
+    out: Optional["np.ndarray"] = None,
 ) -> "np.ndarray":
     """Apply a color palette lookup table to `arr`.
 
+    .. versionchanged:: 3.0
+
+        Added the `out` keyword parameter
+
     If (0028,1201-1203) *Palette Color Lookup Table Data* are missing
     then (0028,1221-1223) *Segmented Palette Color Lookup Table Data* must be
     present and vice versa. The presence of (0028,1204) *Alpha Palette Color
@@ -59,6 +81,10 @@ def apply_color_lut(
         ``'HOT_METAL_BLUE'``, ``'PET_20_STEP'``, ``'SPRING'``, ``'SUMMER'``,
         ``'FALL'``, ``'WINTER'`` or the corresponding well-known (0008,0018)
         *SOP Instance UID*.
+    out : numpy.ndarray, optional
+        If used then the RGB or RGBA pixel data will be written to `out`
+        rather than a new array, which must have the same shape and dtype
+        as the returned array.
 
     Returns
     -------
@@ -67,6 +93,11 @@ def apply_color_lut(
         values, depending on the 3rd value of (0028,1201) *Red Palette Color
         Lookup Table Descriptor*.
 
+    Notes
+    -----
+    The lookup tables are cached, so applying the same palette to further
+    arrays only needs the lookup itself.
+
     References
     ----------
 
@@ -111,13 +142,12 @@ def apply_color_lut(
                 raise ValueError(f"Unknown palette '{palette}'")
 
         try:
-            from pydicom import dcmread
-
             fname = datasets[palette]
-            ds = dcmread(get_palette_files(fname)[0])
         except KeyError:
             raise ValueError(f"Unknown palette '{palette}'")
 
+        ds = _well_known_palette(fname)
+
     ds = cast("Dataset", ds)
 
     # C.8.16.2.1.1.1: Supplemental Palette Color LUT
@@ -131,95 +161,17 @@ def apply_color_lut(
     if "RedPaletteColorLookupTableDescriptor" not in ds:
         raise ValueError("No suitable Palette Color Lookup Table Module found")
 
-    # All channels are supposed to be identical
-    lut_desc = cast(list[int], ds.RedPaletteColorLookupTableDescriptor)
-    # A value of 0 = 2^16 entries
-    nr_entries = lut_desc[0] or 2**16
-
-    # May be negative if Pixel Representation is 1
-    first_map = lut_desc[1]
-    # Actual bit depth may be larger (8 bit entries in 16 bits allocated)
-    nominal_depth = lut_desc[2]
-    dtype = np.dtype(f"uint{nominal_depth:.0f}")
-
-    luts = []
-    if "RedPaletteColorLookupTableData" in ds:
-        # LUT Data is described by PS3.3, C.7.6.3.1.6
-        r_lut = cast(bytes, ds.RedPaletteColorLookupTableData)
-        g_lut = cast(bytes, ds.GreenPaletteColorLookupTableData)
-        b_lut = cast(bytes, ds.BluePaletteColorLookupTableData)
-        a_lut = cast(
-            bytes | None, getattr(ds, "AlphaPaletteColorLookupTableData", None)
-        )
-
-        actual_depth = len(r_lut) / nr_entries * 8
-        dtype = np.dtype(f"uint{actual_depth:.0f}")
-
-        for lut_bytes in [ii for ii in [r_lut, g_lut, b_lut, a_lut] if ii]:
-            luts.append(np.frombuffer(lut_bytes, dtype=dtype))
-    elif "SegmentedRedPaletteColorLookupTableData" in ds:
-        # Segmented LUT Data is described by PS3.3, C.7.9.2
-        r_lut = cast(bytes, ds.SegmentedRedPaletteColorLookupTableData)
-        g_lut = cast(bytes, ds.SegmentedGreenPaletteColorLookupTableData)
-        b_lut = cast(bytes, ds.SegmentedBluePaletteColorLookupTableData)
-        a_lut = cast(
-            bytes | None, getattr(ds, "SegmentedAlphaPaletteColorLookupTableData", None)
-        )
-
-        if hasattr(ds, "file_meta"):
-            is_little_endian = ds.file_meta._tsyntax_encoding[1]
-        else:
-            is_little_endian = ds.original_encoding[1]
-
-        if is_little_endian is None:
-            raise AttributeError(
-                "Unable to determine the endianness of the dataset, please set "
-                "an appropriate Transfer Syntax UID in "
-                f"'{type(ds).__name__}.file_meta'"
-            )
-
-        endianness = "><"[is_little_endian]
-        byte_depth = nominal_depth // 8
-        fmt = "B" if byte_depth == 1 else "H"
-        actual_depth = nominal_depth
-
-        for seg in [ii for ii in [r_lut, g_lut, b_lut, a_lut] if ii]:
-            len_seg = len(seg) // byte_depth
-            s_fmt = f"{endianness}{len_seg}{fmt}"
-            lut_ints = _expand_segmented_lut(unpack(s_fmt, seg), s_fmt)
-            luts.append(np.asarray(lut_ints, dtype=dtype))
-    else:
-        raise ValueError("No suitable Palette Color Lookup Table Module found")
-
-    if actual_depth not in [8, 16]:
-        raise ValueError(
-            f"The bit depth of the LUT data '{actual_depth:.1f}' "
-            "is invalid (only 8 or 16 bits per entry allowed)"
-        )
+    return _apply_lut(arr, _palette_color_lut(ds), out)
 
-    lut_lengths = [len(ii) for ii in luts]
-    if not all(ii == lut_lengths[0] for ii in lut_lengths[1:]):
-        raise ValueError("LUT data must be the same length")
-
-    # IVs < `first_map` get set to first LUT entry (i.e. index 0)
-    clipped_iv = np.zeros(arr.shape, dtype=dtype)
-    # IVs >= `first_map` are mapped by the Palette Color LUTs
-    # `first_map` may be negative, positive or 0
-    mapped_pixels = arr >= first_map
-    clipped_iv[mapped_pixels] = arr[mapped_pixels] - first_map
-    # IVs > number of entries get set to last entry
-    np.clip(clipped_iv, 0, nr_entries - 1, out=clipped_iv)
-
-    # Output array may be RGB or RGBA
-    out = np.empty(list(arr.shape) + [len(luts)], dtype=dtype)
-    for ii, lut in enumerate(luts):
-        out[..., ii] = lut[clipped_iv]
 
-    return out
+def apply_modality_lut(
+    arr: "np.ndarray", ds: "Dataset", *, out: Optional["np.ndarray"] = None
+) -> "np.ndarray":
+    """Apply a modality lookup table or rescale operation to `arr`.
 
+    .. versionchanged:: 3.0
 
-def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
-    """Apply a modality lookup table or rescale operation to `arr`.
+        Added the `out` keyword parameter
 
     Parameters
     ----------
@@ -229,6 +181,10 @@ def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
     ds : dataset.Dataset
         A dataset containing a :dcm:`Modality LUT Module
         <part03/sect_C.11.html#sect_C.11.1>`.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr` and a dtype the result
+        can be cast to.
 
     Returns
     -------
@@ -239,7 +195,7 @@ def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
         (0028,3002) *LUT Descriptor*. If (0028,1052) *Rescale Intercept* and
         (0028,1053) *Rescale Slope* are present then returns an array of
         ``np.float64``. If neither are present then `arr` will be returned
-        unchanged.
+        unchanged (or copied to `out`).
 
     Notes
     -----
@@ -258,54 +214,25 @@ def apply_modality_lut(arr: "np.ndarray", ds: "Dataset") -> "np.ndarray":
     """
     if ds.get("ModalityLUTSequence"):
         item = cast(list["Dataset"], ds.ModalityLUTSequence)[0]
-        nr_entries = cast(list[int], item.LUTDescriptor)[0] or 2**16
-        first_map = cast(list[int], item.LUTDescriptor)[1]
         nominal_depth = cast(list[int], item.LUTDescriptor)[2]
+        return _apply_lut(arr, _item_lut(ds, item, f"uint{nominal_depth}"), out)
 
-        dtype = f"uint{nominal_depth}"
-
-        # Ambiguous VR, US or OW
-        unc_data: Iterable[int]
-        if item["LUTData"].VR == VR.OW:
-            if hasattr(ds, "file_meta"):
-                is_little_endian = ds.file_meta._tsyntax_encoding[1]
-            else:
-                is_little_endian = ds.original_encoding[1]
+    if "RescaleSlope" in ds and "RescaleIntercept" in ds:
+        slope = cast(float, ds.RescaleSlope)
+        result = np.multiply(arr, slope, out=out, dtype=np.float64)
+        result += cast(float, ds.RescaleIntercept)
+        return cast("np.ndarray", result)
 
-            if is_little_endian is None:
-                raise AttributeError(
-                    "Unable to determine the endianness of the dataset, please set "
-                    "an appropriate Transfer Syntax UID in "
-                    f"'{type(ds).__name__}.file_meta'"
-                )
-
-            endianness = "><"[is_little_endian]
-            unpack_fmt = f"{endianness}{nr_entries}H"
-            unc_data = unpack(unpack_fmt, cast(bytes, item.LUTData))
-        else:
-            unc_data = cast(list[int], item.LUTData)
-
-        lut_data: np.ndarray = np.asarray(unc_data, dtype=dtype)
-
-        # IVs < `first_map` get set to first LUT entry (i.e. index 0)
-        clipped_iv = np.zeros(arr.shape, dtype=arr.dtype)
-        # IVs >= `first_map` are mapped by the Modality LUT
-        # `first_map` may be negative, positive or 0
-        mapped_pixels = arr >= first_map
-        clipped_iv[mapped_pixels] = arr[mapped_pixels] - first_map
-        # IVs > number of entries get set to last entry
-        np.clip(clipped_iv, 0, nr_entries - 1, out=clipped_iv)
-
-        return lut_data[clipped_iv]
-    elif "RescaleSlope" in ds and "RescaleIntercept" in ds:
-        arr = arr.astype(np.float64) * cast(float, ds.RescaleSlope)
-        arr += cast(float, ds.RescaleIntercept)
-
-    return arr
+    return _unchanged(arr, out)
 
 
 def apply_voi_lut(
-    arr: "np.ndarray", ds: "Dataset", index: int = 0, prefer_lut: bool = True
+    arr: "np.ndarray",
+    ds: "Dataset",
+    index: int = 0,
+    prefer_lut: bool = True,
+    *,
+    out: Optional["np.ndarray"] = None,
 ) -> "np.ndarray":
     """Apply a VOI lookup table or windowing operation to `arr`.
 
@@ -313,6 +240,10 @@ def apply_voi_lut(
 
         Added the `prefer_lut` keyword parameter
 
+    .. versionchanged:: 3.0
+
+        Added the `out` keyword parameter
+
     Parameters
     ----------
     arr : numpy.ndarray
@@ -333,6 +264,10 @@ def apply_voi_lut(
         When the VOI LUT Module contains both *Window Width*/*Window Center*
         and *VOI LUT Sequence*, if ``True`` (default) then apply the VOI LUT,
         otherwise apply the windowing operation.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr` and the dtype of the
+        returned array.
 
     Returns
     -------
@@ -374,24 +309,34 @@ def apply_voi_lut(
 
     if valid_voi and valid_windowing:
         if prefer_lut:
-            return apply_voi(arr, ds, index)
+            return apply_voi(arr, ds, index, out=out)
 
-        return apply_windowing(arr, ds, index)
+        return apply_windowing(arr, ds, index, out=out)
 
     if valid_voi:
-        return apply_voi(arr, ds, index)
+        return apply_voi(arr, ds, index, out=out)
 
     if valid_windowing:
-        return apply_windowing(arr, ds, index)
+        return apply_windowing(arr, ds, index, out=out)
 
-    return arr
+    return _unchanged(arr, out)
 
 
-def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
+def apply_voi(
+    arr: "np.ndarray",
+    ds: "Dataset",
+    index: int = 0,
+    *,
+    out: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
     """Apply a VOI lookup table to `arr`.
 
     .. versionadded:: 2.1
 
+    .. versionchanged:: 3.0
+
+        Added the `out` keyword parameter
+
     Parameters
     ----------
     arr : numpy.ndarray
@@ -405,6 +350,10 @@ def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
     index : int, optional
         When the VOI LUT Module contains multiple alternative views, this is
         the index of the view to return (default ``0``).
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr` and the dtype of the
+        returned array.
 
     Returns
     -------
@@ -426,7 +375,7 @@ def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
       <part04/sect_N.2.html#sect_N.2.1.1>`
     """
     if not ds.get("VOILUTSequence"):
-        return arr
+        return _unchanged(arr, out)
 
     if not np.issubdtype(arr.dtype, np.integer):
         warn_and_log(
@@ -435,12 +384,8 @@ def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
 
     # VOI LUT Sequence contains one or more items
     item = cast(list["Dataset"], ds.VOILUTSequence)[index]
-    lut_descriptor = cast(list[int], item.LUTDescriptor)
-    nr_entries = lut_descriptor[0] or 2**16
-    first_map = lut_descriptor[1]
-
     # PS3.3 C.8.11.3.1.5: may be 8, 10-16
-    nominal_depth = lut_descriptor[2]
+    nominal_depth = cast(list[int], item.LUTDescriptor)[2]
     if nominal_depth in list(range(10, 17)):
         dtype = "uint16"
     elif nominal_depth == 8:
@@ -450,45 +395,24 @@ def apply_voi(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
             f"'{nominal_depth}' bits per LUT entry is not supported"
         )
 
-    # Ambiguous VR, US or OW
-    unc_data: Iterable[int]
-    if item["LUTData"].VR == VR.OW:
-        if hasattr(ds, "file_meta"):
-            is_little_endian = ds.file_meta._tsyntax_encoding[1]
-        else:
-            is_little_endian = ds.original_encoding[1]
-
-        if is_little_endian is None:
-            raise AttributeError(
-                "Unable to determine the endianness of the dataset, please set "
-                "an appropriate Transfer Syntax UID in "
-                f"'{type(ds).__name__}.file_meta'"
-            )
-
-        unpack_fmt = f"{'><'[is_little_endian]}{nr_entries}H"
-        unc_data = unpack_from(unpack_fmt, cast(bytes, item.LUTData))
-    else:
-        unc_data = cast(list[int], item.LUTData)
-
-    lut_data: np.ndarray = np.asarray(unc_data, dtype=dtype)
-
-    # IVs < `first_map` get set to first LUT entry (i.e. index 0)
-    clipped_iv = np.zeros(arr.shape, dtype=dtype)
-    # IVs >= `first_map` are mapped by the VOI LUT
-    # `first_map` may be negative, positive or 0
-    mapped_pixels = arr >= first_map
-    clipped_iv[mapped_pixels] = arr[mapped_pixels] - first_map
-    # IVs > number of entries get set to last entry
-    np.clip(clipped_iv, 0, nr_entries - 1, out=clipped_iv)
-
-    return cast("np.ndarray", lut_data[clipped_iv])
+    return _apply_lut(arr, _item_lut(ds, item, dtype), out)
 
 
-def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.ndarray":
+def apply_windowing(
+    arr: "np.ndarray",
+    ds: "Dataset",
+    index: int = 0,
+    *,
+    out: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
     """Apply a windowing operation to `arr`.
 
     .. versionadded:: 2.1
 
+    .. versionchanged:: 3.0
+
+        Added the `out` keyword parameter
+
     Parameters
     ----------
     arr : numpy.ndarray
@@ -501,6 +425,10 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
     index : int, optional
         When the VOI LUT Module contains multiple alternative views, this is
         the index of the view to return (default ``0``).
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr` and a floating point
+        dtype. May be `arr` itself if it's already a floating point array.
 
     Returns
     -------
@@ -528,7 +456,7 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
       <part04/sect_N.2.html#sect_N.2.1.1>`
     """
     if "WindowWidth" not in ds and "WindowCenter" not in ds:
-        return arr
+        return _unchanged(arr, out)
 
     if ds.PhotometricInterpretation not in ["MONOCHROME1", "MONOCHROME2"]:
         raise ValueError(
@@ -577,7 +505,12 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
         y_max = y_max * ds.RescaleSlope + ds.RescaleIntercept
 
     y_range = y_max - y_min
-    arr = arr.astype("float64")
+    if out is None:
+        result = arr.astype("float64")
+    else:
+        result = out
+        if out is not arr:
+            np.copyto(out, arr)
 
     if voi_func in ["LINEAR", "LINEAR_EXACT"]:
         # PS3.3 C.11.2.1.2.1 and C.11.2.1.3.2
@@ -595,14 +528,20 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
                 "for a 'LINEAR_EXACT' windowing operation"
             )
 
-        below = arr <= (center - width / 2)
-        above = arr > (center + width / 2)
-        between = np.logical_and(~below, ~above)
+        below = result <= (center - width / 2)
+        above = result > (center + width / 2)
+
+        # Apply the linear function in-place to every value, then replace
+        #   those outside the window (a `width` of 0 has no values inside)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result -= center
+            result /= width
+            result += 0.5
+            result *= y_range
+            result += y_min
 
-        arr[below] = y_min
-        arr[above] = y_max
-        if between.any():
-            arr[between] = ((arr[between] - center) / width + 0.5) * y_range + y_min
+        np.copyto(result, y_min, where=below)
+        np.copyto(result, y_max, where=above)
     elif voi_func == "SIGMOID":
         # PS3.3 C.11.2.1.3.1
         if width <= 0:
@@ -611,15 +550,258 @@ def apply_windowing(arr: "np.ndarray", ds: "Dataset", index: int = 0) -> "np.nda
                 "for a 'SIGMOID' windowing operation"
             )
 
-        arr = y_range / (1 + np.exp(-4 * (arr - center) / width)) + y_min
+        result -= center
+        result *= -4
+        result /= width
+        np.exp(result, out=result)
+        result += 1
+        np.divide(y_range, result, out=result)
+        result += y_min
     else:
         raise ValueError(f"Unsupported (0028,1056) VOI LUT Function value '{voi_func}'")
 
-    return arr
+    return result
+
+
+def _apply_lut(
+    arr: "np.ndarray", lut: _LUT, out: Optional["np.ndarray"] = None
+) -> "np.ndarray":
+    """Return `arr` after mapping its values through `lut`.
+
+    Values less than the first mapped value are mapped to the first LUT entry
+    and values past the end of the LUT are mapped to the last entry.
+    """
+    indices = arr
+    if lut.first_map or arr.dtype.kind not in "ui":
+        # Use a dtype wide enough that subtracting `first_map` can't wrap
+        dtype = np.int32 if arr.dtype.itemsize < 4 else np.int64
+        indices = np.subtract(arr, lut.first_map, dtype=dtype, casting="unsafe")
+
+    if len(lut.data) < lut.nr_entries:
+        # Non-conformant LUT data that's shorter than the descriptor says,
+        #   values mapped past the end of the data can't be looked up
+        indices = np.clip(indices, 0, lut.nr_entries - 1, dtype=np.int64)
+        return np.take(lut.data, indices, axis=0, out=out)
+
+    return np.take(lut.data, indices, axis=0, mode="clip", out=out)
+
+
+def _item_lut(ds: "Dataset", item: "Dataset", dtype: str) -> _LUT:
+    """Return the LUT from a *Modality LUT Sequence* or *VOI LUT Sequence*
+    item.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset containing the sequence, used to determine the endianness
+        of *LUT Data* with a VR of **OW**.
+    item : pydicom.dataset.Dataset
+        The sequence item containing the *LUT Descriptor* and *LUT Data*.
+    dtype : str
+        The dtype of the LUT entries.
+
+    Returns
+    -------
+    _LUT
+        The LUT, which is cached by the values of its elements.
+    """
+    descriptor = tuple(cast(list[int], item.LUTDescriptor))
+
+    # Ambiguous VR, US or OW
+    elem = item["LUTData"]
+    if elem.VR == VR.OW:
+        data = cast(bytes, elem.value)
+        return _lut_from_data(descriptor, data, dtype, _lut_endianness(ds))
+
+    return _lut_from_data(descriptor, tuple(cast(list[int], elem.value)), dtype, "")
+
+
+def _lut_endianness(ds: "Dataset") -> str:
+    """Return the endianness of the LUT data in `ds` as ``"<"`` or ``">"``."""
+    if hasattr(ds, "file_meta"):
+        is_little_endian = ds.file_meta._tsyntax_encoding[1]
+    else:
+        is_little_endian = ds.original_encoding[1]
+
+    if is_little_endian is None:
+        raise AttributeError(
+            "Unable to determine the endianness of the dataset, please set "
+            "an appropriate Transfer Syntax UID in "
+            f"'{type(ds).__name__}.file_meta'"
+        )
+
+    return "><"[is_little_endian]
+
+
+@lru_cache(maxsize=_LUT_CACHE_SIZE)
+def _lut_from_data(
+    descriptor: tuple[int, ...],
+    data: bytes | tuple[int, ...],
+    dtype: str,
+    endianness: str,
+) -> _LUT:
+    """Return a :class:`_LUT` for :func:`_item_lut`.
+
+    Parameters
+    ----------
+    descriptor : tuple[int, ...]
+        The *LUT Descriptor* value.
+    data : bytes | tuple[int, ...]
+        The *LUT Data* value, as :class:`bytes` if the VR is **OW**.
+    dtype : str
+        The dtype of the LUT entries.
+    endianness : str
+        The endianness of `data` if its :class:`bytes`.
+
+    Returns
+    -------
+    _LUT
+        The LUT.
+    """
+    nr_entries = descriptor[0] or 2**16
+    if isinstance(data, bytes):
+        lut = np.frombuffer(data, dtype=f"{endianness}u2", count=nr_entries)
+        lut = lut.astype(dtype)
+    else:
+        lut = np.asarray(data, dtype=dtype)[:nr_entries]
+
+    lut.flags.writeable = False
+
+    return _LUT(lut, descriptor[1], nr_entries)
+
+
+def _palette_color_lut(ds: "Dataset") -> _LUT:
+    """Return the Palette Color LUT from `ds`.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset containing the Palette Color Lookup Table Module.
+
+    Returns
+    -------
+    _LUT
+        The LUT with the red, green, blue and (optional) alpha entries as the
+        columns, which is cached by the values of its elements.
+    """
+    # All channels are supposed to be identical
+    descriptor = tuple(cast(list[int], ds.RedPaletteColorLookupTableDescriptor))
+
+    if "RedPaletteColorLookupTableData" in ds:
+        # LUT Data is described by PS3.3, C.7.6.3.1.6
+        data = (
+            cast(bytes, ds.RedPaletteColorLookupTableData),
+            cast(bytes, ds.GreenPaletteColorLookupTableData),
+            cast(bytes, ds.BluePaletteColorLookupTableData),
+            cast(bytes | None, getattr(ds, "AlphaPaletteColorLookupTableData", None)),
+        )
+        return _palette_lut_from_data(descriptor, data, None)
+
+    if "SegmentedRedPaletteColorLookupTableData" in ds:
+        # Segmented LUT Data is described by PS3.3, C.7.9.2
+        data = (
+            cast(bytes, ds.SegmentedRedPaletteColorLookupTableData),
+            cast(bytes, ds.SegmentedGreenPaletteColorLookupTableData),
+            cast(bytes, ds.SegmentedBluePaletteColorLookupTableData),
+            cast(
+                bytes | None,
+                getattr(ds, "SegmentedAlphaPaletteColorLookupTableData", None),
+            ),
+        )
+        return _palette_lut_from_data(descriptor, data, _lut_endianness(ds))
+
+    raise ValueError("No suitable Palette Color Lookup Table Module found")
+
+
+@lru_cache(maxsize=_LUT_CACHE_SIZE)
+def _palette_lut_from_data(
+    descriptor: tuple[int, ...],
+    data: tuple[bytes | None, ...],
+    endianness: str | None,
+) -> _LUT:
+    """Return a :class:`_LUT` for :func:`_palette_color_lut`.
+
+    Parameters
+    ----------
+    descriptor : tuple[int, ...]
+        The *Red Palette Color Lookup Table Descriptor* value.
+    data : tuple[bytes | None, ...]
+        The red, green, blue and alpha *Palette Color Lookup Table Data* or
+        *Segmented Palette Color Lookup Table Data* values.
+    endianness : str | None
+        The endianness of the segmented `data`, or ``None`` if `data` isn't
+        segmented.
+
+    Returns
+    -------
+    _LUT
+        The LUT.
+    """
+    # A value of 0 = 2^16 entries
+    nr_entries = descriptor[0] or 2**16
+    # Actual bit depth may be larger (8 bit entries in 16 bits allocated)
+    nominal_depth = descriptor[2]
+    dtype = np.dtype(f"uint{nominal_depth:.0f}")
+
+    luts = []
+    if endianness is None:
+        actual_depth = len(cast(bytes, data[0])) / nr_entries * 8
+        dtype = np.dtype(f"uint{actual_depth:.0f}")
+
+        for lut_bytes in [ii for ii in data if ii]:
+            luts.append(np.frombuffer(lut_bytes, dtype=dtype))
+    else:
+        byte_depth = nominal_depth // 8
+        fmt = f"{endianness}{'B' if byte_depth == 1 else 'H'}"
+        actual_depth = nominal_depth
+
+        for seg in [ii for ii in data if ii]:
+            seg_data = np.frombuffer(seg, dtype=f"{endianness}u{byte_depth}")
+            luts.append(_expand_segmented_lut(seg_data, fmt).astype(dtype))
+
+    if actual_depth not in [8, 16]:
+        raise ValueError(
+            f"The bit depth of the LUT data '{actual_depth:.1f}' "
+            "is invalid (only 8 or 16 bits per entry allowed)"
+        )
+
+    lut_lengths = [len(ii) for ii in luts]
+    if not all(ii == lut_lengths[0] for ii in lut_lengths[1:]):
+        raise ValueError("LUT data must be the same length")
+
+    # Each row is the RGB or RGBA value for an entry
+    lut = np.stack(luts, axis=-1)[:nr_entries]
+    lut.flags.writeable = False
+
+    # `first_map` may be negative if Pixel Representation is 1
+    return _LUT(lut, descriptor[1], nr_entries)
+
+
+def _unchanged(arr: "np.ndarray", out: Optional["np.ndarray"]) -> "np.ndarray":
+    """Return `arr`, or `out` after copying `arr` to it if `out` is used."""
+    if out is None:
+        return arr
+
+    np.copyto(out, arr)
+
+    return out
+
+
+@cache
+def _well_known_palette(fname: str) -> "Dataset":
+    """Return the dataset for the well-known color palette in `fname`."""
+    from pydicom import dcmread
+
+    return dcmread(get_palette_files(fname)[0])
 
 
 def convert_color_space(
-    arr: "np.ndarray", current: str, desired: str, per_frame: bool = False
+    arr: "np.ndarray",
+    current: str,
+    desired: str,
+    per_frame: bool = False,
+    *,
+    out: Optional["np.ndarray"] = None,
 ) -> "np.ndarray":
     """Convert the image(s) in `arr` from one color space to another.
 
@@ -627,6 +809,11 @@ def convert_color_space(
 
         Added `per_frame` keyword parameter.
 
+    .. versionchanged:: 3.0
+
+        Added `out` keyword parameter, conversion between RGB and YBR_FULL
+        now uses fixed-point integer arithmetic a chunk of pixels at a time.
+
     Parameters
     ----------
     arr : numpy.ndarray
@@ -643,7 +830,12 @@ def convert_color_space(
         ``'YBR_FULL_422'``.
     per_frame : bool, optional
         If ``True`` and the input array contains multiple frames then process
-        each frame individually to reduce memory usage. Default ``False``.
+        each frame individually and write the result back to `arr` (unless
+        `out` is used). Default ``False``.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr`. May be `arr` itself
+        to convert in-place.
 
     Returns
     -------
@@ -660,8 +852,10 @@ def convert_color_space(
       Section 7
     """
 
-    def _no_change(arr: "np.ndarray") -> "np.ndarray":
-        return arr
+    def _no_change(
+        arr: "np.ndarray", out: Optional["np.ndarray"] = None
+    ) -> "np.ndarray":
+        return _unchanged(arr, out)
 
     _converters = {
         "YBR_FULL_422": {
@@ -688,21 +882,45 @@ def convert_color_space(
         )
 
     if len(arr.shape) == 4 and per_frame:
+        result = arr if out is None else out
         for idx, frame in enumerate(arr):
-            arr[idx] = converter(frame)
+            converter(frame, out=result[idx])
+
+        return result
+
+    return converter(arr, out=out)
 
-        return arr
 
-    return converter(arr)
+# Conversion matrices for RGB <-> YBR_FULL as the coefficients used for each
+#   output channel, see ITU T.871 Section 7
+_RGB_TO_YBR = (
+    (+0.299, +0.587, +0.114),
+    (-0.299 / 1.772, -0.587 / 1.772, +0.886 / 1.772),
+    (+0.701 / 1.402, -0.587 / 1.402, -0.114 / 1.402),
+)
+_YBR_TO_RGB = (
+    (1.000, 0.000, 1.402),
+    (1.000, -0.114 * 1.772 / 0.587, -0.299 * 1.402 / 0.587),
+    (1.000, 1.772, 0.000),
+)
+# The number of fractional bits used by the fixed-point color conversion
+_COLOR_FRACTION_BITS = 16
+# The number of pixels converted at a time
+_COLOR_CHUNK_SIZE = 2**16
 
 
-def _convert_RGB_to_YBR_FULL(arr: "np.ndarray") -> "np.ndarray":
+def _convert_RGB_to_YBR_FULL(
+    arr: "np.ndarray", *, out: Optional["np.ndarray"] = None
+) -> "np.ndarray":
     """Return an ndarray converted from RGB to YBR_FULL color space.
 
     Parameters
     ----------
     arr : numpy.ndarray
         An ndarray of an 8-bit per channel images in RGB color space.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, may be `arr` itself.
 
     Returns
     -------
@@ -718,35 +936,21 @@ def _convert_RGB_to_YBR_FULL(arr: "np.ndarray") -> "np.ndarray":
       <https://www.ijg.org/files/T-REC-T.871-201105-I!!PDF-E.pdf>`_),
       Section 7
     """
-    orig_dtype = arr.dtype
-
-    rgb_to_ybr = np.asarray(
-        [
-            [+0.299, -0.299 / 1.772, +0.701 / 1.402],
-            [+0.587, -0.587 / 1.772, -0.587 / 1.402],
-            [+0.114, +0.886 / 1.772, -0.114 / 1.402],
-        ],
-        dtype=np.float32,
-    )
-
-    arr = np.matmul(arr, rgb_to_ybr, dtype=np.float32)
-    arr += [0.5, 128.5, 128.5]
-    # Round(x) -> floor of (arr + 0.5) : 0.5 added in previous step
-    np.floor(arr, out=arr)
-    # Max(0, arr) -> 0 if 0 >= arr, arr otherwise
-    # Min(arr, 255) -> arr if arr <= 255, 255 otherwise
-    np.clip(arr, 0, 255, out=arr)
+    return _convert_color(arr, _RGB_TO_YBR, (0, 0, 0), (0, 128, 128), out)
 
-    return arr.astype(orig_dtype)
 
-
-def _convert_YBR_FULL_to_RGB(arr: "np.ndarray") -> "np.ndarray":
+def _convert_YBR_FULL_to_RGB(
+    arr: "np.ndarray", *, out: Optional["np.ndarray"] = None
+) -> "np.ndarray":
     """Return an ndarray converted from YBR_FULL to RGB color space.
 
     Parameters
     ----------
     arr : numpy.ndarray
         An ndarray of an 8-bit per channel images in YBR_FULL color space.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, may be `arr` itself.
 
     Returns
     -------
@@ -760,29 +964,95 @@ def _convert_YBR_FULL_to_RGB(arr: "np.ndarray") -> "np.ndarray":
       :dcm:`Annex C.7.6.3.1.2<part03/sect_C.7.6.3.html#sect_C.7.6.3.1.2>`
     * ISO/IEC 10918-5:2012, Section 7
     """
-    orig_dtype = arr.dtype
+    return _convert_color(arr, _YBR_TO_RGB, (0, 128, 128), (0, 0, 0), out)
+
+
+def _convert_color(
+    arr: "np.ndarray",
+    matrix: tuple[tuple[float, float, float], ...],
+    in_offsets: tuple[int, int, int],
+    out_offsets: tuple[int, int, int],
+    out: Optional["np.ndarray"],
+) -> "np.ndarray":
+    """Return `arr` after converting each pixel using `matrix`.
+
+    The conversion uses fixed-point integer arithmetic, which matches the
+    floating point equations in ITU T.871 to within 1, and is performed
+    ``_COLOR_CHUNK_SIZE`` pixels at a time so the only temporary arrays are
+    those for a single chunk.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        The array to convert, with the channels as the last axis.
+    matrix : tuple[tuple[float, float, float], ...]
+        The coefficients of the input channels for each output channel.
+    in_offsets : tuple[int, int, int]
+        The offsets subtracted from each input channel.
+    out_offsets : tuple[int, int, int]
+        The offsets added to each output channel.
+    out : numpy.ndarray or None
+        The array to write the result to, may be `arr` itself. If ``None``
+        then a new array with the same dtype as `arr` will be used.
 
-    ybr_to_rgb = np.asarray(
-        [
-            [1.000, 1.000, 1.000],
-            [0.000, -0.114 * 1.772 / 0.587, 1.772],
-            [1.402, -0.299 * 1.402 / 0.587, 0.000],
-        ],
-        dtype=np.float32,
-    )
+    Returns
+    -------
+    numpy.ndarray
+        The converted array, clipped to the range (0, 255).
+    """
+    if out is None:
+        out = np.empty(arr.shape, dtype=arr.dtype)
+
+    # Writing to `dst` must update `out`
+    dst = out if out.flags.c_contiguous else np.empty(out.shape, dtype=out.dtype)
+    src = arr.reshape(-1, 3)
+    dst_pixels = dst.reshape(-1, 3)
+
+    # 8-bit values fit in 32-bit integers after scaling, anything larger may not
+    dtype = np.int32 if arr.dtype.itemsize == 1 else np.int64
+    bits = _COLOR_FRACTION_BITS
+    coefficients = [[round(c * 2**bits) for c in row] for row in matrix]
+    # The output channel offset, 0.5 for rounding and the input channel offsets
+    additions = [
+        (out_offset << bits)
+        + (1 << (bits - 1))
+        - sum(c * offset for c, offset in zip(row, in_offsets))
+        for row, out_offset in zip(coefficients, out_offsets)
+    ]
 
-    arr = arr.astype(np.float32)
-    arr -= [0, 128, 128]
+    nr_pixels = min(len(src), _COLOR_CHUNK_SIZE)
+    result = np.empty((3, nr_pixels), dtype=dtype)
+    product = np.empty(nr_pixels, dtype=dtype)
+    for start in range(0, len(src), _COLOR_CHUNK_SIZE):
+        pixels = src[start : start + _COLOR_CHUNK_SIZE]
+        chunk = slice(0, len(pixels))
+        for output, row, addition in zip(result, coefficients, additions):
+            output[chunk] = addition
+            for channel, coefficient in enumerate(row):
+                if coefficient:
+                    np.multiply(
+                        pixels[:, channel],
+                        coefficient,
+                        out=product[chunk],
+                        dtype=dtype,
+                        casting="unsafe",
+                    )
+                    output[chunk] += product[chunk]
+
+        result >>= bits
+        np.clip(result, 0, 255, out=result)
+        # Only write once every output channel is done, as `dst` may be `arr`
+        for channel, output in enumerate(result):
+            np.copyto(
+                dst_pixels[start : start + _COLOR_CHUNK_SIZE, channel],
+                output[chunk],
+                casting="unsafe",
+            )
 
-    # Round(x) -> floor of (arr + 0.5)
-    np.matmul(arr, ybr_to_rgb, out=arr)
-    arr += 0.5
-    np.floor(arr, out=arr)
-    # Max(0, arr) -> 0 if 0 >= arr, arr otherwise
-    # Min(arr, 255) -> arr if arr <= 255, 255 otherwise
-    np.clip(arr, 0, 255, out=arr)
+    if dst is not out:
+        np.copyto(out, dst)
 
-    return arr.astype(orig_dtype)
+    return out
 
 
 def dtype_corrected_for_endianness(
@@ -867,16 +1137,19 @@ def expand_ybr422(src: ByteString, bits_allocated: int) -> bytes:
 
 
 def _expand_segmented_lut(
-    data: tuple[int, ...],
+    data: "Sequence[int] | np.ndarray",
     fmt: str,
     nr_segments: int | None = None,
     last_value: int | None = None,
-) -> list[int]:
-    """Return a list containing the expanded lookup table data.
+) -> "np.ndarray":
+    """Return an array containing the expanded lookup table data.
+
+    Only the segment headers are walked in Python, each segment is expanded
+    using NumPy and the segments concatenated once at the end.
 
     Parameters
     ----------
-    data : tuple of int
+    data : numpy.ndarray | Sequence[int]
         The decoded segmented palette lookup table data. May be padded by a
         trailing null.
     fmt : str
@@ -893,57 +1166,60 @@ def _expand_segmented_lut(
 
     Returns
     -------
-    list of int
-        The reconstructed lookup table data.
+    numpy.ndarray
+        The reconstructed lookup table data as ``np.int64``.
 
     References
     ----------
 
     * DICOM Standard, Part 3, Annex C.7.9
     """
+    data = np.asarray(data, dtype=np.int64)
+
     # Indirect segment byte offset is dependent on endianness for 8-bit
     # Little endian: e.g. 0x0302 0x0100, big endian, e.g. 0x0203 0x0001
     indirect_ii = [3, 2, 1, 0] if "<" in fmt else [2, 3, 0, 1]
 
-    lut: list[int] = []
+    lut: list[np.ndarray] = []
+    # The last value in the expanded LUT, None if the LUT is empty
+    y0: int | None = None
     offset = 0
     segments_read = 0
     # Use `offset + 1` to account for possible trailing null
     #   can do this because all segment types are longer than 2
     while offset + 1 < len(data):
-        opcode = data[offset]
-        length = data[offset + 1]
+        opcode = int(data[offset])
+        length = int(data[offset + 1])
         offset += 2
 
         if opcode == 0:
             # C.7.9.2.1: Discrete segment
-            lut.extend(data[offset : offset + length])
+            segment = data[offset : offset + length]
             offset += length
         elif opcode == 1:
             # C.7.9.2.2: Linear segment
-            if lut:
-                y0 = lut[-1]
-            elif last_value:
+            if y0 is None:
+                if not last_value:
+                    raise ValueError(
+                        "Error expanding a segmented palette color lookup table: "
+                        "the first segment cannot be a linear segment"
+                    )
+
                 # Indirect segment with linear segment at 0th offset
                 y0 = last_value
-            else:
-                raise ValueError(
-                    "Error expanding a segmented palette color lookup table: "
-                    "the first segment cannot be a linear segment"
-                )
 
-            y1 = data[offset]
+            y1 = int(data[offset])
             offset += 1
 
             if y0 == y1:
-                lut.extend([y1] * length)
+                segment = np.full(length, y1, dtype=np.int64)
             else:
                 step = (y1 - y0) / length
                 vals = np.around(np.linspace(y0 + step, y1, length))
-                lut.extend([int(vv) for vv in vals])
+                segment = vals.astype(np.int64)
         elif opcode == 2:
             # C.7.9.2.3: Indirect segment
-            if not lut:
+            if y0 is None:
                 raise ValueError(
                     "Error expanding a segmented palette color lookup table: "
                     "the first segment cannot be an indirect segment"
@@ -951,26 +1227,33 @@ def _expand_segmented_lut(
 
             if "B" in fmt:
                 # 8-bit segment entries
-                ii = [data[offset + vv] for vv in indirect_ii]
+                ii = [int(data[offset + vv]) for vv in indirect_ii]
                 byte_offset = (ii[0] << 8 | ii[1]) << 16 | (ii[2] << 8 | ii[3])
                 offset += 4
             else:
                 # 16-bit segment entries
-                byte_offset = data[offset + 1] << 16 | data[offset]
+                byte_offset = int(data[offset + 1]) << 16 | int(data[offset])
                 offset += 2
 
-            lut.extend(_expand_segmented_lut(data[byte_offset:], fmt, length, lut[-1]))
+            segment = _expand_segmented_lut(data[byte_offset:], fmt, length, y0)
         else:
             raise ValueError(
                 "Error expanding a segmented palette lookup table: "
                 f"unknown segment type '{opcode}'"
             )
 
+        lut.append(segment)
+        if len(segment):
+            y0 = int(segment[-1])
+
         segments_read += 1
         if segments_read == nr_segments:
-            return lut
+            break
+
+    if not lut:
+        return np.zeros(0, dtype=np.int64)
 
-    return lut
+    return np.concatenate(lut)
 
 
 def get_expected_length(ds: "Dataset", unit: str = "bytes") -> int:
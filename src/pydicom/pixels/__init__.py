@@ -23,4 +23,5 @@ from pydicom.pixels.encoders.base import (
     JPEGLSLosslessEncoder,
     JPEGLSNearLosslessEncoder,
 )
+from pydicom.pixels.processing import render
 from pydicom.pixels.utils import pixel_array, iter_pixels, as_pixel_options
@@ -17,6 +17,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
 Buffer = bytes | bytearray | memoryview
 
+# Plugins whose underlying libraries release the GIL while encoding or
+#   decoding, so a thread pool can be used instead of a process pool
+_RELEASES_GIL = {"gdcm", "pylibjpeg", "pyjpegls"}
+
 
 class CoderBase:
     """Base class for Decoder and Encoder."""
@@ -2,6 +2,7 @@
 """Pixel data decoding."""
 
 from collections.abc import Callable, Iterator, Iterable
+import copy
 import logging
 import sys
 from typing import Any, BinaryIO, cast
@@ -15,14 +16,15 @@ except ImportError:
 
 from pydicom import config
 from pydicom.dataset import Dataset
-from pydicom.encaps import get_frame, generate_frames
-from pydicom.misc import warn_and_log
+from pydicom.encaps import EncapsulatedFrames, FrameIndex, generate_frames, get_frame
+from pydicom.misc import warn_and_log, _imap_ordered
 from pydicom.pixels.common import (
     Buffer,
     RunnerBase,
     RunnerOptions,
     CoderBase,
     PhotometricInterpretation as PI,
+    _RELEASES_GIL,
 )
 from pydicom.pixels.utils import _get_jpg_parameters
 from pydicom.pixel_data_handlers.util import convert_color_space, get_j2k_parameters
@@ -68,6 +70,10 @@ class DecodeOptions(RunnerOptions, total=False):
     # (ndarray only) Force byte swapping on 8-bit values encoded as OW
     be_swap_ow: bool
 
+    ## Encapsulated decoding options
+    # The frame boundaries within the encapsulated pixel data
+    frame_index: FrameIndex
+
     ## RLE decoding options
     # Segment ordering ">" for big endian (default) or "<" for little endian
     rle_segment_order: str  # pydicom plugin
@@ -102,6 +108,9 @@ def _process_color_space(arr: "np.ndarray", runner: "DecodeRunner") -> "np.ndarr
         and runner.get_option("as_rgb", False)
     ) or force_rgb
 
+    # Decoded pixel data can be converted in-place, however native pixel data
+    #   may be a view on the original buffer which shouldn't be modified
+    out = arr if runner.transfer_syntax.is_encapsulated else None
     if not arr.flags.writeable and (to_rgb or force_ybr):
         if runner.get_option("view_only", False):
             LOGGER.warning(
@@ -109,14 +118,14 @@ def _process_color_space(arr: "np.ndarray", runner: "DecodeRunner") -> "np.ndarr
                 "buffer if applying a color space conversion"
             )
 
-        arr = arr.copy()
+        out = None
 
     # Converting to/from YBR_FULL and YBR_FULL_422 uses the same transformation
     if force_ybr:
-        arr = convert_color_space(arr, PI.RGB, PI.YBR_FULL)
+        arr = convert_color_space(arr, PI.RGB, PI.YBR_FULL, out=out)
         runner.set_option("photometric_interpretation", PI.YBR_FULL)
     elif to_rgb:
-        arr = convert_color_space(arr, PI.YBR_FULL, PI.RGB)
+        arr = convert_color_space(arr, PI.YBR_FULL, PI.RGB, out=out)
         runner.set_option("photometric_interpretation", PI.RGB)
 
     return arr
@@ -200,6 +209,7 @@ class DecodeRunner(RunnerBase):
         self._undeletable = ("transfer_syntax_uid", "pixel_keyword")
         self._decoders: dict[str, DecodeFunction] = {}
         self._previous: tuple[str, DecodeFunction]
+        self._frame_index: FrameIndex | None = None
 
         if self.transfer_syntax.is_encapsulated:
             self.set_option("pixel_keyword", "PixelData")
@@ -224,14 +234,17 @@ class DecodeRunner(RunnerBase):
         bytes | bytearray
             The decoded frame of pixel data.
         """
-        # For encapsulated data `self.src` should not be memoryview to avoid
-        #   creating a duplicate object in memory by the encapsulation functions
-        src = get_frame(
-            self.src,
-            index,
-            number_of_frames=self.number_of_frames,
-            extended_offsets=self.extended_offsets,
-        )
+        if self._frame_index is None and "frame_index" not in self._opts:
+            # Reading a single frame only needs the fragments up to and
+            #   including the frame, rather than indexing all of them
+            src = get_frame(
+                self.src,
+                index,
+                number_of_frames=self.number_of_frames,
+                extended_offsets=self.extended_offsets,
+            )
+        else:
+            src = self.frame_index.read_frame(self.src, index)
 
         return self._decode_frame(src)
 
@@ -293,7 +306,31 @@ class DecodeRunner(RunnerBase):
             f"plugins:\n  {messages}"
         )
 
-    def get_data(self, src: Buffer | BinaryIO, offset: int, length: int) -> bytes:
+    @property
+    def frame_index(self) -> FrameIndex:
+        """Return a :class:`~pydicom.encaps.FrameIndex` for the encapsulated
+        pixel data.
+
+        If the `frame_index` option is set then it will be used, otherwise
+        the index is created on first access by parsing the encapsulated data
+        once, after which frames can be decoded in any order without re-parsing
+        the preceding fragments.
+        """
+        if self._frame_index is None:
+            self._frame_index = self._opts.get("frame_index")
+
+        if self._frame_index is None:
+            # If `self.src` is a memoryview then the index will read from
+            #   it without creating a duplicate object in memory
+            self._frame_index = FrameIndex(
+                self.src,
+                number_of_frames=self.number_of_frames,
+                extended_offsets=self.extended_offsets,
+            )
+
+        return self._frame_index
+
+    def get_data(self, src: Buffer | BinaryIO, offset: int, length: int) -> Buffer:
         """Return `length` bytes from `src`, starting at `offset`.
 
         Parameters
@@ -308,9 +345,11 @@ class DecodeRunner(RunnerBase):
 
         Returns
         -------
-        bytes
+        bytes | bytearray | memoryview
             The data from `src`, may return fewer bytes if the end of `src` is
-            reached before ``offset + length``.
+            reached before ``offset + length``. If `src` is a
+            :class:`memoryview` or a :class:`~pydicom.filebase.DicomMappedIO`
+            then a :class:`memoryview` on the original data will be returned.
         """
         if self.is_dataset or self.is_buffer:
             src = cast(Buffer, src)
@@ -319,42 +358,114 @@ class DecodeRunner(RunnerBase):
         src = cast(BinaryIO, src)
         file_offset = src.tell()
         src.seek(offset)
-        buffer = src.read(length)
+        # Memory-mapped files can return a view without copying
+        buffer = getattr(src, "read_view", src.read)(length)
         src.seek(file_offset)
-        return buffer
+        return cast(Buffer, buffer)
+
+    def iter_decode(self, workers: int = 1) -> Iterator[bytes | bytearray]:
+        """Yield decoded frames from the encoded pixel data.
 
-    def iter_decode(self) -> Iterator[bytes | bytearray]:
-        """Yield decoded frames from the encoded pixel data."""
+        Parameters
+        ----------
+        workers : int, optional
+            The maximum number of frames to decode in parallel (default ``1``).
+            See :meth:`~pydicom.pixels.decoders.base.Decoder.iter_array` for
+            more information.
+        """
         if self.is_binary:
             file_offset = cast(BinaryIO, self.src).tell()
 
-        # For encapsulated data `self.src` should not be memoryview as doing so
-        #   will create a duplicate object in memory by `generate_frames`
+        # If `self.src` is a memoryview then `generate_frames` will read from
+        #   it without creating a duplicate object in memory
         # May yield more frames than `number_of_frames` for JPEG!
         encoded_frames = generate_frames(
             self.src,
             number_of_frames=self.number_of_frames,
             extended_offsets=self.extended_offsets,
         )
-        for index, src in enumerate(encoded_frames):
-            # Try the previously successful decoder first (if available)
-            name, func = getattr(self, "_previous", (None, None))
-            if func:
-                try:
-                    yield func(src, self)
-                    continue
-                except Exception:
-                    LOGGER.warning(
-                        f"The decoding plugin '{name}' failed to decode the "
-                        f"frame at index {index}"
-                    )
-
-            # Otherwise try all decoders
-            yield self._decode_frame(src)
+        if workers > 1:
+            yield from self.iter_decode_parallel(encoded_frames, workers)
+        else:
+            for index, src in enumerate(encoded_frames):
+                # Try the previously successful decoder first (if available)
+                name, func = getattr(self, "_previous", (None, None))
+                if func:
+                    try:
+                        yield func(src, self)
+                        continue
+                    except Exception:
+                        LOGGER.warning(
+                            f"The decoding plugin '{name}' failed to decode the "
+                            f"frame at index {index}"
+                        )
+
+                # Otherwise try all decoders
+                yield self._decode_frame(src)
 
         if self.is_binary:
             cast(BinaryIO, self.src).seek(file_offset)
 
+    def iter_decode_parallel(
+        self, encoded_frames: Iterable[bytes], workers: int
+    ) -> Iterator[bytes | bytearray]:
+        """Yield decoded frames from `encoded_frames` using a pool of workers.
+
+        The first frame is decoded in the current thread to determine which
+        decoding plugin to use. If the plugin releases the GIL while decoding
+        (``"gdcm"``, ``"pylibjpeg"`` and ``"pyjpegls"``) then the remaining
+        frames are decoded using a thread pool, otherwise a process pool is
+        used. No more than ``2 * workers`` frames are in flight at any one
+        time, and the decoded frames are yielded in the same order as
+        `encoded_frames`.
+
+        Parameters
+        ----------
+        encoded_frames : Iterable[bytes]
+            The encoded frames to be decoded.
+        workers : int
+            The maximum number of workers in the pool.
+
+        Yields
+        ------
+        bytes | bytearray
+            The decoded frames.
+        """
+        encoded_frames = iter(encoded_frames)
+        if (src := next(encoded_frames, None)) is None:
+            return
+
+        yield self._decode_frame(src)
+
+        # Each frame gets its own copy of the runner as the per-frame
+        #   JPEG options are set on the runner while decoding
+        yield from _imap_ordered(
+            _decode_frame_worker,
+            ((self._worker_copy(), src) for src in encoded_frames),
+            workers,
+            threads=self._previous[0] in _RELEASES_GIL,
+        )
+
+    def _worker_copy(self) -> "DecodeRunner":
+        """Return a copy of the runner for decoding a single frame in a worker.
+
+        The copy has no pixel data source, which may not be picklable, and
+        tries the previously successful decoding plugin first.
+        """
+        runner = copy.copy(self)
+        runner._src = b""
+        runner._src_type = "Buffer"
+        runner._frame_index = None
+        runner._opts = self._opts.copy()
+        runner._opts.pop("extended_offsets", None)
+        runner._opts.pop("frame_index", None)
+
+        name, func = self._previous
+        runner._decoders = {name: func}
+        runner._decoders.update(self._decoders)
+
+        return runner
+
     @property
     def pixel_dtype(self) -> "np.dtype":
         """Return a :class:`numpy.dtype` suitable for containing the decoded
@@ -520,8 +631,17 @@ class DecodeRunner(RunnerBase):
             :class:`~pydicom.dataset.Dataset` containing the pixel data and
             associated group ``0x0028`` elements.
         """
+        self._frame_index = None
         if isinstance(src, Dataset):
             self._set_options_ds(src)
+            if isinstance(src[self.pixel_keyword].value, EncapsulatedFrames):
+                raise TypeError(
+                    "Unable to decode the pixel data as the (7FE0,0010) 'Pixel "
+                    "Data' value is an 'EncapsulatedFrames' instance, which can "
+                    "only be used as a source of encoded frames when writing the "
+                    "dataset"
+                )
+
             self._src = src[self.pixel_keyword].value
             self._src_type = "Dataset"
         elif hasattr(src, "read"):
@@ -672,6 +792,7 @@ class Decoder(CoderBase):
         validate: bool = True,
         raw: bool = False,
         decoding_plugin: str = "",
+        workers: int = 1,
         **kwargs: DecodeOptions,
     ) -> "np.ndarray":
         """Return decoded pixel data as :class:`~numpy.ndarray`.
@@ -746,6 +867,13 @@ class Decoder(CoderBase):
             available plugins will be tried and the result from the first successful
             one returned. For information on the available plugins for each
             decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+        workers : int, optional
+            The maximum number of frames of compressed pixel data to decode in
+            parallel when `index` is ``None`` (default ``1``). If the decoding
+            plugin releases the GIL (``"gdcm"``, ``"pylibjpeg"`` and
+            ``"pyjpegls"``) then a thread pool is used, otherwise a process
+            pool is used. Each decoded frame is written directly into the
+            returned array.
         **kwargs
             Optional keyword parameters for controlling decoding are also
             available, please see the :doc:`decoding options documentation
@@ -773,6 +901,9 @@ class Decoder(CoderBase):
         if index is not None and index < 0:
             raise ValueError("'index' must be greater than or equal to 0")
 
+        if workers < 1:
+            raise ValueError("'workers' must be greater than or equal to 1")
+
         runner = DecodeRunner(self.UID)
         runner.set_source(src)
         runner.set_options(**kwargs)
@@ -790,16 +921,13 @@ class Decoder(CoderBase):
             runner.validate()
 
         if self.is_native:
-            func = self._as_array_native
+            arr = self._as_array_native(runner, index)
             as_writeable = not runner.get_option("view_only", False)
         else:
-            func = self._as_array_encapsulated
+            arr = self._as_array_encapsulated(runner, index, workers)
             as_writeable = True
 
-        arr = runner.reshape(
-            func(runner, index),
-            as_frame=False if index is None else True,
-        )
+        arr = runner.reshape(arr, as_frame=False if index is None else True)
 
         if runner._test_for("sign_correction"):
             arr = _apply_sign_correction(arr, runner)
@@ -814,7 +942,9 @@ class Decoder(CoderBase):
         return arr.copy() if not arr.flags.writeable and as_writeable else arr
 
     @staticmethod
-    def _as_array_encapsulated(runner: DecodeRunner, index: int | None) -> "np.ndarray":
+    def _as_array_encapsulated(
+        runner: DecodeRunner, index: int | None, workers: int = 1
+    ) -> "np.ndarray":
         """Return compressed and encapsulated pixel data as :class:`~numpy.ndarray`.
 
         Parameters
@@ -824,6 +954,9 @@ class Decoder(CoderBase):
         index : int | None
             The index of the frame to be returned, or ``None`` if all frames
             are to be returned
+        workers : int, optional
+            The maximum number of frames to decode in parallel when `index` is
+            ``None``.
 
         Returns
         -------
@@ -843,7 +976,7 @@ class Decoder(CoderBase):
         #   itemsize if the bits allocated value is modified during decoding
         pixels_per_frame = runner.frame_length(unit="pixels")
         arr = np.empty(pixels_per_frame * runner.number_of_frames, dtype=dtype)
-        frame_generator = runner.iter_decode()
+        frame_generator = runner.iter_decode(workers)
         for idx in range(runner.number_of_frames):
             frame = next(frame_generator)
             start = idx * pixels_per_frame
@@ -1065,7 +1198,9 @@ class Decoder(CoderBase):
               same type in `src` will be returned, except if `view_only` is
               ``True`` in which case a :class:`memoryview` on the original
               buffer will be returned instead. If `src` is a file-like then
-              :class:`bytes` will always be returned.
+              :class:`bytes` will always be returned, unless it's a
+              :class:`~pydicom.filebase.DicomMappedIO` in which case a
+              :class:`memoryview` will be returned.
             * Encapsulated pixel data will be returned as :class:`bytearray`.
 
             8-bit pixel data encoded as **OW** using Explicit VR Big Endian will
@@ -1237,6 +1372,7 @@ class Decoder(CoderBase):
         raw: bool = False,
         validate: bool = True,
         decoding_plugin: str = "",
+        workers: int = 1,
         **kwargs: Any,
     ) -> Iterator["np.ndarray"]:
         """Yield pixel data frames as :class:`~numpy.ndarray`.
@@ -1309,6 +1445,13 @@ class Decoder(CoderBase):
             available plugins will be tried and the result from the first successful
             one yielded. For information on the available plugins for each
             decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+        workers : int, optional
+            The maximum number of frames of compressed pixel data to decode in
+            parallel (default ``1``). If the decoding plugin releases the GIL
+            (``"gdcm"``, ``"pylibjpeg"`` and ``"pyjpegls"``) then a thread pool
+            is used, otherwise a process pool is used. Frames are still yielded
+            in order, with no more than ``2 * workers`` frames in flight at
+            any one time.
         **kwargs
             Optional keyword parameters for controlling decoding are also
             available, please see the :doc:`decoding options documentation
@@ -1331,6 +1474,9 @@ class Decoder(CoderBase):
                 "NumPy is required when converting pixel data to an ndarray"
             )
 
+        if workers < 1:
+            raise ValueError("'workers' must be greater than or equal to 1")
+
         runner = DecodeRunner(self.UID)
         runner.set_source(src)
         runner.set_options(**kwargs)
@@ -1354,8 +1500,16 @@ class Decoder(CoderBase):
             func = self._as_array_encapsulated
             as_writeable = True
 
-        if self.is_encapsulated and not indices:
-            for frame in runner.iter_decode():
+        if self.is_encapsulated and (not indices or workers > 1):
+            if not indices:
+                frames = runner.iter_decode(workers)
+            else:
+                frames = runner.iter_decode_parallel(
+                    (runner.frame_index.read_frame(runner.src, idx) for idx in indices),
+                    workers,
+                )
+
+            for frame in frames:
                 arr = np.frombuffer(frame, dtype=runner.pixel_dtype)
                 arr = runner.reshape(arr, as_frame=True)
                 if runner._test_for("sign_correction"):
@@ -1371,6 +1525,10 @@ class Decoder(CoderBase):
 
             return
 
+        if self.is_encapsulated:
+            # Index the frames once rather than parsing the fragments for each
+            runner.set_option("frame_index", runner.frame_index)
+
         indices = indices if indices else range(runner.number_of_frames)
         for index in indices:
             arr = runner.reshape(func(runner, index), as_frame=True)
@@ -1450,7 +1608,9 @@ class Decoder(CoderBase):
               same type in `src` will be yielded, except if `view_only` is
               ``True`` in which case a :class:`memoryview` on the original
               buffer will be yielded instead. If `src` is a file-like then
-              :class:`bytes` will always be yielded.
+              :class:`bytes` will always be yielded, unless it's a
+              :class:`~pydicom.filebase.DicomMappedIO` in which case a
+              :class:`memoryview` will be yielded.
             * Encapsulated pixel data will be yielded as :class:`bytearray`.
 
             8-bit pixel data encoded as **OW** using Explicit VR Big Endian will
@@ -1482,6 +1642,10 @@ class Decoder(CoderBase):
         else:
             func = self._as_buffer_encapsulated
 
+        if self.is_encapsulated:
+            # Index the frames once rather than parsing the fragments for each
+            runner.set_option("frame_index", runner.frame_index)
+
         indices = indices if indices else range(runner.number_of_frames)
         for index in indices:
             yield func(runner, index)
@@ -1584,6 +1748,7 @@ RLELosslessDecoder = Decoder(RLELossless)
 RLELosslessDecoder.add_plugins(
     [
         ("pylibjpeg", ("pydicom.pixels.decoders.pylibjpeg", "_decode_frame")),
+        ("numpy", ("pydicom.pixels.decoders.rle_numpy", "_decode_frame")),
         ("pydicom", ("pydicom.pixels.decoders.rle", "_decode_frame")),
     ]
 )
@@ -1611,6 +1776,11 @@ _PIXEL_DATA_DECODERS = {
 }
 
 
+def _decode_frame_worker(runner: DecodeRunner, src: bytes) -> bytes | bytearray:
+    """Return the decoded frame `src`, for use with a thread or process pool."""
+    return runner._decode_frame(src)
+
+
 def _build_decoder_docstrings() -> None:
     """Override the default Decoder docstring."""
     for dec, versionadded in _PIXEL_DATA_DECODERS.values():
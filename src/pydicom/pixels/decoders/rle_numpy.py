@@ -0,0 +1,209 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Use NumPy to decode RLE Lossless encoded *Pixel Data*.
+
+This module is not intended to be used directly.
+"""
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.misc import warn_and_log
+from pydicom.pixels.decoders.base import DecodeRunner
+from pydicom.pixels.decoders.rle import _rle_parse_header
+from pydicom.uid import RLELossless
+
+
+DECODER_DEPENDENCIES = {RLELossless: ("numpy",)}
+
+
+def is_available(uid: str) -> bool:
+    """Return ``True`` if a pixel data decoder for `uid` is available for use,
+    ``False`` otherwise.
+    """
+    if not HAVE_NP:
+        return False
+
+    return uid in DECODER_DEPENDENCIES
+
+
+def _decode_frame(src: bytes, runner: DecodeRunner) -> bytearray:
+    """Wrapper for use with the decoder interface.
+
+    Parameters
+    ----------
+    src : bytes
+        A single frame of RLE encoded data.
+    runner : pydicom.pixels.decoders.base.DecodeRunner
+
+        Required parameters:
+
+        * `rows`: int
+        * `columns`: int
+        * `samples_per_pixel`: int
+        * `bits_allocated`: int
+
+        Optional parameters:
+
+        * `rle_segment_order`: str, "<" for little endian segment order, or
+          ">" for big endian (default)
+
+    Returns
+    -------
+    bytearray
+        The decoded frame, ordered as planar configuration 1.
+    """
+    frame = _rle_decode_frame(
+        src,
+        runner.rows,
+        runner.columns,
+        runner.samples_per_pixel,
+        runner.bits_allocated,
+        runner.get_option("rle_segment_order", ">"),
+    )
+    # Update the runner options to ensure the reshaping is correct
+    # Only do this if we successfully decoded the frame
+    runner.set_option("planar_configuration", 1)
+
+    return frame
+
+
+def _rle_decode_frame(
+    src: bytes,
+    rows: int,
+    columns: int,
+    nr_samples: int,
+    nr_bits: int,
+    segment_order: str = ">",
+) -> bytearray:
+    """Decodes a single frame of RLE encoded data.
+
+    Each frame may contain up to 15 segments of encoded data.
+
+    Parameters
+    ----------
+    src : bytes
+        The RLE frame data
+    rows : int
+        The number of output rows
+    columns : int
+        The number of output columns
+    nr_samples : int
+        Number of samples per pixel (e.g. 3 for RGB data).
+    nr_bits : int
+        Number of bits per sample - must be a multiple of 8
+    segment_order : str
+        The segment order of the `data`, '>' for big endian (default),
+        '<' for little endian (non-conformant).
+
+    Returns
+    -------
+    bytearray
+        The frame's decoded data in little endian and planar configuration 1
+        byte ordering (i.e. for RGB data this is all red pixels then all
+        green then all blue, with the bytes for each pixel ordered from
+        MSB to LSB when reading left to right).
+    """
+    if nr_bits % 8:
+        raise NotImplementedError(
+            f"Unable to decode RLE encoded pixel data with {nr_bits} bits allocated"
+        )
+
+    # Parse the RLE Header
+    offsets = _rle_parse_header(src[:64])
+    nr_segments = len(offsets)
+
+    # Check that the actual number of segments is as expected
+    bytes_per_sample = nr_bits // 8
+    if nr_segments != nr_samples * bytes_per_sample:
+        raise ValueError(
+            "The number of RLE segments in the pixel data doesn't match the "
+            f"expected amount ({nr_segments} vs. {nr_samples * bytes_per_sample} "
+            "segments)"
+        )
+
+    # Ensure the last segment gets decoded
+    offsets.append(len(src))
+
+    # A (samples, pixels, bytes per sample) view of the decoded frame, which
+    #   is planar configuration 1 with little endian byte ordering
+    nr_pixels = rows * columns
+    decoded = bytearray(nr_pixels * nr_samples * bytes_per_sample)
+    arr = np.frombuffer(decoded, dtype="u1")
+    arr = arr.reshape(nr_samples, nr_pixels, bytes_per_sample)
+    for sample_number in range(nr_samples):
+        for byte_offset in range(bytes_per_sample):
+            ii = sample_number * bytes_per_sample + byte_offset
+            segment = _rle_decode_segment(src[offsets[ii] : offsets[ii + 1]])
+
+            # Check that the number of decoded bytes is correct
+            actual_length = len(segment)
+            if actual_length < nr_pixels:
+                raise ValueError(
+                    "The amount of decoded RLE segment data doesn't match the "
+                    f"expected amount ({actual_length} vs. {nr_pixels} bytes)"
+                )
+            elif actual_length != nr_pixels:
+                warn_and_log(
+                    "The decoded RLE segment contains non-conformant padding "
+                    f"- {actual_length} vs. {nr_pixels} bytes expected"
+                )
+
+            # Segments are ordered MSB to LSB for big endian segment order
+            if segment_order == ">":
+                byte_offset = bytes_per_sample - byte_offset - 1
+
+            arr[sample_number, :, byte_offset] = segment[:nr_pixels]
+
+    return decoded
+
+
+def _rle_decode_segment(src: bytes) -> "np.ndarray":
+    """Return a single segment of decoded RLE data as a :class:`numpy.ndarray`.
+
+    The position of each header byte depends on the value of the header byte
+    before it, so only the run headers are walked in Python. The runs
+    themselves are then expanded in a single vectorized pass by counting the
+    number of times each byte of `src` appears in the output: ``0`` for a
+    header, ``1`` for a literal byte and ``257 - N`` for a replicated byte.
+
+    Parameters
+    ----------
+    src : bytes
+        The segment data to be decoded.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded segment as a 1D array of ``uint8``.
+    """
+    length = len(src)
+    headers: list[int] = []
+    append = headers.append
+    pos = 0
+    while pos < length:
+        append(pos)
+        header_byte = src[pos]
+        if header_byte < 128:
+            # Literal run of the next (N + 1) bytes
+            pos += header_byte + 2
+        elif header_byte > 128:
+            # Replicate run of the next byte (257 - N) times
+            pos += 2
+        else:
+            # No operation
+            pos += 1
+
+    data = np.frombuffer(src, dtype="u1")
+    indices = np.asarray(headers, dtype=np.intp)
+    replicate = indices[data[indices] > 128]
+
+    # An extra count for a replicate run header in the final byte
+    counts = np.ones(length + 1, dtype=np.intp)
+    counts[indices] = 0
+    counts[replicate + 1] = 257 - data[replicate].astype(np.intp)
+
+    return np.repeat(data, counts[:length])
@@ -2,6 +2,7 @@
 """Pixel data encoding."""
 
 from collections.abc import Callable, Iterator, Iterable
+import copy
 import logging
 import math
 import sys
@@ -14,7 +15,14 @@ except ImportError:
 
 from pydicom import config
 from pydicom.dataset import Dataset
-from pydicom.pixels.common import Buffer, RunnerBase, CoderBase, RunnerOptions
+from pydicom.misc import _imap_ordered
+from pydicom.pixels.common import (
+    Buffer,
+    RunnerBase,
+    CoderBase,
+    RunnerOptions,
+    _RELEASES_GIL,
+)
 from pydicom.uid import (
     UID,
     JPEGBaseline8Bit,
@@ -77,6 +85,7 @@ class EncodeRunner(RunnerBase):
         }
         self._undeletable = ("transfer_syntax_uid", "pixel_keyword", "byteorder")
         self._encoders: dict[str, EncodeFunction] = {}
+        self._previous: tuple[str, EncodeFunction]
 
     def encode(self, index: int | None) -> bytes:
         """Return an encoded frame of pixel data as :class:`bytes`.
@@ -92,10 +101,28 @@ class EncodeRunner(RunnerBase):
         bytes
             The encoded pixel data frame.
         """
+        return self._encode_frame(self.get_frame(index))
+
+    def _encode_frame(self, src: bytes) -> bytes:
+        """Return an encoded frame of pixel data.
+
+        Parameters
+        ----------
+        src : bytes
+            A frame of uncompressed pixel data to be passed to the encoding
+            plugins.
+
+        Returns
+        -------
+        bytes
+            The encoded frame.
+        """
         failure_messages = []
         for name, func in self._encoders.items():
             try:
-                return func(self.get_frame(index), self)
+                frame = func(src, self)
+                self._previous = (name, func)
+                return cast(bytes, frame)
             except Exception as exc:
                 LOGGER.exception(exc)
                 failure_messages.append(f"{name}: {exc}")
@@ -106,6 +133,56 @@ class EncodeRunner(RunnerBase):
             f"plugins:\n  {messages}"
         )
 
+    def iter_encode(self, workers: int = 1) -> Iterator[bytes]:
+        """Yield encoded frames from the multi-frame pixel data.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The maximum number of frames to encode in parallel (default ``1``).
+            If greater than ``1`` then the first frame is encoded in the
+            current thread to determine which encoding plugin to use. If the
+            plugin releases the GIL (``"gdcm"``, ``"pylibjpeg"`` and
+            ``"pyjpegls"``) then the remaining frames are encoded using a
+            thread pool, otherwise a process pool is used. No more than
+            ``2 * workers`` frames are in flight at any one time, and the
+            encoded frames are yielded in order.
+        """
+        if workers < 2:
+            for index in range(self.number_of_frames):
+                yield self.encode(index)
+
+            return
+
+        yield self.encode(0)
+
+        yield from _imap_ordered(
+            _encode_frame_worker,
+            (
+                (self._worker_copy(), self.get_frame(index))
+                for index in range(1, self.number_of_frames)
+            ),
+            workers,
+            threads=self._previous[0] in _RELEASES_GIL,
+        )
+
+    def _worker_copy(self) -> "EncodeRunner":
+        """Return a copy of the runner for encoding a single frame in a worker.
+
+        The copy has no pixel data source and tries the previously successful
+        encoding plugin first.
+        """
+        runner = copy.copy(self)
+        runner._src = b""
+        runner._src_type = "Buffer"
+        runner._opts = self._opts.copy()
+
+        name, func = self._previous
+        runner._encoders = {name: func}
+        runner._encoders.update(self._encoders)
+
+        return runner
+
     def get_frame(self, index: int | None) -> bytes:
         """Return a frame's worth of uncompressed pixel data as :class:`bytes`.
 
@@ -588,6 +665,7 @@ class Encoder(CoderBase):
         *,
         validate: bool = True,
         encoding_plugin: str = "",
+        workers: int = 1,
         **kwargs: Any,
     ) -> Iterator[bytes]:
         """Yield encoded frames of the pixel data in `src` as :class:`bytes`.
@@ -628,6 +706,13 @@ class Encoder(CoderBase):
             plugins will be tried (default). For information on the available
             plugins for each encoder see the
             :mod:`API documentation<pydicom.pixels.encoders>`.
+        workers : int, optional
+            The maximum number of frames of multi-frame pixel data to encode
+            in parallel (default ``1``). If the encoding plugin releases the
+            GIL (``"gdcm"``, ``"pylibjpeg"`` and ``"pyjpegls"``) then a thread
+            pool is used, otherwise a process pool is used. Frames are still
+            yielded in order, with no more than ``2 * workers`` frames in
+            flight at any one time.
         **kwargs
             The following keyword parameters are required when `src` is
             :class:`bytes` or :class:`~numpy.ndarray`:
@@ -661,6 +746,9 @@ class Encoder(CoderBase):
         bytes
             An encoded frame of pixel data.
         """
+        if workers < 1:
+            raise ValueError("'workers' must be greater than or equal to 1")
+
         runner = EncodeRunner(self.UID)
         runner.set_source(src)
         runner.set_options(**kwargs)
@@ -681,8 +769,7 @@ class Encoder(CoderBase):
             yield runner.encode(None)
             return
 
-        for index in range(runner.number_of_frames):
-            yield runner.encode(index)
+        yield from runner.iter_encode(workers)
 
 
 # UID: [
@@ -764,6 +851,7 @@ RLELosslessEncoder.add_plugins(
     [
         ("gdcm", ("pydicom.pixels.encoders.gdcm", "encode_pixel_data")),
         ("pylibjpeg", ("pydicom.pixels.encoders.pylibjpeg", "encode_pixel_data")),
+        ("numpy", ("pydicom.pixels.encoders.rle_numpy", "_encode_frame")),
         ("pydicom", ("pydicom.pixels.encoders.native", "_encode_frame")),
     ],
 )
@@ -788,10 +876,16 @@ _PIXEL_DATA_ENCODERS = {
 }
 
 
+def _encode_frame_worker(runner: EncodeRunner, src: bytes) -> bytes:
+    """Return the encoded frame `src`, for use with a thread or process pool."""
+    return runner._encode_frame(src)
+
+
 def _build_encoder_docstrings() -> None:
     """Override the default Encoder docstring."""
     plugin_doc_links = {
         "pydicom": ":ref:`pydicom <encoder_plugin_pydicom>`",
+        "numpy": ":ref:`numpy <encoder_plugin_numpy>`",
         "pylibjpeg": ":ref:`pylibjpeg <encoder_plugin_pylibjpeg>`",
         "gdcm": ":ref:`gdcm <encoder_plugin_gdcm>`",
         "pyjpegls": ":ref:`pyjpegls <encoder_plugin_pyjpegls>`",
@@ -0,0 +1,209 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Use NumPy to RLE Lossless encode *Pixel Data*.
+
+This module is not intended to be used directly.
+"""
+
+import math
+from struct import pack
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.pixels.encoders.base import EncodeRunner
+from pydicom.uid import RLELossless
+
+
+ENCODER_DEPENDENCIES = {RLELossless: ("numpy",)}
+
+
+def is_available(uid: str) -> bool:
+    """Return ``True`` if a pixel data encoder for `uid` is available for use,
+    ``False`` otherwise.
+    """
+    if not HAVE_NP:
+        return False
+
+    return uid in ENCODER_DEPENDENCIES
+
+
+def _encode_frame(src: bytes, runner: EncodeRunner) -> bytes:
+    """Wrapper for use with the encoder interface.
+
+    The encoded frame is identical to that produced by the ``"pydicom"``
+    plugin.
+
+    Parameters
+    ----------
+    src : bytes
+        A single frame of little-endian ordered image data to be RLE encoded.
+    runner : pydicom.pixels.encoders.base.EncodeRunner
+
+        Required parameters:
+
+        * `rows`: int
+        * `columns`: int
+        * `samples_per_pixel`: int
+        * `bits_allocated`: int
+
+    Returns
+    -------
+    bytes
+        An RLE encoded frame.
+    """
+    if runner.get_option("byteorder", "<") == ">":
+        raise ValueError("Unsupported option \"byteorder = '>'\"")
+
+    bytes_allocated = math.ceil(runner.bits_allocated / 8)
+
+    nr_segments = bytes_allocated * runner.samples_per_pixel
+    if nr_segments > 15:
+        raise ValueError(
+            "Unable to encode as the DICOM standard only allows "
+            "a maximum of 15 segments in RLE encoded data"
+        )
+
+    # Each column is a byte-plane of the frame
+    arr = np.frombuffer(src, dtype="u1").reshape(-1, nr_segments)
+
+    segments = []
+    columns = runner.columns
+    for sample_nr in range(runner.samples_per_pixel):
+        for byte_offset in reversed(range(bytes_allocated)):
+            idx = byte_offset + bytes_allocated * sample_nr
+            segments.append(_encode_segment(arr[:, idx], columns))
+
+    # Add the number of segments to the header
+    rle_header = bytearray(pack("<L", len(segments)))
+
+    # Add the segment offsets, starting at 64 for the first segment
+    offsets = np.cumsum([64] + [len(segment) for segment in segments[:-1]])
+    rle_header.extend(pack(f"<{len(offsets)}L", *offsets.tolist()))
+
+    # Add trailing padding to make up the rest of the header (if required)
+    rle_header.extend(b"\x00" * (64 - len(rle_header)))
+
+    return b"".join([rle_header, *segments])
+
+
+def _encode_segment(src: "bytes | np.ndarray", columns: int) -> bytes:
+    """Return `src` as RLE encoded bytes.
+
+    Runs are found across the entire byte segment at once rather than row by
+    row, with the encoding of each row following the same rules as
+    :func:`pydicom.pixels.encoders.native._encode_row`:
+
+    * Each row is encoded separately as required by the DICOM Standard.
+    * Repeats of two or more bytes are encoded as Replicate Runs of at most
+      128 bytes, with any single byte remainder encoded as a one byte Literal
+      Run.
+    * Consecutive non-repeating bytes are encoded as Literal Runs of at most
+      128 bytes.
+
+    Parameters
+    ----------
+    src : bytes | numpy.ndarray
+        The data to be encoded, representing a Byte Segment as in the DICOM
+        Standard, Part 5, :dcm:`Annex G.2<part05/sect_G.2.html>`.
+    columns : int
+        The number of columns in the image.
+
+    Returns
+    -------
+    bytes
+        The RLE encoded segment, following the format specified by the DICOM
+        Standard. Odd length encoded segments are padded by a trailing ``0x00``
+        to be even length.
+    """
+    data = np.frombuffer(src, dtype="u1") if isinstance(src, bytes) else src
+    length = len(data)
+    if not length:
+        return b""
+
+    # Runs of equal bytes, which also end at the end of each row
+    is_start = np.ones(length, dtype=bool)
+    is_start[1:] = data[1:] != data[:-1]
+    is_start[::columns] = True
+    starts = np.flatnonzero(is_start)
+    run_lengths = np.diff(np.append(starts, length))
+
+    # Bytes that aren't repeated are grouped by row into literal runs
+    is_literal = np.zeros(length, dtype=bool)
+    is_literal[starts[run_lengths == 1]] = True
+    is_first = is_literal.copy()
+    is_first[1:] &= ~is_literal[:-1]
+    is_first[::columns] = is_literal[::columns]
+    is_last = is_literal.copy()
+    is_last[:-1] &= ~is_literal[1:]
+    is_last[columns - 1 :: columns] = is_literal[columns - 1 :: columns]
+    literal_starts = np.flatnonzero(is_first)
+    literal_lengths = np.flatnonzero(is_last) + 1 - literal_starts
+
+    # Split into literal and replicate runs of at most 128 bytes, with any
+    #   single byte remainder of a repeat encoded as a literal run
+    repeated = run_lengths > 1
+    literal_starts, literal_lengths = _split_runs(literal_starts, literal_lengths)
+    repeat_starts, repeat_lengths = _split_runs(starts[repeated], run_lengths[repeated])
+
+    # Each encoded run is keyed by the position of the first byte it covers
+    #   which keeps the encoded runs in the same order as `data`
+    header = np.zeros(length, dtype="u1")
+    header[literal_starts] = literal_lengths - 1
+    header[repeat_starts] = np.where(repeat_lengths > 1, 257 - repeat_lengths, 0)
+    is_header = np.zeros(length, dtype=bool)
+    is_header[literal_starts] = True
+    is_header[repeat_starts] = True
+
+    # The bytes that follow each header: all the bytes of a literal run and
+    #   the first byte of a replicate run
+    is_copied = is_literal
+    is_copied[repeat_starts] = True
+
+    header_positions = np.flatnonzero(is_header)
+    nr_headers = len(header_positions)
+    encoded_length = nr_headers + np.count_nonzero(is_copied)
+
+    # Pad odd length data with a trailing 0x00 byte
+    out = np.zeros(encoded_length + encoded_length % 2, dtype="u1")
+    copied_before = np.cumsum(is_copied) - is_copied
+    out_positions = np.arange(nr_headers) + copied_before[header_positions]
+    out[out_positions] = header[header_positions]
+    is_data = np.ones(len(out), dtype=bool)
+    is_data[out_positions] = False
+    is_data[encoded_length:] = False
+    out[is_data] = data[is_copied]
+
+    return out.tobytes()
+
+
+def _split_runs(
+    starts: "np.ndarray", lengths: "np.ndarray"
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the start positions and lengths after splitting runs that are
+    longer than 128 bytes.
+
+    Parameters
+    ----------
+    starts : numpy.ndarray
+        The start position of each run.
+    lengths : numpy.ndarray
+        The length of each run.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The start positions and lengths of the runs, with each run split into
+        as many runs of 128 bytes as possible followed by the remainder.
+    """
+    nr_splits = (lengths + 127) // 128
+    index = np.repeat(np.arange(len(lengths)), nr_splits)
+    offsets = np.arange(len(index)) - np.repeat(
+        np.cumsum(nr_splits) - nr_splits, nr_splits
+    )
+    offsets *= 128
+
+    return starts[index] + offsets, np.minimum(lengths[index] - offsets, 128)
@@ -0,0 +1,294 @@
+# Copyright 2008-2024 pydicom authors. See LICENSE file for details.
+"""Pixel data processing functions for display."""
+
+from collections.abc import MutableSequence
+from functools import lru_cache
+from typing import Any, cast
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.dataset import Dataset
+from pydicom.pixel_data_handlers.util import (
+    apply_modality_lut,
+    apply_voi_lut,
+    _apply_lut,
+    _LUT,
+)
+from pydicom.sequence import Sequence
+
+
+# The elements used by the modality and VOI LUT functions
+_RENDER_TAGS = (
+    0x00280004,  # PhotometricInterpretation
+    0x00280101,  # BitsStored
+    0x00280103,  # PixelRepresentation
+    0x00281050,  # WindowCenter
+    0x00281051,  # WindowWidth
+    0x00281052,  # RescaleIntercept
+    0x00281053,  # RescaleSlope
+    0x00281056,  # VOILUTFunction
+    0x00283000,  # ModalityLUTSequence
+    0x00283010,  # VOILUTSequence
+)
+# The elements used from the *Modality LUT Sequence* and *VOI LUT Sequence*
+_LUT_ITEM_TAGS = (
+    0x00283002,  # LUTDescriptor
+    0x00283006,  # LUTData
+)
+# Array dtypes small enough to be rendered with a LUT covering every value
+_LUT_DTYPES = ("uint8", "int8", "uint16", "int16")
+# The maximum number of rendering LUTs to cache
+_RENDER_CACHE_SIZE = 16
+# The number of values rendered at a time without a LUT
+_RENDER_CHUNK_SIZE = 2**18
+
+# An element as (tag, VR, value) and a dataset as a tuple of elements
+_ElementKey = tuple[int, str, Any]
+_DatasetKey = tuple[_ElementKey, ...]
+
+
+def render(
+    arr: "np.ndarray",
+    ds: Dataset,
+    *,
+    index: int = 0,
+    prefer_lut: bool = True,
+    dtype: str = "uint8",
+    out: "np.ndarray | None" = None,
+) -> "np.ndarray":
+    """Return `arr` after applying the modality and VOI LUTs and scaling the
+    result to the range of `dtype`.
+
+    .. versionadded:: 3.0
+
+    The result is the same as applying
+    :func:`~pydicom.pixel_data_handlers.util.apply_modality_lut`, then
+    :func:`~pydicom.pixel_data_handlers.util.apply_voi_lut` and then scaling
+    to `dtype`, but without the intermediate ``np.float64`` arrays:
+
+    * Arrays of 8 or 16-bit integers are rendered using a single LUT covering
+      every possible value, which is created once and cached by the values of
+      the elements used to create it.
+    * Other arrays are rendered a chunk of values at a time.
+
+    The VOI output range is scaled to the range of `dtype`. If there's a *VOI
+    LUT Sequence* then the range is given by its *LUT Descriptor*, otherwise
+    it's the output range of the modality LUT or rescale operation.
+    A :ref:`photometric interpretation<photometric_interpretation>` of
+    ``"MONOCHROME1"`` isn't inverted.
+
+    Examples
+    --------
+    Render each frame of a multi-frame CT for display::
+
+        from pydicom import Dataset
+        from pydicom.pixels import iter_pixels, render
+
+        ds = Dataset()
+        for arr in iter_pixels("ct.dcm", ds_out=ds):
+            image = render(arr, ds)
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        The pixel data to render, such as a frame or a tile from a frame.
+    ds : pydicom.dataset.Dataset
+        The dataset containing the :dcm:`Modality LUT Module
+        <part03/sect_C.11.html#sect_C.11.1>` and :dcm:`VOI LUT Module
+        <part03/sect_C.11.2.html>` elements to apply.
+    index : int, optional
+        When the VOI LUT Module contains multiple alternative views, this is
+        the index of the view to use (default ``0``).
+    prefer_lut : bool, optional
+        When the VOI LUT Module contains both *Window Width*/*Window Center*
+        and *VOI LUT Sequence*, if ``True`` (default) then apply the VOI LUT,
+        otherwise apply the windowing operation.
+    dtype : str, optional
+        The unsigned integer dtype of the returned array, default
+        ``"uint8"``.
+    out : numpy.ndarray, optional
+        If used then the result will be written to `out` rather than a new
+        array, which must have the same shape as `arr` and the dtype given
+        by `dtype`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The rendered pixel data.
+    """
+    if not HAVE_NP:
+        raise ImportError("NumPy is required for 'render()'")
+
+    out_dtype = np.dtype(dtype)
+    if out_dtype.kind != "u":
+        raise ValueError(
+            f"Unable to render to '{out_dtype}', only unsigned integer dtypes "
+            "are supported"
+        )
+
+    key = _dataset_key(ds, _RENDER_TAGS)
+    little_endian = _lut_little_endian(ds)
+    if arr.dtype.name in _LUT_DTYPES:
+        lut = _render_lut(
+            key, little_endian, arr.dtype.name, index, prefer_lut, out_dtype.name
+        )
+        return _apply_lut(arr, lut, out)
+
+    if out is None:
+        out = np.empty(arr.shape, dtype=out_dtype)
+
+    ds = _key_dataset(key, little_endian)
+    # Chunk along the first axis, keeping at least one row per chunk
+    nr_rows = max(1, _RENDER_CHUNK_SIZE // max(1, arr[:1].size))
+    for start in range(0, len(arr), nr_rows):
+        rows = slice(start, start + nr_rows)
+        _render_values(arr[rows], ds, index, prefer_lut, out[rows])
+
+    return out
+
+
+def _dataset_key(ds: Dataset, tags: tuple[int, ...]) -> _DatasetKey:
+    """Return a hashable representation of the elements in `ds` with `tags`."""
+    elements = []
+    for tag in tags:
+        if tag not in ds:
+            continue
+
+        elem = ds[tag]
+        value = elem.value
+        if isinstance(value, Sequence):
+            value = tuple(_dataset_key(item, _LUT_ITEM_TAGS) for item in value)
+        elif isinstance(value, MutableSequence):
+            value = tuple(value)
+
+        elements.append((tag, elem.VR, value))
+
+    return tuple(elements)
+
+
+def _key_dataset(key: _DatasetKey, little_endian: bool | None) -> Dataset:
+    """Return a dataset created from a key returned by :func:`_dataset_key`."""
+    ds = Dataset()
+    ds.set_original_encoding(False, little_endian, None)
+    for tag, vr, value in key:
+        if vr == "SQ":
+            value = [_key_dataset(item, little_endian) for item in value]
+        elif isinstance(value, tuple):
+            value = list(value)
+
+        ds.add_new(tag, vr, value)
+
+    return ds
+
+
+def _lut_little_endian(ds: Dataset) -> bool | None:
+    """Return the endianness of any OW *LUT Data* in `ds`."""
+    if hasattr(ds, "file_meta"):
+        return cast(bool | None, ds.file_meta._tsyntax_encoding[1])
+
+    return ds.original_encoding[1]
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_lut(
+    key: _DatasetKey,
+    little_endian: bool | None,
+    arr_dtype: str,
+    index: int,
+    prefer_lut: bool,
+    out_dtype: str,
+) -> _LUT:
+    """Return a LUT that renders every value of `arr_dtype`.
+
+    Parameters
+    ----------
+    key : tuple
+        The elements used for rendering, from :func:`_dataset_key`.
+    little_endian : bool | None
+        The endianness of any OW *LUT Data*.
+    arr_dtype : str
+        The dtype of the arrays to be rendered.
+    index : int
+        The index of the VOI LUT view to use.
+    prefer_lut : bool
+        Whether to apply the VOI LUT rather than the windowing operation.
+    out_dtype : str
+        The dtype of the LUT entries.
+
+    Returns
+    -------
+    _LUT
+        The rendering LUT.
+    """
+    info = np.iinfo(arr_dtype)
+    values = np.arange(info.min, info.max + 1, dtype=arr_dtype)
+    lut = np.empty(values.shape, dtype=out_dtype)
+    _render_values(values, _key_dataset(key, little_endian), index, prefer_lut, lut)
+    lut.flags.writeable = False
+
+    return _LUT(lut, info.min, len(lut))
+
+
+def _render_values(
+    arr: "np.ndarray",
+    ds: Dataset,
+    index: int,
+    prefer_lut: bool,
+    out: "np.ndarray",
+) -> None:
+    """Render `arr` to `out` using the modality and VOI LUT elements in `ds`."""
+    values = apply_modality_lut(arr, ds)
+    values = apply_voi_lut(values, ds, index, prefer_lut)
+
+    # Scale the VOI output range to the range of `out`
+    y_min, y_max = _voi_range(ds, index, prefer_lut)
+    max_value = np.iinfo(out.dtype).max
+    scale = max_value / (y_max - y_min) if y_max != y_min else 0.0
+    values = np.subtract(values, y_min, dtype=np.float64)
+    values *= scale
+    np.clip(values, 0, max_value, out=values)
+    np.rint(values, out=values)
+    np.copyto(out, values, casting="unsafe")
+
+
+def _voi_range(ds: Dataset, index: int, prefer_lut: bool) -> tuple[float, float]:
+    """Return the (minimum, maximum) output values of the VOI LUT function."""
+    seq = ds.get("VOILUTSequence")
+    valid_voi = bool(seq) and None not in [
+        seq[0].get("LUTDescriptor", None),
+        seq[0].get("LUTData", None),
+    ]
+    valid_windowing = None not in [
+        ds.get("WindowCenter", None),
+        ds.get("WindowWidth", None),
+    ]
+    if valid_voi and (prefer_lut or not valid_windowing):
+        nominal_depth = cast(list[int], seq[index].LUTDescriptor)[2]
+        return 0, 2**nominal_depth - 1
+
+    # The output range of windowing is the same as its input range
+    if ds.get("ModalityLUTSequence"):
+        # Unsigned - see PS3.3 C.11.1.1.1
+        item = cast(list[Dataset], ds.ModalityLUTSequence)[0]
+        return 0, 2 ** cast(list[int], item.LUTDescriptor)[2] - 1
+
+    bits_stored = cast(int, ds.BitsStored)
+    y_min: float
+    y_max: float
+    if ds.PixelRepresentation == 0:
+        y_min, y_max = 0, 2**bits_stored - 1
+    else:
+        y_min, y_max = -(2 ** (bits_stored - 1)), 2 ** (bits_stored - 1) - 1
+
+    slope = ds.get("RescaleSlope", None)
+    intercept = ds.get("RescaleIntercept", None)
+    if slope is not None and intercept is not None:
+        y_min = y_min * slope + intercept
+        y_max = y_max * slope + intercept
+
+    return y_min, y_max
@@ -3,8 +3,9 @@
 
 Sequence is a list of pydicom Dataset objects.
 """
-from typing import cast, Any, TypeVar
-from collections.abc import Iterable
+from io import BytesIO
+from typing import cast, overload, Any, NamedTuple, TypeVar
+from collections.abc import Iterable, Iterator, MutableSequence
 
 from pydicom.dataset import Dataset
 from pydicom.multival import ConstrainedList
@@ -14,6 +15,28 @@ from pydicom.multival import ConstrainedList
 Self = TypeVar("Self", bound="Sequence")
 
 
+class _EncodedItem(NamedTuple):
+    """The location of an item that hasn't been parsed yet."""
+
+    #: The offset to the start of the item's tag
+    start: int
+    #: The offset to the end of the item
+    end: int
+
+
+class _EncodedSequence(NamedTuple):
+    """An encoded sequence value and its encoding."""
+
+    #: The encoded items, without any trailing Sequence Delimitation Item
+    value: bytes
+    is_implicit_VR: bool
+    is_little_endian: bool
+    #: The character encoding used by the items
+    encoding: str | MutableSequence[str]
+    #: The offset from the start of the file to the start of `value`
+    offset: int
+
+
 class Sequence(ConstrainedList[Dataset]):
     """Class to hold multiple :class:`~pydicom.dataset.Dataset` in a :class:`list`."""
 
@@ -38,8 +61,176 @@ class Sequence(ConstrainedList[Dataset]):
         # If True, SQ element uses an undefined length of 0xFFFFFFFF
         self.is_undefined_length: bool
 
+        # The encoded sequence, if any of its items haven't been parsed
+        self._encoded: _EncodedSequence | None = None
+        self._nr_encoded = 0
+        # If True then the encoded sequence is unchanged and can be written
+        #   as-is, which is only the case if no items have been parsed
+        self._is_unmodified = False
+        # The *Pixel Representation* used by the parent dataset, if any
+        self._parent_pixel_rep: int | None = None
+
         super().__init__(iterable)
 
+    @classmethod
+    def _from_encoded(
+        cls, encoded: _EncodedSequence, items: Iterable[tuple[int, int]]
+    ) -> "Sequence":
+        """Return a :class:`Sequence` that parses its items from `encoded`
+        when they're first accessed.
+
+        Parameters
+        ----------
+        encoded : pydicom.sequence._EncodedSequence
+            The encoded sequence.
+        items : Iterable[tuple[int, int]]
+            The ``(start, end)`` offsets of each item in the encoded value.
+
+        Returns
+        -------
+        pydicom.sequence.Sequence
+            The sequence with unparsed items.
+        """
+        seq = cls()
+        seq._list = cast(list[Dataset], [_EncodedItem(*item) for item in items])
+        if seq._list:
+            seq._encoded = encoded
+            seq._nr_encoded = len(seq._list)
+            seq._is_unmodified = True
+
+        return seq
+
+    def _parse(self, index: int) -> Dataset:
+        """Return the item at `index`, parsing it first if required."""
+        item = self._list[index]
+        if not isinstance(item, _EncodedItem):
+            return item
+
+        # Avoid circular import
+        from pydicom.filereader import read_sequence_item
+
+        encoded = cast(_EncodedSequence, self._encoded)
+        fp = BytesIO(encoded.value)
+        fp.seek(item.start)
+        ds = cast(
+            Dataset,
+            read_sequence_item(
+                fp,
+                encoded.is_implicit_VR,
+                encoded.is_little_endian,
+                encoded.encoding,
+                encoded.offset,
+            ),
+        )
+        ds.file_tell = ds.seq_item_tell
+        ds._set_item_pixel_rep(self._parent_pixel_rep)
+        self._list[index] = ds
+
+        # Parsed items may be changed without the sequence knowing
+        self._is_unmodified = False
+        self._nr_encoded -= 1
+        if not self._nr_encoded:
+            # All the items have been parsed
+            self._encoded = None
+
+        return ds
+
+    def _remove_encoded(self, items: list[Any]) -> None:
+        """Update the number of unparsed items after `items` have been removed
+        from the sequence.
+        """
+        self._nr_encoded -= sum(isinstance(item, _EncodedItem) for item in items)
+        if not self._nr_encoded:
+            # No more unparsed items, so release the encoded value
+            self._encoded = None
+
+    def _parse_all(self) -> None:
+        """Parse any items that haven't been parsed yet."""
+        if self._encoded is not None:
+            for index in range(len(self._list)):
+                self._parse(index)
+
+    def _parsed_items(self) -> Iterator[Dataset]:
+        """Yield the items that have already been parsed."""
+        for item in self._list:
+            if not isinstance(item, _EncodedItem):
+                yield item
+
+    @property
+    def _unmodified_value(self) -> _EncodedSequence | None:
+        """Return the encoded sequence if it's unchanged since being read,
+        ``None`` otherwise.
+        """
+        return self._encoded if self._is_unmodified else None
+
+    def append(self, val: Dataset) -> None:
+        """Append a :class:`~pydicom.dataset.Dataset` to the sequence."""
+        super().append(val)
+        self._is_unmodified = False
+
+    def __copy__(self) -> "Sequence":
+        """Return a shallow copy of the sequence."""
+        # The copy shares its items with the original so parse them now,
+        #   otherwise an item parsed and changed using one of them wouldn't
+        #   mark the other as modified
+        self._parse_all()
+        seq = self.__class__.__new__(self.__class__)
+        seq.__dict__.update(self.__dict__)
+
+        return seq
+
+    def __delitem__(self, index: slice | int) -> None:
+        """Remove the item(s) at `index`."""
+        removed = self._list[index] if isinstance(index, slice) else [self._list[index]]
+        super().__delitem__(index)
+        self._remove_encoded(removed)
+        self._is_unmodified = False
+
+    def __eq__(self, other: Any) -> Any:
+        """Return ``True`` if `other` is equal to self."""
+        self._parse_all()
+        if isinstance(other, Sequence):
+            other._parse_all()
+
+        return super().__eq__(other)
+
+    def __ne__(self, other: Any) -> Any:
+        """Return ``True`` if `other` is not equal to self."""
+        return not self == other
+
+    @overload
+    def __getitem__(self, index: int) -> Dataset:
+        pass  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> MutableSequence[Dataset]:
+        pass  # pragma: no cover
+
+    def __getitem__(self, index: slice | int) -> MutableSequence[Dataset] | Dataset:
+        """Return item(s) from the sequence, parsing them first if required."""
+        if self._encoded is not None:
+            if isinstance(index, slice):
+                for idx in range(*index.indices(len(self._list))):
+                    self._parse(idx)
+            else:
+                return self._parse(index)
+
+        return self._list[index]
+
+    def insert(self, position: int, val: Dataset) -> None:
+        """Insert a :class:`~pydicom.dataset.Dataset` at `position`."""
+        super().insert(position, val)
+        self._is_unmodified = False
+
+    def __iter__(self) -> Iterator[Dataset]:
+        """Yield the items, parsing them first if required."""
+        if self._encoded is None:
+            yield from self._list
+            return
+
+        for index in range(len(self._list)):
+            yield self._parse(index)
+
     def extend(self, val: Iterable[Dataset]) -> None:
         """Extend the :class:`~pydicom.sequence.Sequence` using an iterable
         of :class:`~pydicom.dataset.Dataset` instances.
@@ -48,16 +239,19 @@ class Sequence(ConstrainedList[Dataset]):
             raise TypeError("An iterable of 'Dataset' is required")
 
         super().extend(val)
+        self._is_unmodified = False
 
     def __iadd__(self: Self, other: Iterable[Dataset]) -> Self:
         """Implement Sequence() += [Dataset()]."""
         if isinstance(other, Dataset):
             raise TypeError("An iterable of 'Dataset' is required")
 
+        self._is_unmodified = False
         return super().__iadd__(other)
 
     def __setitem__(self, index: slice | int, val: Iterable[Dataset] | Dataset) -> None:
         """Add item(s) to the Sequence at `index`."""
+        removed = self._list[index] if isinstance(index, slice) else [self._list[index]]
         if isinstance(index, slice):
             if isinstance(val, Dataset):
                 raise TypeError("Can only assign an iterable of 'Dataset'")
@@ -66,6 +260,9 @@ class Sequence(ConstrainedList[Dataset]):
         else:
             super().__setitem__(index, cast(Dataset, val))
 
+        self._remove_encoded(removed)
+        self._is_unmodified = False
+
     def __str__(self) -> str:
         """String description of the Sequence."""
         return f"[{''.join([str(x) for x in self])}]"
@@ -1,18 +1,13 @@
 # Copyright 2008-2019 pydicom authors. See LICENSE file for details.
 """Access code dictionary information"""
 
+from functools import cache
 from itertools import chain
 import inspect
-from typing import cast, Union
+from typing import Any, cast, Union
 from collections.abc import KeysView, Iterable
 
 from pydicom.sr.coding import Code
-from pydicom.sr._concepts_dict import concepts as CONCEPTS
-from pydicom.sr._cid_dict import name_for_cid, cid_concepts as CID_CONCEPTS
-
-
-# Reverse lookup for cid names
-cid_for_name = {v: k for k, v in name_for_cid.items()}
 
 
 def _filtered(source: Iterable[str], filters: Iterable[str]) -> list[str]:
@@ -47,6 +42,50 @@ ConceptsType = dict[str, dict[str, dict[str, tuple[str, list[int]]]]]
 SnomedMappingType = dict[str, dict[str, str]]
 
 
+# The concept dictionaries are large, so are only imported when first used
+def _concepts() -> ConceptsType:
+    """Return the concepts dictionary."""
+    from pydicom.sr._concepts_dict import concepts
+
+    return cast(ConceptsType, concepts)
+
+
+def _cid_concepts() -> dict[int, dict[str, list[str]]]:
+    """Return the CID concepts dictionary."""
+    from pydicom.sr._cid_dict import cid_concepts
+
+    return cast(dict[int, dict[str, list[str]]], cid_concepts)
+
+
+def _name_for_cid() -> dict[int, str]:
+    """Return the CID names dictionary."""
+    from pydicom.sr._cid_dict import name_for_cid
+
+    return cast(dict[int, str], name_for_cid)
+
+
+@cache
+def _cid_for_name() -> dict[str, int]:
+    """Return the reverse lookup for CID names."""
+    return {v: k for k, v in _name_for_cid().items()}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "CONCEPTS":
+        return _concepts()
+
+    if name == "CID_CONCEPTS":
+        return _cid_concepts()
+
+    if name == "name_for_cid":
+        return _name_for_cid()
+
+    if name == "cid_for_name":
+        return _cid_for_name()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class _CID_Dict:
     repr_format = "{} = {}"
     str_format = "{:20} {:12} {:8} {}\n"
@@ -71,7 +110,7 @@ class _CID_Dict:
         """Return the ``Code`` for class attribute `name`."""
         matches = [
             scheme
-            for scheme, keywords in CID_CONCEPTS[self.cid].items()
+            for scheme, keywords in _cid_concepts()[self.cid].items()
             if name in keywords
         ]
 
@@ -86,7 +125,7 @@ class _CID_Dict:
             )
 
         scheme = matches[0]
-        identifiers = cast(dict[str, tuple[str, list[int]]], CONCEPTS[scheme][name])
+        identifiers = cast(dict[str, tuple[str, list[int]]], _concepts()[scheme][name])
         # Almost always only one code per identifier
         if len(identifiers) == 1:
             code, val = list(identifiers.items())[0]
@@ -124,7 +163,7 @@ class _CID_Dict:
 
     def __str__(self) -> str:
         """Return a str representation of the instance."""
-        s = [f"CID {self.cid} ({name_for_cid[self.cid]})"]
+        s = [f"CID {self.cid} ({_name_for_cid()[self.cid]})"]
         s.append(self.str_format.format("Attribute", "Code value", "Scheme", "Meaning"))
         s.append(self.str_format.format("---------", "----------", "------", "-------"))
         s.append(
@@ -154,7 +193,7 @@ class _CID_Dict:
         """
         # CID_CONCEPTS: Dict[int, Dict[str, List[str]]]
         return _filtered(
-            chain.from_iterable(CID_CONCEPTS[self.cid].values()),
+            chain.from_iterable(_cid_concepts()[self.cid].values()),
             filters,
         )
 
@@ -211,7 +250,15 @@ class _CodesDict:
             dictionary.
         """
         self.scheme = scheme
-        self._dict = {scheme: CONCEPTS[scheme]} if scheme else CONCEPTS
+
+    @property
+    def _dict(self) -> ConceptsType:
+        """Return the concepts for the scheme, or all concepts if no scheme."""
+        concepts = _concepts()
+        if self.scheme:
+            return {self.scheme: concepts[self.scheme]}
+
+        return concepts
 
     def __dir__(self) -> list[str]:
         """Gives a list of available SR identifiers.
@@ -1,8 +1,17 @@
 # Copyright 2008-2021 pydicom authors. See LICENSE file for details.
 
-from typing import NamedTuple, Any
+from functools import cache
+from typing import NamedTuple, Any, cast
 
-from pydicom.sr._snomed_dict import mapping as snomed_mapping
+
+@cache
+def _srt_to_sct() -> dict[str, str]:
+    """Return the SNOMED-RT to SNOMED CT mapping, which is only imported
+    when first used.
+    """
+    from pydicom.sr._snomed_dict import mapping
+
+    return cast(dict[str, str], mapping["SRT"])
 
 
 class Code(NamedTuple):
@@ -22,9 +31,10 @@ class Code(NamedTuple):
         return hash(self.scheme_designator + self.value)
 
     def __eq__(self, other: Any) -> Any:
-        if self.scheme_designator == "SRT" and self.value in snomed_mapping["SRT"]:
+        srt_to_sct = _srt_to_sct()
+        if self.scheme_designator == "SRT" and self.value in srt_to_sct:
             self_mapped = Code(
-                value=snomed_mapping["SRT"][self.value],
+                value=srt_to_sct[self.value],
                 meaning="",
                 scheme_designator="SCT",
                 scheme_version=self.scheme_version,
@@ -37,9 +47,9 @@ class Code(NamedTuple):
                 scheme_version=self.scheme_version,
             )
 
-        if other.scheme_designator == "SRT" and other.value in snomed_mapping["SRT"]:
+        if other.scheme_designator == "SRT" and other.value in srt_to_sct:
             other_mapped = Code(
-                value=snomed_mapping["SRT"][other.value],
+                value=srt_to_sct[other.value],
                 meaning="",
                 scheme_designator="SCT",
                 scheme_version=other.scheme_version,
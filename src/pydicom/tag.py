@@ -144,6 +144,8 @@ class BaseTag(int):
     Tags are represented as an :class:`int`.
     """
 
+    __slots__ = ()
+
     # Override comparisons so can convert "other" to Tag as necessary
     #   See Ordering Comparisons at:
     #   https://docs.python.org/3/whatsnew/3.0.html#ordering-comparisons
@@ -36,15 +36,17 @@ def fix_separator_callback(
         #    so need to replace backslash as bytes
         new_value = None
         if raw_elem.value is not None:
+            # The value may be a memoryview when read using mmap
+            value = bytes(raw_elem.value)
             if kwargs["invalid_separator"] == b" ":
-                stripped_val = raw_elem.value.strip()
-                strip_count = len(raw_elem.value) - len(stripped_val)
+                stripped_val = value.strip()
+                strip_count = len(value) - len(stripped_val)
                 new_value = (
                     stripped_val.replace(kwargs["invalid_separator"], b"\\")
                     + b" " * strip_count
                 )
             else:
-                new_value = raw_elem.value.replace(kwargs["invalid_separator"], b"\\")
+                new_value = value.replace(kwargs["invalid_separator"], b"\\")
         return_val = raw_elem._replace(value=new_value)
 
     return return_val
@@ -3,9 +3,9 @@
    data elements to proper python types
 """
 
-import re
 from io import BytesIO
 from struct import unpack, calcsize
+import re
 from typing import Union, cast, Any, TypeVar
 from collections.abc import MutableSequence, Callable
 
@@ -15,7 +15,7 @@ from pydicom.charset import default_encoding, decode_bytes
 from pydicom.config import logger, have_numpy
 from pydicom.dataelem import empty_value_for_VR, RawDataElement
 from pydicom.errors import BytesLengthException
-from pydicom.filereader import read_sequence
+from pydicom.filereader import read_sequence, _MAPPABLE_VR
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag, BaseTag
@@ -41,6 +41,12 @@ from pydicom.valuerep import PersonName
 
 _T = TypeVar("_T")
 
+# Characters allowed by the 'DS' and 'IS' repertoires, plus the delimiter
+_DS_CHARACTERS = b"0123456789+-eE. \\"
+_IS_CHARACTERS = b"0123456789+- \\"
+# Backslash delimited integers, each with at least one digit
+_IS_VALUES = re.compile(rb"(?: *[+-]?[0-9]+ *\\)* *[+-]?[0-9]+ *")
+
 
 def multi_string(
     val: str, valtype: Callable[[str], _T] | None = None
@@ -250,31 +256,146 @@ def convert_DS_string(
         If :data:`~pydicom.config.use_DS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
-    # Below, go directly to DS class instance
-    # rather than factory DS, but need to
-    # ensure last string doesn't have
-    # blank padding (use strip())
     if config.use_DS_numpy:
         if not have_numpy:
             raise ImportError("use_DS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r"[ \\0-9\.+eE-]*\Z"
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "DS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], "", num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype="f8", sep="\\")
+
+        value = cast("numpy.ndarray", convert_DS_array(byte_string))
         if len(value) == 1:  # Don't use array for one number
-            return value[0]
+            return cast("numpy.float64", value[0])
 
         return value
 
+    # Below, go directly to DS class instance
+    # rather than factory DS, but need to
+    # ensure last string doesn't have
+    # blank padding (use strip())
+    num_string = byte_string.decode(default_encoding)
     return multi_string(num_string.strip(), valtype=pydicom.valuerep.DSclass)
 
 
+def convert_DS_array(
+    byte_string: bytes, *, fallback: bool = False
+) -> Union["numpy.ndarray", pydicom.valuerep.DSclass, MutableSequence[Any]]:
+    """Return an encoded 'DS' value as a :class:`numpy.ndarray` of
+    :class:`numpy.float64`.
+
+    .. versionadded:: 3.0
+
+    All the values are converted in a single pass without creating a
+    :class:`~pydicom.valuerep.DSfloat` for each one, which is much faster
+    for elements with many values such as *Contour Data*.
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded 'DS' element value.
+    fallback : bool, optional
+        If ``False`` (default) then raise an exception if `byte_string`
+        contains invalid values, otherwise return the invalid value as
+        :func:`convert_DS_string` would when
+        :attr:`~pydicom.config.use_DS_numpy` is ``False``.
+
+    Returns
+    -------
+    numpy.ndarray | DSfloat | DSdecimal | MultiValue
+        A 1D array of the values, or the values as
+        :class:`~pydicom.valuerep.DSfloat` (or
+        :class:`~pydicom.valuerep.DSdecimal`) if `fallback` is ``True`` and
+        any of the values are invalid.
+
+    Raises
+    ------
+    ImportError
+        If NumPy isn't available.
+    ValueError
+        If `fallback` is ``False`` and the value contains characters outside
+        the 'DS' repertoire, empty values or values that aren't decimal
+        numbers.
+    """
+    arr = _numeric_string_array(byte_string, "DS", _DS_CHARACTERS, "f8")
+    if isinstance(arr, str):
+        if not fallback:
+            raise ValueError(arr)
+
+        num_string = byte_string.decode(default_encoding)
+        return multi_string(num_string.strip(), valtype=pydicom.valuerep.DSclass)
+
+    return arr
+
+
+def _numeric_string_array(
+    byte_string: bytes,
+    vr: str,
+    characters: bytes,
+    dtype: str,
+) -> Union["numpy.ndarray", str]:
+    """Return an encoded 'DS' or 'IS' value as a :class:`numpy.ndarray`.
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded value.
+    vr : str
+        The element's VR, used in the error messages.
+    characters : bytes
+        The characters allowed in `byte_string`.
+    dtype : str
+        The dtype of the returned array, ``"f8"`` or ``"i8"``.
+
+    Returns
+    -------
+    numpy.ndarray | str
+        A 1D array of the values, or a message describing why the value
+        couldn't be converted.
+    """
+    if not have_numpy:
+        raise ImportError(f"NumPy is required to convert '{vr}' values to an array")
+
+    invalid = byte_string.translate(None, characters)
+    if invalid:
+        invalid_chars = invalid.decode(default_encoding, errors="replace")
+        return f"{vr}: char(s) not in repertoire: '{invalid_chars}'"
+
+    if not byte_string.strip():
+        return numpy.empty(0, dtype=dtype)
+
+    # The characters are valid, so only malformed numbers such as '1.2.3'
+    #   and empty values are left to be caught when parsing
+    try:
+        return _parse_numbers(byte_string, dtype)
+    except (ValueError, OverflowError):
+        value = byte_string.decode(default_encoding)
+        return f"{vr}: unable to convert '{value}' to an array of numbers"
+
+
+def _parse_numbers(byte_string: bytes, dtype: str) -> "numpy.ndarray":
+    """Return the backslash delimited numbers in `byte_string` as an array
+    with `dtype`, either ``"f8"`` or ``"i8"``.
+    """
+    nr_values = byte_string.count(b"\\") + 1
+    if dtype == "f8" or nr_values < 32:
+        # float() is correctly rounded and faster than checking that 'DS'
+        #   values are well-formed for NumPy's text parser, and int() has
+        #   less overhead for a small number of values
+        parse = float if dtype == "f8" else int
+        values = map(parse, byte_string.split(b"\\"))
+        return numpy.fromiter(values, dtype=dtype, count=nr_values)
+
+    # NumPy's text parser is much faster than int() for many values, but
+    #   accepts malformed values such as '-', ' ' or '1 2' and clamps on
+    #   overflow, so check the values are well-formed first
+    if not _IS_VALUES.fullmatch(byte_string):
+        raise ValueError("Empty or malformed value")
+
+    arr = numpy.fromstring(byte_string, dtype=dtype, sep="\\")
+    info = numpy.iinfo(arr.dtype)
+    if arr.min() == info.min or arr.max() == info.max:
+        raise OverflowError("Value too large")
+
+    return arr
+
+
 def _DT_from_str(value: str) -> DT:
     value = value.rstrip()
     length = len(value)
@@ -353,28 +474,68 @@ def convert_IS_string(
         If :data:`~pydicom.config.use_IS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
-
     if config.use_IS_numpy:
         if not have_numpy:
             raise ImportError("use_IS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r"[ \\0-9\.+-]*\Z"
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "IS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], "", num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype="i8", sep=chr(92))  # 92:'\'
+
+        value = cast("numpy.ndarray", convert_IS_array(byte_string))
         if len(value) == 1:  # Don't use array for one number
             return cast("numpy.int64", value[0])
 
-        return cast("numpy.ndarray", value)
+        return value
 
+    num_string = byte_string.decode(default_encoding)
     return multi_string(num_string, valtype=pydicom.valuerep.IS)
 
 
+def convert_IS_array(
+    byte_string: bytes, *, fallback: bool = False
+) -> Union["numpy.ndarray", IS, MutableSequence[IS]]:
+    """Return an encoded 'IS' value as a :class:`numpy.ndarray` of
+    :class:`numpy.int64`.
+
+    .. versionadded:: 3.0
+
+    All the values are converted in a single pass without creating an
+    :class:`~pydicom.valuerep.IS` for each one.
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded 'IS' element value.
+    fallback : bool, optional
+        If ``False`` (default) then raise an exception if `byte_string`
+        contains invalid values, otherwise return the invalid value as
+        :func:`convert_IS_string` would when
+        :attr:`~pydicom.config.use_IS_numpy` is ``False``.
+
+    Returns
+    -------
+    numpy.ndarray | IS | MultiValue[IS]
+        A 1D array of the values, or the values as
+        :class:`~pydicom.valuerep.IS` if `fallback` is ``True`` and any of
+        the values are invalid.
+
+    Raises
+    ------
+    ImportError
+        If NumPy isn't available.
+    ValueError
+        If `fallback` is ``False`` and the value contains characters outside
+        the 'IS' repertoire, empty values or values that are too large for
+        a :class:`numpy.int64`.
+    """
+    arr = _numeric_string_array(byte_string, "IS", _IS_CHARACTERS, "i8")
+    if isinstance(arr, str):
+        if not fallback:
+            raise ValueError(arr)
+
+        num_string = byte_string.decode(default_encoding)
+        return multi_string(num_string, valtype=pydicom.valuerep.IS)
+
+    return arr
+
+
 def convert_numbers(
     byte_string: bytes, is_little_endian: bool, struct_format: str
 ) -> str | int | float | MutableSequence[int] | MutableSequence[float]:
@@ -772,6 +933,10 @@ def convert_value(
         encodings = [encodings]
 
     byte_string = raw_data_element.value
+    if isinstance(byte_string, memoryview) and VR not in _MAPPABLE_VR:
+        # Values read from memory-mapped files may be views
+        byte_string = byte_string.tobytes()
+
     is_little_endian = raw_data_element.is_little_endian
     is_implicit_VR = raw_data_element.is_implicit_VR
 
@@ -2,6 +2,8 @@
 
 from io import BytesIO
 import logging
+import threading
+import time
 from struct import pack, unpack
 from sys import byteorder
 
@@ -9,7 +11,7 @@ import pytest
 
 from pydicom import config
 from pydicom.dataset import Dataset
-from pydicom.encaps import get_frame, generate_frames, encapsulate
+from pydicom.encaps import get_frame, generate_frames, encapsulate, FrameIndex
 from pydicom.pixels import get_decoder, ExplicitVRLittleEndianDecoder
 from pydicom.pixels.common import PhotometricInterpretation as PI
 from pydicom.pixels.decoders.base import DecodeRunner, Decoder
@@ -492,6 +494,67 @@ class TestDecodeRunner:
         assert runner.get_data(src, 3, 4) == b"\x03\x04\x05"
         assert src.tell() == 2
 
+    def test_iter_decode_parallel(self):
+        """Test iter_decode_parallel() with a thread pool"""
+        runner = DecodeRunner(RLELossless)
+        runner.set_source(encapsulate([b"\x00\x01\x02\x03"] * 2))
+        thread_ids = set()
+
+        def decode(src, opts):
+            thread_ids.add(threading.get_ident())
+            time.sleep(0.01)
+            return src[::-1]
+
+        # Thread pool used for plugins that release the GIL
+        runner.set_decoders({"pylibjpeg": decode})
+        frames = [bytes([idx, 0]) for idx in range(20)]
+        decoded = list(runner.iter_decode_parallel(frames, workers=4))
+        assert decoded == [frame[::-1] for frame in frames]
+        assert threading.get_ident() in thread_ids
+        assert len(thread_ids) > 1
+
+        assert list(runner.iter_decode_parallel([], workers=4)) == []
+
+    def test_frame_index(self):
+        """Test frame_index"""
+        runner = DecodeRunner(RLELossless)
+        runner.set_source(RLE_16_1_10F.ds)
+        assert runner._frame_index is None
+
+        index = runner.frame_index
+        assert len(index) == 10
+        assert runner.frame_index is index
+        assert index.read_frame(runner.src, 9) == get_frame(
+            runner.src, 9, number_of_frames=10
+        )
+
+        # Changing the source resets the index
+        runner.set_source(encapsulate([b"\x00\x01\x02\x03"] * 2))
+        assert runner._frame_index is None
+        assert len(runner.frame_index) == 2
+
+        # The `frame_index` option is used if set
+        runner.set_source(RLE_16_1_10F.ds)
+        runner.set_option("frame_index", index)
+        assert runner.frame_index is index
+
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+    def test_decode_frame_index(self):
+        """Test decode() only uses a frame index for repeated access"""
+        runner = DecodeRunner(RLELossless)
+        runner.set_source(RLE_16_1_10F.ds)
+        decoder = get_decoder(RLELossless)
+        runner.set_decoders(decoder._validate_plugins("pydicom"))
+
+        # A single frame is read without indexing every frame
+        reference = runner.decode(9)
+        assert runner._frame_index is None
+
+        index = FrameIndex(RLE_16_1_10F.ds.PixelData, number_of_frames=10)
+        runner.set_option("frame_index", index)
+        assert runner.decode(9) == reference
+        assert runner._frame_index is index
+
 
 @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
 class TestDecodeRunner_Reshape:
@@ -1058,6 +1121,34 @@ class TestDecoder_Array:
             assert arr.dtype == reference.dtype
             assert arr.flags.writeable
 
+    def test_encapsulated_frame_index(self, monkeypatch):
+        """Test reusing a `frame_index` with encapsulated pixel data."""
+        decoder = get_decoder(RLELossless)
+        reference = RLE_16_1_10F
+        index = FrameIndex(reference.ds.PixelData, number_of_frames=10)
+
+        def get_frame(*args, **kwargs):
+            raise RuntimeError("get_frame() used")
+
+        monkeypatch.setattr("pydicom.pixels.decoders.base.get_frame", get_frame)
+        for idx in [9, 0, 4]:
+            arr = decoder.as_array(
+                reference.ds, index=idx, decoding_plugin="pydicom", frame_index=index
+            )
+            reference.test(arr, index=idx)
+
+        # Multiple indices are decoded using a single frame index
+        func = decoder.iter_array(
+            reference.ds, indices=[9, 0, 4], decoding_plugin="pydicom"
+        )
+        for idx, arr in zip([9, 0, 4], func):
+            reference.test(arr, index=idx)
+
+        func = decoder.iter_buffer(
+            reference.ds, indices=[9, 0], decoding_plugin="pydicom"
+        )
+        assert len(list(func)) == 2
+
     def test_encapsulated_plugin(self):
         """Test `decoding_plugin` with an encapsulated pixel data."""
         decoder = get_decoder(RLELossless)
@@ -1069,6 +1160,21 @@ class TestDecoder_Array:
         assert arr.dtype == reference.dtype
         assert arr.flags.writeable
 
+    def test_encapsulated_workers(self):
+        """Test `workers` with an encapsulated pixel data."""
+        decoder = get_decoder(RLELossless)
+
+        reference = RLE_16_1_10F
+        arr = decoder.as_array(reference.ds, decoding_plugin="pydicom", workers=3)
+        reference.test(arr)
+        assert arr.shape == reference.shape
+        assert arr.dtype == reference.dtype
+        assert arr.flags.writeable
+
+        msg = "'workers' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=msg):
+            decoder.as_array(reference.ds, workers=0)
+
     def test_encapsulated_excess_frames(self):
         """Test returning excess frame data"""
         decoder = get_decoder(RLELossless)
@@ -1126,6 +1232,19 @@ class TestDecoder_Array:
         # Lossy conversion, equal to within 1 intensity unit
         assert np.allclose(out, raw, atol=1)
 
+    def test_processing_colorspace_buffer_unchanged(self):
+        """Test color space conversion doesn't modify a writeable source."""
+        decoder = get_decoder(ExplicitVRLittleEndian)
+        reference = EXPL_8_3_1F_YBR
+        runner = DecodeRunner(ExplicitVRLittleEndian)
+        runner.set_source(reference.ds)
+
+        original = bytes(reference.ds.PixelData)
+        src = memoryview(bytearray(original))
+        arr = decoder.as_array(src, **runner.options)
+        reference.test(arr, as_rgb=True)
+        assert src.tobytes() == original
+
     def test_expb_ow_view_only_warns(self, caplog):
         """Test view_only with BE swapped OW warns"""
         decoder = get_decoder(ExplicitVRBigEndian)
@@ -1318,6 +1437,33 @@ class TestDecoder_Array:
             assert arr.flags.writeable
             assert arr.shape == reference.shape[1:]
 
+    def test_iter_encapsulated_workers(self):
+        """Test `workers` with an encapsulated pixel data."""
+        decoder = get_decoder(RLELossless)
+
+        reference = RLE_16_1_10F
+        func = decoder.iter_array(reference.ds, decoding_plugin="pydicom", workers=2)
+        for index, arr in enumerate(func):
+            reference.test(arr, index=index)
+            assert arr.dtype == reference.dtype
+            assert arr.flags.writeable
+            assert arr.shape == reference.shape[1:]
+
+        assert index == 9
+
+        indices = [9, 0, 4]
+        func = decoder.iter_array(
+            reference.ds, indices=indices, decoding_plugin="pydicom", workers=2
+        )
+        for idx, arr in enumerate(func):
+            reference.test(arr, index=indices[idx])
+
+        assert idx == 2
+
+        msg = "'workers' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=msg):
+            next(decoder.iter_array(reference.ds, workers=0))
+
     def test_iter_processing(self):
         """Test the processing options."""
         decoder = get_decoder(ExplicitVRLittleEndian)
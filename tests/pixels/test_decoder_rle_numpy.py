@@ -0,0 +1,172 @@
+"""Tests for the NumPy RLE Lossless decoding plugin."""
+
+import random
+
+import pytest
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.encaps import get_frame
+from pydicom.pixels import get_decoder
+from pydicom.pixels.decoders import rle
+from pydicom.pixels.decoders.rle_numpy import (
+    is_available,
+    _rle_decode_frame,
+    _rle_decode_segment,
+)
+from pydicom.pixels.encoders.native import _encode_segment
+from pydicom.uid import RLELossless, JPEGBaseline8Bit
+
+from .pixels_reference import PIXEL_REFERENCE, RLE_16_1_1F
+
+
+RLE_REFERENCE = PIXEL_REFERENCE[RLELossless]
+
+
+def name(ref):
+    return f"{ref.name}"
+
+
+@pytest.mark.skipif(HAVE_NP, reason="NumPy is available")
+def test_is_available_unavailable():
+    """Test the decoder is unavailable without NumPy."""
+    assert not is_available(RLELossless)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestDecoding:
+    """Tests for decoding RLE Lossless with the 'numpy' plugin."""
+
+    def setup_method(self):
+        self.decoder = get_decoder(RLELossless)
+
+    def test_is_available(self):
+        """Test the plugin availability."""
+        assert is_available(RLELossless)
+        assert not is_available(JPEGBaseline8Bit)
+        assert "numpy" in self.decoder._available
+
+    @pytest.mark.parametrize("reference", RLE_REFERENCE, ids=name)
+    def test_reference(self, reference):
+        """Test against the reference data for RLE lossless."""
+        arr = self.decoder.as_array(reference.ds, raw=True, decoding_plugin="numpy")
+        reference.test(arr)
+        assert arr.shape == reference.shape
+        assert arr.dtype == reference.dtype
+        assert arr.flags.writeable
+
+    @pytest.mark.parametrize("reference", RLE_REFERENCE, ids=name)
+    def test_matches_pydicom(self, reference):
+        """Test the decoded frames match those from the 'pydicom' plugin."""
+        ds = reference.ds
+        for index in range(reference.number_of_frames):
+            src = get_frame(
+                ds.PixelData, index, number_of_frames=reference.number_of_frames
+            )
+            args = (
+                ds.Rows,
+                ds.Columns,
+                ds.SamplesPerPixel,
+                ds.BitsAllocated,
+            )
+            assert _rle_decode_frame(src, *args) == rle._rle_decode_frame(src, *args)
+
+    def test_little_endian_segment_order(self):
+        """Test decoding using non-conformant segment ordering."""
+        ds = RLE_16_1_1F.ds
+        src = get_frame(ds.PixelData, 0)
+        args = (ds.Rows, ds.Columns, ds.SamplesPerPixel, ds.BitsAllocated, "<")
+        assert _rle_decode_frame(src, *args) == rle._rle_decode_frame(src, *args)
+
+    def test_invalid_segment_data_raises(self):
+        """Test invalid segment data raises exception"""
+        ds = RLE_16_1_1F.ds
+        src = get_frame(ds.PixelData, 0)[:-1]
+        msg = r"amount \(4095 vs. 4096 bytes\)"
+        with pytest.raises(ValueError, match=msg):
+            _rle_decode_frame(src, ds.Rows, ds.Columns, 1, 16)
+
+    def test_nonconf_segment_padding_warns(self):
+        """Test non-conformant segment padding warns"""
+        ds = RLE_16_1_1F.ds
+        src = get_frame(ds.PixelData, 0) + b"\x00\x01"
+        msg = (
+            r"The decoded RLE segment contains non-conformant padding - 4097 "
+            r"vs. 4096 bytes expected"
+        )
+        with pytest.warns(UserWarning, match=msg):
+            _rle_decode_frame(src, 4096, 1, 1, 16)
+
+    def test_unsupported_bits_allocated_raises(self):
+        """Test exception raised for BitsAllocated not a multiple of 8."""
+        msg = r"Unable to decode RLE encoded pixel data with 12 bits allocated"
+        with pytest.raises(NotImplementedError, match=msg):
+            _rle_decode_frame(b"\x00\x00\x00\x00", 1, 1, 1, 12)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestDecodeSegment:
+    """Tests for rle_numpy._rle_decode_segment()."""
+
+    def test_noop(self):
+        """Test no-operation output."""
+        assert _rle_decode_segment(b"").tobytes() == b""
+        assert _rle_decode_segment(b"\x80\x80\x80").tobytes() == b""
+
+        data = (
+            b"\x80\x80"  # No operation
+            b"\x05\x01\x02\x03\x04\x05\x06"  # Literal
+            b"\x80"  # No operation
+            b"\xFE\x01"  # Copy
+            b"\x80"
+        )
+        assert _rle_decode_segment(data).tobytes() == (
+            b"\x01\x02\x03\x04\x05\x06" b"\x01\x01\x01"
+        )
+
+    def test_literal(self):
+        """Test literal output."""
+        assert _rle_decode_segment(b"\x00\x02\x80").tobytes() == b"\x02"
+        assert _rle_decode_segment(b"\x01\x02\x03\x80").tobytes() == b"\x02\x03"
+        data = b"\x7f" + b"\x40" * 128 + b"\x80"
+        assert _rle_decode_segment(data).tobytes() == b"\x40" * 128
+
+    def test_copy(self):
+        """Test copy output."""
+        assert _rle_decode_segment(b"\xFF\x02\x80").tobytes() == b"\x02\x02"
+        assert _rle_decode_segment(b"\xFE\x02\x80").tobytes() == b"\x02\x02\x02"
+        assert _rle_decode_segment(b"\x81\x02\x80").tobytes() == b"\x02" * 128
+
+    def test_truncated(self):
+        """Test truncated segments match the 'pydicom' plugin."""
+        data = (
+            b"\x05\x01\x02\x03\x04\x05\x06"  # Literal
+            b"\xFE\x01"  # Copy
+            b"\x03\x07\x08\x09\x0A"  # Literal
+        )
+        for length in range(len(data) + 1):
+            src = data[:length]
+            assert _rle_decode_segment(src).tobytes() == rle._rle_decode_segment(src)
+
+    def test_random(self):
+        """Test randomly generated segments match the 'pydicom' plugin."""
+        rng = random.Random(12345)
+        for _ in range(50):
+            rows = rng.randint(1, 10)
+            columns = rng.randint(1, 300)
+            # Mix of runs and literals
+            src = bytearray()
+            while len(src) < rows * columns:
+                value = rng.randint(0, 255)
+                src.extend([value] * rng.choice([1, 1, 2, 3, 50, 200]))
+
+            src = bytes(src[: rows * columns])
+            encoded = _encode_segment(src, columns=columns)
+            decoded = _rle_decode_segment(encoded)
+            assert decoded.tobytes() == src
+            assert decoded.tobytes() == rle._rle_decode_segment(encoded)
@@ -2,6 +2,8 @@
 
 import importlib
 import logging
+import threading
+import time
 
 import pytest
 
@@ -1401,6 +1403,34 @@ class TestEncodeRunner_GetFrame:
 class TestEncodeRunner_Encode:
     """Tests for EncodeRunner.encode()"""
 
+    def test_iter_encode_workers(self):
+        """Test iter_encode() with a thread pool"""
+        runner = EncodeRunner(RLELossless)
+        runner.set_source(b"".join(bytes([idx]) * 4 for idx in range(10)))
+        runner.set_options(
+            rows=2,
+            columns=2,
+            number_of_frames=10,
+            samples_per_pixel=1,
+            bits_allocated=8,
+            bits_stored=8,
+            pixel_representation=0,
+            photometric_interpretation="MONOCHROME2",
+        )
+        thread_ids = set()
+
+        def encode(src, opts):
+            thread_ids.add(threading.get_ident())
+            time.sleep(0.01)
+            return src[:1]
+
+        # Thread pool used for plugins that release the GIL
+        runner.set_encoders({"pylibjpeg": encode})
+        out = list(runner.iter_encode(workers=4))
+        assert out == [bytes([idx]) for idx in range(10)]
+        assert threading.get_ident() in thread_ids
+        assert len(thread_ids) > 1
+
     @pytest.mark.skipif(not HAVE_NP, reason="Numpy unavailable")
     def test_specify_plugin(self):
         """Test with specific plugin"""
@@ -1639,6 +1669,24 @@ class TestEncoder:
         with pytest.raises(StopIteration):
             next(gen)
 
+    def test_array_iter_encode_workers(self):
+        """Test encoding a multiframe array with iter_encode and workers"""
+        arr = np.stack([self.arr + idx for idx in range(5)])
+        self.kwargs["number_of_frames"] = 5
+        reference = list(
+            self.enc.iter_encode(arr, encoding_plugin="pydicom", **self.kwargs)
+        )
+        out = list(
+            self.enc.iter_encode(
+                arr, encoding_plugin="pydicom", workers=2, **self.kwargs
+            )
+        )
+        assert out == reference
+
+        msg = "'workers' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=msg):
+            next(self.enc.iter_encode(arr, workers=0, **self.kwargs))
+
     # Passing Dataset
     def test_unc_dataset(self):
         """Test encoding an uncompressed dataset"""
@@ -1780,6 +1828,17 @@ class TestDatasetCompress:
         ds.SamplesPerPixel = 3
         assert np.array_equal(ref, ds.pixel_array)
 
+    @pytest.mark.skipif(not HAVE_NP, reason="Numpy not available")
+    def test_workers(self):
+        """Test compressing using multiple workers."""
+        ds = get_testdata_file("emri_small.dcm", read=True)
+        ref = ds.pixel_array
+        assert ds.NumberOfFrames == 10
+
+        ds.compress(RLELossless, encoding_plugin="pydicom", workers=3)
+        assert ds.file_meta.TransferSyntaxUID == RLELossless
+        assert np.array_equal(ref, ds.pixel_array)
+
     def test_planar_configuration_rle(self):
         """Test that multi-sample data has correct planar configuration."""
         ds = examples.rgb_color
@@ -0,0 +1,126 @@
+"""Tests for the 'numpy' RLE Lossless encoder plugin."""
+
+import random
+
+import pytest
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.pixels import RLELosslessEncoder
+from pydicom.pixels.encoders.base import EncodeRunner
+from pydicom.pixels.encoders import native
+from pydicom.pixels.encoders.rle_numpy import (
+    is_available,
+    _encode_frame,
+    _encode_segment,
+)
+from pydicom.uid import RLELossless, JPEGBaseline8Bit
+
+from .test_encoder_pydicom import REFERENCE_ENCODE_ROW
+
+
+REFERENCE_DATASETS = [
+    "OBXXXX1A.dcm",  # 8/8-bit, 1 sample/pixel, 1 frame
+    "SC_rgb.dcm",  # 8/8-bit, 3 sample/pixel, 1 frame
+    "MR_small.dcm",  # 16/16-bit, 1 sample/pixel, 1 frame
+    "SC_rgb_16bit.dcm",  # 16/16-bit, 3 sample/pixel, 1 frame
+    "rtdose_1frame.dcm",  # 32/32-bit, 1 sample/pixel, 1 frame
+    "SC_rgb_32bit.dcm",  # 32/32-bit, 3 sample/pixel, 1 frame
+]
+
+
+@pytest.mark.skipif(HAVE_NP, reason="NumPy is available")
+def test_is_available_unavailable():
+    """Test the encoder is unavailable without NumPy."""
+    assert not is_available(RLELossless)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestEncodeFrame:
+    """Tests for rle_numpy._encode_frame."""
+
+    def test_is_available(self):
+        """Test the plugin availability."""
+        assert is_available(RLELossless)
+        assert not is_available(JPEGBaseline8Bit)
+        assert "numpy" in RLELosslessEncoder._available
+
+    @pytest.mark.parametrize("fname", REFERENCE_DATASETS)
+    def test_matches_pydicom(self, fname):
+        """Test the encoded frame is identical to the 'pydicom' plugin."""
+        ds = dcmread(get_testdata_file(fname))
+        runner = EncodeRunner(RLELossless)
+        runner.set_options(
+            rows=ds.Rows,
+            columns=ds.Columns,
+            samples_per_pixel=ds.SamplesPerPixel,
+            bits_allocated=ds.BitsAllocated,
+        )
+        src = ds.PixelData
+        assert _encode_frame(src, runner) == native._encode_frame(src, runner)
+
+    def test_encode_plugin(self):
+        """Test encoding using the plugin interface."""
+        ds = dcmread(get_testdata_file("SC_rgb_16bit_2frame.dcm"))
+        for index in range(ds.NumberOfFrames):
+            assert RLELosslessEncoder.encode(
+                ds, index=index, encoding_plugin="numpy"
+            ) == RLELosslessEncoder.encode(ds, index=index, encoding_plugin="pydicom")
+
+    def test_16_segments_raises(self):
+        """Test trying to encode more than 15 segments raises exception."""
+        runner = EncodeRunner(RLELossless)
+        runner.set_options(rows=1, columns=1, samples_per_pixel=16, bits_allocated=8)
+        msg = (
+            r"Unable to encode as the DICOM standard only allows "
+            r"a maximum of 15 segments in RLE encoded data"
+        )
+        with pytest.raises(ValueError, match=msg):
+            _encode_frame(bytes(range(16)), runner)
+
+    def test_invalid_byteorder_raises(self):
+        """Test big endian `src` raises an exception."""
+        runner = EncodeRunner(RLELossless)
+        runner.set_options(
+            rows=1, columns=5, samples_per_pixel=3, bits_allocated=8, byteorder=">"
+        )
+        msg = r"Unsupported option \"byteorder = '>'\""
+        with pytest.raises(ValueError, match=msg):
+            _encode_frame(b"", runner)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestEncodeSegment:
+    """Tests for rle_numpy._encode_segment."""
+
+    @pytest.mark.parametrize("src, output", REFERENCE_ENCODE_ROW)
+    def test_encode_row(self, src, output):
+        """Test encoding a single row."""
+        output += b"\x00" * (len(output) % 2)
+        assert _encode_segment(bytes(src), max(len(src), 1)) == output
+
+    def test_rows(self):
+        """Test each row is encoded separately."""
+        src = b"\x00\x00\x00\x01" + b"\x01\x01\x02\x03" + b"\x03\x03"
+        assert _encode_segment(src, 4) == native._encode_segment(src, 4)
+
+    def test_random(self):
+        """Test randomly generated segments match the 'pydicom' plugin."""
+        rng = random.Random(12345)
+        for _ in range(100):
+            columns = rng.randint(1, 300)
+            length = rng.randint(1, 8) * columns - rng.randint(0, columns - 1)
+            src = bytearray()
+            while len(src) < length:
+                value = rng.randint(0, 3)
+                src.extend([value] * rng.choice([1, 1, 2, 3, 127, 128, 129, 257]))
+
+            src = bytes(src[:length])
+            assert _encode_segment(src, columns) == native._encode_segment(src, columns)
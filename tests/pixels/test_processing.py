@@ -0,0 +1,155 @@
+"""Tests for the pixels.processing module."""
+
+import pytest
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom import dcmread, Dataset
+from pydicom.data import get_testdata_file
+from pydicom.pixel_data_handlers.util import apply_modality_lut, apply_voi_lut
+from pydicom.pixels import iter_pixels, render
+from pydicom.pixels import processing
+from pydicom.pixels.processing import _render_lut, _voi_range
+
+
+# 16/12, 1 sample/pixel, windowing
+WIN_12_1F = get_testdata_file("MR-SIEMENS-DICOM-WithOverlays.dcm")
+# 16/16, 1 sample/pixel, rescale
+MOD_16 = get_testdata_file("CT_small.dcm")
+# 16/16, 1 sample/pixel, modality LUT
+MOD_16_SEQ = get_testdata_file("mlut_18.dcm")
+# 8/8, 1 sample/pixel, VOI LUT
+VOI_08_1F = get_testdata_file("vlut_04.dcm")
+# 16/12, 1 sample/pixel, 10 frames, windowing
+EMRI_16_10F = get_testdata_file("emri_small.dcm")
+
+
+def reference(arr, ds, dtype="uint8"):
+    """Return the rendered `arr` using the apply_* functions."""
+    values = apply_voi_lut(apply_modality_lut(arr, ds), ds).astype("f8")
+    y_min, y_max = _voi_range(ds, 0, True)
+    max_value = np.iinfo(dtype).max
+    values = (values - y_min) * (max_value / (y_max - y_min))
+    return np.rint(np.clip(values, 0, max_value)).astype(dtype)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestRender:
+    """Tests for render()"""
+
+    @pytest.mark.parametrize(
+        "path", [WIN_12_1F, MOD_16, MOD_16_SEQ, VOI_08_1F, EMRI_16_10F]
+    )
+    def test_matches_apply(self, path):
+        """Test the result matches the apply_* functions."""
+        ds = dcmread(path)
+        arr = ds.pixel_array
+        expected = reference(arr, ds)
+        result = render(arr, ds)
+        assert result.dtype == "uint8"
+        assert result.shape == arr.shape
+        assert np.array_equal(result, expected)
+
+        # Without a LUT
+        assert np.array_equal(render(arr.astype("i4"), ds), expected)
+
+    @pytest.mark.parametrize("voi_func", ["LINEAR", "LINEAR_EXACT", "SIGMOID"])
+    def test_windowing(self, voi_func):
+        """Test the windowing functions."""
+        ds = dcmread(WIN_12_1F)
+        ds.VOILUTFunction = voi_func
+        arr = ds.pixel_array
+        expected = reference(arr, ds)
+        assert np.array_equal(render(arr, ds), expected)
+        assert np.array_equal(render(arr.astype("f8"), ds), expected)
+
+    def test_prefer_lut(self):
+        """Test rendering with both a VOI LUT and windowing."""
+        ds = dcmread(VOI_08_1F)
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.BitsStored = 8
+        ds.WindowCenter = 128
+        ds.WindowWidth = 64
+        arr = ds.pixel_array
+        assert np.array_equal(render(arr, ds), reference(arr, ds))
+
+        result = render(arr, ds, prefer_lut=False)
+        windowed = apply_voi_lut(arr, ds, prefer_lut=False)
+        assert np.array_equal(result, np.rint(windowed).astype("u1"))
+
+    def test_dtype(self):
+        """Test rendering to uint16."""
+        ds = dcmread(WIN_12_1F)
+        arr = ds.pixel_array
+        result = render(arr, ds, dtype="uint16")
+        assert result.dtype == "uint16"
+        assert np.array_equal(result, reference(arr, ds, "uint16"))
+
+        msg = (
+            "Unable to render to 'float32', only unsigned integer dtypes are "
+            "supported"
+        )
+        with pytest.raises(ValueError, match=msg):
+            render(arr, ds, dtype="float32")
+
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(EMRI_16_10F)
+        arr = ds.pixel_array
+        expected = reference(arr, ds)
+        out = np.empty(arr.shape, dtype="u1")
+        assert render(arr, ds, out=out) is out
+        assert np.array_equal(out, expected)
+
+        out = np.empty(arr.shape, dtype="u1")
+        assert render(arr.astype("i4"), ds, out=out) is out
+        assert np.array_equal(out, expected)
+
+    def test_chunked(self, monkeypatch):
+        """Test rendering without a LUT using multiple chunks."""
+        monkeypatch.setattr(processing, "_RENDER_CHUNK_SIZE", 1000)
+        ds = dcmread(EMRI_16_10F)
+        arr = ds.pixel_array.astype("i4")
+        expected = reference(arr, ds)
+        assert np.array_equal(render(arr, ds), expected)
+        assert np.array_equal(render(arr[0], ds), expected[0])
+        assert np.array_equal(render(arr[0, 0], ds), expected[0, 0])
+
+    def test_lut_cached(self):
+        """Test the LUT is only created once for the same elements."""
+        ds = dcmread(WIN_12_1F)
+        arr = ds.pixel_array
+        _render_lut.cache_clear()
+        render(arr, ds)
+        render(arr[:10, :10], ds)
+        info = _render_lut.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+        ds.WindowCenter = [400, 200]
+        result = render(arr, ds)
+        assert _render_lut.cache_info().misses == 2
+        assert np.array_equal(result, reference(arr, ds))
+
+    def test_iter_pixels(self):
+        """Test rendering the frames from iter_pixels()."""
+        ds = dcmread(EMRI_16_10F)
+        expected = reference(ds.pixel_array, ds)
+
+        ds_out = Dataset()
+        for idx, arr in enumerate(iter_pixels(EMRI_16_10F, ds_out=ds_out)):
+            assert np.array_equal(render(arr, ds_out), expected[idx])
+
+    def test_lut_data_ow(self):
+        """Test a modality LUT with OW LUT Data."""
+        ds = dcmread(MOD_16_SEQ)
+        arr = ds.pixel_array
+        expected = reference(arr, ds)
+        seq = ds.ModalityLUTSequence[0]
+        seq["LUTData"].VR = "OW"
+        seq.LUTData = np.asarray(seq.LUTData, dtype="<u2").tobytes()
+        assert np.array_equal(render(arr, ds), expected)
@@ -2,8 +2,10 @@
 """Unit tests for the pydicom.dataelem module."""
 
 # Many tests of DataElement class are implied in test_dataset also
+import copy
 import datetime
 import math
+import pickle
 
 import pytest
 
@@ -306,6 +308,25 @@ class TestDataElement:
         elem = DataElement(0x60023000, "OB", b"\x00")
         assert "Overlay Data" in elem.__str__()
 
+    def test_slots(self):
+        """Test per-instance attributes use slots."""
+        elem = DataElement(0x00100010, "PN", "ANON")
+        assert "tag" not in elem.__dict__
+
+        elem.showVR = False
+        elem.foo = "bar"
+        copied = copy.deepcopy(elem)
+        assert copied == elem
+        assert copied.file_tell is None
+        assert copied.private_creator is None
+        assert not copied.showVR
+        assert copied.foo == "bar"
+        assert DataElement.showVR
+
+        unpickled = pickle.loads(pickle.dumps(elem))
+        assert unpickled == elem
+        assert unpickled.foo == "bar"
+
     def test_str_no_vr(self):
         """Test DataElement.__str__ output with no VR"""
         elem = DataElement(0x00100010, "PN", "ANON")
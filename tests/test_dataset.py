@@ -24,7 +24,13 @@ from pydicom import config
 from pydicom import dcmread
 from pydicom.data import get_testdata_file
 from pydicom.dataelem import DataElement, RawDataElement
-from pydicom.dataset import Dataset, FileDataset, validate_file_meta, FileMetaDataset
+from pydicom.dataset import (
+    Dataset,
+    FileDataset,
+    validate_file_meta,
+    FileMetaDataset,
+    _CompactElements,
+)
 from pydicom.encaps import encapsulate
 from pydicom.filebase import DicomBytesIO
 from pydicom.pixel_data_handlers.util import get_image_pixel_ids
@@ -2271,6 +2277,271 @@ class TestDatasetOverlayArray:
         assert isinstance(self.ds.overlay_array(0x6000), numpy.ndarray)
 
 
+class TestDatasetSequenceArray:
+    """Tests for Dataset.sequence_array()."""
+
+    def setup_method(self):
+        self.ds = dcmread(get_testdata_file("liver_1frame.dcm"))
+        self.path = "PerFrameFunctionalGroupsSequence.PlanePositionSequence"
+
+    @pytest.mark.skipif(HAVE_NP, reason="numpy is available")
+    def test_not_available(self):
+        """Test exception raised if numpy isn't available."""
+        msg = r"NumPy is required for FileDataset.sequence_array\(\)"
+        with pytest.raises(ImportError, match=msg):
+            self.ds.sequence_array(f"{self.path}.ImagePositionPatient")
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_unparsed_items(self):
+        """Test getting values without parsing the sequence items."""
+        arr = self.ds.sequence_array(f"{self.path}.ImagePositionPatient")
+        assert arr.dtype == "f8"
+        assert arr.tolist() == [
+            [-235.2, -226.8, -128.69],
+            [-235.2, -226.8, -127.69],
+            [-235.2, -226.8, -126.69],
+        ]
+        seq = self.ds.PerFrameFunctionalGroupsSequence
+        assert seq._nr_encoded == len(seq)
+
+        arr = self.ds.sequence_array([0x52009230, "FrameContentSequence", 0x00209157])
+        assert arr.dtype == "u4"
+        assert arr.tolist() == [[1, 1], [1, 2], [1, 3]]
+
+        path = (
+            "PerFrameFunctionalGroupsSequence.SegmentIdentificationSequence"
+            ".ReferencedSegmentNumber"
+        )
+        arr = self.ds.sequence_array(path)
+        assert arr.shape == (3,)
+        assert arr.dtype == "u2"
+        assert arr.tolist() == [1, 1, 1]
+        assert seq._nr_encoded == len(seq)
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_matches_parsed(self):
+        """Test the values match those from the parsed items."""
+        path = "PerFrameFunctionalGroupsSequence.FrameContentSequence"
+        keywords = ["DimensionIndexValues", "StackID", "FrameAcquisitionNumber"]
+        unparsed = [self.ds.sequence_array(f"{path}.{kw}") for kw in keywords]
+
+        ds = dcmread(get_testdata_file("liver_expb_1frame.dcm"))
+        for item in ds.PerFrameFunctionalGroupsSequence:
+            item.FrameContentSequence[0].StackID = "1"
+
+        for kw, arr in zip(keywords, unparsed):
+            parsed = ds.sequence_array(f"{path}.{kw}")
+            expected = [
+                item.FrameContentSequence[0].get(kw)
+                for item in ds.PerFrameFunctionalGroupsSequence
+            ]
+            assert parsed.tolist() == expected
+            if kw != "StackID":
+                assert arr.tolist() == parsed.tolist()
+
+        assert unparsed[1].tolist() == [None, None, None]
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_nested_and_strings(self):
+        """Test values from nested sequences and non-numeric values."""
+        arr = self.ds.sequence_array(
+            "PerFrameFunctionalGroupsSequence.DerivationImageSequence"
+            ".SourceImageSequence.ReferencedSOPInstanceUID"
+        )
+        assert arr.dtype == object
+        assert arr[0] == "1.2.392.200103.20080913.113635.2.2009.6.22.21.43.10.23433.1"
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_missing_values(self):
+        """Test items without the element use NaN."""
+        del self.ds.PerFrameFunctionalGroupsSequence[1].PlanePositionSequence[0][
+            "ImagePositionPatient"
+        ]
+        self.ds.PerFrameFunctionalGroupsSequence[2].PlanePositionSequence = []
+        arr = self.ds.sequence_array(f"{self.path}.ImagePositionPatient")
+        assert arr[0].tolist() == [-235.2, -226.8, -128.69]
+        assert numpy.isnan(arr[1:]).all()
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_invalid_path_raises(self):
+        """Test exceptions raised for invalid paths."""
+        msg = "The path must contain the sequence and the element to return"
+        with pytest.raises(ValueError, match=msg):
+            self.ds.sequence_array("PerFrameFunctionalGroupsSequence")
+
+        msg = r"The element \(0028,0010\) in the path is not a sequence"
+        with pytest.raises(ValueError, match=msg):
+            self.ds.sequence_array("Rows.Columns")
+
+        msg = r"The element \(0020,9157\) in the path is not a sequence"
+        with pytest.raises(ValueError, match=msg):
+            self.ds.sequence_array(
+                "PerFrameFunctionalGroupsSequence.FrameContentSequence"
+                ".DimensionIndexValues.Rows"
+            )
+
+
+class TestDatasetContourArrays:
+    """Tests for Dataset.contour_arrays()."""
+
+    def setup_method(self):
+        self.ds = dcmread(get_testdata_file("rtstruct.dcm"), force=True)
+
+    @pytest.mark.skipif(HAVE_NP, reason="numpy is available")
+    def test_not_available(self):
+        """Test exception raised if numpy isn't available."""
+        msg = r"NumPy is required for FileDataset.contour_arrays\(\)"
+        with pytest.raises(ImportError, match=msg):
+            self.ds.contour_arrays()
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_unparsed_items(self):
+        """Test getting the contours without parsing the sequence items."""
+        contours = self.ds.contour_arrays()
+        assert list(contours) == [1, 2, 3]
+
+        points, offsets = contours[1]
+        assert points.shape == (17, 3)
+        assert points.dtype == "f8"
+        assert offsets.tolist() == [0, 5, 11, 17]
+        assert points[0].tolist() == [-200.0, 150.0, -200.0]
+        assert contours[2][0].shape == (1, 3)
+        assert contours[2][1].tolist() == [0, 1]
+        assert contours[3][0].shape == (1, 3)
+
+        seq = self.ds.ROIContourSequence
+        assert seq._nr_encoded == len(seq)
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_matches_parsed(self):
+        """Test the contours match those from the parsed items."""
+        unparsed = self.ds.contour_arrays()
+        expected = {}
+        for item in self.ds.ROIContourSequence:
+            data = [c.ContourData for c in item.ContourSequence]
+            expected[item.ReferencedROINumber] = (
+                numpy.asarray([v for d in data for v in d]).reshape(-1, 3),
+                numpy.cumsum([0] + [len(d) // 3 for d in data]),
+            )
+
+        # Parsed items and 'Contour Data' values
+        self.ds.ROIContourSequence[0].ContourSequence[1].ContourData
+        parsed = self.ds.contour_arrays()
+        for roi, (points, offsets) in expected.items():
+            for result in (unparsed, parsed):
+                assert numpy.array_equal(result[roi][0], points)
+                assert numpy.array_equal(result[roi][1], offsets)
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_empty(self):
+        """Test ROIs without any contours."""
+        del self.ds.ROIContourSequence[1].ContourSequence
+        self.ds.ROIContourSequence[2].ContourSequence[0].ContourData = None
+        contours = self.ds.contour_arrays()
+        assert contours[2][0].shape == (0, 3)
+        assert contours[2][1].tolist() == [0]
+        assert contours[3][0].shape == (0, 3)
+        assert contours[3][1].tolist() == [0, 0]
+
+        assert contours[1][1].tolist() == [0, 5, 11, 17]
+
+    @pytest.mark.skipif(not HAVE_NP, reason="numpy is not available")
+    def test_invalid_raises(self):
+        """Test exceptions raised for invalid contours."""
+        del self.ds.ROIContourSequence[1].ReferencedROINumber
+        msg = (
+            r"Item 1 in the 'ROI Contour Sequence' has no \(3006,0084\) "
+            "'Referenced ROI Number' value"
+        )
+        with pytest.raises(ValueError, match=msg):
+            self.ds.contour_arrays()
+
+        self.ds.ROIContourSequence[1].ReferencedROINumber = 2
+        self.ds.ROIContourSequence[1].ContourSequence[0].ContourData = [1, 2]
+        msg = (
+            "Unable to return the contour points as one or more 'Contour Data' "
+            r"values doesn't contain \(x, y, z\) triplets"
+        )
+        with pytest.raises(ValueError, match=msg):
+            self.ds.contour_arrays()
+
+        del self.ds.ROIContourSequence
+        with pytest.raises(KeyError):
+            self.ds.contour_arrays()
+
+
+class TestCompactElements:
+    """Tests for datasets read with compact element storage."""
+
+    def test_read(self, compact_datasets):
+        """Test reading datasets with compact storage."""
+        path = get_testdata_file("CT_small.dcm")
+        ds = dcmread(path)
+        assert isinstance(ds._dict, _CompactElements)
+        elements = ds._dict
+        nr_elements = len(elements)
+        assert 0 < len(elements._tags) < nr_elements
+        assert isinstance(ds.file_meta._dict, _CompactElements)
+
+        elem = elements[0x00100010]
+        assert isinstance(elem, RawDataElement)
+        assert elem.value == b"CompressedSamples^CT1 "
+
+        config.settings.compact_datasets = False
+        reference = dcmread(path)
+        assert sorted(ds.keys()) == sorted(reference.keys())
+        assert ds == reference
+
+        # Accessed elements are converted and stored separately
+        assert ds.PatientName == "CompressedSamples^CT1"
+        assert 0x00100010 in elements._elements
+        assert 0x00100010 not in elements._tags
+        assert len(elements) == nr_elements
+
+    def test_mutation(self, compact_datasets):
+        """Test adding, changing and removing elements."""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        elements = ds._dict
+        nr_elements = len(elements)
+
+        ds.PatientName = "Citizen^Jan"
+        assert ds.PatientName == "Citizen^Jan"
+        del ds.PatientID
+        assert "PatientID" not in ds
+        with pytest.raises(KeyError):
+            del elements[0x00100020]
+
+        ds.PatientComments = "Test"
+        assert len(elements) == nr_elements
+        assert 0x00104000 in elements
+        assert "PatientID" not in elements
+        assert ds.pop(0x00100010).value == "Citizen^Jan"
+        assert len(ds) == nr_elements - 1
+
+        # Converting while iterating
+        assert [elem.tag for elem in ds] == sorted(elements)
+
+    def test_sequence_items(self, compact_datasets):
+        """Test sequence items use compact storage."""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        item = ds.BeamSequence[0]
+        assert isinstance(item._dict, _CompactElements)
+        assert item.BeamName == "Field 1"
+
+        fp = io.BytesIO()
+        ds.save_as(fp)
+        fp.seek(0)
+        assert dcmread(fp) == ds
+
+    def test_copy_pickle(self, compact_datasets):
+        """Test copying and pickling datasets with compact storage."""
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        assert copy.deepcopy(ds) == ds
+        ds2 = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds2._dict, _CompactElements)
+        assert ds2 == ds
+
+
 class TestFileMeta:
     def test_type_exception(self):
         """Assigning ds.file_meta warns if not FileMetaDataset instance"""
@@ -18,6 +18,8 @@ from pydicom.datadict import (
     add_private_dict_entries,
     add_private_dict_entry,
     _dictionary_vr_fast,
+    mask_match,
+    masks,
 )
 from pydicom.datadict import add_dict_entry, add_dict_entries
 from .test_util import save_private_dict
@@ -46,6 +48,26 @@ class TestDict:
         assert repeater_has_tag(0x60020010)
         assert not repeater_has_tag(0x00100010)
 
+    def test_mask_match(self):
+        """Test mask_match()"""
+        assert mask_match(0x60000010) == "60xx0010"
+        assert mask_match(0x601E3000) == "60xx3000"
+        assert mask_match(0x50020005) == "50xx0005"
+        assert mask_match(0x7F010010) == "7Fxx0010"
+        assert mask_match(0x00280410) == "002804x0"
+        assert mask_match(0x002808F8) == "002808x8"
+        assert mask_match(0x002031AB) == "002031xx"
+        assert mask_match(0x10001235) == "1000xxx5"
+        assert mask_match(0x1010ABCD) == "1010xxxx"
+        assert mask_match(0x00100010) is None
+        assert mask_match(0x60000013) is None
+        assert mask_match(0x00280415) is None
+        assert mask_match(0x10001236) is None
+
+        for mask_x in masks:
+            for digit in "0A":
+                assert mask_match(int(mask_x.replace("x", digit), 16)) == mask_x
+
     def test_repeater_has_keyword(self):
         """Test repeater_has_keyword"""
         assert repeater_has_keyword("OverlayData")
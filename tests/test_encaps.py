@@ -1,13 +1,14 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """Test for encaps.py"""
 
+import base64
 from io import BytesIO
 import mmap
 from struct import unpack
 
 import pytest
 
-from pydicom import dcmread, config, encaps
+from pydicom import dcmread, config, encaps, Dataset
 from pydicom.data import get_testdata_file
 from pydicom.encaps import (
     fragment_frame,
@@ -20,8 +21,11 @@ from pydicom.encaps import (
     generate_fragmented_frames,
     generate_frames,
     get_frame,
+    FrameIndex,
+    EncapsulatedFrames,
 )
 from pydicom.filebase import DicomBytesIO
+from pydicom.pixels import RLELosslessDecoder
 
 
 JP2K_10FRAME_NOBOT = get_testdata_file("emri_small_jpeg_2k_lossless.dcm")
@@ -1372,6 +1376,151 @@ class TestEncapsulateExtended:
         assert unpack(f"<{len(frames)}Q", eot_lengths) == (2, 2, 2)
 
 
+class TestEncapsulatedFrames:
+    """Tests for encaps.EncapsulatedFrames."""
+
+    def write(self, source, little_endian=True):
+        fp = DicomBytesIO()
+        fp.is_little_endian = little_endian
+        source.write(fp)
+        return fp.getvalue()
+
+    def test_matches_encapsulate(self):
+        """Test the written data matches encapsulate()."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        frames = list(generate_frames(ds.PixelData, number_of_frames=10))
+        source = EncapsulatedFrames((f for f in frames), has_bot=False)
+        assert source.number_of_frames is None
+        assert not source.has_bot
+        assert self.write(source) == encapsulate(frames, has_bot=False)
+
+        for nr_fragments in (1, 3):
+            source = EncapsulatedFrames(
+                (f for f in frames),
+                number_of_frames=10,
+                fragments_per_frame=nr_fragments,
+            )
+            assert self.write(source) == encapsulate(frames, nr_fragments)
+
+    def test_sized(self):
+        """Test the number of frames is taken from sized `frames`."""
+        source = EncapsulatedFrames([b"\x00\x01", b"\x02"])
+        assert source.number_of_frames == 2
+        assert source.has_bot
+        assert self.write(source) == encapsulate([b"\x00\x01", b"\x02"])
+        assert source.offsets == [0, 10]
+        assert source.lengths == [2, 2]
+
+    def test_offsets(self):
+        """Test the offsets and lengths match encapsulate_extended()."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        frames = list(generate_frames(ds.PixelData, number_of_frames=10))
+        source = EncapsulatedFrames(frames, use_extended=True)
+        assert not source.has_bot
+        data, offsets, lengths = encapsulate_extended(frames)
+        assert self.write(source) == data
+        assert source.offsets == list(unpack("<10Q", offsets))
+        assert source.lengths == list(unpack("<10Q", lengths))
+
+    def test_big_endian(self):
+        """Test writing big endian encapsulated data."""
+        source = EncapsulatedFrames([b"\x00\x01", b"\x02\x03"])
+        assert self.write(source, little_endian=False) == (
+            b"\xff\xfe\xe0\x00\x00\x00\x00\x08"
+            b"\x00\x00\x00\x00\x00\x00\x00\x0a"
+            b"\xff\xfe\xe0\x00\x00\x00\x00\x02\x00\x01"
+            b"\xff\xfe\xe0\x00\x00\x00\x00\x02\x02\x03"
+        )
+
+    def test_number_of_frames_required(self):
+        """Test an exception is raised if the number of frames is unknown."""
+        msg = "'number_of_frames' is required when using the Basic or Extended"
+        with pytest.raises(ValueError, match=msg):
+            EncapsulatedFrames(f for f in [b"\x00\x01"])
+
+        with pytest.raises(ValueError, match=msg):
+            EncapsulatedFrames((f for f in [b"\x00\x01"]), use_extended=True)
+
+    def test_extended_fragments_raises(self):
+        """Test the Extended Offset Table requires a fragment per frame."""
+        msg = "The Extended Offset Table can only be used when each frame is"
+        with pytest.raises(ValueError, match=msg):
+            EncapsulatedFrames([b"\x00\x01"], fragments_per_frame=2, use_extended=True)
+
+    def test_frame_count_mismatch_raises(self):
+        """Test an exception is raised if the number of frames is wrong."""
+        source = EncapsulatedFrames((f for f in [b"\x00\x01"]), number_of_frames=2)
+        msg = (
+            r"The number of frames written \(1\) doesn't match the expected "
+            r"number of frames \(2\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            self.write(source)
+
+        # Iterators can only be written once
+        source = EncapsulatedFrames((f for f in [b"\x00\x01"]), number_of_frames=1)
+        self.write(source)
+        msg = r"The number of frames written \(0\)"
+        with pytest.raises(ValueError, match=msg):
+            self.write(source)
+
+    def test_from_buffer(self):
+        """Test re-encapsulating frames from a buffer."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        frames = list(generate_frames(ds.PixelData, number_of_frames=10))
+        source = EncapsulatedFrames.from_buffer(ds.PixelData, number_of_frames=10)
+        assert source.number_of_frames == 10
+        assert self.write(source) == encapsulate(frames)
+        # Can be written more than once
+        assert self.write(source) == encapsulate(frames)
+
+        buffer = BytesIO(b"\x00" * 4 + ds.PixelData)
+        buffer.seek(4)
+        source = EncapsulatedFrames.from_buffer(
+            buffer, number_of_frames=10, has_bot=False
+        )
+        assert self.write(source) == encapsulate(frames, has_bot=False)
+        assert buffer.tell() == 4
+
+    def test_to_bytes(self):
+        """Test returning the encapsulated frames as bytes."""
+        frames = [b"\x00\x01", b"\x02\x03\x04\x05"]
+        source = EncapsulatedFrames(frames)
+        assert source.to_bytes() == encapsulate(frames)
+        assert source.offsets == [0, 10]
+
+    def test_to_json(self):
+        """Test the Pixel Data element can be converted to JSON."""
+        frames = [b"\x00\x01", b"\x02\x03\x04\x05"]
+        ds = Dataset()
+        ds.PixelData = EncapsulatedFrames(frames)
+        ds["PixelData"].VR = "OB"
+        encoded = base64.b64encode(encapsulate(frames)).decode("utf-8")
+        assert ds.to_json_dict() == {"7FE00010": {"vr": "OB", "InlineBinary": encoded}}
+
+    def test_decode_raises(self):
+        """Test decoding the Pixel Data raises a clear exception."""
+        ds = dcmread(get_testdata_file("MR_small_RLE.dcm"))
+        ds.PixelData = EncapsulatedFrames.from_buffer(ds.PixelData)
+        msg = (
+            r"Unable to decode the pixel data as the \(7FE0,0010\) 'Pixel "
+            r"Data' value is an 'EncapsulatedFrames' instance, which can only "
+            r"be used as a source of encoded frames when writing the dataset"
+        )
+        with pytest.raises(TypeError, match=msg):
+            ds.pixel_array
+
+        with pytest.raises(TypeError, match=msg):
+            RLELosslessDecoder.as_array(ds)
+
+    def test_repr(self):
+        """Test the string representation."""
+        source = EncapsulatedFrames([b"\x00\x01"], use_extended=True)
+        assert repr(source) == (
+            "<EncapsulatedFrames: 1 frame(s), has_bot=False, use_extended=True>"
+        )
+
+
 def as_bytesio(buffer):
     buffer = BytesIO(buffer)
     buffer.seek(0)
@@ -2373,7 +2522,7 @@ class TestGenerateFrames:
             b"\x04\x00\x00\x00"
             b"\x01\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == b"\x01\x00\x00\x00"
@@ -2395,7 +2544,7 @@ class TestGenerateFrames:
             b"\x04\x00\x00\x00"
             b"\x03\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src, number_of_frames=1)
             assert next(frames) == (b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00")
@@ -2412,7 +2561,7 @@ class TestGenerateFrames:
             b"\x04\x00\x00\x00"
             b"\x01\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == b"\x01\x00\x00\x00"
@@ -2435,7 +2584,7 @@ class TestGenerateFrames:
             b"\x04\x00\x00\x00"
             b"\x03\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == (b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00")
@@ -2460,7 +2609,7 @@ class TestGenerateFrames:
             b"\x04\x00\x00\x00"
             b"\x03\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == b"\x01\x00\x00\x00"
@@ -2487,7 +2636,7 @@ class TestGenerateFrames:
             b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x02\x00\x00\x00"
             b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x03\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
@@ -2517,7 +2666,7 @@ class TestGenerateFrames:
             b"\xFE\xFF\x00\xE0"
             b"\x02\x00\x00\x00\x02\x04"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             frames = generate_frames(src)
             assert next(frames) == b"\x01\x00\x00\x00\x00\x01"
@@ -2529,7 +2678,7 @@ class TestGenerateFrames:
         """Test multi-frame where multiple frags per frame and no BOT."""
         ds = dcmread(JP2K_10FRAME_NOBOT)
         assert 10 == ds.NumberOfFrames
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(ds.PixelData)
             frame_gen = generate_frames(src, number_of_frames=ds.NumberOfFrames)
             for ii in range(10):
@@ -2543,7 +2692,7 @@ class TestGenerateFrames:
         # Regression test for #685
         ds = dcmread(JP2K_10FRAME_NOBOT)
         assert 10 == ds.NumberOfFrames
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(ds.PixelData)
             # Note that we will yield 10 frames, not 8
             frame_gen = generate_frames(src, number_of_frames=8)
@@ -2564,7 +2713,7 @@ class TestGenerateFrames:
             "be invalid"
         )
         excess = b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x00\x01\x02\x03"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(b"".join([ds.PixelData, excess]))
             # Note that we will yield 10 frames, not 8
             frame_gen = generate_frames(src, number_of_frames=8)
@@ -2615,7 +2764,7 @@ class TestGetFrame:
             b"\x04\x00\x00\x00"
             b"\x01\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == b"\x01\x00\x00\x00"
 
@@ -2635,7 +2784,7 @@ class TestGetFrame:
             b"\x04\x00\x00\x00"
             b"\x03\x00\x00\x00"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0, number_of_frames=1) == (
                 b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
@@ -2662,7 +2811,7 @@ class TestGetFrame:
             r"pixel data as there is no basic or extended offset table data "
             r"and the number of frames has not been supplied"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             with pytest.raises(ValueError, match=msg):
                 get_frame(src, 0)
@@ -2689,7 +2838,7 @@ class TestGetFrame:
             b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\xD9\x00"
         )
         msg = "There is insufficient pixel data to contain 5 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
 
             # Note that we can access a single "extra" frame
@@ -2720,7 +2869,7 @@ class TestGetFrame:
             b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\x00\x00"
         )
 
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert (
                 get_frame(src, 0, number_of_frames=3)
@@ -2756,7 +2905,7 @@ class TestGetFrame:
             b"\x01\x00\x00\x00"
         )
         msg = "The 'index' must be 0 if the number of frames is 1"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             with pytest.raises(ValueError, match=msg):
                 get_frame(src, 1, number_of_frames=1)
@@ -2777,7 +2926,7 @@ class TestGetFrame:
             "Found 2 frame fragments in the encapsulated pixel data, an "
             "'index' of 2 is invalid"
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             with pytest.raises(ValueError, match=msg):
                 get_frame(src, 2, number_of_frames=2)
@@ -2794,7 +2943,7 @@ class TestGetFrame:
             b"\x01\x00\x00\x00"
         )
         msg = "There aren't enough offsets in the Basic Offset Table for 2 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == b"\x01\x00\x00\x00"
             with pytest.raises(ValueError, match=msg):
@@ -2818,7 +2967,7 @@ class TestGetFrame:
             b"\x03\x00\x00\x00"
         )
         msg = "There aren't enough offsets in the Basic Offset Table for 2 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == (
                 b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
@@ -2846,7 +2995,7 @@ class TestGetFrame:
             b"\x03\x00\x00\x00"
         )
         msg = "There aren't enough offsets in the Basic Offset Table for 4 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == b"\x01\x00\x00\x00"
             assert get_frame(src, 1) == b"\x02\x00\x00\x00"
@@ -2874,7 +3023,7 @@ class TestGetFrame:
             b"\xFE\xFF\x00\xE0\x04\x00\x00\x00\x03\x00\x00\x00"
         )
         msg = "There aren't enough offsets in the Basic Offset Table for 4 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == (
                 b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
@@ -2911,7 +3060,7 @@ class TestGetFrame:
             b"\x02\x00\x00\x00\x02\x04"
         )
         msg = "There aren't enough offsets in the Basic Offset Table for 4 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0) == b"\x01\x00\x00\x00\x00\x01"
             assert get_frame(src, 1) == (
@@ -2933,7 +3082,7 @@ class TestGetFrame:
         )
         eot = ([0], [4])
         msg = "Found 1 frame fragment in the encapsulated pixel data, 'index' must be 0"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0, extended_offsets=eot) == b"\x01\x00\x00\x00"
             with pytest.raises(ValueError, match=msg):
@@ -2943,7 +3092,7 @@ class TestGetFrame:
             b"\x00\x00\x00\x00\x00\x00\x00\x00",
             b"\x04\x00\x00\x00\x00\x00\x00\x00",
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0, extended_offsets=eot) == b"\x01\x00\x00\x00"
             with pytest.raises(ValueError, match=msg):
@@ -2967,7 +3116,7 @@ class TestGetFrame:
         )
         eot = ([0, 12, 24], [4, 4, 4])
         msg = "There aren't enough offsets in the Extended Offset Table for 4 frames"
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0, extended_offsets=eot) == b"\x01\x00\x00\x00"
             assert get_frame(src, 1, extended_offsets=eot) == b"\x02\x00\x00\x00"
@@ -2981,7 +3130,7 @@ class TestGetFrame:
             b"\x18\x00\x00\x00\x00\x00\x00\x00",
             b"\x04\x00\x00\x00\x00\x00\x00\x00" * 3,
         )
-        for func in (bytes, as_bytesio):
+        for func in (bytes, memoryview, as_bytesio):
             src = func(buffer)
             assert get_frame(src, 0, extended_offsets=eot) == b"\x01\x00\x00\x00"
             assert get_frame(src, 1, extended_offsets=eot) == b"\x02\x00\x00\x00"
@@ -3014,6 +3163,233 @@ class TestGetFrame:
             assert frame == references[2]
 
 
+class TestFrameIndex:
+    """Tests for FrameIndex"""
+
+    def test_empty_bot_single_fragment(self):
+        """Test a single-frame image where the frame is one fragment"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+        )
+        for func in (bytes, memoryview, as_bytesio):
+            src = func(buffer)
+            index = FrameIndex(src)
+            assert len(index) == 1
+            assert index.fragments(0) == [(16, 4)]
+            assert index.read_frame(src, 0) == b"\x01\x00\x00\x00"
+
+    def test_empty_bot_triple_fragment_single_frame(self):
+        """Test a single-frame image where the frame is three fragments"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x03\x00\x00\x00"
+        )
+        for func in (bytes, memoryview, as_bytesio):
+            src = func(buffer)
+            index = FrameIndex(src, number_of_frames=1)
+            assert len(index) == 1
+            assert index.fragments(0) == [(16, 4), (28, 4), (40, 4)]
+            assert index.read_frame(src, 0) == (
+                b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
+            )
+
+    def test_empty_bot_no_number_of_frames_raises(self):
+        """Test creating the index raises if no BOT and no number_of_frames."""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\x00\x00"
+        )
+        msg = (
+            r"Unable to determine the frame boundaries for the encapsulated "
+            r"pixel data as there is no basic or extended offset table data "
+            r"and the number of frames has not been supplied"
+        )
+        with pytest.raises(ValueError, match=msg):
+            FrameIndex(buffer)
+
+    def test_empty_bot_eoi(self):
+        """Test frame boundaries found using the JPEG EOI marker"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\xFF\xD9"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x03\x00\xFF\xD9"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x04\x00\x00\x00"
+        )
+        for func in (bytes, memoryview, as_bytesio):
+            src = func(buffer)
+            index = FrameIndex(src, number_of_frames=2)
+            assert len(index) == 3
+            assert index.read_frame(src, 0) == b"\x01\x00\x00\x00\x02\x00\xFF\xD9"
+            assert index.read_frame(src, 1) == b"\x03\x00\xFF\xD9"
+
+            msg = (
+                "The end of the encapsulated pixel data has been reached but "
+                "no JPEG EOI/EOC marker was found, the returned frame data may "
+                "be invalid"
+            )
+            with pytest.warns(UserWarning, match=msg):
+                assert index.read_frame(src, 2) == b"\x04\x00\x00\x00"
+
+    def test_bot(self):
+        """Test frame boundaries found using the Basic Offset Table"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x08\x00\x00\x00"
+            b"\x00\x00\x00\x00"
+            b"\x18\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x03\x00\x00\x00"
+            b"\xFE\xFF\xDD\xE0"
+            b"\x00\x00\x00\x00"
+        )
+        for func in (bytes, memoryview, as_bytesio):
+            src = func(buffer)
+            index = FrameIndex(src)
+            assert len(index) == 2
+            assert index.read_frame(src, 0) == b"\x01\x00\x00\x00\x02\x00\x00\x00"
+            assert index.read_frame(src, 1) == b"\x03\x00\x00\x00"
+
+    def test_bot_invalid_offset_raises(self):
+        """Test a BOT offset that isn't at the start of a fragment raises"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x08\x00\x00\x00"
+            b"\x00\x00\x00\x00"
+            b"\x10\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\x00\x00"
+        )
+        msg = (
+            "The Basic Offset Table offset 16 doesn't match the start of any "
+            "encapsulated pixel data fragment"
+        )
+        with pytest.raises(ValueError, match=msg):
+            FrameIndex(buffer)
+
+    def test_eot(self):
+        """Test frame boundaries from the Extended Offset Table"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x02\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x03\x00\x00\x00"
+        )
+        eots = [
+            ([0, 12, 24], [4, 4, 4]),
+            (
+                b"\x00\x00\x00\x00\x00\x00\x00\x00"
+                b"\x0C\x00\x00\x00\x00\x00\x00\x00"
+                b"\x18\x00\x00\x00\x00\x00\x00\x00",
+                b"\x04\x00\x00\x00\x00\x00\x00\x00" * 3,
+            ),
+        ]
+        msg = "There is insufficient pixel data to contain 4 frames"
+        for eot in eots:
+            for func in (bytes, memoryview, as_bytesio):
+                src = func(buffer)
+                index = FrameIndex(src, extended_offsets=eot)
+                assert len(index) == 3
+                assert index.read_frame(src, 0) == b"\x01\x00\x00\x00"
+                assert index.read_frame(src, 1) == b"\x02\x00\x00\x00"
+                assert index.read_frame(src, 2) == b"\x03\x00\x00\x00"
+                with pytest.raises(ValueError, match=msg):
+                    index.read_frame(src, 3)
+
+    def test_invalid_index_raises(self):
+        """Test an out of range index raises"""
+        buffer = (
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+        )
+        index = FrameIndex(buffer)
+        msg = "There is insufficient pixel data to contain 2 frames"
+        with pytest.raises(ValueError, match=msg):
+            index.fragments(1)
+
+        msg = "There is insufficient pixel data to contain 0 frames"
+        with pytest.raises(ValueError, match=msg):
+            index.fragments(-1)
+
+    def test_buffer_position_restored(self):
+        """Test the position of a file-like is unchanged"""
+        buffer = (
+            b"\x00\x01"
+            b"\xFE\xFF\x00\xE0"
+            b"\x00\x00\x00\x00"
+            b"\xFE\xFF\x00\xE0"
+            b"\x04\x00\x00\x00"
+            b"\x01\x00\x00\x00"
+        )
+        src = BytesIO(buffer)
+        src.seek(2)
+        index = FrameIndex(src)
+        assert src.tell() == 2
+        assert index.read_frame(src, 0) == b"\x01\x00\x00\x00"
+        assert src.tell() == 2
+
+    def test_matches_get_frame(self):
+        """Test the indexed frames match those from get_frame()"""
+        with dcmread(JP2K_10FRAME_NOBOT) as ds:
+            src = ds.PixelData
+
+        index = FrameIndex(src, number_of_frames=10)
+        assert len(index) == 10
+        for idx in reversed(range(10)):
+            frame = get_frame(src, idx, number_of_frames=10)
+            assert index.read_frame(src, idx) == frame
+            assert index.read_frame(memoryview(src), idx) == frame
+
+
 @pytest.fixture
 def use_future():
     original = config._use_future
@@ -6,7 +6,13 @@ from io import BytesIO
 import pytest
 
 from pydicom.data import get_testdata_file
-from pydicom.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom.filebase import (
+    DicomIO,
+    DicomFileLike,
+    DicomFile,
+    DicomBytesIO,
+    DicomMappedIO,
+)
 from pydicom.tag import Tag
 
 
@@ -296,3 +302,73 @@ class TestDicomFile:
             #   lowercase file path on Windows
             assert "ct_small.dcm" in fp.name.lower()
             assert fp.read(2) == b"\x49\x49"
+
+
+class TestDicomMappedIO:
+    """Test filebase.DicomMappedIO class"""
+
+    def test_path(self):
+        """Test mapping a file from its path"""
+        fp = DicomMappedIO(TEST_FILE)
+        assert "ct_small.dcm" in fp.name.lower()
+        assert fp.read(2) == b"\x49\x49"
+        assert fp.tell() == 2
+        view = fp.read_view(2)
+        assert isinstance(view, memoryview)
+        assert view == b"\x2A\x00"
+        assert fp.tell() == 4
+        fp.close()
+
+    def test_file_like(self):
+        """Test mapping from a file-like starts at its current position"""
+        with open(TEST_FILE, "rb") as f:
+            f.seek(128)
+            fp = DicomMappedIO(f)
+            assert fp.read(4) == b"DICM"
+            fp.close()
+            assert not f.closed
+
+    def test_buffer(self):
+        """Test wrapping a buffer"""
+        buffer = bytearray(b"\x00\x01\x02\x03")
+        fp = DicomMappedIO(buffer)
+        assert fp.name == "<no filename>"
+        assert fp.read_view() == b"\x00\x01\x02\x03"
+        assert fp.read_view(2) == b""
+        assert fp.read(2) == b""
+
+    def test_seek(self):
+        """Test seeking"""
+        fp = DicomMappedIO(b"\x00\x01\x02\x03")
+        assert fp.seek(1) == 1
+        assert fp.read(1) == b"\x01"
+        assert fp.seek(1, 1) == 3
+        assert fp.read(1) == b"\x03"
+        assert fp.seek(-2, 2) == 2
+        assert fp.read() == b"\x02\x03"
+        with pytest.raises(ValueError, match="Negative seek position -1"):
+            fp.seek(-1)
+
+        with pytest.raises(ValueError, match="Invalid whence value '3'"):
+            fp.seek(0, 3)
+
+    def test_mode_raises(self):
+        """Test only 'rb' mode is allowed"""
+        msg = "'DicomMappedIO' only supports mode 'rb'"
+        with pytest.raises(ValueError, match=msg):
+            DicomMappedIO(TEST_FILE, "wb")
+
+    def test_close_with_views(self):
+        """Test closing the mapping while views still exist"""
+        fp = DicomMappedIO(TEST_FILE)
+        fp.seek(128)
+        view = fp.read_view(4)
+        fp.close()
+        assert view == b"DICM"
+
+    def test_empty_file(self, tmp_path):
+        """Test mapping an empty file"""
+        path = tmp_path / "empty"
+        path.touch()
+        with DicomMappedIO(path) as fp:
+            assert fp.read() == b""
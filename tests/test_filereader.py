@@ -1,11 +1,13 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Unit tests for the pydicom.filereader module."""
 
+import copy
 import gzip
 import io
 from io import BytesIO
 import logging
 import os
+import pickle
 import shutil
 from pathlib import Path
 from struct import unpack
@@ -17,17 +19,20 @@ import pytest
 import pydicom.config
 from pydicom import config, dicomio
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
-from pydicom.data import get_testdata_file
+from pydicom.data import get_testdata_file, get_charset_files
 from pydicom.datadict import add_dict_entries
 from pydicom.filereader import (
     dcmread,
     read_dataset,
     data_element_generator,
     read_file_meta_info,
+    deferred_read_cache,
+    scan_directory,
+    scan_headers,
 )
 from pydicom.dataelem import DataElement, DataElement_from_raw
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomMappedIO
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag
@@ -943,7 +948,7 @@ class TestReader:
 
     def test_sequence_undefined_length_logged(self, enable_debugging, caplog):
         with caplog.at_level(logging.DEBUG, logger="pydicom"):
-            read_dataset(
+            ds = read_dataset(
                 BytesIO(
                     b"\x08\x00\x05\x00CS\x0a\x00ISO_IR 100"
                     b"\x08\x00\x06\x00SQ\x00\x00\xFF\xFF\xFF\xFF"
@@ -953,7 +958,11 @@ class TestReader:
                 False,
                 True,
             )
-        assert "0000001E: Reading/parsing undefined length sequence" in caplog.text
+            assert "0000001E: Reading/parsing undefined length sequence" in caplog.text
+            assert "Found Item tag" not in caplog.text
+            # Items are parsed when first accessed
+            ds[0x00080006].value[0]
+
         assert (
             "00000022: fe ff 00 e0 00 00 00 00  Found Item tag (start of item)"
         ) in caplog.text
@@ -1611,6 +1620,7 @@ class TestDeferredRead:
         shutil.copyfile(ct_name, self.testfile_name)
 
     def teardown_method(self):
+        deferred_read_cache.close()
         if os.path.exists(self.testfile_name):
             os.remove(self.testfile_name)
 
@@ -1674,6 +1684,76 @@ class TestDeferredRead:
         private_block = dataset.private_block(0x43, "GEMS_PARM_01")
         assert 2068 == len(private_block[0x29].value)
 
+    def test_file_handle_cached(self):
+        """Test the file is only opened once for multiple deferred reads."""
+        ds_norm = dcmread(self.testfile_name)
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds_other = dcmread(self.testfile_name, defer_size=1024)
+        assert len(deferred_read_cache) == 0
+        assert ds.PixelData == ds_norm.PixelData
+        assert len(deferred_read_cache) == 1
+        (fp,) = deferred_read_cache._handles.values()
+
+        elem = ds.private_block(0x43, "GEMS_PARM_01")[0x29]
+        assert elem.value == ds_norm[elem.tag].value
+        assert ds_other.PixelData == ds_norm.PixelData
+        assert list(deferred_read_cache._handles.values()) == [fp]
+        assert not fp.closed
+
+        deferred_read_cache.invalidate(self.testfile_name)
+        assert len(deferred_read_cache) == 0
+        assert fp.closed
+
+    def test_file_replaced(self):
+        """Test a replaced file isn't read using a stale cached handle."""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds_other = dcmread(self.testfile_name, defer_size=1024)
+        assert ds.PixelData == dcmread(ct_name).PixelData
+        assert len(deferred_read_cache) == 1
+        (fp,) = deferred_read_cache._handles.values()
+
+        # Replace the file with one that has different pixel data, keeping
+        #   the same modification time
+        ds_new = dcmread(ct_name)
+        ds_new.PixelData = b"\x01" * len(ds_new.PixelData)
+        replacement = self.testfile_name + ".new"
+        ds_new.save_as(replacement)
+        stat = os.stat(self.testfile_name)
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, self.testfile_name)
+
+        assert ds_other.PixelData == ds_new.PixelData
+        assert fp.closed
+        assert len(deferred_read_cache) == 1
+
+    def test_tag_mismatch_raises(self):
+        """Test an exception is raised if the tag doesn't match."""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        offset = ds._dict[0x7FE00010].value_tell - 12
+        with open(self.testfile_name, "r+b") as f:
+            f.seek(offset)
+            f.write(b"\xe0\x7f\x11\x00")
+
+        msg = (
+            r"Deferred read tag \(7FE0,0011\) does not match original " r"\(7FE0,0010\)"
+        )
+        with pytest.warns(UserWarning, match="modification time has changed"):
+            with pytest.raises(ValueError, match=msg):
+                ds.PixelData
+
+    def test_vr_mismatch_raises(self):
+        """Test an exception is raised if the VR doesn't match."""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        offset = ds._dict[0x7FE00010].value_tell - 8
+        with open(self.testfile_name, "r+b") as f:
+            f.seek(offset)
+            f.write(b"OB")
+
+        msg = r"Deferred read VR OB does not match original OW"
+        with pytest.warns(UserWarning, match="modification time has changed"):
+            with pytest.raises(ValueError, match=msg):
+                ds.PixelData
+
 
 class TestReadTruncatedFile:
     def testReadFileWithMissingPixelData(self):
@@ -1764,6 +1844,333 @@ class TestFileLike:
         file_like.close()
 
 
+class TestMemoryMap:
+    """Test dcmread() with mmap=True"""
+
+    def test_path(self):
+        """Test reading from a path"""
+        ds = dcmread(ct_name, mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+        assert isinstance(ds.PatientName, pydicom.valuerep.PersonName)
+        assert ds.fileobj_type is DicomMappedIO
+        assert ds.filename == ct_name
+        assert ds == dcmread(ct_name)
+
+    def test_file_like(self):
+        """Test reading from a file-like"""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(f, mmap=True)
+            assert not f.closed
+
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds == dcmread(ct_name)
+
+    def test_buffer_raises(self):
+        """Test reading from an unmappable buffer raises"""
+        msg = (
+            r"dcmread: 'mmap' requires a file path or a file-like with a "
+            r"'fileno\(\)' method, but got BytesIO"
+        )
+        with open(ct_name, "rb") as f:
+            buffer = BytesIO(f.read())
+
+        with pytest.raises(TypeError, match=msg):
+            dcmread(buffer, mmap=True)
+
+    def test_implicit_vr(self):
+        """Test bulk values are views for implicit VR"""
+        ds = dcmread(get_testdata_file("MR_small_implicit.dcm"), mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds["PixelData"].VR == "OW"
+
+    def test_encapsulated(self):
+        """Test encapsulated pixel data is a view"""
+        ds = dcmread(jpeg2000_name, mmap=True)
+        elem = ds["PixelData"]
+        assert elem.is_undefined_length
+        assert isinstance(elem.value, memoryview)
+        assert elem.value == dcmread(jpeg2000_name).PixelData
+
+    def test_deferred(self):
+        """Test deferred reads also use the mapping"""
+        ds = dcmread(ct_name, mmap=True, defer_size=256)
+        assert ds._dict[0x7FE00010].value is None
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds.PixelData == dcmread(ct_name).PixelData
+
+    def test_deepcopy(self):
+        """Test deepcopy of a mapped dataset copies the views to bytes"""
+        ds = dcmread(ct_name, mmap=True)
+        ds_copy = copy.deepcopy(ds)
+        assert isinstance(ds_copy._dict[0x7FE00010].value, bytes)
+        assert isinstance(ds_copy.PixelData, bytes)
+
+        ds.PixelData  # convert from raw
+        ds_copy = copy.deepcopy(ds)
+        assert isinstance(ds_copy.PixelData, bytes)
+        assert ds_copy == ds
+
+    def test_pickle(self):
+        """Test pickling a mapped dataset copies the views to bytes"""
+        ds = dcmread(ct_name, mmap=True)
+        ds_copy = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds_copy._dict[0x7FE00010].value, bytes)
+        assert isinstance(ds_copy.PixelData, bytes)
+        assert ds_copy == dcmread(ct_name)
+
+        ds.PixelData  # convert from raw
+        ds_copy = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds_copy.PixelData, bytes)
+        assert ds_copy == ds
+
+    def test_write(self):
+        """Test writing a mapped dataset"""
+        ds = dcmread(ct_name, mmap=True)
+        fp = DicomBytesIO()
+        ds.save_as(fp)
+        fp.seek(0)
+        assert dcmread(fp) == dcmread(ct_name)
+
+    @pytest.mark.parametrize("access", [False, True])
+    def test_write_encapsulated(self, access):
+        """Test writing a mapped dataset with encapsulated pixel data"""
+        path = get_testdata_file("MR_small_RLE.dcm")
+        ds = dcmread(path, mmap=True)
+        if access:
+            assert isinstance(ds.PixelData, memoryview)
+
+        fp = DicomBytesIO()
+        ds.save_as(fp)
+        fp.seek(0)
+        assert dcmread(fp) == dcmread(path)
+
+    def test_str(self):
+        """Test the string output for small views"""
+        ds = dcmread(ct_name, mmap=True)
+        assert isinstance(ds.file_meta.FileMetaInformationVersion, memoryview)
+        assert "OB: b'\\x00\\x01'" in str(ds.file_meta)
+
+    @pytest.mark.skipif(not have_numpy, reason="NumPy is not available")
+    def test_pixel_array(self):
+        """Test decoding pixel data from a view"""
+        reference = dcmread(ct_name).pixel_array
+        ds = dcmread(ct_name, mmap=True)
+        assert numpy.array_equal(ds.pixel_array, reference)
+
+
+class TestScanHeaders:
+    """Tests for filereader.scan_headers()"""
+
+    def test_rows(self):
+        """Test the values match those from dcmread()"""
+        tags = ["PatientName", "PatientID", "SOPInstanceUID", "Rows", "Columns"]
+        paths = [ct_name, mr_name, rtplan_name, jpeg2000_name, emri_name]
+        rows = scan_headers(paths, tags)
+        assert len(rows) == 5
+        for path, row in zip(paths, rows):
+            ds = dcmread(path)
+            assert list(row) == [Tag(tag) for tag in tags]
+            for tag in tags:
+                assert row[Tag(tag)] == ds.get(tag)
+
+    def test_columnar(self):
+        """Test returning a columnar batch"""
+        batch = scan_headers(
+            [ct_name, rtplan_name], ["Modality", 0x00280010], columnar=True
+        )
+        assert batch == {
+            0x00080060: ["CT", "RTPLAN"],
+            0x00280010: [128, None],
+        }
+        assert scan_headers([], ["Modality"], columnar=True) == {0x00080060: []}
+
+    def test_missing_and_empty(self):
+        """Test missing elements are None and empty elements are converted"""
+        row = scan_headers([ct_name], ["AccessionNumber", 0x00431099, "BeamSequence"])
+        assert row[0] == {
+            0x00080050: "",
+            0x00431099: None,
+            0x300A00B0: None,
+        }
+
+    def test_file_meta(self):
+        """Test File Meta Information elements are returned"""
+        (row,) = scan_headers([jpeg2000_name], ["TransferSyntaxUID", "Rows"])
+        assert row[0x00020010] == pydicom.uid.JPEG2000
+        assert row[0x00280010] == 1024
+
+    def test_skip_undefined_length(self):
+        """Test skipping undefined length sequences and encapsulated data"""
+        tags = ["Rows", "PixelData", 0xFFFFFFFE]
+        for path in [jpeg2000_name, get_testdata_file("liver_1frame.dcm")]:
+            ds = dcmread(path)
+            (row,) = scan_headers([path], ["Rows", 0x7FE00011])
+            assert row == {0x00280010: ds.Rows, 0x7FE00011: None}
+
+            (row,) = scan_headers([path], tags)
+            assert row[0x00280010] == ds.Rows
+            assert row[0x7FE00010] == ds.PixelData
+            assert row[0xFFFFFFFE] is None
+
+    def test_sequence(self):
+        """Test returning sequences"""
+        tags = ["SourceImageSequence", "DerivationCodeSequence", "BeamSequence"]
+        paths = [jpeg2000_name, rtplan_name]
+        rows = scan_headers(paths, tags)
+        for path, row in zip(paths, rows):
+            ds = dcmread(path)
+            for tag in tags:
+                assert row[Tag(tag)] == ds.get(tag)
+
+        assert isinstance(rows[0][Tag("SourceImageSequence")], Sequence)
+        assert rows[0][Tag("BeamSequence")] is None
+        assert len(rows[1][Tag("BeamSequence")]) == 1
+
+    def test_character_set(self):
+        """Test values are decoded using the Specific Character Set"""
+        path = get_charset_files("chrX1.dcm")[0]
+        (row,) = scan_headers([path], ["PatientName"])
+        assert row[0x00100010] == "Wang^XiaoDong=王^小東"
+
+    def test_encodings(self):
+        """Test reading the different transfer syntaxes"""
+        tags = ["PatientName", "Rows", "PixelSpacing"]
+        paths = [emri_big_endian_name, deflate_name, no_meta_group_length]
+        for path, row in zip(paths, scan_headers(paths, tags)):
+            ds = dcmread(path)
+            for tag in tags:
+                assert row[Tag(tag)] == ds.get(tag)
+
+    def test_force(self):
+        """Test reading datasets without File Meta Information"""
+        msg = "File is missing DICOM File Meta Information header"
+        with pytest.raises(InvalidDicomError, match=msg):
+            scan_headers([explicit_vr_be_no_meta], ["StudyDate"])
+
+        paths = [explicit_vr_le_no_meta, explicit_vr_be_no_meta]
+        rows = scan_headers(paths, ["SOPInstanceUID", "StudyDate"], force=True)
+        for path, row in zip(paths, rows):
+            ds = dcmread(path, force=True)
+            assert row == {0x00080018: ds.SOPInstanceUID, 0x00080020: ds.StudyDate}
+
+    def test_file_like(self):
+        """Test reading from file-likes and path-likes"""
+        with open(ct_name, "rb") as f:
+            fp = BytesIO(f.read())
+
+        (row,) = scan_headers([fp], ["PatientID"])
+        assert row[0x00100020] == "1CT1"
+        assert not fp.closed
+
+        (row,) = scan_headers([Path(ct_name)], ["PatientID"])
+        assert row[0x00100020] == "1CT1"
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    """Return a directory of files for scan_directory()"""
+    shutil.copy(ct_name, tmp_path / "b.dcm")
+    shutil.copy(mr_name, tmp_path / "a.dcm")
+    (tmp_path / "c.txt").write_text("Not a DICOM file")
+    (tmp_path / "sub").mkdir()
+    shutil.copy(rtplan_name, tmp_path / "sub" / "d.dcm")
+    shutil.copy(explicit_vr_le_no_meta, tmp_path / "sub" / "e.dcm")
+    return tmp_path
+
+
+class TestScanDirectory:
+    """Tests for filereader.scan_directory()"""
+
+    def test_scan(self, scan_dir):
+        """Test scanning a directory"""
+        (batch,) = list(scan_directory(scan_dir, ["Modality", "Rows"]))
+        assert batch.paths == [
+            os.fspath(scan_dir / "a.dcm"),
+            os.fspath(scan_dir / "b.dcm"),
+            os.fspath(scan_dir / "sub" / "d.dcm"),
+        ]
+        assert batch.values == {
+            0x00080060: ["MR", "CT", "RTPLAN"],
+            0x00280010: [64, 128, None],
+        }
+
+        # Unreadable files are recorded as errors
+        assert [path for path, _ in batch.errors] == [
+            os.fspath(scan_dir / "c.txt"),
+            os.fspath(scan_dir / "sub" / "e.dcm"),
+        ]
+        assert all(isinstance(exc, InvalidDicomError) for _, exc in batch.errors)
+
+    def test_options(self, scan_dir):
+        """Test the recursive, check_dicom and force options"""
+        (batch,) = list(scan_directory(scan_dir, ["Modality"], recursive=False))
+        assert batch.values == {0x00080060: ["MR", "CT"]}
+        assert len(batch.errors) == 1
+
+        (batch,) = list(scan_directory(scan_dir, ["Modality"], check_dicom=True))
+        assert batch.values == {0x00080060: ["MR", "CT", "RTPLAN"]}
+        assert batch.errors == []
+
+        (batch,) = list(scan_directory(scan_dir, ["Modality"], force=True))
+        assert batch.values == {0x00080060: ["MR", "CT", None, "RTPLAN", "RTPLAN"]}
+        assert batch.errors == []
+
+    def test_batches(self, scan_dir):
+        """Test the files are split into batches"""
+        batches = list(scan_directory(scan_dir, ["Modality"], batch_size=2))
+        assert [len(b.paths) + len(b.errors) for b in batches] == [2, 2, 1]
+        assert [b.values[0x00080060] for b in batches] == [
+            ["MR", "CT"],
+            ["RTPLAN"],
+            [],
+        ]
+
+        msg = "'batch_size' must be greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            next(scan_directory(scan_dir, ["Modality"], batch_size=0))
+
+    def test_workers(self, scan_dir):
+        """Test reading in parallel gives the same results"""
+        tags = ["Modality", "Rows"]
+        kwargs = {"batch_size": 1, "check_dicom": True}
+        reference = list(scan_directory(scan_dir, tags, **kwargs))
+        batches = list(scan_directory(scan_dir, tags, workers=2, **kwargs))
+        assert batches == reference
+        assert len(batches) == 5
+
+    @pytest.mark.skipif(not have_numpy, reason="Numpy not available")
+    def test_as_array(self, scan_dir):
+        """Test returning the values as a structured array"""
+        tags = ["Modality", "Rows", "Columns", "SliceThickness", 0x00431099]
+        (batch,) = list(scan_directory(scan_dir, tags, check_dicom=True, as_array=True))
+        arr = batch.values
+        assert arr.dtype.names == (
+            "Modality",
+            "Rows",
+            "Columns",
+            "SliceThickness",
+            "00431099",
+        )
+        assert arr["Modality"].tolist() == ["MR", "CT", "RTPLAN"]
+        assert arr["Rows"].dtype == "f8"
+        assert arr["Rows"][:2].tolist() == [64, 128]
+        assert numpy.isnan(arr["Rows"][2])
+        assert arr["SliceThickness"].dtype == "f8"
+        assert arr["00431099"].tolist() == [None, None, None]
+
+        (batch,) = list(
+            scan_directory(scan_dir, tags[:3], recursive=False, as_array=True)
+        )
+        assert batch.values["Rows"].dtype == "i8"
+
+    def test_as_array_no_numpy_raises(self, scan_dir, monkeypatch):
+        """Test an exception is raised if NumPy isn't available"""
+        monkeypatch.setattr(config, "have_numpy", False)
+        msg = "NumPy is required when 'as_array' is True"
+        with pytest.raises(ImportError, match=msg):
+            next(scan_directory(scan_dir, ["Modality"], as_array=True))
+
+
 class TestDataElementGenerator:
     """Test filereader.data_element_generator"""
 
@@ -1474,6 +1474,22 @@ class TestFileSet:
 
         assert 0 == len(fs)
 
+    def test_remove_uids(self, tiny):
+        """Test FileSet.remove() updates the instances found by UID."""
+        fs = FileSet(tiny)
+        uids = [instance.SOPInstanceUID for instance in fs]
+        assert fs._find_instance(uids[0]) is not None
+        assert len(uids) == len(fs._uid_keys)
+        for uid in uids[::2]:
+            fs.remove(fs._find_instance(uid))
+
+        assert len(uids[1::2]) == len(fs._uid_keys) == len(fs._uids)
+        for uid in uids[::2]:
+            assert fs._find_instance(uid) is None
+
+        for uid in uids[1::2]:
+            assert fs._find_instance(uid).SOPInstanceUID == uid
+
     def test_remove_remove(self, ct, tdir):
         """Test removing an instance that's already removed."""
         fs = FileSet()
@@ -2008,6 +2024,126 @@ class TestFileSet_Load:
             search_element: ["MONOCHROME1", "MONOCHROME2"]
         }
 
+    def test_find_multiple_values(self, dicomdir):
+        """Test FileSet.find() with a list of values."""
+        fs = FileSet(dicomdir)
+        matches = fs.find(PatientID=["77654033", "98890234"])
+        assert matches == fs.find()
+        assert 7 == len(fs.find(PatientID=["77654033", "12345678"]))
+        assert 3 == len(fs.find(Modality=["CR", "MR"], PatientID="77654033"))
+
+        # Multi-valued elements still match the entire value
+        file_id = fs._instances[0].ReferencedFileID
+        assert fs.find(ReferencedFileID=list(file_id)) == [fs._instances[0]]
+
+    def test_find_wildcard(self, dicomdir):
+        """Test FileSet.find() with wildcard matching."""
+        fs = FileSet(dicomdir)
+        assert 7 == len(fs.find(PatientID="7765*"))
+        assert 7 == len(fs.find(PatientID="?7654033"))
+        assert 24 == len(fs.find(PatientName="*^Peter"))
+        assert 31 == len(fs.find(PatientName="*"))
+        assert [] == fs.find(PatientID="7765?")
+        assert [] == fs.find(PatientID="7765.*")
+
+    def test_find_range(self, dicomdir):
+        """Test FileSet.find() with range matching."""
+        fs = FileSet(dicomdir)
+        assert 14 == len(fs.find(StudyDate="19950101-20021231"))
+        assert 27 == len(fs.find(StudyDate="20010101-"))
+        assert 31 == len(fs.find(StudyDate="-20030505"))
+        assert 17 == len(fs.find(StudyDate="20030505-20030505"))
+        assert [] == fs.find(StudyDate="20100101-")
+        assert 31 == len(fs.find(StudyTime="000000-235959"))
+
+    def test_find_matches_unindexed(self, dicomdir, monkeypatch):
+        """Test the indexed search matches searching every record."""
+        fs = FileSet(dicomdir)
+        queries = [
+            {"PatientID": "98890234", "StudyDate": "20030505"},
+            {"Modality": ["CT", "CR"]},
+            {"InstanceNumber": 1},
+            {"InstanceNumber": "1"},
+            {"PatientName": "Doe^Archibald"},
+            {"PatientName": "Doe^*", "SeriesNumber": "1"},
+            {"StudyDate": "-20010101", "StudyTime": ["000000", "173032"]},
+        ]
+        indexed = [fs.find(**query) for query in queries]
+        assert all(indexed)
+
+        monkeypatch.setattr(fs, "_index", lambda tag: None)
+        assert indexed == [fs.find(**query) for query in queries]
+
+    def test_find_index_updated(self, dicomdir, ct):
+        """Test the indexes are kept up to date by add() and remove()."""
+        fs = FileSet(dicomdir)
+        matches = fs.find(PatientID="77654033")
+        assert 7 == len(matches)
+        assert ["CR", "CT", "MR"] == fs.find_values("Modality")
+        assert fs._indexes[Tag("PatientID")] is not None
+
+        # The CR instances
+        fs.remove(matches[:3])
+        assert matches[3:] == fs.find(PatientID="77654033")
+        assert ["CT", "MR"] == fs.find_values("Modality")
+
+        # Cancel a removal, re-added instances are at the end
+        fs.add(matches[0].load())
+        assert matches[3:] + matches[:1] == fs.find(PatientID="77654033")
+        assert ["CT", "MR", "CR"] == fs.find_values("Modality")
+
+        instance = fs.add(ct)
+        assert [instance] == fs.find(PatientID=ct.PatientID)
+        assert ct.PatientID in fs.find_values("PatientID")
+        assert instance is fs.add(ct)
+
+        fs.remove(instance)
+        assert [] == fs.find(PatientID=ct.PatientID)
+        assert ct.PatientID not in fs.find_values("PatientID")
+
+    def test_reindex(self, dicomdir):
+        """Test the indexes are discarded by reindex()."""
+        fs = FileSet(dicomdir)
+        matches = fs.find(PatientID="77654033")
+        assert 7 == len(matches)
+
+        node = matches[0].node
+        while node.record_type != "PATIENT":
+            node = node.parent
+
+        node._record.PatientID = "CHANGED"
+        # The indexes aren't updated when records are changed
+        assert 7 == len(fs.find(PatientID="77654033"))
+
+        fs.reindex()
+        assert {} == fs._indexes
+        assert matches == fs.find(PatientID="CHANGED")
+        assert [] == fs.find(PatientID="77654033")
+        assert "CHANGED" in fs.find_values("PatientID")
+
+    def test_find_load_cached(self, private, monkeypatch):
+        """Test FileSet.find(load=True) only reads each instance once."""
+        fs = FileSet(private)
+        paths = []
+
+        def read(fp, *args, **kwargs):
+            paths.append(fp)
+            return dcmread(fp, *args, **kwargs)
+
+        monkeypatch.setattr("pydicom.fileset.dcmread", read)
+        results = fs.find(load=True, PhotometricInterpretation="MONOCHROME1")
+        assert 3 == len(results)
+        assert len(fs) == len(paths)
+
+        results = fs.find(load=True, PhotometricInterpretation="MONOCHROME2")
+        assert 28 == len(results)
+        assert fs.find_values("Rows", load=True)
+        assert len(fs) == len(paths)
+
+        # Elements after the pixel data require reading the entire instance
+        assert [] == fs.find(load=True, DataSetTrailingPadding=b"\x00")
+        assert 2 * len(fs) == len(paths)
+
     def test_empty_file_id(self, dicomdir):
         """Test loading a record with an empty File ID."""
         item = dicomdir.DirectoryRecordSequence[5]
@@ -2152,6 +2288,17 @@ class TestFileSet_Load:
         for ii, rr in zip(fs, ref):
             assert ii.SOPInstanceUID == rr.SOPInstanceUID
 
+    def test_load_dicomdir_no_patient(self):
+        """Test loading DICOMDIR-nopatient raises for the invalid record"""
+        ds = dcmread(get_testdata_file("DICOMDIR-nopatient"))
+        assert ds.DirectoryRecordSequence._nr_encoded > 0
+        msg = (
+            r"The UNKNOWN directory record at offset 976 is missing a required "
+            r"element"
+        )
+        with pytest.raises(ValueError, match=msg):
+            FileSet(ds)
+
     def test_load_dicomdir_no_uid(self, dicomdir):
         """Test loading DICOMDIR with no UID"""
         del dicomdir.file_meta.MediaStorageSOPInstanceUID
@@ -2159,6 +2306,43 @@ class TestFileSet_Load:
         assert fs.UID.is_valid
         assert fs.UID == dicomdir.file_meta.MediaStorageSOPInstanceUID
 
+    def test_load_records_unparsed(self, dicomdir):
+        """Test the directory records aren't parsed when loading."""
+        fs = FileSet(dicomdir)
+        seq = dicomdir.DirectoryRecordSequence
+        assert 52 == seq._nr_encoded
+        assert all(node._encoded is not None for node in fs._tree)
+
+        # Records are parsed when first used
+        node = fs._tree.children[0]
+        assert "PATIENT" == node.record_type
+        assert "77654033" == node.key
+        assert node._encoded is None
+        assert node._record is seq[0]
+        assert 51 == seq._nr_encoded
+
+        # Same result as with parsed records
+        ref = dcmread(TEST_FILE)
+        ref.DirectoryRecordSequence._parse_all()
+        assert str(FileSet(ref)) == str(fs)
+        assert [ii.path for ii in FileSet(ref)] == [ii.path for ii in fs]
+
+    def test_load_records_bad_record(self, dicomdir_copy):
+        """Test an invalid unparsed record raises when loading."""
+        tdir, ds = dicomdir_copy
+        # Same encoded length so the record offsets are unchanged
+        ds.DirectoryRecordSequence[0].DirectoryRecordType = "PRIVATE"
+        ds.save_as(ds.filename)
+
+        ds = dcmread(ds.filename)
+        assert 52 == ds.DirectoryRecordSequence._nr_encoded
+        msg = (
+            r"The PRIVATE directory record at offset 396 is missing a "
+            r"required element"
+        )
+        with pytest.raises(ValueError, match=msg):
+            FileSet(ds)
+
 
 class TestFileSet_Modify:
     """Tests for a modified File-set."""
@@ -2479,6 +2663,81 @@ class TestFileSet_Modify:
         item = ds.DirectoryRecordSequence[-1]
         assert item.ReferencedFileID == ["98892003", "MR700", "4648"]
 
+    def test_write_incremental(self, ct, tdir, monkeypatch):
+        """Test only new records and instances are written to a File-set."""
+        fs = FileSet()
+        fs.add(ct)
+        mr = dcmread(get_testdata_file("MR_small.dcm"))
+        fs.add(mr)
+        fs.write(tdir.name)
+        ref = dcmread(Path(tdir.name) / "DICOMDIR")
+
+        # Existing records are written as-is without being parsed
+        fs = FileSet(Path(tdir.name) / "DICOMDIR")
+        inodes = {ii.path: os.stat(ii.path).st_ino for ii in fs}
+        leaves = [ii.node for ii in fs]
+        encoded = []
+        encode_record = RecordNode._encode_record
+
+        def record(self, force_implicit=False):
+            encoded.append(self)
+            return encode_record(self, force_implicit)
+
+        monkeypatch.setattr(RecordNode, "_encode_record", record)
+        ct.SOPInstanceUID = generate_uid()
+        ct.SeriesInstanceUID = generate_uid()
+        instance = fs.add(ct)
+        fs.write()
+        # Only records that have been parsed are re-encoded
+        assert instance.node in encoded
+        assert not any(node in encoded for node in leaves)
+        # Existing instances haven't been moved or copied
+        assert inodes == {k: os.stat(k).st_ino for k in inodes}
+
+        ds = dcmread(Path(tdir.name) / "DICOMDIR")
+        seq = ds.DirectoryRecordSequence
+        assert 10 == len(seq)
+        # Only the offset values of the existing records have changed
+        uids = (ct.SeriesInstanceUID, ct.SOPInstanceUID)
+        new = [
+            ii
+            for ii in seq
+            if ii.get("SeriesInstanceUID") not in uids
+            and ii.get("ReferencedSOPInstanceUIDInFile") not in uids
+        ]
+        for item in [*ref.DirectoryRecordSequence, *new]:
+            del item.OffsetOfTheNextDirectoryRecord
+            del item.OffsetOfReferencedLowerLevelDirectoryEntity
+
+        assert ref.DirectoryRecordSequence == new
+        fs = FileSet(ds)
+        assert 3 == len(fs)
+        assert 1 == len(fs.find(SOPInstanceUID=ct.SOPInstanceUID))
+
+    def test_write_workers(self, ct, tdir, monkeypatch):
+        """Test writing staged instances with multiple workers."""
+
+        def link(src, dst):
+            raise OSError("Links not supported")
+
+        monkeypatch.setattr(os, "link", link)
+        fs = FileSet()
+        for _ in range(5):
+            ct.SOPInstanceUID = generate_uid()
+            fs.add(ct)
+
+        fs.write(tdir.name, workers=2)
+        fs = FileSet(Path(tdir.name) / "DICOMDIR")
+        assert 5 == len(fs)
+        for instance in fs:
+            assert instance.SOPInstanceUID == instance.load().SOPInstanceUID
+
+        with TemporaryDirectory() as path:
+            copied = fs.copy(path, workers=2)
+            assert 5 == len(copied)
+            for instance in copied:
+                assert instance.SOPInstanceUID == instance.load().SOPInstanceUID
+
 
 class TestFileSet_Copy:
     """Tests for copying a File-set."""
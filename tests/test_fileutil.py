@@ -2,9 +2,11 @@
 """Test suite for util functions"""
 from io import BytesIO
 from pathlib import Path
+import threading
 
+import pytest
 
-from pydicom.fileutil import path_from_pathlike
+from pydicom.fileutil import path_from_pathlike, FileHandleCache
 
 
 class PathLike:
@@ -32,3 +34,135 @@ class TestPathFromPathLike:
 
     def test_path_like(self):
         assert "test.dcm" == path_from_pathlike(PathLike("test.dcm"))
+
+
+class TestFileHandleCache:
+    """Tests for FileHandleCache"""
+
+    def setup_method(self):
+        self.opened = []
+
+    def opener(self, path, mode):
+        fp = open(path, mode)
+        self.opened.append(fp)
+        return fp
+
+    def test_reuse(self, tmp_path):
+        """Test handles are reused for the same path and version"""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"\x00\x01\x02\x03")
+        cache = FileHandleCache()
+        with cache.open(str(path), 1.0, self.opener) as fp:
+            fp.seek(2)
+            assert fp.read(2) == b"\x02\x03"
+
+        with cache.open(str(path), 1.0, self.opener) as fp:
+            fp.seek(0)
+            assert fp.read(2) == b"\x00\x01"
+
+        assert len(self.opened) == 1
+        assert len(cache) == 1
+        assert not self.opened[0].closed
+
+        cache.close()
+        assert len(cache) == 0
+        assert self.opened[0].closed
+
+    def test_version_changed(self, tmp_path):
+        """Test a changed version closes the stale handle"""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"\x00\x01")
+        cache = FileHandleCache()
+        with cache.open(str(path), 1.0, self.opener):
+            pass
+
+        with cache.open(str(path), 2.0, self.opener):
+            pass
+
+        assert len(self.opened) == 2
+        assert self.opened[0].closed
+        assert not self.opened[1].closed
+        assert len(cache) == 1
+        cache.close()
+
+    def test_maxsize(self, tmp_path):
+        """Test the least recently used handle is closed when full"""
+        paths = []
+        for name in "abc":
+            paths.append(str(tmp_path / name))
+            Path(paths[-1]).write_bytes(b"\x00")
+
+        cache = FileHandleCache(maxsize=2)
+        for path in (paths[0], paths[1], paths[0], paths[2]):
+            with cache.open(path, None, self.opener):
+                pass
+
+        assert len(self.opened) == 3
+        assert len(cache) == 2
+        assert [fp.closed for fp in self.opened] == [False, True, False]
+        cache.close()
+
+        cache = FileHandleCache(maxsize=0)
+        with cache.open(paths[0], None, self.opener) as fp:
+            assert not fp.closed
+
+        assert fp.closed
+        assert len(cache) == 0
+
+    def test_invalidate(self, tmp_path):
+        """Test invalidating the handles for a path"""
+        a = tmp_path / "a"
+        b = tmp_path / "b"
+        a.write_bytes(b"\x00")
+        b.write_bytes(b"\x00")
+        cache = FileHandleCache()
+        for path in (a, b):
+            with cache.open(str(path), None, self.opener):
+                pass
+
+        cache.invalidate(a)
+        assert [fp.closed for fp in self.opened] == [True, False]
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+        assert self.opened[1].closed
+
+    def test_concurrent(self, tmp_path):
+        """Test the lock isn't held while a handle is in use"""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"\x00\x01")
+        cache = FileHandleCache()
+        opened = []
+
+        def read():
+            with cache.open(str(path), 1.0, self.opener) as fp:
+                fp.seek(1)
+                opened.append(fp.read(1))
+
+        with cache.open(str(path), 1.0, self.opener) as fp:
+            # Another thread can use the cache without waiting for us
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+            assert opened == [b"\x01"]
+
+        # Only the most recently returned handle is kept
+        assert len(self.opened) == 2
+        assert fp is self.opened[0]
+        assert not fp.closed
+        assert self.opened[1].closed
+        assert list(cache._handles.values()) == [fp]
+        cache.close()
+
+    def test_exception_closes(self, tmp_path):
+        """Test the handle isn't cached if an exception is raised"""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"\x00")
+        cache = FileHandleCache()
+        with pytest.raises(ValueError):
+            with cache.open(str(path), None, self.opener):
+                raise ValueError
+
+        assert self.opened[0].closed
+        assert len(cache) == 0
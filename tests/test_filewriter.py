@@ -18,6 +18,12 @@ from pydicom import config, __version_info__, uid
 from pydicom.data import get_testdata_file, get_charset_files
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom.dataelem import DataElement, RawDataElement
+from pydicom.encaps import (
+    EncapsulatedFrames,
+    encapsulate,
+    encapsulate_extended,
+    generate_frames,
+)
 from pydicom.filebase import DicomBytesIO
 from pydicom.filereader import dcmread, read_dataset
 from pydicom.filewriter import (
@@ -34,9 +40,11 @@ from pydicom.filewriter import (
     write_OWvalue,
     writers,
     dcmwrite,
+    patch_file,
 )
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
+from pydicom.tag import Tag
 from .test_helpers import assert_no_warning
 from pydicom.uid import (
     ImplicitVRLittleEndian,
@@ -2192,6 +2200,58 @@ class TestWriteDataset:
         with pytest.raises(AttributeError, match=msg):
             write_dataset(fp, ds)
 
+    @pytest.mark.parametrize(
+        "path", [ct_name, mr_implicit_name, mr_bigendian_name, jpeg_name, rtplan_name]
+    )
+    def test_raw_passthrough(self, path, monkeypatch):
+        """Test unconverted raw elements are written as-is."""
+        ds = dcmread(path)
+        ds.PatientName = "Foo^Bar"
+        del ds[ds.dir()[-1]]
+        fp = DicomBytesIO()
+        write_dataset(fp, ds)
+        assert ds.get_item(0x00080016).is_raw
+
+        monkeypatch.setattr(
+            "pydicom.filewriter._write_raw_data_element", lambda fp, elem: False
+        )
+        ref = DicomBytesIO()
+        write_dataset(ref, ds)
+        assert fp.getvalue() == ref.getvalue()
+
+        fp.seek(0)
+        ds_read = read_dataset(fp, ds.is_implicit_VR, ds.is_little_endian)
+        assert ds_read.PatientName == "Foo^Bar"
+        assert ds_read == ds
+
+    def test_raw_passthrough_changed_encoding(self):
+        """Test raw elements are converted if the encoding changes."""
+        ds = dcmread(mr_implicit_name)
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+        fp.seek(0)
+        ds_read = read_dataset(fp, is_implicit_VR=False, is_little_endian=True)
+        assert ds_read["PatientName"].VR == VR.PN
+        assert ds_read == ds
+
+    def test_raw_passthrough_fallback(self):
+        """Test raw elements that can't be copied as-is are still written."""
+        ds = Dataset()
+        ds.set_original_encoding(False, True, "iso8859")
+        # Value too long for a 16-bit length
+        ds._dict[Tag(0x00100010)] = RawDataElement(
+            Tag(0x00100010), "LO", 0x10002, b"A" * 0x10002, 0, False, True
+        )
+        fp = DicomBytesIO()
+        msg = r"data element VR is changed from 'LO' to 'UN'"
+        with pytest.warns(UserWarning, match=msg):
+            write_dataset(fp, ds)
+
+        assert fp.getvalue()[:12] == b"\x10\x00\x10\x00UN\x00\x00\x02\x00\x01\x00"
+        assert fp.getvalue()[12:] == b"A" * 0x10002
+
 
 class TestWriteFileMetaInfoToStandard:
     """Unit tests for writing File Meta Info to the DICOM standard."""
@@ -3068,6 +3128,227 @@ class TestWriteUndefinedLengthPixelData:
         assert "UN" == ds[0x30040058].VR
 
 
+class TestWriteEncapsulatedFrames:
+    """Test writing Pixel Data from an EncapsulatedFrames source."""
+
+    def setup_method(self):
+        self.ds = dcmread(get_testdata_file("emri_small_RLE.dcm"))
+        self.frames = list(generate_frames(self.ds.PixelData, number_of_frames=10))
+
+    def test_write_data_element(self):
+        """Test write_data_element() streams the frames."""
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        fp.is_implicit_VR = False
+        elem = DataElement(0x7FE00010, "OB", EncapsulatedFrames(self.frames))
+        write_data_element(fp, elem)
+        assert fp.getvalue() == (
+            b"\xe0\x7f\x10\x00OB\x00\x00\xff\xff\xff\xff"
+            + encapsulate(self.frames)
+            + b"\xfe\xff\xdd\xe0\x00\x00\x00\x00"
+        )
+
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        fp.is_implicit_VR = True
+        write_data_element(fp, elem)
+        assert fp.getvalue()[:8] == b"\xe0\x7f\x10\x00\xff\xff\xff\xff"
+        assert fp.getvalue()[8:-8] == encapsulate(self.frames)
+
+    def test_dcmwrite_generator(self):
+        """Test dcmwrite() with a generator of frames."""
+        ref = DicomBytesIO()
+        self.ds.PixelData = encapsulate(self.frames)
+        self.ds.save_as(ref)
+
+        self.ds.PixelData = EncapsulatedFrames(
+            (frame for frame in self.frames), number_of_frames=10
+        )
+        fp = DicomBytesIO()
+        self.ds.save_as(fp)
+        assert fp.getvalue() == ref.getvalue()
+
+    def test_dcmwrite_extended(self):
+        """Test dcmwrite() back-patches the Extended Offset Table."""
+        ref = DicomBytesIO()
+        data, offsets, lengths = encapsulate_extended(self.frames)
+        self.ds.PixelData = data
+        self.ds.ExtendedOffsetTable = offsets
+        self.ds.ExtendedOffsetTableLengths = lengths
+        self.ds.save_as(ref)
+
+        # Existing table values are replaced
+        self.ds.ExtendedOffsetTable = b"\x00" * 8
+        self.ds.PixelData = EncapsulatedFrames(
+            (frame for frame in self.frames), number_of_frames=10, use_extended=True
+        )
+        fp = DicomBytesIO()
+        self.ds.save_as(fp)
+        assert fp.getvalue() == ref.getvalue()
+
+        fp.seek(0)
+        ds = dcmread(fp)
+        assert ds.ExtendedOffsetTable == offsets
+        assert ds.ExtendedOffsetTableLengths == lengths
+
+    def test_dcmwrite_from_buffer(self, tmp_path):
+        """Test dcmwrite() with frames copied from an existing file."""
+        path = get_testdata_file("emri_small_RLE.dcm")
+        with dcmread(path, mmap=True) as ds:
+            ds.PixelData = EncapsulatedFrames.from_buffer(
+                ds.PixelData, number_of_frames=ds.NumberOfFrames
+            )
+            ds.save_as(tmp_path / "out.dcm")
+
+        ds = dcmread(tmp_path / "out.dcm")
+        assert ds.PixelData == encapsulate(self.frames)
+
+
+class TestPatchFile:
+    """Tests for patch_file()"""
+
+    def copy(self, path, tmp_path):
+        dst = tmp_path / "patched.dcm"
+        dst.write_bytes(Path(path).read_bytes())
+        return dst
+
+    @pytest.mark.parametrize("path", [ct_name, mr_implicit_name, mr_bigendian_name])
+    def test_in_place(self, path, tmp_path):
+        """Test values with the same encoded length are changed in place."""
+        dst = self.copy(path, tmp_path)
+        original = dst.read_bytes()
+        ds = dcmread(path)
+        patient_id = "X" * len(ds.PatientID)
+        assert patch_file(dst, {"PatientID": patient_id, 0x00280010: 256})
+
+        patched = dst.read_bytes()
+        assert len(patched) == len(original)
+        diff = [idx for idx, (a, b) in enumerate(zip(original, patched)) if a != b]
+        assert 0 < len(diff) <= len(patient_id) + 2
+
+        ds_patched = dcmread(dst)
+        assert ds_patched.PatientID == patient_id
+        assert ds_patched.Rows == 256
+        del ds.PatientID, ds_patched.PatientID
+        del ds.Rows, ds_patched.Rows
+        assert ds_patched == ds
+
+    @pytest.mark.parametrize(
+        "path", [ct_name, mr_implicit_name, mr_bigendian_name, jpeg_name]
+    )
+    def test_rewrite(self, path, tmp_path):
+        """Test the file is rewritten if the encoded length changes."""
+        dst = self.copy(path, tmp_path)
+        ds = dcmread(path)
+        values = {
+            "PatientID": "ABCDEFGHIJKLMNOPQRS",
+            "AccessionNumber": "ACC",
+            "InstitutionName": "Hospital",
+            0x00081030: DataElement(0x00081030, "LO", "Study"),
+        }
+        assert not patch_file(dst, values)
+
+        ds_patched = dcmread(dst)
+        assert ds_patched.PatientID == "ABCDEFGHIJKLMNOPQRS"
+        assert ds_patched.AccessionNumber == "ACC"
+        assert ds_patched.InstitutionName == "Hospital"
+        assert ds_patched.StudyDescription == "Study"
+        assert ds_patched.PixelData == ds.PixelData
+        for tag in (0x00100020, 0x00080050, 0x00080080, 0x00081030):
+            if tag in ds:
+                del ds[tag]
+
+            del ds_patched[tag]
+
+        assert ds_patched == ds
+        assert list(tmp_path.iterdir()) == [dst]
+
+    def test_rewrite_without_kernel_copy(self, tmp_path, monkeypatch):
+        """Test rewriting if the kernel can't copy the unchanged data."""
+
+        def raise_oserror(*args):
+            raise OSError()
+
+        monkeypatch.setattr(os, "copy_file_range", raise_oserror, raising=False)
+        monkeypatch.setattr(os, "sendfile", raise_oserror, raising=False)
+        dst = self.copy(ct_name, tmp_path)
+        assert not patch_file(dst, {"PatientID": "ABCDEFGHIJKLMNOPQRS"})
+
+        ds = dcmread(ct_name)
+        ds.PatientID = "ABCDEFGHIJKLMNOPQRS"
+        assert dcmread(dst) == ds
+
+    def test_deflated(self, tmp_path):
+        """Test changing a deflated dataset."""
+        dst = self.copy(deflate_name, tmp_path)
+        assert not patch_file(dst, {"PatientID": "12345"})
+
+        ds = dcmread(deflate_name)
+        ds.PatientID = "12345"
+        assert dcmread(dst) == ds
+
+    def test_charset(self, tmp_path):
+        """Test the new values are encoded using the file's character set."""
+        dst = self.copy(unicode_name, tmp_path)
+        assert not patch_file(dst, {"PatientName": "Yamada^Tarou=山田^太郎"})
+        ds = dcmread(dst)
+        assert ds.PatientName == "Yamada^Tarou=山田^太郎"
+
+    def test_ambiguous_vr_implicit(self, tmp_path):
+        """Test changing an ambiguous VR element in an implicit VR file."""
+        dst = self.copy(mr_implicit_name, tmp_path)
+        assert patch_file(dst, {"SmallestImagePixelValue": -5})
+
+        ds = dcmread(dst)
+        assert ds.PixelRepresentation == 1
+        assert ds.SmallestImagePixelValue == -5
+        assert ds["SmallestImagePixelValue"].VR == VR.SS
+
+    @pytest.mark.parametrize("pixel_rep, vr", [(0, VR.US), (1, VR.SS)])
+    def test_ambiguous_vr_added(self, pixel_rep, vr, tmp_path):
+        """Test adding an ambiguous VR element to an explicit VR file."""
+        dst = self.copy(ct_name, tmp_path)
+        values = {"PixelRepresentation": pixel_rep, "LargestImagePixelValue": 1000}
+        assert not patch_file(dst, values)
+
+        ds = dcmread(dst)
+        assert ds.LargestImagePixelValue == 1000
+        assert ds["LargestImagePixelValue"].VR == vr
+
+    def test_private_implicit(self, tmp_path):
+        """Test changing private elements in an implicit VR file."""
+        dst = tmp_path / "implicit.dcm"
+        ds = dcmread(ct_name)
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        ds.save_as(dst)
+        assert ds[0x00111010].VR == VR.SS
+        assert patch_file(dst, {0x00111010: 7})
+        assert dcmread(dst)[0x00111010].value == 7
+
+        msg = (
+            r"Unable to determine the VR for the element with tag \(0077,1001\), "
+            "use a 'DataElement' with the VR set as the value instead"
+        )
+        with pytest.raises(ValueError, match=msg):
+            patch_file(dst, {0x00771001: "Unknown"})
+
+        assert not patch_file(dst, {0x00771001: DataElement(0x00771001, "LO", "A")})
+        assert dcmread(dst)[0x00771001].value == b"A "
+
+    def test_no_values(self, tmp_path):
+        """Test nothing changes if no values are given."""
+        dst = self.copy(ct_name, tmp_path)
+        assert patch_file(dst, {})
+        assert dst.read_bytes() == Path(ct_name).read_bytes()
+
+    def test_file_meta_raises(self, tmp_path):
+        """Test changing File Meta Information elements raises."""
+        dst = self.copy(ct_name, tmp_path)
+        msg = "cannot be used to change File Meta Information elements"
+        with pytest.raises(ValueError, match=msg):
+            patch_file(dst, {"TransferSyntaxUID": ExplicitVRBigEndian})
+
+
 def test_all_writers():
     """Test that the VR writer functions are complete"""
     assert set(VR) == set(writers)
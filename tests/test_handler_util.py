@@ -27,6 +27,8 @@ from pydicom.pixel_data_handlers.util import (
     get_expected_length,
     apply_color_lut,
     _expand_segmented_lut,
+    _item_lut,
+    _palette_color_lut,
     apply_modality_lut,
     apply_voi_lut,
     get_j2k_parameters,
@@ -1056,6 +1058,72 @@ class TestNumpy_ConvertColourSpace:
         assert (63, 128, 128) == tuple(ybr[1, 85, 50, :])
         assert (0, 128, 128) == tuple(ybr[1, 95, 50, :])
 
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(RGB_8_3_2F)
+        arr = ds.pixel_array
+        ybr = convert_color_space(arr, "RGB", "YBR_FULL")
+        out = np.empty_like(arr)
+        assert convert_color_space(arr, "RGB", "YBR_FULL", out=out) is out
+        assert np.array_equal(out, ybr)
+
+        out = np.empty_like(arr)
+        result = convert_color_space(arr, "RGB", "YBR_FULL", per_frame=True, out=out)
+        assert result is out
+        assert np.array_equal(out, ybr)
+        assert (255, 0, 0) == tuple(arr[0, 5, 50, :])
+
+        rgb = convert_color_space(ybr, "YBR_FULL", "RGB")
+        assert convert_color_space(ybr, "YBR_FULL", "RGB", out=ybr) is ybr
+        assert np.array_equal(ybr, rgb)
+
+        # Non-contiguous `out`
+        out = np.empty(arr.shape[::-1], dtype=arr.dtype).T
+        assert convert_color_space(rgb, "RGB", "RGB", out=out) is out
+        assert np.array_equal(out, rgb)
+        assert convert_color_space(arr, "RGB", "YBR_FULL", out=out) is out
+        assert np.array_equal(out, convert_color_space(arr, "RGB", "YBR_FULL"))
+
+    def test_chunked(self, monkeypatch):
+        """Test converting using multiple chunks."""
+        ds = dcmread(RGB_8_3_2F)
+        arr = ds.pixel_array
+        ybr = convert_color_space(arr, "RGB", "YBR_FULL")
+        rgb = convert_color_space(ybr, "YBR_FULL", "RGB")
+        monkeypatch.setattr("pydicom.pixel_data_handlers.util._COLOR_CHUNK_SIZE", 1001)
+        assert np.array_equal(convert_color_space(arr, "RGB", "YBR_FULL"), ybr)
+        assert np.array_equal(convert_color_space(ybr, "YBR_FULL", "RGB"), rgb)
+
+    @pytest.mark.parametrize("dtype", ["u1", "u2", "u4"])
+    def test_matches_float(self, dtype):
+        """Test the result is within 1 of the floating point equations."""
+        # Every combination of 0, 1, ..., 255 for two of the channels
+        values = np.arange(256)
+        arr = np.zeros((256, 256, 3), dtype=dtype)
+        arr[..., 0] = 127
+        arr[..., 1] = values[:, None]
+        arr[..., 2] = values[None, :]
+        channels = arr.astype("f8").transpose(2, 0, 1)
+
+        # ITU T.871 Section 7
+        r, g, b = channels
+        y = 0.299 * r + 0.587 * g + 0.114 * b
+        cb = -0.299 / 1.772 * r - 0.587 / 1.772 * g + 0.886 / 1.772 * b + 128
+        cr = 0.701 / 1.402 * r - 0.587 / 1.402 * g - 0.114 / 1.402 * b + 128
+        expected = np.clip(np.rint(np.stack([y, cb, cr], axis=-1)), 0, 255)
+        ybr = convert_color_space(arr, "RGB", "YBR_FULL")
+        assert ybr.dtype == dtype
+        assert np.abs(ybr - expected).max() <= 1
+
+        y, cb, cr = channels
+        r = y + 1.402 * (cr - 128)
+        g = y - 0.114 * 1.772 / 0.587 * (cb - 128) - 0.299 * 1.402 / 0.587 * (cr - 128)
+        b = y + 1.772 * (cb - 128)
+        expected = np.clip(np.rint(np.stack([r, g, b], axis=-1)), 0, 255)
+        rgb = convert_color_space(arr, "YBR_FULL", "RGB")
+        assert rgb.dtype == dtype
+        assert np.abs(rgb - expected).max() <= 1
+
 
 @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
 class TestNumpy_DtypeCorrectedForEndianness:
@@ -1274,6 +1342,44 @@ class TestNumpy_ModalityLUT:
         out = apply_modality_lut(arr, ds)
         assert [0, 0, 0, 1] == list(out)
 
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(MOD_16_SEQ)
+        arr = ds.pixel_array
+        expected = apply_modality_lut(arr, ds)
+        out = np.empty(arr.shape, dtype="u2")
+        assert apply_modality_lut(arr, ds, out=out) is out
+        assert np.array_equal(out, expected)
+
+        ds = dcmread(MOD_16)
+        arr = ds.pixel_array
+        expected = apply_modality_lut(arr, ds)
+        out = np.empty(arr.shape, dtype="f8")
+        assert apply_modality_lut(arr, ds, out=out) is out
+        assert np.array_equal(out, expected)
+
+        del ds.RescaleSlope
+        assert apply_modality_lut(arr, ds, out=out) is out
+        assert np.array_equal(out, arr)
+
+    def test_lut_cached(self):
+        """Test the LUT is only created once for the same LUT Data."""
+        ds = dcmread(MOD_16_SEQ)
+        arr = ds.pixel_array
+        expected = apply_modality_lut(arr, ds)
+        seq = ds.ModalityLUTSequence[0]
+        seq["LUTData"].VR = "OW"
+        seq.LUTData = pack("<4096H", *seq.LUTData)
+        lut = _item_lut(ds, seq, "uint16")
+        assert not lut.data.flags.writeable
+        assert _item_lut(ds, seq, "uint16") is lut
+        assert np.array_equal(apply_modality_lut(arr, ds), expected)
+
+        seq.LUTData = pack("<4096H", *range(4096))
+        assert _item_lut(ds, seq, "uint16") is not lut
+        out = apply_modality_lut(arr, ds)
+        assert np.array_equal(out, np.clip(arr.astype("i4") + 2048, 0, 4095))
+
     def test_unchanged(self):
         """Test no modality LUT transform."""
         ds = dcmread(MOD_16)
@@ -1683,6 +1789,33 @@ class TestNumpy_PaletteColor:
         assert [60160, 25600, 37376] == list(rgb[arr == 130][0])
         assert ([60160, 25600, 37376] == rgb[arr == 130]).all()
 
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(PAL_08_256_0_16_1F)
+        arr = ds.pixel_array
+        expected = apply_color_lut(arr, ds)
+        out = np.empty(arr.shape + (3,), dtype="u2")
+        assert apply_color_lut(arr, ds, out=out) is out
+        assert np.array_equal(out, expected)
+
+        msg = "output array does not match result of ndarray.take"
+        with pytest.raises(ValueError, match=msg):
+            apply_color_lut(arr, ds, out=np.empty(arr.shape, dtype="u2"))
+
+    def test_lut_cached(self):
+        """Test the LUT is only created once for the same LUT Data."""
+        ds = dcmread(PAL_SEG_LE_16_1F)
+        lut = _palette_color_lut(ds)
+        assert (65536, 3) == lut.data.shape
+        assert not lut.data.flags.writeable
+        assert _palette_color_lut(ds) is lut
+
+        ds.SegmentedBluePaletteColorLookupTableData = (
+            ds.SegmentedRedPaletteColorLookupTableData
+        )
+        assert _palette_color_lut(ds) is not lut
+        assert np.array_equal(_palette_color_lut(ds).data[:, 2], lut.data[:, 0])
+
     def test_unchanged(self):
         """Test dataset with no LUT is unchanged."""
         # Regression test for #1068
@@ -1700,53 +1833,53 @@ class TestNumpy_ExpandSegmentedLUT:
     def test_discrete(self):
         """Test expanding a discrete segment."""
         data = (0, 1, 0)
-        assert [0] == _expand_segmented_lut(data, "H")
+        assert [0] == _expand_segmented_lut(data, "H").tolist()
 
         data = (0, 2, 0, 112)
-        assert [0, 112] == _expand_segmented_lut(data, "H")
+        assert [0, 112] == _expand_segmented_lut(data, "H").tolist()
 
         data = (0, 2, 0, -112)
-        assert [0, -112] == _expand_segmented_lut(data, "H")
+        assert [0, -112] == _expand_segmented_lut(data, "H").tolist()
 
         data = (0, 2, 0, 112, 0, 0)
-        assert [0, 112] == _expand_segmented_lut(data, "H")
+        assert [0, 112] == _expand_segmented_lut(data, "H").tolist()
 
         data = (0, 2, 0, -112, 0, 0)
-        assert [0, -112] == _expand_segmented_lut(data, "H")
+        assert [0, -112] == _expand_segmented_lut(data, "H").tolist()
 
     def test_linear(self):
         """Test expanding a linear segment."""
         # Linear can never be the first segment
         # Positive slope
         data = (0, 2, 0, 28672, 1, 5, 49152)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, 28672, 32768, 36864, 40960, 45056, 49152] == out
 
         data = (0, 1, -400, 1, 5, 0)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [-400, -320, -240, -160, -80, 0] == out
 
         # Positive slope, floating point steps
         data = (0, 1, 163, 1, 48, 255)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert (1 + 48) == len(out)
 
         # No slope
         data = (0, 2, 0, 28672, 1, 5, 28672)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, 28672, 28672, 28672, 28672, 28672, 28672] == out
 
         data = (0, 1, -100, 1, 5, -100)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [-100, -100, -100, -100, -100, -100] == out
 
         # Negative slope
         data = (0, 2, 0, 49152, 1, 5, 28672)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, 49152, 45056, 40960, 36864, 32768, 28672] == out
 
         data = (0, 1, 0, 1, 5, -400)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, -80, -160, -240, -320, -400] == out
 
     def test_indirect_08(self):
@@ -1757,42 +1890,42 @@ class TestNumpy_ExpandSegmentedLUT:
 
         # Little endian
         data = (0, 2, 0, 112, 1, 5, 192, 2, 1, 4, 0, 0, 0)
-        out = _expand_segmented_lut(data, "<B")
+        out = _expand_segmented_lut(data, "<B").tolist()
         assert ref_a == out
 
         data = (0, 2, 0, 112, 2, 1, 0, 0, 0, 0)
-        out = _expand_segmented_lut(data, "<B")
+        out = _expand_segmented_lut(data, "<B").tolist()
         assert [0, 112, 0, 112] == out
 
         # 0x0100 0x0302 is 66051 in LE 16-bit MSB, LSB
         data = [0, 1, 0] * 22017 + [0, 2, 1, 2] + [2, 1, 3, 2, 1, 0]
-        out = _expand_segmented_lut(data, "<B")
+        out = _expand_segmented_lut(data, "<B").tolist()
         assert [0] * 22017 + [1, 2, 1, 2] == out
 
         # Big endian
         data = (0, 2, 0, 112, 1, 5, 192, 2, 1, 0, 4, 0, 0)
-        out = _expand_segmented_lut(data, ">B")
+        out = _expand_segmented_lut(data, ">B").tolist()
         assert ref_a == out
 
         data = (0, 2, 0, 112, 2, 1, 0, 0, 0, 0)
-        out = _expand_segmented_lut(data, ">B")
+        out = _expand_segmented_lut(data, ">B").tolist()
         assert [0, 112, 0, 112] == out
 
         # 0x0001 0x0203 is 66051 in BE 16-bit MSB, LSB
         data = [0, 1, 0] * 22017 + [0, 2, 1, 2] + [2, 1, 2, 3, 0, 1]
-        out = _expand_segmented_lut(data, ">B")
+        out = _expand_segmented_lut(data, ">B").tolist()
         assert [0] * 22017 + [1, 2, 1, 2] == out
 
     def test_indirect_16(self):
         """Test expanding an indirect segment encoded as 16-bit."""
         # Start from a discrete segment
         data = (0, 2, 0, 112, 1, 5, 192, 2, 2, 0, 0)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, 112, 128, 144, 160, 176, 192] * 2 == out
 
         # Start from a linear segment
         data = (0, 2, 0, 112, 1, 5, 192, 2, 1, 4, 0)
-        out = _expand_segmented_lut(data, "H")
+        out = _expand_segmented_lut(data, "H").tolist()
         assert [0, 112, 128, 144, 160, 176, 192, 192, 192, 192, 192, 192] == out
 
     def test_palettes_spring(self):
@@ -1802,19 +1935,19 @@ class TestNumpy_ExpandSegmentedLUT:
         bs = ds.SegmentedRedPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [255] * 256 == out
 
         bs = ds.SegmentedGreenPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert list(range(0, 256)) == out
 
         bs = ds.SegmentedBluePaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert list(range(255, -1, -1)) == out
 
     def test_palettes_summer(self):
@@ -1824,20 +1957,20 @@ class TestNumpy_ExpandSegmentedLUT:
         bs = ds.SegmentedRedPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [0] * 256 == out
 
         bs = ds.SegmentedGreenPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [255, 255, 254, 254, 253] == out[:5]
         assert [130, 129, 129, 128, 128] == out[-5:]
 
         bs = ds.SegmentedBluePaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [0] * 128 == out[:128]
         assert [246, 248, 250, 252, 254] == out[-5:]
 
@@ -1848,19 +1981,19 @@ class TestNumpy_ExpandSegmentedLUT:
         bs = ds.SegmentedRedPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [255] * 256 == out
 
         bs = ds.SegmentedGreenPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert list(range(255, -1, -1)) == out
 
         bs = ds.SegmentedBluePaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [0] * 256 == out
 
     def test_palettes_winter(self):
@@ -1870,20 +2003,20 @@ class TestNumpy_ExpandSegmentedLUT:
         bs = ds.SegmentedRedPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [0] * 128 == out[:128]
         assert [123, 124, 125, 126, 127] == out[-5:]
 
         bs = ds.SegmentedGreenPaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert list(range(0, 256)) == out
 
         bs = ds.SegmentedBluePaletteColorLookupTableData
         fmt = f"<{len(bs)}B"
         data = unpack(fmt, bs)
-        out = _expand_segmented_lut(data, fmt)
+        out = _expand_segmented_lut(data, fmt).tolist()
         assert [255, 255, 254, 254, 253] == out[:5]
         assert [130, 129, 129, 128, 128] == out[-5:]
 
@@ -2311,6 +2444,34 @@ class TestNumpy_ApplyWindowing:
         with pytest.raises(IndexError, match=r"list index out of range"):
             apply_windowing(arr, ds, index=2)
 
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(WIN_12_1F)
+        arr = ds.pixel_array
+        for voi_func in ["LINEAR", "LINEAR_EXACT", "SIGMOID"]:
+            ds.VOILUTFunction = voi_func
+            expected = apply_windowing(arr, ds)
+            out = np.empty(arr.shape, dtype="f8")
+            assert apply_windowing(arr, ds, out=out) is out
+            assert np.array_equal(out, expected)
+
+            # In-place
+            out = arr.astype("f8")
+            assert apply_windowing(out, ds, out=out) is out
+            assert np.array_equal(out, expected)
+
+    def test_linear_zero_width(self):
+        """Test a 'LINEAR' windowing operation with a Window Width of 1."""
+        ds = Dataset()
+        ds.PhotometricInterpretation = "MONOCHROME1"
+        ds.PixelRepresentation = 0
+        ds.BitsStored = 8
+        ds.WindowCenter = 10
+        ds.WindowWidth = 1
+        arr = np.asarray([0, 9, 10, 11, 255], dtype="u1")
+        out = apply_windowing(arr, ds)
+        assert [0, 0, 255, 255, 255] == out.tolist()
+
     def test_unchanged(self):
         """Test input array is unchanged if no VOI LUT"""
         ds = Dataset()
@@ -2527,6 +2688,15 @@ class TestNumpy_ApplyVOI:
             out = apply_voi(arr, ds)
             assert [0, 127, 32768, 65535, 65535] == out.tolist()
 
+    def test_out(self):
+        """Test writing the result to `out`."""
+        ds = dcmread(VOI_08_1F)
+        arr = ds.pixel_array
+        expected = apply_voi(arr, ds)
+        out = np.empty(arr.shape, dtype=expected.dtype)
+        assert apply_voi(arr, ds, out=out) is out
+        assert np.array_equal(out, expected)
+
     def test_unchanged(self):
         """Test input array is unchanged if no VOI LUT"""
         ds = Dataset()
@@ -2614,6 +2784,14 @@ class TestNumpy_ApplyVOILUT:
         out = apply_voi_lut(arr, ds)
         assert [-128, -127, -1, 0, 1, 126, 127] == out.tolist()
 
+    def test_unchanged_out(self):
+        """Test input array is copied to `out` if no VOI LUT"""
+        ds = Dataset()
+        arr = np.asarray([-128, -127, -1, 0, 1, 126, 127], dtype="int8")
+        out = np.zeros(arr.shape, dtype="int8")
+        assert apply_voi_lut(arr, ds, out=out) is out
+        assert [-128, -127, -1, 0, 1, 126, 127] == out.tolist()
+
     def test_only_windowing(self):
         """Test only windowing operation elements present."""
         ds = Dataset()
@@ -2,11 +2,17 @@
 """Unit tests for the pydicom.sequence module."""
 
 import copy
+from io import BytesIO
+import pickle
 
 import pytest
 
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
 from pydicom.dataset import Dataset
-from pydicom.sequence import Sequence
+from pydicom.filewriter import dcmwrite
+from pydicom.sequence import Sequence, _EncodedItem
+from pydicom.uid import ExplicitVRLittleEndian
 
 
 class TestSequence:
@@ -180,3 +186,166 @@ class TestSequence:
 
         seq2 = copy.deepcopy(my_sequence_subclass)
         assert seq2.__class__ is MySequenceSubclass
+
+
+class TestLazySequence:
+    """Tests for sequences read from file with items parsed on access."""
+
+    def setup_method(self):
+        self.ds = dcmread(get_testdata_file("rtplan.dcm"))
+        self.seq = self.ds.BeamSequence[0].ControlPointSequence
+
+    def test_items_parsed_on_access(self):
+        """Test items are only parsed when first accessed."""
+        seq = self.seq
+        assert len(seq) == 2
+        assert all(isinstance(item, _EncodedItem) for item in seq._list)
+        assert seq._unmodified_value is not None
+
+        item = seq[1]
+        assert isinstance(item, Dataset)
+        assert item.ControlPointIndex == 1
+        assert isinstance(seq._list[0], _EncodedItem)
+        assert seq._unmodified_value is None
+        assert seq[1] is item
+
+        assert [ds.ControlPointIndex for ds in seq] == [0, 1]
+        assert not any(isinstance(item, _EncodedItem) for item in seq._list)
+        assert seq._encoded is None
+
+    def test_slice(self):
+        """Test slicing parses the selected items."""
+        items = self.seq[:1]
+        assert len(items) == 1
+        assert items[0].ControlPointIndex == 0
+        assert isinstance(self.seq._list[1], _EncodedItem)
+
+    def test_equality(self):
+        """Test equality with lazily parsed sequences."""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        other = ds.BeamSequence[0].ControlPointSequence
+        assert self.seq == other
+        assert self.seq == list(other)
+        del other[0]
+        assert self.seq != other
+
+    def test_not_equal(self):
+        """Test inequality with lazily parsed sequences."""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        other = ds.BeamSequence[0].ControlPointSequence
+        assert isinstance(other._list[0], _EncodedItem)
+        assert not self.seq != other
+        other[1].ControlPointIndex = 5
+        assert self.seq != other
+
+    def test_remove_releases_encoded(self):
+        """Test removing or replacing unparsed items releases the encoded
+        value once there are no unparsed items left.
+        """
+        seq = self.seq
+        del seq[0]
+        assert seq._encoded is not None
+        assert seq._nr_encoded == 1
+        seq[0] = Dataset()
+        assert seq._nr_encoded == 0
+        assert seq._encoded is None
+
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        seq = ds.BeamSequence[0].ControlPointSequence
+        assert seq._nr_encoded == 2
+        seq[:] = [Dataset()]
+        assert seq._encoded is None
+        assert len(seq) == 1
+
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        seq = ds.BeamSequence[0].ControlPointSequence
+        seq[0]
+        del seq[:]
+        assert seq._nr_encoded == 0
+        assert seq._encoded is None
+
+    def test_modified(self):
+        """Test modifying the sequence invalidates the encoded value."""
+        seq = self.seq
+        seq.append(Dataset())
+        assert seq._unmodified_value is None
+        assert len(seq) == 3
+        assert seq[0].ControlPointIndex == 0
+
+    def test_deepcopy_pickle(self):
+        """Test deepcopy and pickling lazily parsed sequences."""
+        seq = copy.deepcopy(self.seq)
+        assert seq == self.seq
+        seq = pickle.loads(pickle.dumps(self.ds)).BeamSequence[0]
+        assert seq.ControlPointSequence == self.seq
+
+    @pytest.mark.parametrize(
+        "filename", ["rtplan.dcm", "liver_1frame.dcm", "nested_priv_SQ.dcm"]
+    )
+    def test_write_unmodified(self, filename):
+        """Test writing unmodified sequences copies the encoded items."""
+        path = get_testdata_file(filename)
+        ds = dcmread(path)
+        fp = BytesIO()
+        dcmwrite(fp, ds)
+        with open(path, "rb") as f:
+            assert fp.getvalue() == f.read()
+
+    def test_write_un_sequence(self):
+        """Test writing an inferred UN sequence whose items are implicit VR
+        in an explicit VR dataset re-encodes the items.
+        """
+        ds = dcmread(get_testdata_file("UN_sequence.dcm"))
+        seq = ds[0x4453100C].value
+        assert not ds.is_implicit_VR
+        assert seq._encoded is not None
+        assert seq._unmodified_value is None
+        fp = BytesIO()
+        dcmwrite(fp, ds)
+
+        # Matches the output after parsing all the items
+        ds = dcmread(get_testdata_file("UN_sequence.dcm"))
+        ds[0x4453100C].value._parse_all()
+        reference = BytesIO()
+        dcmwrite(reference, ds)
+        assert fp.getvalue() == reference.getvalue()
+        assert b"\x20\x00\x0d\x00UI\x34\x00" in fp.getvalue()
+
+    def test_write_modified_copy(self):
+        """Test writing a sequence modified using a shallow copy."""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        seq = copy.copy(ds.BeamSequence)
+        seq[0].BeamName = "CHANGED"
+        assert ds.BeamSequence[0].BeamName == "CHANGED"
+        assert ds.BeamSequence._unmodified_value is None
+
+        fp = BytesIO()
+        dcmwrite(fp, ds)
+        fp.seek(0)
+        assert dcmread(fp).BeamSequence[0].BeamName == "CHANGED"
+
+    def test_write_modified(self):
+        """Test writing modified sequences re-encodes the items."""
+        self.seq[0].ControlPointIndex = 10
+        fp = BytesIO()
+        dcmwrite(fp, self.ds)
+        fp.seek(0)
+        ds = dcmread(fp)
+        seq = ds.BeamSequence[0].ControlPointSequence
+        assert [item.ControlPointIndex for item in seq] == [10, 1]
+
+        self.ds.BeamSequence[0].ControlPointSequence = Sequence()
+        fp = BytesIO()
+        dcmwrite(fp, self.ds)
+        fp.seek(0)
+        assert dcmread(fp).BeamSequence[0].ControlPointSequence == []
+
+    def test_write_different_encoding(self):
+        """Test unmodified sequences are re-encoded for a new transfer syntax."""
+        self.ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        fp = BytesIO()
+        dcmwrite(fp, self.ds)
+        fp.seek(0)
+        ds = dcmread(fp)
+        assert ds.file_meta.TransferSyntaxUID == ExplicitVRLittleEndian
+        assert ds.BeamSequence == self.ds.BeamSequence
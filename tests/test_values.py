@@ -4,6 +4,14 @@ import logging
 
 import pytest
 
+try:
+    import numpy
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.multival import MultiValue
 from pydicom.tag import Tag
 from pydicom.uid import UID
 from pydicom.values import (
@@ -16,9 +24,11 @@ from pydicom.values import (
     convert_single_string,
     convert_AE_string,
     convert_PN,
+    convert_DS_array,
+    convert_IS_array,
     multi_string,
 )
-from pydicom.valuerep import VR
+from pydicom.valuerep import VR, DSfloat, IS
 
 
 class TestConvertTag:
@@ -224,6 +234,119 @@ class TestConvertDA:
         assert convert_DA_string(bytestring, True) == ""
 
 
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestConvertDSArray:
+    """Tests for convert_DS_array()"""
+
+    def test_values(self):
+        """Test converting valid values."""
+        arr = convert_DS_array(b"1.5\\-2.25E3\\ +3 \\.5\\1e-3 ")
+        assert arr.dtype == numpy.float64
+        assert arr.tolist() == [1.5, -2250.0, 3.0, 0.5, 0.001]
+        assert convert_DS_array(b"42").tolist() == [42.0]
+
+    def test_matches_float(self):
+        """Test the values match those from parsing with DSfloat."""
+        values = [f"{x:.10g}" for x in numpy.linspace(-1000, 1000, 1001)]
+        arr = convert_DS_array("\\".join(values).encode())
+        assert arr.tolist() == [DSfloat(v) for v in values]
+
+    def test_empty(self):
+        """Test converting an empty value."""
+        assert convert_DS_array(b"").shape == (0,)
+        assert convert_DS_array(b"  ").shape == (0,)
+
+    @pytest.mark.parametrize(
+        "value, msg",
+        [
+            (b"1.5\\2b", r"DS: char\(s\) not in repertoire: 'b'"),
+            (b"nan", r"DS: char\(s\) not in repertoire: 'nan'"),
+            (b"1.5\\\\2", r"DS: unable to convert '1.5\\\\2' to an array"),
+            (b"1.2.3", r"DS: unable to convert '1.2.3' to an array"),
+            (b"1 2", r"DS: unable to convert '1 2' to an array"),
+        ],
+    )
+    def test_invalid_raises(self, value, msg):
+        """Test an invalid value raises an exception."""
+        with pytest.raises(ValueError, match=msg):
+            convert_DS_array(value)
+
+    @pytest.mark.parametrize("value", [b"1.2.3", b"1 2", b"1-2", b"1e", b"-", b" "])
+    @pytest.mark.parametrize("index", [0, 20, -1])
+    def test_invalid_many_raises(self, value, index):
+        """Test an invalid value amongst many values raises an exception."""
+        values = [b"1.5"] * 40
+        values[index] = value
+        with pytest.raises(ValueError, match="DS: unable to convert"):
+            convert_DS_array(b"\\".join(values))
+
+    def test_fallback(self):
+        """Test falling back to DSfloat for invalid values."""
+        value = convert_DS_array(b"1.5\\\\2", fallback=True)
+        assert isinstance(value, MultiValue)
+        assert value == [1.5, "", 2.0]
+        assert isinstance(value[0], DSfloat)
+
+        arr = convert_DS_array(b"1.5\\2", fallback=True)
+        assert isinstance(arr, numpy.ndarray)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestConvertISArray:
+    """Tests for convert_IS_array()"""
+
+    def test_values(self):
+        """Test converting valid values."""
+        arr = convert_IS_array(b"1\\-2\\ +3 \\2147483647 ")
+        assert arr.dtype == numpy.int64
+        assert arr.tolist() == [1, -2, 3, 2147483647]
+        assert convert_IS_array(b"42").tolist() == [42]
+
+    def test_empty(self):
+        """Test converting an empty value."""
+        assert convert_IS_array(b"").shape == (0,)
+        assert convert_IS_array(b"  ").shape == (0,)
+
+    @pytest.mark.parametrize(
+        "value, msg",
+        [
+            (b"1.0", r"IS: char\(s\) not in repertoire: '.'"),
+            (b"1\\", r"IS: unable to convert '1\\' to an array"),
+            (b"\\1", r"IS: unable to convert '\\1' to an array"),
+            (b"1-2", r"IS: unable to convert '1-2' to an array"),
+            (b"99999999999999999999", "IS: unable to convert '99999999999999999999'"),
+        ],
+    )
+    def test_invalid_raises(self, value, msg):
+        """Test an invalid value raises an exception."""
+        with pytest.raises(ValueError, match=msg):
+            convert_IS_array(value)
+
+    def test_many_values(self):
+        """Test converting many values."""
+        values = [f" {x:+d} " for x in range(-20, 20)]
+        arr = convert_IS_array("\\".join(values).encode())
+        assert arr.tolist() == list(range(-20, 20))
+
+    @pytest.mark.parametrize(
+        "value", [b"-", b"+", b" ", b"", b"1 2", b"1-2", b"99999999999999999999"]
+    )
+    @pytest.mark.parametrize("index", [0, 20, -1])
+    def test_invalid_many_raises(self, value, index):
+        """Test an invalid value amongst many values raises an exception."""
+        values = [b"1"] * 40
+        values[index] = value
+        with pytest.raises(ValueError, match="IS: unable to convert"):
+            convert_IS_array(b"\\".join(values))
+
+    def test_fallback(self):
+        """Test falling back to IS for invalid values."""
+        value = convert_IS_array(b"1\\\\2", fallback=True)
+        assert isinstance(value, MultiValue)
+        assert value == [1, "", 2]
+        assert isinstance(value[0], IS)
+
+
 class TestConvertValue:
     def test_convert_value_raises(self):
         """Test convert_value raises exception if unsupported VR"""